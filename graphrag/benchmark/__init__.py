@@ -0,0 +1,17 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmarks of the index and the searches on synthetic corpora."""
+
+from .corpus import generate_corpus, generate_queries
+from .mock_openai import MockOpenAIServer, serve_mock_openai
+from .run import compare_results, run_benchmark
+
+__all__ = [
+    "MockOpenAIServer",
+    "compare_results",
+    "generate_corpus",
+    "generate_queries",
+    "run_benchmark",
+    "serve_mock_openai",
+]
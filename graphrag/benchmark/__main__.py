@@ -0,0 +1,114 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The Benchmark package root."""
+
+import argparse
+
+from .cli import benchmark_cli
+from .run import (
+    DEFAULT_CONCURRENT_REQUESTS,
+    DEFAULT_QUERIES,
+    DEFAULT_QUERY_CONCURRENCY,
+    DEFAULT_TOLERANCE,
+)
+
+
+def _parse_latency(values: list[str]) -> dict[str, float]:
+    latency = {}
+    for value in values:
+        kind, _, seconds = value.rpartition("=")
+        latency[kind or "default"] = float(seconds)
+    return latency
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m graphrag.benchmark",
+        description="Benchmark the index and the searches on synthetic corpora with a mock LLM",
+    )
+    parser.add_argument(
+        "--chunks",
+        help="The number of chunks of the corpora to benchmark, comma-separated. Default value: 1000",
+        default="1000",
+        type=str,
+    )
+    parser.add_argument(
+        "--output",
+        help="The JSON file to write the results to. Default value: benchmark.json",
+        default="benchmark.json",
+        type=str,
+    )
+    parser.add_argument(
+        "--baseline",
+        help="The results of a previous run to compare to, exits with an error on a regression",
+        required=False,
+        default=None,
+        type=str,
+    )
+    parser.add_argument(
+        "--tolerance",
+        help=f"The fraction a time, peak memory or queries per second may get worse than the baseline by. Default value: {DEFAULT_TOLERANCE}",
+        default=DEFAULT_TOLERANCE,
+        type=float,
+    )
+    parser.add_argument(
+        "--latency",
+        help="The simulated latency of the mock LLM in seconds, either for every request or as kind=seconds for extraction, summarization, report, claims, query or embedding requests. Can be repeated",
+        action="append",
+        default=[],
+        type=str,
+    )
+    parser.add_argument(
+        "--queries",
+        help=f"The number of local and of global searches to run. Default value: {DEFAULT_QUERIES}",
+        default=DEFAULT_QUERIES,
+        type=int,
+    )
+    parser.add_argument(
+        "--query-concurrency",
+        help=f"The number of searches to run at the same time. Default value: {DEFAULT_QUERY_CONCURRENCY}",
+        default=DEFAULT_QUERY_CONCURRENCY,
+        type=int,
+    )
+    parser.add_argument(
+        "--concurrent-requests",
+        help=f"The number of concurrent requests of the index to the mock LLM. Default value: {DEFAULT_CONCURRENT_REQUESTS}",
+        default=DEFAULT_CONCURRENT_REQUESTS,
+        type=int,
+    )
+    parser.add_argument(
+        "--entities",
+        help="The number of entities of the corpora. Default value: a quarter of the chunks",
+        required=False,
+        default=None,
+        type=int,
+    )
+    parser.add_argument(
+        "--seed",
+        help="The seed of the corpora and the queries. Default value: 0",
+        default=0,
+        type=int,
+    )
+    parser.add_argument(
+        "--root",
+        help="The folder to keep the outputs of the index in, a temporary folder by default",
+        required=False,
+        default=None,
+        type=str,
+    )
+    args = parser.parse_args()
+
+    benchmark_cli(
+        chunks=[int(size) for size in args.chunks.split(",")],
+        output=args.output,
+        baseline=args.baseline,
+        latency=_parse_latency(args.latency),
+        queries=args.queries,
+        query_concurrency=args.query_concurrency,
+        concurrent_requests=args.concurrent_requests,
+        entities=args.entities,
+        seed=args.seed,
+        tolerance=args.tolerance,
+        root=args.root,
+    )
@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Command line interface for the benchmarks."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from graphrag.index.progress import PrintProgressReporter
+
+from .run import compare_results, run_benchmark
+
+
+def benchmark_cli(
+    chunks: list[int],
+    output: str,
+    baseline: str | None,
+    latency: dict[str, float],
+    queries: int,
+    query_concurrency: int,
+    concurrent_requests: int,
+    entities: int | None,
+    seed: int,
+    tolerance: float,
+    root: str | None,
+) -> None:
+    """Run the benchmarks for each corpus size, and compare them to a baseline."""
+    reporter = PrintProgressReporter("")
+    results = []
+    for size in chunks:
+        reporter.info(f"Benchmarking {size} chunks")
+        results.append(
+            asyncio.run(
+                run_benchmark(
+                    chunks=size,
+                    root_dir=str(Path(root) / str(size)) if root else None,
+                    entities=entities,
+                    latency=latency,
+                    queries=queries,
+                    query_concurrency=query_concurrency,
+                    concurrent_requests=concurrent_requests,
+                    seed=seed,
+                    progress_reporter=reporter,
+                )
+            )
+        )
+
+    Path(output).write_text(json.dumps(results, indent=4), encoding="utf-8")
+    reporter.success(f"Results written to {output}")
+
+    if baseline:
+        baseline_results = json.loads(Path(baseline).read_text(encoding="utf-8"))
+        regressions = []
+        for result in results:
+            before = next(
+                (
+                    run
+                    for run in baseline_results
+                    if run["parameters"] == result["parameters"]
+                ),
+                None,
+            )
+            if before is None:
+                reporter.warning(
+                    f"No baseline run for {result['parameters']['chunks']} chunks"
+                )
+                continue
+            regressions.extend(
+                f"{result['parameters']['chunks']} chunks, {regression}"
+                for regression in compare_results(before, result, tolerance)
+            )
+        for regression in regressions:
+            reporter.error(regression)
+        if regressions:
+            sys.exit(1)
+        reporter.success("No regressions from the baseline")
@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Synthetic corpora for the benchmarks."""
+
+import itertools
+import random
+import re
+
+import pandas as pd
+
+# the entities of the corpora, which the mock LLM extracts from the chunks
+ENTITY_PATTERN = re.compile(r"\bENTITY_\d+\b")
+
+DEFAULT_SENTENCES_PER_CHUNK = 8
+
+_VERBS = [
+    "met with",
+    "signed a contract with",
+    "acquired a stake in",
+    "traveled with",
+    "published a report on",
+    "filed a complaint against",
+    "hosted an event for",
+    "competed with",
+]
+_PLACES = [
+    "in the capital",
+    "at the annual summit",
+    "near the harbor",
+    "during the quarterly review",
+    "after the elections",
+    "in a joint statement",
+]
+
+
+def entity_name(index: int) -> str:
+    """Get the name of an entity of the corpora."""
+    return f"ENTITY_{index}"
+
+
+def generate_corpus(
+    chunks: int,
+    entities: int | None = None,
+    sentences_per_chunk: int = DEFAULT_SENTENCES_PER_CHUNK,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Generate documents that are one chunk each, with the id, title and text columns.
+
+    Each sentence relates two entities, drawn with a Zipf distribution so a few
+    entities appear in many chunks and most in a few, as in real corpora. There are a
+    quarter as many entities as chunks by default. The same arguments give the same
+    corpus.
+    """
+    entities = entities or max(10, chunks // 4)
+    rng = random.Random(seed)  # noqa S311
+    cum_weights = list(itertools.accumulate(1 / (i + 1) for i in range(entities)))
+    population = range(entities)
+
+    def sentence() -> str:
+        source, target = rng.choices(population, cum_weights=cum_weights, k=2)
+        return (
+            f"{entity_name(source)} {rng.choice(_VERBS)} {entity_name(target)} "
+            f"{rng.choice(_PLACES)}."
+        )
+
+    texts = [
+        " ".join(sentence() for _ in range(sentences_per_chunk)) for _ in range(chunks)
+    ]
+    return pd.DataFrame({
+        "id": [f"doc-{i}" for i in range(chunks)],
+        "title": [f"Document {i}" for i in range(chunks)],
+        "text": texts,
+    })
+
+
+def generate_queries(count: int, entities: int, seed: int = 0) -> list[str]:
+    """Generate questions about the entities of a corpus."""
+    rng = random.Random(seed)  # noqa S311
+    return [
+        f"What is {entity_name(rng.randrange(entities))} involved in?"
+        for _ in range(count)
+    ]
@@ -0,0 +1,300 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A mock of the OpenAI API answering the prompts of the index and the searches."""
+
+import base64
+import contextlib
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+import numpy as np
+
+from .corpus import ENTITY_PATTERN
+
+log = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_DIMENSIONS = 64
+
+# the kinds of requests, which each have their own simulated latency
+EXTRACTION = "extraction"
+SUMMARIZATION = "summarization"
+REPORT = "report"
+CLAIMS = "claims"
+QUERY = "query"
+EMBEDDING = "embedding"
+
+_ENTITY_TYPES = ["ORGANIZATION", "PERSON", "GEO", "EVENT"]
+# the phrases the default prompts are recognized by
+_PROMPT_MARKERS = [
+    (SUMMARIZATION, "generating a comprehensive summary of the data provided below"),
+    (REPORT, "Write a comprehensive report of a community"),
+    (CLAIMS, "analyze claims against certain entities"),
+    (EXTRACTION, "identify all entities of those types from the text"),
+]
+
+
+def chat_response(messages: list[dict[str, Any]]) -> tuple[str, str]:
+    """Get the kind of a chat request and its canned response.
+
+    The responses are derived from the prompts, so the same chunk always yields the
+    same entities and relationships, and the graph grows with the corpus.
+    """
+    prompt = str(messages[-1].get("content") or "")
+    system = str(messages[0].get("content") or "")
+
+    # the gleanings of the extractions find nothing more
+    if prompt.startswith("MANY entities"):
+        return EXTRACTION, ""
+    if prompt.startswith("It appears some entities"):
+        return EXTRACTION, "NO"
+
+    for kind, marker in _PROMPT_MARKERS:
+        if marker in prompt:
+            return kind, _RESPONSES[kind](prompt)
+    if "list of key points" in system:
+        return QUERY, json.dumps({
+            "points": [{"description": "A key point [Data: Reports (0)]", "score": 50}]
+        })
+    return QUERY, f"An answer to the question: {prompt}"
+
+
+def embed(text: str, dimensions: int = DEFAULT_EMBEDDING_DIMENSIONS) -> np.ndarray:
+    """Embed a text into a unit vector seeded by its hash."""
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+    vector = np.random.default_rng(seed).standard_normal(dimensions)
+    return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+
+def _extraction(text: str) -> str:
+    records = []
+    extracted = set()
+    for sentence in text.split("."):
+        sentence = sentence.strip()
+        names = list(dict.fromkeys(ENTITY_PATTERN.findall(sentence)))
+        for name in names:
+            if name in extracted:
+                continue
+            extracted.add(name)
+            entity_type = _ENTITY_TYPES[int(name.rsplit("_", 1)[1]) % 4]
+            records.append(
+                f'("entity"<|>{name}<|>{entity_type}<|>{name} is mentioned in: {sentence})'
+            )
+        records.extend(
+            f'("relationship"<|>{source}<|>{target}<|>{sentence}<|>1)'
+            for source, target in itertools.pairwise(names)
+        )
+    return "\n##\n".join(records) + "\n<|COMPLETE|>"
+
+
+def _summary(prompt: str) -> str:
+    names = ENTITY_PATTERN.findall(prompt.rsplit("Entities:", 1)[-1])
+    return f"A summary of the descriptions of {' and '.join(dict.fromkeys(names))}."
+
+
+def _report(prompt: str) -> str:
+    names = list(dict.fromkeys(ENTITY_PATTERN.findall(prompt.rsplit("Text:", 1)[-1])))
+    title = f"Community of {names[0]}" if names else "Community"
+    return json.dumps({
+        "title": title,
+        "summary": f"The community of {', '.join(names[:10])}.",
+        "rating": 5.0,
+        "rating_explanation": "The community is of average importance.",
+        "findings": [
+            {
+                "summary": f"{name} is a member of the community",
+                "explanation": f"{name} is related to the other members. [Data: Entities (0)]",
+            }
+            for name in names[:5]
+        ],
+    })
+
+
+_RESPONSES: dict[str, Callable[[str], str]] = {
+    SUMMARIZATION: _summary,
+    REPORT: _report,
+    CLAIMS: lambda _prompt: "<|COMPLETE|>",
+    EXTRACTION: lambda prompt: _extraction(prompt.rsplit("Text:", 1)[-1]),
+}
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """Answer the chat completions and embeddings requests of the OpenAI API.
+
+    Each request is answered after its simulated latency, by kind: extraction,
+    summarization, report, claims, query or embedding, with "default" for the kinds
+    that aren't given. Streamed completions are sent in one chunk.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: dict[str, float] | None = None,
+    ):
+        """Init method definition."""
+        super().__init__((host, port), _MockOpenAIRequestHandler)
+        self.latency = latency or {}
+        self.requests: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Get the API base url of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def wait(self, kind: str) -> None:
+        """Count a request, and wait for its simulated latency."""
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+        latency = self.latency.get(kind, self.latency.get("default", 0.0))
+        if latency > 0:
+            time.sleep(latency)
+
+
+class _MockOpenAIRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def mock_server(self) -> MockOpenAIServer:
+        return cast(MockOpenAIServer, self.server)
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.endswith("/chat/completions"):
+            kind, content = chat_response(request.get("messages") or [{}])
+            self.mock_server.wait(kind)
+            self._send_completion(request, content)
+        elif self.path.endswith("/embeddings"):
+            self.mock_server.wait(EMBEDDING)
+            self._send_embeddings(request)
+        else:
+            self._send({"error": {"message": f"Unknown path: {self.path}"}}, 404)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        log.debug(format, *args)
+
+    def _send_completion(self, request: dict[str, Any], content: str) -> None:
+        model = request.get("model", "mock")
+        usage = _usage(json.dumps(request.get("messages")), content)
+        if not request.get("stream"):
+            self._send({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            })
+            return
+
+        chunks = [
+            {"role": "assistant", "content": content},
+            {},
+        ]
+        events = "".join(
+            "data: "
+            + json.dumps({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": delta,
+                        "finish_reason": None if delta else "stop",
+                    }
+                ],
+            })
+            + "\n\n"
+            for delta in chunks
+        )
+        self._send_data(
+            (events + "data: [DONE]\n\n").encode(), "text/event-stream", 200
+        )
+
+    def _send_embeddings(self, request: dict[str, Any]) -> None:
+        texts = request.get("input") or []
+        if isinstance(texts, str):
+            texts = [texts]
+        dimensions = request.get("dimensions") or DEFAULT_EMBEDDING_DIMENSIONS
+        as_base64 = request.get("encoding_format") == "base64"
+        data = []
+        for index, text in enumerate(texts):
+            vector = embed(str(text), dimensions)
+            data.append({
+                "object": "embedding",
+                "index": index,
+                "embedding": base64.b64encode(vector.tobytes()).decode()
+                if as_base64
+                else vector.tolist(),
+            })
+        self._send({
+            "object": "list",
+            "data": data,
+            "model": request.get("model", "mock"),
+            "usage": _usage(json.dumps(texts), ""),
+        })
+
+    def _send(self, body: dict[str, Any], status: int = 200) -> None:
+        self._send_data(json.dumps(body).encode(), "application/json", status)
+
+    def _send_data(self, data: bytes, content_type: str, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _usage(prompt: str, completion: str) -> dict[str, int]:
+    # about four characters per token, the mock doesn't pay for tokenizing
+    prompt_tokens = len(prompt) // 4
+    completion_tokens = len(completion) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _serve(latency: dict[str, float], urls: Any) -> None:
+    with MockOpenAIServer(latency=latency) as server:
+        urls.put(server.url)
+        server.serve_forever()
+
+
+@contextlib.contextmanager
+def serve_mock_openai(latency: dict[str, float] | None = None) -> Iterator[str]:
+    """Run a mock OpenAI server in its own process, and get its API base url.
+
+    The server runs in another process so its work isn't measured with the index.
+    """
+    context = multiprocessing.get_context("spawn")
+    urls = context.Queue()
+    process = context.Process(target=_serve, args=(latency or {}, urls), daemon=True)
+    process.start()
+    try:
+        yield urls.get(timeout=120)
+    finally:
+        process.terminate()
+        process.join()
@@ -0,0 +1,321 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmark the index and the searches on a synthetic corpus."""
+
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, cast
+
+import pandas as pd
+
+from graphrag.config import (
+    GraphRagConfig,
+    GraphRagConfigInput,
+    create_graphrag_config,
+)
+from graphrag.index import create_pipeline_config
+from graphrag.index.cache import NoopPipelineCache
+from graphrag.index.progress import NullProgressReporter, ProgressReporter
+from graphrag.index.run import run_pipeline_with_config
+from graphrag.query.engine import QueryEngine
+
+from .corpus import generate_corpus, generate_queries
+from .mock_openai import serve_mock_openai
+
+log = logging.getLogger(__name__)
+
+# the version of the format of the results, bumped when they can't be compared
+RESULTS_VERSION = 1
+
+DEFAULT_CHUNKS = 1000
+DEFAULT_CHUNK_SIZE = 300
+DEFAULT_QUERIES = 20
+DEFAULT_QUERY_CONCURRENCY = 4
+DEFAULT_CONCURRENT_REQUESTS = 25
+DEFAULT_TOLERANCE = 0.2
+# the times under which a change is noise rather than a regression
+DEFAULT_MIN_SECONDS = 1.0
+
+_ARTIFACTS_DIR = "output/artifacts"
+_OUTPUT_TABLES = {
+    "documents": "create_final_documents.parquet",
+    "text_units": "create_final_text_units.parquet",
+    "entities": "create_final_entities.parquet",
+    "relationships": "create_final_relationships.parquet",
+    "community_reports": "create_final_community_reports.parquet",
+}
+
+
+async def run_benchmark(
+    chunks: int = DEFAULT_CHUNKS,
+    root_dir: str | None = None,
+    entities: int | None = None,
+    latency: dict[str, float] | None = None,
+    queries: int = DEFAULT_QUERIES,
+    query_concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    concurrent_requests: int = DEFAULT_CONCURRENT_REQUESTS,
+    seed: int = 0,
+    progress_reporter: ProgressReporter | None = None,
+) -> dict[str, Any]:
+    """Index a synthetic corpus with a mock LLM, then run local and global searches on it.
+
+    Args:
+        - chunks - The number of chunks of the corpus
+        - root_dir - The folder to write the outputs of the index to, a temporary folder by default
+        - entities - The number of entities of the corpus, a quarter of the chunks by default
+        - latency - The simulated latency of the mock LLM in seconds, by kind of request: extraction, summarization, report, claims, query, embedding or default
+        - queries - The number of local and of global searches to run
+        - query_concurrency - The number of searches to run at the same time
+        - concurrent_requests - The number of concurrent requests of the index to the mock LLM
+        - seed - The seed of the corpus and the queries
+    Returns:
+        - results - The times, peak memory and queries per second, as JSON values that compare_results takes
+    """
+    progress_reporter = progress_reporter or NullProgressReporter()
+    entities = entities or max(10, chunks // 4)
+    if root_dir is None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            return await run_benchmark(
+                chunks,
+                temp_dir,
+                entities,
+                latency,
+                queries,
+                query_concurrency,
+                concurrent_requests,
+                seed,
+                progress_reporter,
+            )
+
+    progress_reporter.info(f"Generating a corpus of {chunks} chunks")
+    corpus = generate_corpus(chunks, entities, seed=seed)
+    results: dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "parameters": {
+            "chunks": chunks,
+            "entities": entities,
+            "latency": latency or {},
+            "queries": queries,
+            "query_concurrency": query_concurrency,
+            "concurrent_requests": concurrent_requests,
+            "seed": seed,
+        },
+    }
+    with serve_mock_openai(latency) as api_base:
+        values = _config_values(root_dir, api_base, concurrent_requests)
+        progress_reporter.info("Indexing the corpus")
+        results["index"] = await _benchmark_index(
+            create_graphrag_config(cast(GraphRagConfigInput, values), root_dir),
+            corpus,
+            progress_reporter,
+        )
+
+        # the index writes the embeddings to the tables, the searches read them
+        # into a vector store
+        values["embeddings"]["vector_store"] = {
+            "type": "numpy",
+            "db_uri": str(Path(root_dir) / "output" / "vectors"),
+        }
+        progress_reporter.info("Running the searches")
+        results["query"] = await _benchmark_queries(
+            QueryEngine(
+                create_graphrag_config(cast(GraphRagConfigInput, values), root_dir),
+                data_dir=str(Path(root_dir) / _ARTIFACTS_DIR),
+            ),
+            generate_queries(queries, entities, seed),
+            query_concurrency,
+        )
+    return results
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    results: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> list[str]:
+    """Get the regressions of the results from a baseline run with the same parameters.
+
+    A time or peak memory more than the tolerance above the baseline, or queries per
+    second more than the tolerance below it, is a regression. Times shorter than
+    min_seconds in both runs are ignored.
+    """
+    if baseline.get("parameters") != results.get("parameters"):
+        msg = "The results were run with other parameters than the baseline"
+        raise ValueError(msg)
+
+    regressions = []
+
+    def check(name: str, before: float | None, after: float | None, unit: str):
+        if before is None or after is None:
+            return
+        if unit == "s" and max(before, after) < min_seconds:
+            return
+        higher_is_better = unit == "qps"
+        change = (after - before) / before if before else 0.0
+        if (-change if higher_is_better else change) > tolerance:
+            regressions.append(
+                f"{name}: {before:.2f}{unit} -> {after:.2f}{unit} ({change:+.0%})"
+            )
+
+    index_before = baseline["index"]
+    index_after = results["index"]
+    check("index time", index_before["time"], index_after["time"], "s")
+    check(
+        "index peak memory",
+        index_before["peak_rss_mb"],
+        index_after["peak_rss_mb"],
+        "MB",
+    )
+    for workflow, after in index_after["workflows"].items():
+        before = index_before["workflows"].get(workflow)
+        if before is None:
+            continue
+        check(f"{workflow} time", before["time"], after["time"], "s")
+    for method, after in results["query"]["searches"].items():
+        before = baseline["query"]["searches"].get(method)
+        if before is None:
+            continue
+        check(f"{method} search", before["qps"], after["qps"], "qps")
+    return regressions
+
+
+def _config_values(
+    root_dir: str, api_base: str, concurrent_requests: int
+) -> dict[str, Any]:
+    llm = {
+        "api_key": "benchmark",
+        "api_base": api_base,
+        "concurrent_requests": concurrent_requests,
+    }
+    output = Path(root_dir) / "output"
+    return {
+        "llm": {
+            **llm,
+            "type": "openai_chat",
+            "model": "gpt-4-turbo-preview",
+            "model_supports_json": True,
+        },
+        "embeddings": {
+            "llm": {
+                **llm,
+                "type": "openai_embedding",
+                "model": "text-embedding-3-small",
+            },
+        },
+        # each document of the corpus is one chunk
+        "chunks": {"size": DEFAULT_CHUNK_SIZE, "overlap": 0},
+        "storage": {"type": "file", "base_dir": str(output / "artifacts")},
+        "reporting": {"type": "file", "base_dir": str(output / "reports")},
+        # the LLM calls are made on every run, so runs can be compared
+        "cache": {"type": "none"},
+    }
+
+
+async def _benchmark_index(
+    config: GraphRagConfig, corpus: pd.DataFrame, progress_reporter: ProgressReporter
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    errors = []
+    async for output in run_pipeline_with_config(
+        create_pipeline_config(config),
+        dataset=corpus,
+        cache=NoopPipelineCache(),
+        progress_reporter=progress_reporter,
+    ):
+        if output.errors:
+            errors.extend(str(error) for error in output.errors)
+        progress_reporter.success(output.workflow)
+    elapsed = time.perf_counter() - start
+    if errors:
+        msg = f"The index failed: {'; '.join(errors)}"
+        raise RuntimeError(msg)
+
+    artifacts = Path(config.root_dir) / _ARTIFACTS_DIR
+    stats = json.loads((artifacts / "stats.json").read_text(encoding="utf-8"))
+    metrics = json.loads((artifacts / "metrics.json").read_text(encoding="utf-8"))
+    workflows = {}
+    for workflow, timings in stats["workflows"].items():
+        verbs = metrics["workflows"].get(workflow, {}).get("verbs", {})
+        peaks = [verb["peak_rss_mb"] for verb in verbs.values() if verb["peak_rss_mb"]]
+        workflows[workflow] = {
+            "time": timings["overall"],
+            # the peak memory of the process by the end of the workflow
+            "peak_rss_mb": max(peaks, default=None),
+        }
+    peaks = [w["peak_rss_mb"] for w in workflows.values() if w["peak_rss_mb"]]
+    return {
+        "time": elapsed,
+        "peak_rss_mb": max(peaks, default=None),
+        "workflows": workflows,
+        "outputs": {
+            name: len(pd.read_parquet(artifacts / table))
+            for name, table in _OUTPUT_TABLES.items()
+            if (artifacts / table).exists()
+        },
+        "llm": metrics["llm"],
+    }
+
+
+async def _benchmark_queries(
+    engine: QueryEngine, queries: list[str], concurrency: int
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    engine.load()
+    load_time = time.perf_counter() - start
+    return {
+        "load_time": load_time,
+        "searches": {
+            "local": await _run_searches(engine.local_search, queries, concurrency),
+            "global": await _run_searches(engine.global_search, queries, concurrency),
+        },
+    }
+
+
+async def _run_searches(
+    search: Any, queries: list[str], concurrency: int
+) -> dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def run(query: str) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await search(query)
+            except Exception:
+                log.exception("search failed: %s", query)
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(query) for query in queries))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "queries": len(queries),
+        "errors": errors,
+        "time": elapsed,
+        "qps": len(latencies) / elapsed if elapsed else None,
+        "latency": {
+            "mean": statistics.fmean(latencies) if latencies else None,
+            "p50": _percentile(latencies, 0.5),
+            "p95": _percentile(latencies, 0.95),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(fraction * len(values)))]
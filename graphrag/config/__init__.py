@@ -8,6 +8,7 @@ from .create_graphrag_config import (
 )
 from .enums import (
     CacheType,
+    EmbeddingDType,
     InputFileType,
     InputType,
     LLMType,
@@ -35,6 +36,7 @@ from .input_models import (
     LLMParametersInput,
     LocalSearchConfigInput,
     ParallelizationParametersInput,
+    ProcessPoolConfigInput,
     ReportingConfigInput,
     SnapshotsConfigInput,
     StorageConfigInput,
@@ -57,6 +59,7 @@ from .models import (
     LLMParameters,
     LocalSearchConfig,
     ParallelizationParameters,
+    ProcessPoolConfig,
     ReportingConfig,
     SnapshotsConfig,
     StorageConfig,
@@ -83,6 +86,7 @@ __all__ = [
     "CommunityReportsConfigInput",
     "EmbedGraphConfig",
     "EmbedGraphConfigInput",
+    "EmbeddingDType",
     "EntityExtractionConfig",
     "EntityExtractionConfigInput",
     "GlobalSearchConfig",
@@ -102,6 +106,8 @@ __all__ = [
     "LocalSearchConfigInput",
     "ParallelizationParameters",
     "ParallelizationParametersInput",
+    "ProcessPoolConfig",
+    "ProcessPoolConfigInput",
     "ReportingConfig",
     "ReportingConfigInput",
     "ReportingType",
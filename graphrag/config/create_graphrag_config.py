@@ -16,6 +16,7 @@ import graphrag.config.defaults as defs
 
 from .enums import (
     CacheType,
+    EmbeddingDType,
     InputFileType,
     InputType,
     LLMType,
@@ -47,6 +48,7 @@ from .models import (
     LLMParameters,
     LocalSearchConfig,
     ParallelizationParameters,
+    ProcessPoolConfig,
     ReportingConfig,
     SnapshotsConfig,
     StorageConfig,
@@ -103,6 +105,10 @@ def create_graphrag_config(
             if sleep_on_rate_limit is None:
                 sleep_on_rate_limit = base.sleep_on_rate_limit_recommendation
 
+            adaptive_rate_limit = reader.bool(Fragment.adaptive_rate_limit)
+            if adaptive_rate_limit is None:
+                adaptive_rate_limit = base.adaptive_rate_limit
+
             return LLMParameters(
                 api_key=api_key,
                 type=llm_type,
@@ -129,8 +135,15 @@ def create_graphrag_config(
                 max_retry_wait=reader.float(Fragment.max_retry_wait)
                 or base.max_retry_wait,
                 sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
+                adaptive_rate_limit=adaptive_rate_limit,
                 concurrent_requests=reader.int(Fragment.concurrent_requests)
                 or base.concurrent_requests,
+                max_connections=reader.int(Fragment.max_connections)
+                or base.max_connections,
+                max_keepalive_connections=reader.int(Fragment.max_keepalive_connections)
+                or base.max_keepalive_connections,
+                keepalive_expiry=reader.float(Fragment.keepalive_expiry)
+                or base.keepalive_expiry,
             )
 
     def hydrate_embeddings_params(
@@ -176,6 +189,10 @@ def create_graphrag_config(
             if sleep_on_rate_limit is None:
                 sleep_on_rate_limit = base.sleep_on_rate_limit_recommendation
 
+            adaptive_rate_limit = reader.bool(Fragment.adaptive_rate_limit)
+            if adaptive_rate_limit is None:
+                adaptive_rate_limit = defs.LLM_ADAPTIVE_RATE_LIMIT
+
             return LLMParameters(
                 api_key=api_key,
                 type=api_type,
@@ -196,8 +213,15 @@ def create_graphrag_config(
                 max_retry_wait=reader.float(Fragment.max_retry_wait)
                 or defs.LLM_MAX_RETRY_WAIT,
                 sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
+                adaptive_rate_limit=adaptive_rate_limit,
                 concurrent_requests=reader.int(Fragment.concurrent_requests)
                 or defs.LLM_CONCURRENT_REQUESTS,
+                max_connections=reader.int(Fragment.max_connections)
+                or defs.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=reader.int(Fragment.max_keepalive_connections)
+                or defs.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=reader.float(Fragment.keepalive_expiry)
+                or defs.LLM_KEEPALIVE_EXPIRY,
             )
 
     def hydrate_parallelization_params(
@@ -254,6 +278,10 @@ def create_graphrag_config(
                 if sleep_on_rate_limit is None:
                     sleep_on_rate_limit = defs.LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION
 
+                adaptive_rate_limit = reader.bool(Fragment.adaptive_rate_limit)
+                if adaptive_rate_limit is None:
+                    adaptive_rate_limit = defs.LLM_ADAPTIVE_RATE_LIMIT
+
                 llm_model = LLMParameters(
                     api_key=api_key,
                     api_base=api_base,
@@ -281,8 +309,17 @@ def create_graphrag_config(
                     max_retry_wait=reader.float(Fragment.max_retry_wait)
                     or defs.LLM_MAX_RETRY_WAIT,
                     sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
+                    adaptive_rate_limit=adaptive_rate_limit,
                     concurrent_requests=reader.int(Fragment.concurrent_requests)
                     or defs.LLM_CONCURRENT_REQUESTS,
+                    max_connections=reader.int(Fragment.max_connections)
+                    or defs.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=reader.int(
+                        Fragment.max_keepalive_connections
+                    )
+                    or defs.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=reader.float(Fragment.keepalive_expiry)
+                    or defs.LLM_KEEPALIVE_EXPIRY,
                 )
             with reader.use(values.get("parallelization")):
                 llm_parallelization_model = ParallelizationParameters(
@@ -294,6 +331,7 @@ def create_graphrag_config(
         embeddings_config = values.get("embeddings") or {}
         with reader.envvar_prefix(Section.embedding), reader.use(embeddings_config):
             embeddings_target = reader.str("target")
+            embeddings_dtype = reader.str("dtype")
             embeddings_model = TextEmbeddingConfig(
                 llm=hydrate_embeddings_params(embeddings_config, llm_model),
                 parallelization=hydrate_parallelization_params(
@@ -309,6 +347,11 @@ def create_graphrag_config(
                 batch_size=reader.int("batch_size") or defs.EMBEDDING_BATCH_SIZE,
                 batch_max_tokens=reader.int("batch_max_tokens")
                 or defs.EMBEDDING_BATCH_MAX_TOKENS,
+                dtype=(
+                    EmbeddingDType(embeddings_dtype)
+                    if embeddings_dtype
+                    else defs.EMBEDDING_DTYPE
+                ),
                 skip=reader.list("skip") or [],
             )
         with (
@@ -350,6 +393,7 @@ def create_graphrag_config(
                 connection_string=reader.str(Fragment.conn_string),
                 storage_account_blob_url=reader.str(Fragment.storage_account_blob_url),
                 container_name=reader.str(Fragment.container_name),
+                batch_size=reader.int("batch_size") or defs.INPUT_BATCH_SIZE,
             )
         with reader.envvar_prefix(Section.cache), reader.use(values.get("cache")):
             c_type = reader.str(Fragment.type)
@@ -359,6 +403,8 @@ def create_graphrag_config(
                 storage_account_blob_url=reader.str(Fragment.storage_account_blob_url),
                 container_name=reader.str(Fragment.container_name),
                 base_dir=reader.str(Fragment.base_dir) or defs.CACHE_BASE_DIR,
+                segmented=reader.bool("segmented") or defs.CACHE_SEGMENTED,
+                segment_size=reader.int("segment_size") or defs.CACHE_SEGMENT_SIZE,
             )
         with (
             reader.envvar_prefix(Section.reporting),
@@ -406,6 +452,15 @@ def create_graphrag_config(
             umap_model = UmapConfig(
                 enabled=reader.bool(Fragment.enabled) or defs.UMAP_ENABLED,
             )
+        with (
+            reader.envvar_prefix(Section.process_pool),
+            reader.use(values.get("process_pool")),
+        ):
+            process_pool_model = ProcessPoolConfig(
+                num_processes=reader.int("num_processes")
+                or defs.PROCESS_POOL_NUM_PROCESSES,
+                verbs=reader.list("verbs") or defs.PROCESS_POOL_VERBS,
+            )
 
         entity_extraction_config = values.get("entity_extraction") or {}
         with (
@@ -524,6 +579,9 @@ def create_graphrag_config(
             reader.use(values.get("global_search")),
             reader.envvar_prefix(Section.global_search),
         ):
+            early_stop_min_score = reader.int("early_stop_min_score")
+            if early_stop_min_score is None:
+                early_stop_min_score = defs.GLOBAL_SEARCH_EARLY_STOP_MIN_SCORE
             global_search_model = GlobalSearchConfig(
                 temperature=reader.float("llm_temperature")
                 or defs.GLOBAL_SEARCH_LLM_TEMPERATURE,
@@ -538,10 +596,18 @@ def create_graphrag_config(
                 reduce_max_tokens=reader.int("reduce_max_tokens")
                 or defs.GLOBAL_SEARCH_REDUCE_MAX_TOKENS,
                 concurrency=reader.int("concurrency") or defs.GLOBAL_SEARCH_CONCURRENCY,
+                early_stop=reader.bool("early_stop") or defs.GLOBAL_SEARCH_EARLY_STOP,
+                early_stop_min_score=early_stop_min_score,
             )
 
         encoding_model = reader.str(Fragment.encoding_model) or defs.ENCODING_MODEL
         skip_workflows = reader.list("skip_workflows") or []
+        max_concurrent_workflows = (
+            reader.int("max_concurrent_workflows") or defs.MAX_CONCURRENT_WORKFLOWS
+        )
+        table_cache_max_mb = reader.int("table_cache_max_mb")
+        if table_cache_max_mb is None:
+            table_cache_max_mb = defs.TABLE_CACHE_MAX_MB
 
     return GraphRagConfig(
         root_dir=root_dir,
@@ -561,9 +627,12 @@ def create_graphrag_config(
         community_reports=community_reports_model,
         summarize_descriptions=summarize_descriptions_model,
         umap=umap_model,
+        process_pool=process_pool_model,
         cluster_graph=cluster_graph_model,
         encoding_model=encoding_model,
         skip_workflows=skip_workflows,
+        max_concurrent_workflows=max_concurrent_workflows,
+        table_cache_max_mb=table_cache_max_mb,
         local_search=local_search_model,
         global_search=global_search_model,
     )
@@ -572,6 +641,7 @@ def create_graphrag_config(
 class Fragment(str, Enum):
     """Configuration Fragments."""
 
+    adaptive_rate_limit = "ADAPTIVE_RATE_LIMIT"
     api_base = "API_BASE"
     api_key = "API_KEY"
     api_version = "API_VERSION"
@@ -589,7 +659,10 @@ class Fragment(str, Enum):
     encoding = "ENCODING"
     encoding_model = "ENCODING_MODEL"
     file_type = "FILE_TYPE"
+    keepalive_expiry = "KEEPALIVE_EXPIRY"
+    max_connections = "MAX_CONNECTIONS"
     max_gleanings = "MAX_GLEANINGS"
+    max_keepalive_connections = "MAX_KEEPALIVE_CONNECTIONS"
     max_length = "MAX_LENGTH"
     max_retries = "MAX_RETRIES"
     max_retry_wait = "MAX_RETRY_WAIT"
@@ -629,6 +702,7 @@ class Section(str, Enum):
     storage = "STORAGE"
     summarize_descriptions = "SUMMARIZE_DESCRIPTIONS"
     umap = "UMAP"
+    process_pool = "PROCESS_POOL"
     local_search = "LOCAL_SEARCH"
     global_search = "GLOBAL_SEARCH"
 
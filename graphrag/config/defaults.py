@@ -7,6 +7,7 @@ from datashaper import AsyncType
 
 from .enums import (
     CacheType,
+    EmbeddingDType,
     InputFileType,
     InputType,
     LLMType,
@@ -17,6 +18,8 @@ from .enums import (
 
 ASYNC_MODE = AsyncType.Threaded
 ENCODING_MODEL = "cl100k_base"
+MAX_CONCURRENT_WORKFLOWS = 1
+TABLE_CACHE_MAX_MB = 1024
 #
 # LLM Parameters
 #
@@ -32,7 +35,11 @@ LLM_REQUESTS_PER_MINUTE = 0
 LLM_MAX_RETRIES = 10
 LLM_MAX_RETRY_WAIT = 10.0
 LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION = True
+LLM_ADAPTIVE_RATE_LIMIT = False
 LLM_CONCURRENT_REQUESTS = 25
+LLM_MAX_CONNECTIONS = 100
+LLM_MAX_KEEPALIVE_CONNECTIONS = 100
+LLM_KEEPALIVE_EXPIRY = 30.0
 
 #
 # Text Embedding Parameters
@@ -42,9 +49,12 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_BATCH_SIZE = 16
 EMBEDDING_BATCH_MAX_TOKENS = 8191
 EMBEDDING_TARGET = TextEmbeddingTarget.required
+EMBEDDING_DTYPE = EmbeddingDType.float32
 
 CACHE_TYPE = CacheType.file
 CACHE_BASE_DIR = "cache"
+CACHE_SEGMENTED = False
+CACHE_SEGMENT_SIZE = 100
 CHUNK_SIZE = 1200
 CHUNK_OVERLAP = 100
 CHUNK_GROUP_BY_COLUMNS = ["id"]
@@ -65,6 +75,7 @@ INPUT_FILE_ENCODING = "utf-8"
 INPUT_TEXT_COLUMN = "text"
 INPUT_CSV_PATTERN = ".*\\.csv$"
 INPUT_TEXT_PATTERN = ".*\\.txt$"
+INPUT_BATCH_SIZE = 0
 PARALLELIZATION_STAGGER = 0.3
 PARALLELIZATION_NUM_THREADS = 50
 NODE2VEC_ENABLED = False
@@ -82,6 +93,13 @@ STORAGE_BASE_DIR = "output/${timestamp}/artifacts"
 STORAGE_TYPE = StorageType.file
 SUMMARIZE_DESCRIPTIONS_MAX_LENGTH = 500
 UMAP_ENABLED = False
+PROCESS_POOL_NUM_PROCESSES = 1
+PROCESS_POOL_VERBS = [
+    "chunk",
+    "merge_graphs",
+    "cluster_graph",
+    "prepare_community_reports",
+]
 
 # Local Search
 LOCAL_SEARCH_TEXT_UNIT_PROP = 0.5
@@ -104,3 +122,5 @@ GLOBAL_SEARCH_DATA_MAX_TOKENS = 12_000
 GLOBAL_SEARCH_MAP_MAX_TOKENS = 1000
 GLOBAL_SEARCH_REDUCE_MAX_TOKENS = 2_000
 GLOBAL_SEARCH_CONCURRENCY = 32
+GLOBAL_SEARCH_EARLY_STOP = False
+GLOBAL_SEARCH_EARLY_STOP_MIN_SCORE = 50
@@ -92,6 +92,19 @@ class TextEmbeddingTarget(str, Enum):
         return f'"{self.value}"'
 
 
+class EmbeddingDType(str, Enum):
+    """The data type used to store embeddings."""
+
+    float32 = "float32"
+    float16 = "float16"
+    int8 = "int8"
+    """Unit-length embeddings scaled to the int8 range."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
 class LLMType(str, Enum):
     """LLMType enum class definition."""
 
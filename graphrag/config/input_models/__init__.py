@@ -17,6 +17,7 @@ from .llm_config_input import LLMConfigInput
 from .llm_parameters_input import LLMParametersInput
 from .local_search_config_input import LocalSearchConfigInput
 from .parallelization_parameters_input import ParallelizationParametersInput
+from .process_pool_config_input import ProcessPoolConfigInput
 from .reporting_config_input import ReportingConfigInput
 from .snapshots_config_input import SnapshotsConfigInput
 from .storage_config_input import StorageConfigInput
@@ -41,6 +42,7 @@ __all__ = [
     "LLMParametersInput",
     "LocalSearchConfigInput",
     "ParallelizationParametersInput",
+    "ProcessPoolConfigInput",
     "ReportingConfigInput",
     "SnapshotsConfigInput",
     "StorageConfigInput",
@@ -16,3 +16,5 @@ class CacheConfigInput(TypedDict):
     connection_string: NotRequired[str | None]
     container_name: NotRequired[str | None]
     storage_account_blob_url: NotRequired[str | None]
+    segmented: NotRequired[bool | str | None]
+    segment_size: NotRequired[int | str | None]
@@ -14,3 +14,5 @@ class GlobalSearchConfigInput(TypedDict):
     map_max_tokens: NotRequired[int | str | None]
     reduce_max_tokens: NotRequired[int | str | None]
     concurrency: NotRequired[int | str | None]
+    early_stop: NotRequired[bool | str | None]
+    early_stop_min_score: NotRequired[int | str | None]
@@ -16,6 +16,7 @@ from .global_search_config_input import GlobalSearchConfigInput
 from .input_config_input import InputConfigInput
 from .llm_config_input import LLMConfigInput
 from .local_search_config_input import LocalSearchConfigInput
+from .process_pool_config_input import ProcessPoolConfigInput
 from .reporting_config_input import ReportingConfigInput
 from .snapshots_config_input import SnapshotsConfigInput
 from .storage_config_input import StorageConfigInput
@@ -43,7 +44,10 @@ class GraphRagConfigInput(LLMConfigInput):
     claim_extraction: NotRequired[ClaimExtractionConfigInput | None]
     cluster_graph: NotRequired[ClusterGraphConfigInput | None]
     umap: NotRequired[UmapConfigInput | None]
+    process_pool: NotRequired[ProcessPoolConfigInput | None]
     encoding_model: NotRequired[str | None]
     skip_workflows: NotRequired[list[str] | str | None]
+    max_concurrent_workflows: NotRequired[int | str | None]
+    table_cache_max_mb: NotRequired[int | str | None]
     local_search: NotRequired[LocalSearchConfigInput | None]
     global_search: NotRequired[GlobalSearchConfigInput | None]
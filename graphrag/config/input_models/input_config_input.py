@@ -25,3 +25,4 @@ class InputConfigInput(TypedDict):
     title_column: NotRequired[str | None]
     document_attribute_columns: NotRequired[list[str] | str | None]
     storage_account_blob_url: NotRequired[str | None]
+    batch_size: NotRequired[int | str | None]
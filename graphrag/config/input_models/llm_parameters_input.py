@@ -28,4 +28,8 @@ class LLMParametersInput(TypedDict):
     max_retries: NotRequired[int | str | None]
     max_retry_wait: NotRequired[float | str | None]
     sleep_on_rate_limit_recommendation: NotRequired[bool | str | None]
+    adaptive_rate_limit: NotRequired[bool | str | None]
     concurrent_requests: NotRequired[int | str | None]
+    max_connections: NotRequired[int | str | None]
+    max_keepalive_connections: NotRequired[int | str | None]
+    keepalive_expiry: NotRequired[float | str | None]
@@ -0,0 +1,13 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from typing_extensions import NotRequired, TypedDict
+
+
+class ProcessPoolConfigInput(TypedDict):
+    """Configuration section for running CPU-bound verbs on worker processes."""
+
+    num_processes: NotRequired[int | str | None]
+    verbs: NotRequired[list[str] | str | None]
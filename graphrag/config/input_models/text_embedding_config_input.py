@@ -6,6 +6,7 @@
 from typing_extensions import NotRequired
 
 from graphrag.config.enums import (
+    EmbeddingDType,
     TextEmbeddingTarget,
 )
 
@@ -18,6 +19,7 @@ class TextEmbeddingConfigInput(LLMConfigInput):
     batch_size: NotRequired[int | str | None]
     batch_max_tokens: NotRequired[int | str | None]
     target: NotRequired[TextEmbeddingTarget | str | None]
+    dtype: NotRequired[EmbeddingDType | str | None]
     skip: NotRequired[list[str] | str | None]
     vector_store: NotRequired[dict | None]
     strategy: NotRequired[dict | None]
@@ -27,3 +27,11 @@ class CacheConfig(BaseModel):
     storage_account_blob_url: str | None = Field(
         description="The storage account blob url to use.", default=None
     )
+    segmented: bool = Field(
+        description="Whether to pack the cache entries into segment files instead of writing a file per entry.",
+        default=defs.CACHE_SEGMENTED,
+    )
+    segment_size: int = Field(
+        description="The number of entries written to each cache segment file.",
+        default=defs.CACHE_SEGMENT_SIZE,
+    )
@@ -43,3 +43,11 @@ class GlobalSearchConfig(BaseModel):
         description="The number of concurrent requests.",
         default=defs.GLOBAL_SEARCH_CONCURRENCY,
     )
+    early_stop: bool = Field(
+        description="Whether to map the highest ranked reports first and reduce once the data tokens are filled.",
+        default=defs.GLOBAL_SEARCH_EARLY_STOP,
+    )
+    early_stop_min_score: int = Field(
+        description="The minimum score of the key points counted towards the data tokens when stopping early.",
+        default=defs.GLOBAL_SEARCH_EARLY_STOP_MIN_SCORE,
+    )
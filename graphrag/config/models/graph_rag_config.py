@@ -19,6 +19,7 @@ from .global_search_config import GlobalSearchConfig
 from .input_config import InputConfig
 from .llm_config import LLMConfig
 from .local_search_config import LocalSearchConfig
+from .process_pool_config import ProcessPoolConfig
 from .reporting_config import ReportingConfig
 from .snapshots_config import SnapshotsConfig
 from .storage_config import StorageConfig
@@ -125,6 +126,12 @@ class GraphRagConfig(LLMConfig):
     )
     """The UMAP configuration to use."""
 
+    process_pool: ProcessPoolConfig = Field(
+        description="The process pool configuration to use.",
+        default=ProcessPoolConfig(),
+    )
+    """The process pool configuration to use."""
+
     local_search: LocalSearchConfig = Field(
         description="The local search configuration.", default=LocalSearchConfig()
     )
@@ -144,3 +151,15 @@ class GraphRagConfig(LLMConfig):
         description="The workflows to skip, usually for testing reasons.", default=[]
     )
     """The workflows to skip, usually for testing reasons."""
+
+    max_concurrent_workflows: int = Field(
+        description="The maximum number of independent workflows to run at the same time.",
+        default=defs.MAX_CONCURRENT_WORKFLOWS,
+    )
+    """The maximum number of independent workflows to run at the same time."""
+
+    table_cache_max_mb: int = Field(
+        description="The memory budget, in megabytes, for keeping workflow outputs in memory for downstream workflows.",
+        default=defs.TABLE_CACHE_MAX_MB,
+    )
+    """The memory budget, in megabytes, for keeping workflow outputs in memory for downstream workflows."""
@@ -58,3 +58,7 @@ class InputConfig(BaseModel):
     document_attribute_columns: list[str] = Field(
         description="The document attribute columns to use.", default=[]
     )
+    batch_size: int = Field(
+        description="The number of documents to chunk and extract at a time, 0 loads every document at once.",
+        default=defs.INPUT_BATCH_SIZE,
+    )
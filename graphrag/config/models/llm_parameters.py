@@ -81,7 +81,23 @@ class LLMParameters(BaseModel):
         description="Whether to sleep on rate limit recommendations.",
         default=defs.LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION,
     )
+    adaptive_rate_limit: bool = Field(
+        description="Whether to adapt the concurrency and rates to the rate limit feedback of the LLM service.",
+        default=defs.LLM_ADAPTIVE_RATE_LIMIT,
+    )
     concurrent_requests: int = Field(
         description="Whether to use concurrent requests for the LLM service.",
         default=defs.LLM_CONCURRENT_REQUESTS,
     )
+    max_connections: int = Field(
+        description="The maximum number of connections to the LLM service.",
+        default=defs.LLM_MAX_CONNECTIONS,
+    )
+    max_keepalive_connections: int = Field(
+        description="The maximum number of idle connections to keep open to the LLM service.",
+        default=defs.LLM_MAX_KEEPALIVE_CONNECTIONS,
+    )
+    keepalive_expiry: float = Field(
+        description="The number of seconds to keep an idle connection open.",
+        default=defs.LLM_KEEPALIVE_EXPIRY,
+    )
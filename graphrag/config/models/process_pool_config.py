@@ -0,0 +1,25 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+import graphrag.config.defaults as defs
+
+
+class ProcessPoolConfig(BaseModel):
+    """Configuration section for running CPU-bound verbs on worker processes."""
+
+    num_processes: int = Field(
+        description="The number of worker processes to run CPU-bound verbs on, 1 runs them in the pipeline process.",
+        default=defs.PROCESS_POOL_NUM_PROCESSES,
+    )
+    verbs: list[str] = Field(
+        description="The verbs to run on the worker processes.",
+        default=defs.PROCESS_POOL_VERBS,
+    )
+
+    def num_processes_for(self, verb: str) -> int:
+        """Get the number of worker processes a verb runs on."""
+        return self.num_processes if verb in self.verbs else 1
@@ -6,7 +6,7 @@
 from pydantic import Field
 
 import graphrag.config.defaults as defs
-from graphrag.config.enums import TextEmbeddingTarget
+from graphrag.config.enums import EmbeddingDType, TextEmbeddingTarget
 
 from .llm_config import LLMConfig
 
@@ -25,6 +25,10 @@ class TextEmbeddingConfig(LLMConfig):
         description="The target to use. 'all' or 'required'.",
         default=defs.EMBEDDING_TARGET,
     )
+    dtype: EmbeddingDType = Field(
+        description="The data type to store embeddings as.",
+        default=defs.EMBEDDING_DTYPE,
+    )
     skip: list[str] = Field(description="The specific embeddings to skip.", default=[])
     vector_store: dict | None = Field(
         description="The vector storage configuration", default=None
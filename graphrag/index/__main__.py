@@ -42,6 +42,13 @@ if __name__ == "__main__":
         default=None,
         type=str,
     )
+    parser.add_argument(
+        "--update",
+        help="Incrementally update a given data run with the new input documents. Only the new documents are chunked and extracted, and only the communities whose members changed are reported on again.",
+        required=False,
+        default=None,
+        type=str,
+    )
     parser.add_argument(
         "--reporter",
         help="The progress reporter to use. Valid values are 'rich', 'print', or 'none'",
@@ -72,6 +79,8 @@ if __name__ == "__main__":
 
     if args.overlay_defaults and not args.config:
         parser.error("--overlay-defaults requires --config")
+    if args.update and args.resume:
+        parser.error("--update cannot be combined with --resume")
 
     index_cli(
         root=args.root,
@@ -85,5 +94,6 @@ if __name__ == "__main__":
         dryrun=args.dryrun or False,
         init=args.init or False,
         overlay_defaults=args.overlay_defaults or False,
+        update=args.update,
         cli=True,
     )
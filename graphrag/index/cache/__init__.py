@@ -8,11 +8,13 @@ from .load_cache import load_cache
 from .memory_pipeline_cache import InMemoryCache
 from .noop_pipeline_cache import NoopPipelineCache
 from .pipeline_cache import PipelineCache
+from .segmented_pipeline_cache import SegmentedPipelineCache
 
 __all__ = [
     "InMemoryCache",
     "JsonPipelineCache",
     "NoopPipelineCache",
     "PipelineCache",
+    "SegmentedPipelineCache",
     "load_cache",
 ]
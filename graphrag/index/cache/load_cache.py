@@ -18,10 +18,14 @@ if TYPE_CHECKING:
     from graphrag.index.config import (
         PipelineCacheConfig,
     )
+    from graphrag.index.storage import PipelineStorage
+
+    from .pipeline_cache import PipelineCache
 
 from .json_pipeline_cache import JsonPipelineCache
 from .memory_pipeline_cache import create_memory_cache
 from .noop_pipeline_cache import NoopPipelineCache
+from .segmented_pipeline_cache import SegmentedPipelineCache
 
 
 def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
@@ -37,7 +41,7 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
         case CacheType.file:
             config = cast(PipelineFileCacheConfig, config)
             storage = FilePipelineStorage(root_dir).child(config.base_dir)
-            return JsonPipelineCache(storage)
+            return _create_storage_cache(storage, config)
         case CacheType.blob:
             config = cast(PipelineBlobCacheConfig, config)
             storage = BlobPipelineStorage(
@@ -45,7 +49,18 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
                 config.container_name,
                 storage_account_blob_url=config.storage_account_blob_url,
             ).child(config.base_dir)
-            return JsonPipelineCache(storage)
+            return _create_storage_cache(storage, config)
         case _:
             msg = f"Unknown cache type: {config.type}"
             raise ValueError(msg)
+
+
+def _create_storage_cache(
+    storage: PipelineStorage,
+    config: PipelineFileCacheConfig | PipelineBlobCacheConfig,
+) -> PipelineCache:
+    if config.segmented:
+        if config.segment_size:
+            return SegmentedPipelineCache(storage, segment_size=config.segment_size)
+        return SegmentedPipelineCache(storage)
+    return JsonPipelineCache(storage)
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABCMeta, abstractmethod
 from typing import Any
 
@@ -58,6 +59,38 @@ class PipelineCache(metaclass=ABCMeta):
     async def clear(self) -> None:
         """Clear the cache."""
 
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values for the given keys.
+
+        Args:
+            - keys - The keys to get the values for.
+
+        Returns
+        -------
+            - output - The value for each key, None for keys that are not in the cache.
+        """
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict[str, dict] | None = None
+    ) -> None:
+        """Set the values for the given keys.
+
+        Args:
+            - values - The value to set for each key.
+            - debug_data - The debug data to store with each key.
+        """
+        debug_data = debug_data or {}
+        await asyncio.gather(
+            *(
+                self.set(key, value, debug_data.get(key))
+                for key, value in values.items()
+            )
+        )
+
+    async def flush(self) -> None:  # noqa: B027
+        """Persist any writes the cache has buffered."""
+
     @abstractmethod
     def child(self, name: str) -> PipelineCache:
         """Create a child cache with the given name.
@@ -0,0 +1,302 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'SegmentedPipelineCache' model."""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from graphrag.index.storage import PipelineStorage
+
+from .pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+INDEX_NAME = "cache_index.json"
+SEGMENTS_DIR = "segments"
+_SEGMENT_PATTERN = re.compile(r".*\.jsonl$")
+
+
+class SegmentedPipelineCache(PipelineCache):
+    """Pipeline cache that packs entries into append-only segment files.
+
+    Entries are sharded by key and buffered in memory. When a shard's buffer is full
+    it is written as a new segment, a file of JSON lines that is never modified. An
+    index file maps every key to its segment, so a run loads it in one read and
+    answers has() and cache misses without touching the storage. Segments are read
+    on demand, and the most recently used ones are kept in memory.
+
+    The index is saved by flush(). Segments written after the last flush, by a run
+    that stopped early, are found and indexed the next time the cache is loaded.
+    """
+
+    _storage: PipelineStorage
+    _encoding: str
+
+    def __init__(
+        self,
+        storage: PipelineStorage,
+        encoding: str = "utf-8",
+        segment_size: int = 100,
+        num_shards: int = 16,
+        max_loaded_segments: int = 64,
+    ):
+        """Init method definition."""
+        self._storage = storage
+        self._encoding = encoding
+        self._segment_size = max(segment_size, 1)
+        self._num_shards = num_shards
+        self._max_loaded_segments = max_loaded_segments
+        self._children: dict[str, SegmentedPipelineCache] = {}
+        # the cache is shared by the threads of threaded verbs
+        self._lock = threading.Lock()
+        self._run_id = f"{time.time_ns():020d}"
+        self._reset()
+
+    def _reset(self) -> None:
+        self._index_loaded = False
+        self._index_changed = False
+        # all segments in the order they were written, later segments win
+        self._segments: list[str] = []
+        self._keys: dict[str, str] = {}
+        self._pending: list[dict[str, dict]] = [{} for _ in range(self._num_shards)]
+        self._loaded: OrderedDict[str, dict[str, dict]] = OrderedDict()
+        self._num_written = 0
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values for the given keys, reading each segment at most once."""
+        await self._load_index()
+        found: dict[str, dict] = {}
+        segment_keys: dict[str, list[str]] = {}
+        with self._lock:
+            for key in keys:
+                data = self._pending[self._shard(key)].get(key)
+                if data is not None:
+                    found[key] = data
+                elif key in self._keys:
+                    segment_keys.setdefault(self._keys[key], []).append(key)
+
+        segments = await asyncio.gather(
+            *(self._get_segment(name) for name in segment_keys)
+        )
+        for entries, segment in zip(segments, segment_keys.values(), strict=True):
+            found.update({key: entries[key] for key in segment if key in entries})
+
+        return [found[key].get("result") if key in found else None for key in keys]
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        await self.set_many({key: value}, {key: debug_data} if debug_data else None)
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict[str, dict] | None = None
+    ) -> None:
+        """Set the values for the given keys, writing a segment for every full shard."""
+        await self._load_index()
+        debug_data = debug_data or {}
+        segments = []
+        with self._lock:
+            for key, value in values.items():
+                if value is None:
+                    continue
+                shard = self._shard(key)
+                self._keys.pop(key, None)
+                self._pending[shard][key] = {
+                    "result": value,
+                    **(debug_data.get(key) or {}),
+                }
+                if len(self._pending[shard]) >= self._segment_size:
+                    segments.append(self._take_segment(shard))
+
+        for name, entries in segments:
+            await self._write_segment(name, entries)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        await self._load_index()
+        with self._lock:
+            return key in self._keys or key in self._pending[self._shard(key)]
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await self._load_index()
+        with self._lock:
+            if self._keys.pop(key, None) is not None:
+                self._index_changed = True
+            self._pending[self._shard(key)].pop(key, None)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await self._storage.clear()
+        self._reset_all()
+
+    def child(self, name: str) -> "SegmentedPipelineCache":
+        """Child method definition."""
+        with self._lock:
+            if name not in self._children:
+                self._children[name] = SegmentedPipelineCache(
+                    self._storage.child(name),
+                    encoding=self._encoding,
+                    segment_size=self._segment_size,
+                    num_shards=self._num_shards,
+                    max_loaded_segments=self._max_loaded_segments,
+                )
+            return self._children[name]
+
+    async def flush(self) -> None:
+        """Write the buffered entries as segments, then save the index."""
+        index = None
+        segments = []
+        with self._lock:
+            if self._index_loaded:
+                segments = [
+                    self._take_segment(shard)
+                    for shard in range(self._num_shards)
+                    if self._pending[shard]
+                ]
+            if self._index_changed:
+                index = self._create_index()
+                self._index_changed = False
+
+        for name, entries in segments:
+            await self._write_segment(name, entries)
+        if index is not None:
+            await self._storage.set(
+                INDEX_NAME,
+                json.dumps(index, ensure_ascii=False),
+                encoding=self._encoding,
+            )
+
+        for child in list(self._children.values()):
+            await child.flush()
+
+    def _reset_all(self) -> None:
+        with self._lock:
+            self._reset()
+            # clearing the storage removed the children's entries too
+            self._index_loaded = True
+        for child in list(self._children.values()):
+            child._reset_all()  # noqa: SLF001
+
+    def _shard(self, key: str) -> int:
+        return zlib.crc32(key.encode()) % self._num_shards
+
+    def _take_segment(self, shard: int) -> tuple[str, dict[str, dict]]:
+        """Move a shard's buffered entries to a new segment, must hold the lock."""
+        entries = self._pending[shard]
+        self._pending[shard] = {}
+        name = (
+            f"{SEGMENTS_DIR}/{shard:02x}/{self._run_id}-{self._num_written:06d}.jsonl"
+        )
+        self._num_written += 1
+        self._segments.append(name)
+        self._keys.update(dict.fromkeys(entries, name))
+        self._index_changed = True
+        self._cache_segment(name, entries)
+        return name, entries
+
+    def _create_index(self) -> dict[str, Any]:
+        """Create the index document, must hold the lock."""
+        keys: dict[str, list[str]] = {name: [] for name in self._segments}
+        for key, name in self._keys.items():
+            keys[name].append(key)
+        return {
+            "segments": [{"name": name, "keys": keys[name]} for name in self._segments]
+        }
+
+    async def _write_segment(self, name: str, entries: dict[str, dict]) -> None:
+        lines = [
+            json.dumps({"key": key, "data": data}, ensure_ascii=False)
+            for key, data in entries.items()
+        ]
+        await self._storage.set(name, "\n".join(lines) + "\n", encoding=self._encoding)
+
+    async def _get_segment(self, name: str) -> dict[str, dict]:
+        with self._lock:
+            entries = self._loaded.get(name)
+            if entries is not None:
+                self._loaded.move_to_end(name)
+                return entries
+
+        entries = await self._read_segment(name)
+        with self._lock:
+            self._cache_segment(name, entries)
+        return entries
+
+    def _cache_segment(self, name: str, entries: dict[str, dict]) -> None:
+        """Keep a segment's entries in memory, must hold the lock."""
+        self._loaded[name] = entries
+        self._loaded.move_to_end(name)
+        while len(self._loaded) > self._max_loaded_segments:
+            self._loaded.popitem(last=False)
+
+    async def _read_segment(self, name: str) -> dict[str, dict]:
+        entries: dict[str, dict] = {}
+        data = await self._storage.get(name, encoding=self._encoding)
+        if data is None:
+            log.warning("cache segment %s is missing", name)
+            return entries
+
+        for line in data.splitlines():
+            try:
+                record = json.loads(line)
+            except json.decoder.JSONDecodeError:
+                # the end of a segment that was being written when a run stopped
+                log.warning("skipping a corrupt entry in cache segment %s", name)
+            else:
+                entries[record["key"]] = record["data"]
+        return entries
+
+    async def _load_index(self) -> None:
+        if self._index_loaded:
+            return
+
+        segments: list[str] = []
+        keys: dict[str, str] = {}
+        if await self._storage.has(INDEX_NAME):
+            data = await self._storage.get(INDEX_NAME, encoding=self._encoding)
+            try:
+                index = json.loads(data)
+            except (TypeError, json.decoder.JSONDecodeError):
+                log.warning("cache index is corrupt, rebuilding it from the segments")
+                index = {}
+            for segment in index.get("segments", []):
+                segments.append(segment["name"])
+                keys.update(dict.fromkeys(segment["keys"], segment["name"]))
+
+        indexed = set(segments)
+        unindexed = sorted(
+            name
+            for name in (
+                Path(path).as_posix()
+                for path, _ in self._storage.find(
+                    _SEGMENT_PATTERN, base_dir=SEGMENTS_DIR
+                )
+            )
+            if name not in indexed
+        )
+        for name in unindexed:
+            log.info("indexing cache segment %s", name)
+            entries = await self._read_segment(name)
+            segments.append(name)
+            keys.update(dict.fromkeys(entries, name))
+
+        with self._lock:
+            if self._index_loaded:
+                return
+            self._segments = segments
+            self._keys = keys
+            self._index_changed = len(unindexed) > 0
+            self._index_loaded = True
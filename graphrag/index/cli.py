@@ -81,6 +81,7 @@ def index_cli(
     emit: str | None,
     dryrun: bool,
     overlay_defaults: bool,
+    update: str | None = None,
     cli: bool = False,
 ):
     """Run the pipeline with the given config."""
@@ -137,6 +138,7 @@ def index_cli(
                     else None
                 ),
                 is_resume_run=bool(resume),
+                update_from=update,
             ):
                 if output.errors and len(output.errors) > 0:
                     encountered_errors = True
@@ -32,6 +32,18 @@ class PipelineFileCacheConfig(PipelineCacheConfig[Literal[CacheType.file]]):
     )
     """The base directory for the cache."""
 
+    segmented: bool = pydantic_Field(
+        description="Whether to pack the cache entries into segment files.",
+        default=False,
+    )
+    """Whether to pack the cache entries into segment files."""
+
+    segment_size: int | None = pydantic_Field(
+        description="The number of entries written to each cache segment file.",
+        default=None,
+    )
+    """The number of entries written to each cache segment file."""
+
 
 class PipelineMemoryCacheConfig(PipelineCacheConfig[Literal[CacheType.memory]]):
     """Represent the memory cache configuration for the pipeline."""
@@ -73,6 +85,18 @@ class PipelineBlobCacheConfig(PipelineCacheConfig[Literal[CacheType.blob]]):
     )
     """The storage account blob url for cache"""
 
+    segmented: bool = pydantic_Field(
+        description="Whether to pack the cache entries into segment files.",
+        default=False,
+    )
+    """Whether to pack the cache entries into segment files."""
+
+    segment_size: int | None = pydantic_Field(
+        description="The number of entries written to each cache segment file.",
+        default=None,
+    )
+    """The number of entries written to each cache segment file."""
+
 
 PipelineCacheConfigTypes = (
     PipelineFileCacheConfig
@@ -70,6 +70,12 @@ class PipelineInputConfig(BaseModel, Generic[T]):
     )
     """The encoding for the input files."""
 
+    batch_size: int = pydantic_Field(
+        description="The number of documents to chunk and extract at a time, 0 loads every document at once.",
+        default=0,
+    )
+    """The number of documents to chunk and extract at a time, 0 loads every document at once."""
+
 
 class PipelineCSVInputConfig(PipelineInputConfig[Literal[InputFileType.csv]]):
     """Represent the configuration for a CSV input."""
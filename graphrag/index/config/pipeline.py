@@ -62,3 +62,15 @@ class PipelineConfig(BaseModel):
         description="The workflows for the pipeline.", default_factory=list
     )
     """The workflows for the pipeline."""
+
+    max_concurrent_workflows: int = pydantic_Field(
+        description="The maximum number of independent workflows to run at the same time.",
+        default=1,
+    )
+    """The maximum number of independent workflows to run at the same time."""
+
+    table_cache_max_mb: int = pydantic_Field(
+        description="The memory budget, in megabytes, for keeping workflow outputs in memory for downstream workflows.",
+        default=1024,
+    )
+    """The memory budget, in megabytes, for keeping workflow outputs in memory for downstream workflows."""
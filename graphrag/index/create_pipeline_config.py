@@ -126,6 +126,8 @@ def create_pipeline_config(settings: GraphRagConfig, verbose=False) -> PipelineC
         reporting=_get_reporting_config(settings),
         storage=_get_storage_config(settings),
         cache=_get_cache_config(settings),
+        max_concurrent_workflows=settings.max_concurrent_workflows,
+        table_cache_max_mb=settings.table_cache_max_mb,
         workflows=[
             *_document_workflows(settings, embedded_fields),
             *_text_unit_workflows(settings, covariates_enabled, embedded_fields),
@@ -222,6 +224,7 @@ def _text_unit_workflows(
             name=create_base_text_units,
             config={
                 "chunk_by": settings.chunks.group_by_columns,
+                "num_processes": settings.process_pool.num_processes_for("chunk"),
                 "text_chunk": {
                     "strategy": settings.chunks.resolved_strategy(
                         settings.encoding_model
@@ -266,7 +269,7 @@ def _get_embedding_settings(
 ) -> dict:
     vector_store_settings = settings.vector_store
     if vector_store_settings is None:
-        return {"strategy": settings.resolved_strategy()}
+        return {"strategy": settings.resolved_strategy(), "dtype": settings.dtype}
     #
     # If we get to this point, settings.vector_store is defined, and there's a specific setting for this embedding.
     # settings.vector_store.base contains connection information, or may be undefined
@@ -280,6 +283,7 @@ def _get_embedding_settings(
     return {
         "strategy": strategy,
         "embedding_name": embedding_name,
+        "dtype": settings.dtype,
     }
 
 
@@ -299,6 +303,9 @@ def _graph_workflows(
             config={
                 "graphml_snapshot": settings.snapshots.graphml,
                 "raw_entity_snapshot": settings.snapshots.raw_entities,
+                "num_processes": settings.process_pool.num_processes_for(
+                    "merge_graphs"
+                ),
                 "entity_extract": {
                     **settings.entity_extraction.parallelization.model_dump(),
                     "async_mode": settings.entity_extraction.async_mode,
@@ -327,6 +334,9 @@ def _graph_workflows(
             config={
                 "graphml_snapshot": settings.snapshots.graphml,
                 "embed_graph_enabled": settings.embed_graph.enabled,
+                "num_processes": settings.process_pool.num_processes_for(
+                    "cluster_graph"
+                ),
                 "cluster_graph": {
                     "strategy": settings.cluster_graph.resolved_strategy()
                 },
@@ -396,6 +406,9 @@ def _community_workflows(
             name=create_final_community_reports,
             config={
                 "covariates_enabled": covariates_enabled,
+                "num_processes": settings.process_pool.num_processes_for(
+                    "prepare_community_reports"
+                ),
                 "skip_title_embedding": skip_community_title_embedding,
                 "skip_summary_embedding": skip_community_summary_embedding,
                 "skip_full_content_embedding": skip_community_full_content_embedding,
@@ -469,6 +482,7 @@ def _get_pipeline_input_config(
                 connection_string=settings.input.connection_string,
                 storage_account_blob_url=settings.input.storage_account_blob_url,
                 container_name=settings.input.container_name,
+                batch_size=settings.input.batch_size,
             )
         case InputFileType.text:
             return PipelineTextInputConfig(
@@ -479,6 +493,7 @@ def _get_pipeline_input_config(
                 connection_string=settings.input.connection_string,
                 storage_account_blob_url=settings.input.storage_account_blob_url,
                 container_name=settings.input.container_name,
+                batch_size=settings.input.batch_size,
             )
         case _:
             msg = f"Unknown input type: {file_type}"
@@ -565,7 +580,11 @@ def _get_cache_config(
             return PipelineMemoryCacheConfig()
         case CacheType.file:
             # relative to root dir
-            return PipelineFileCacheConfig(base_dir=settings.cache.base_dir)
+            return PipelineFileCacheConfig(
+                base_dir=settings.cache.base_dir,
+                segmented=settings.cache.segmented,
+                segment_size=settings.cache.segment_size,
+            )
         case CacheType.none:
             return PipelineNoneCacheConfig()
         case CacheType.blob:
@@ -583,6 +602,8 @@ def _get_cache_config(
                 container_name=container_name,
                 base_dir=settings.cache.base_dir,
                 storage_account_blob_url=storage_account_blob_url,
+                segmented=settings.cache.segmented,
+                segment_size=settings.cache.segment_size,
             )
         case _:
             # relative to root dir
@@ -5,9 +5,11 @@
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import graphs_to_graphml
 
 from .table_emitter import TableEmitter
 
@@ -29,5 +31,24 @@ class CSVTableEmitter(TableEmitter):
         log.info("emitting CSV table %s", filename)
         await self._storage.set(
             filename,
-            data.to_csv(),
+            _arrays_to_lists(graphs_to_graphml(data)).to_csv(),
         )
+
+
+def _arrays_to_lists(data: pd.DataFrame) -> pd.DataFrame:
+    # numpy abbreviates the str() of long arrays, such as embeddings, with "..."
+    columns = [
+        column
+        for column in data.columns
+        if data[column].dtype == object
+        and any(isinstance(value, np.ndarray) for value in data[column])
+    ]
+    if len(columns) == 0:
+        return data
+
+    data = data.copy()
+    for column in columns:
+        data[column] = data[column].map(
+            lambda value: value.tolist() if isinstance(value, np.ndarray) else value
+        )
+    return data
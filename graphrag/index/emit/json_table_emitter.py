@@ -8,6 +8,7 @@ import logging
 import pandas as pd
 
 from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import graphs_to_graphml
 
 from .table_emitter import TableEmitter
 
@@ -30,5 +31,7 @@ class JsonTableEmitter(TableEmitter):
         log.info("emitting JSON table %s", filename)
         await self._storage.set(
             filename,
-            data.to_json(orient="records", lines=True, force_ascii=False),
+            graphs_to_graphml(data).to_json(
+                orient="records", lines=True, force_ascii=False
+            ),
         )
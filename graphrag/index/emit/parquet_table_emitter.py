@@ -3,10 +3,14 @@
 
 """ParquetTableEmitter module."""
 
+import io
 import logging
 import traceback
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pyarrow.lib import ArrowInvalid, ArrowTypeError
 
 from graphrag.index.storage import PipelineStorage
@@ -37,7 +41,7 @@ class ParquetTableEmitter(TableEmitter):
         filename = f"{name}.parquet"
         log.info("emitting parquet table %s", filename)
         try:
-            await self._storage.set(filename, data.to_parquet())
+            await self._storage.set(filename, _to_parquet(data))
         except ArrowTypeError as e:
             log.exception("Error while emitting parquet table")
             self._on_error(
@@ -52,3 +56,45 @@ class ParquetTableEmitter(TableEmitter):
                 traceback.format_exc(),
                 None,
             )
+
+
+def _to_parquet(data: pd.DataFrame) -> bytes:
+    """Write a dataframe as parquet, storing columns of equal-length arrays compactly."""
+    table = pa.Table.from_pandas(data)
+    for name, column in data.items():
+        if column.dtype == object:
+            array = _to_fixed_size_list(column)
+            if array is not None:
+                index = table.schema.get_field_index(str(name))
+                table = table.set_column(index, str(name), array)
+
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
+
+
+def _to_fixed_size_list(column: pd.Series) -> pa.FixedSizeListArray | None:
+    """Convert a column of numeric arrays of one size and dtype, like embeddings."""
+    values = column.to_numpy()
+    if len(values) == 0:
+        return None
+
+    first = values[0]
+    if (
+        not isinstance(first, np.ndarray)
+        or first.ndim != 1
+        or len(first) == 0
+        or first.dtype.kind not in "iuf"
+    ):
+        return None
+    for value in values:
+        # parquet can't store nulls in fixed size lists
+        if (
+            not isinstance(value, np.ndarray)
+            or value.shape != first.shape
+            or value.dtype != first.dtype
+        ):
+            return None
+    return pa.FixedSizeListArray.from_arrays(
+        pa.array(np.concatenate(values)), len(first)
+    )
@@ -50,3 +50,6 @@ RATING = "rank"
 EXPLANATION = "rating_explanation"
 FULL_CONTENT = "full_content"
 FULL_CONTENT_JSON = "full_content_json"
+
+# PREVIOUS COMMUNITY REPORT TABLE SCHEMA
+COMMUNITY_MEMBERS = "members"
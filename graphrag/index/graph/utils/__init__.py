@@ -3,7 +3,13 @@
 
 """The Indexing Engine graph utils package root."""
 
-from .normalize_node_names import normalize_node_names
+from .csr_graph import CSRGraph
+from .normalize_node_names import normalize_node_name, normalize_node_names
 from .stable_lcc import stable_largest_connected_component
 
-__all__ = ["normalize_node_names", "stable_largest_connected_component"]
+__all__ = [
+    "CSRGraph",
+    "normalize_node_name",
+    "normalize_node_names",
+    "stable_largest_connected_component",
+]
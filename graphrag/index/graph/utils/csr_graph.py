@@ -0,0 +1,170 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the CSRGraph class, an array-backed undirected graph."""
+
+import hashlib
+import json
+from typing import Any
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import coo_array
+from scipy.sparse.csgraph import connected_components
+
+from .normalize_node_names import normalize_node_name
+
+
+class CSRGraph:
+    """An undirected graph over integer node ids, with a CSR adjacency.
+
+    The node ids are the positions of the nodes in names. The edge table holds each
+    edge once, in the order the edges are given, which is the order their weights
+    are read in by Leiden.
+    """
+
+    def __init__(
+        self,
+        names: list[Any],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray,
+    ):
+        """Init method definition."""
+        self.names = names
+        self.sources = sources.astype(np.int64, copy=False)
+        self.targets = targets.astype(np.int64, copy=False)
+        self.weights = weights.astype(np.float64, copy=False)
+        num_nodes = len(names)
+        self.adjacency = coo_array(
+            (
+                np.ones(2 * len(sources), dtype=np.int8),
+                (
+                    np.concatenate([self.sources, self.targets]),
+                    np.concatenate([self.targets, self.sources]),
+                ),
+            ),
+            shape=(num_nodes, num_nodes),
+        ).tocsr()
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: nx.Graph,
+        weight_attribute: str = "weight",
+        weight_default: float = 1.0,
+    ) -> "CSRGraph":
+        """Read the nodes and edges of a networkx graph, in the order of the graph."""
+        if graph.is_directed() or graph.is_multigraph():
+            msg = "Only undirected non-multi-graph networkx graphs are supported"
+            raise ValueError(msg)
+        names = list(graph.nodes)
+        ids = {name: index for index, name in enumerate(names)}
+        edges = graph.edges(data=weight_attribute, default=weight_default)
+        num_edges = graph.number_of_edges()
+        sources = np.empty(num_edges, dtype=np.int64)
+        targets = np.empty(num_edges, dtype=np.int64)
+        weights = np.empty(num_edges, dtype=np.float64)
+        for index, (source, target, weight) in enumerate(edges):
+            sources[index] = ids[source]
+            targets[index] = ids[target]
+            weights[index] = float(weight)
+        return cls(names, sources, targets, weights)
+
+    @property
+    def num_nodes(self) -> int:
+        """Get the number of nodes."""
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        """Get the number of edges."""
+        return len(self.sources)
+
+    def fingerprint(self) -> str:
+        """Get a hash of the nodes and edges, the same graph read the same way has the same hash."""
+        digest = hashlib.sha256()
+        digest.update(json.dumps(self.names, default=str).encode("utf-8"))
+        for array in (self.sources, self.targets, self.weights):
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def edge_list(self) -> list[tuple[int, int, float]]:
+        """Get the edges as (source id, target id, weight) tuples."""
+        return list(
+            zip(
+                self.sources.tolist(),
+                self.targets.tolist(),
+                self.weights.tolist(),
+                strict=True,
+            )
+        )
+
+    def connected_components(self) -> list["CSRGraph"]:
+        """Get the connected components, numbered by their first node, with the nodes and edges of each in the order of this graph."""
+        if self.num_nodes == 0:
+            return []
+
+        num_components, labels = connected_components(self.adjacency, directed=False)
+        node_counts = np.bincount(labels, minlength=num_components)
+        node_order = np.argsort(labels, kind="stable")
+        node_starts = np.cumsum(node_counts) - node_counts
+        # the id of each node within its component
+        new_ids = np.empty(self.num_nodes, dtype=np.int64)
+        new_ids[node_order] = np.arange(self.num_nodes) - np.repeat(
+            node_starts, node_counts
+        )
+
+        edge_labels = labels[self.sources]
+        edge_counts = np.bincount(edge_labels, minlength=num_components)
+        edge_order = np.argsort(edge_labels, kind="stable")
+        return [
+            CSRGraph(
+                [self.names[node] for node in nodes.tolist()],
+                new_ids[self.sources[edges]],
+                new_ids[self.targets[edges]],
+                self.weights[edges],
+            )
+            for nodes, edges in zip(
+                np.split(node_order, np.cumsum(node_counts)[:-1]),
+                np.split(edge_order, np.cumsum(edge_counts)[:-1]),
+                strict=True,
+            )
+        ]
+
+    def stable_largest_connected_component(self) -> "CSRGraph":
+        """Get the largest connected component, with normalized node names and the nodes and edges sorted in a stable way.
+
+        The same as stable_largest_connected_component on the networkx graph: the
+        first of the largest components, the nodes whose normalized names collide
+        merged and the edges between them merged with the weight of the last one.
+        """
+        if self.num_nodes == 0:
+            return self
+
+        # the components are numbered by their first node, the first largest wins
+        _, labels = connected_components(self.adjacency, directed=False)
+        in_lcc = labels == np.argmax(np.bincount(labels))
+        lcc_nodes = np.flatnonzero(in_lcc)
+
+        normalized = np.array([
+            normalize_node_name(self.names[node]) for node in lcc_nodes
+        ])
+        names, node_ids = np.unique(normalized, return_inverse=True)
+        new_ids = np.full(self.num_nodes, -1, dtype=np.int64)
+        new_ids[lcc_nodes] = node_ids
+
+        in_lcc_edges = in_lcc[self.sources]
+        sources = new_ids[self.sources[in_lcc_edges]]
+        targets = new_ids[self.targets[in_lcc_edges]]
+        weights = self.weights[in_lcc_edges]
+        low = np.minimum(sources, targets)
+        high = np.maximum(sources, targets)
+
+        # an edge repeated by merged nodes keeps the weight of its last occurrence,
+        # the unique edges come out sorted by their source and target
+        edges, first_reversed = np.unique(
+            np.stack([low, high], axis=1)[::-1], axis=0, return_index=True
+        )
+        last = len(low) - 1 - first_reversed
+        return CSRGraph(names.tolist(), edges[:, 0], edges[:, 1], weights[last])
@@ -1,7 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing normalize_node_names method definition."""
+"""A module containing normalize_node_names and normalize_node_name methods definition."""
 
 import html
 
@@ -10,5 +10,10 @@ import networkx as nx
 
 def normalize_node_names(graph: nx.Graph | nx.DiGraph) -> nx.Graph | nx.DiGraph:
     """Normalize node names."""
-    node_mapping = {node: html.unescape(node.upper().strip()) for node in graph.nodes()}  # type: ignore
+    node_mapping = {node: normalize_node_name(node) for node in graph.nodes()}  # type: ignore
     return nx.relabel_nodes(graph, node_mapping)
+
+
+def normalize_node_name(name: str) -> str:
+    """Normalize a node name."""
+    return html.unescape(name.upper().strip())
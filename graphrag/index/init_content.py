@@ -23,7 +23,10 @@ llm:
   # max_retries: {defs.LLM_MAX_RETRIES}
   # max_retry_wait: {defs.LLM_MAX_RETRY_WAIT}
   # sleep_on_rate_limit_recommendation: true # whether to sleep when azure suggests wait-times
+  # adaptive_rate_limit: false # whether to adapt concurrency and rates to the rate limit headers
   # concurrent_requests: {defs.LLM_CONCURRENT_REQUESTS} # the number of parallel inflight requests that may be made
+  # max_connections: {defs.LLM_MAX_CONNECTIONS} # the size of the connection pool shared by every workflow
+  # keepalive_expiry: {defs.LLM_KEEPALIVE_EXPIRY} # the number of seconds to keep idle connections open
   # temperature: {defs.LLM_TEMPERATURE} # temperature for sampling
   # top_p: {defs.LLM_TOP_P} # top-p sampling
   # n: {defs.LLM_N} # Number of completions to generate
@@ -51,9 +54,13 @@ embeddings:
     # max_retries: {defs.LLM_MAX_RETRIES}
     # max_retry_wait: {defs.LLM_MAX_RETRY_WAIT}
     # sleep_on_rate_limit_recommendation: true # whether to sleep when azure suggests wait-times
+    # adaptive_rate_limit: false # whether to adapt concurrency and rates to the rate limit headers
     # concurrent_requests: {defs.LLM_CONCURRENT_REQUESTS} # the number of parallel inflight requests that may be made
+    # max_connections: {defs.LLM_MAX_CONNECTIONS} # the size of the connection pool shared by every workflow
+    # keepalive_expiry: {defs.LLM_KEEPALIVE_EXPIRY} # the number of seconds to keep idle connections open
     # batch_size: {defs.EMBEDDING_BATCH_SIZE} # the number of documents to send in a single request
     # batch_max_tokens: {defs.EMBEDDING_BATCH_MAX_TOKENS} # the maximum number of tokens to send in a single request
+    # dtype: {defs.EMBEDDING_DTYPE.value} # the data type to store embeddings as: float32, float16 or int8
     
   
 
@@ -75,6 +82,8 @@ cache:
   base_dir: "{defs.CACHE_BASE_DIR}"
   # connection_string: <azure_blob_storage_connection_string>
   # container_name: <azure_blob_storage_container_name>
+  # segmented: {str(defs.CACHE_SEGMENTED).lower()} # if true, packs the cache entries into segment files with an index
+  # segment_size: {defs.CACHE_SEGMENT_SIZE}
 
 storage:
   type: {defs.STORAGE_TYPE.value} # or blob
@@ -134,6 +143,10 @@ embed_graph:
 umap:
   enabled: false # if true, will generate UMAP embeddings for nodes
 
+process_pool:
+  num_processes: {defs.PROCESS_POOL_NUM_PROCESSES} # worker processes for CPU-bound verbs, 1 runs them in the pipeline process
+  # verbs: [{", ".join(defs.PROCESS_POOL_VERBS)}]
+
 snapshots:
   graphml: false
   raw_entities: false
@@ -159,6 +172,8 @@ global_search:
   # map_max_tokens: {defs.GLOBAL_SEARCH_MAP_MAX_TOKENS}
   # reduce_max_tokens: {defs.GLOBAL_SEARCH_REDUCE_MAX_TOKENS}
   # concurrency: {defs.GLOBAL_SEARCH_CONCURRENCY}
+  # early_stop: {defs.GLOBAL_SEARCH_EARLY_STOP}
+  # early_stop_min_score: {defs.GLOBAL_SEARCH_EARLY_STOP_MIN_SCORE}
 """
 
 INIT_DOTENV = """
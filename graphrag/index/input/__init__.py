@@ -3,6 +3,6 @@
 
 """The Indexing Engine input package root."""
 
-from .load_input import load_input
+from .load_input import load_input, stream_input
 
-__all__ = ["load_input"]
+__all__ = ["load_input", "stream_input"]
@@ -5,6 +5,7 @@
 
 import logging
 import re
+from collections.abc import AsyncIterator
 from io import BytesIO
 from typing import cast
 
@@ -28,14 +29,33 @@ async def load(
     storage: PipelineStorage,
 ) -> pd.DataFrame:
     """Load csv inputs from a directory."""
+    batches = [batch async for batch in load_batches(config, progress, storage)]
+    return batches[0]
+
+
+async def load_batches(
+    config: PipelineInputConfig,
+    progress: ProgressReporter | None,
+    storage: PipelineStorage,
+    batch_size: int | None = None,
+) -> AsyncIterator[pd.DataFrame]:
+    """Load csv inputs from a directory, batch_size rows at a time (all rows if None)."""
     csv_config = cast(PipelineCSVInputConfig, config)
     log.info("Loading csv files from %s", csv_config.base_dir)
 
-    async def load_file(path: str, group: dict | None) -> pd.DataFrame:
+    async def load_file(path: str, group: dict | None) -> AsyncIterator[pd.DataFrame]:
+        buffer = BytesIO(await storage.get(path, as_bytes=True))
+        encoding = config.encoding or "latin-1"
+        if batch_size is None:
+            yield process_rows(pd.read_csv(buffer, encoding=encoding), path, group)
+            return
+        with pd.read_csv(buffer, encoding=encoding, chunksize=batch_size) as reader:
+            for data in reader:
+                yield process_rows(data, path, group)
+
+    def process_rows(data: pd.DataFrame, path: str, group: dict | None) -> pd.DataFrame:
         if group is None:
             group = {}
-        buffer = BytesIO(await storage.get(path, as_bytes=True))
-        data = pd.read_csv(buffer, encoding=config.encoding or "latin-1")
         additional_keys = group.keys()
         if len(additional_keys) > 0:
             data[[*additional_keys]] = data.apply(
@@ -111,28 +131,48 @@ async def load(
         if config.file_pattern is not None
         else DEFAULT_FILE_PATTERN
     )
-    files = list(
-        storage.find(
-            file_pattern,
-            progress=progress,
-            file_filter=config.file_filter,
-        )
+    files = storage.find(
+        file_pattern,
+        progress=progress,
+        file_filter=config.file_filter,
     )
 
-    if len(files) == 0:
-        msg = f"No CSV files found in {config.base_dir}"
-        raise ValueError(msg)
-
+    num_files = 0
+    num_loaded = 0
+    num_rows = 0
     files_loaded = []
+    rows_loaded = 0
 
     for file, group in files:
+        num_files += 1
+        file_start = len(files_loaded)
         try:
-            files_loaded.append(await load_file(file, group))
+            async for data in load_file(file, group):
+                files_loaded.append(data)
+                rows_loaded += len(data)
+                if batch_size is not None and rows_loaded >= batch_size:
+                    rows = pd.concat(files_loaded)
+                    yield rows.iloc[:batch_size]
+                    num_rows += batch_size
+                    # the rest of the rows come from the current file
+                    files_loaded = [rows.iloc[batch_size:]]
+                    rows_loaded -= batch_size
+                    file_start = 0
+            num_loaded += 1
         except Exception:  # noqa: BLE001 (catching Exception is fine here)
             log.warning("Warning! Error loading csv file %s. Skipping...", file)
+            # rows of the file that were already yielded in a batch can't be skipped
+            del files_loaded[file_start:]
+            rows_loaded = sum(len(data) for data in files_loaded)
+
+    if num_files == 0:
+        msg = f"No CSV files found in {config.base_dir}"
+        raise ValueError(msg)
 
-    log.info("Found %d csv files, loading %d", len(files), len(files_loaded))
-    result = pd.concat(files_loaded)
-    total_files_log = f"Total number of unfiltered csv rows: {len(result)}"
+    log.info("Found %d csv files, loading %d", num_files, num_loaded)
+    if rows_loaded > 0 or num_rows == 0:
+        result = pd.concat(files_loaded)
+        num_rows += len(result)
+        yield result
+    total_files_log = f"Total number of unfiltered csv rows: {num_rows}"
     log.info(total_files_log)
-    return result
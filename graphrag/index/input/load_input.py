@@ -4,7 +4,7 @@
 """A module containing load_input method definition."""
 
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 from typing import cast
 
@@ -16,18 +16,25 @@ from graphrag.index.progress import NullProgressReporter, ProgressReporter
 from graphrag.index.storage import (
     BlobPipelineStorage,
     FilePipelineStorage,
+    PipelineStorage,
 )
 
 from .csv import input_type as csv
 from .csv import load as load_csv
+from .csv import load_batches as load_csv_batches
 from .text import input_type as text
 from .text import load as load_text
+from .text import load_batches as load_text_batches
 
 log = logging.getLogger(__name__)
 loaders: dict[str, Callable[..., Awaitable[pd.DataFrame]]] = {
     text: load_text,
     csv: load_csv,
 }
+batch_loaders: dict[str, Callable[..., AsyncIterator[pd.DataFrame]]] = {
+    text: load_text_batches,
+    csv: load_csv_batches,
+}
 
 
 async def load_input(
@@ -44,6 +51,53 @@ async def load_input(
         msg = "No input specified!"
         raise ValueError(msg)
 
+    storage = _create_input_storage(config, root_dir)
+
+    if config.file_type in loaders:
+        progress = progress_reporter.child(
+            f"Loading Input ({config.file_type})", transient=False
+        )
+        loader = loaders[config.file_type]
+        results = await loader(config, progress, storage)
+        return cast(pd.DataFrame, results)
+
+    msg = f"Unknown input type {config.file_type}"
+    raise ValueError(msg)
+
+
+async def stream_input(
+    config: PipelineInputConfig | InputConfig,
+    batch_size: int,
+    progress_reporter: ProgressReporter | None = None,
+    root_dir: str | None = None,
+) -> AsyncIterator[pd.DataFrame]:
+    """Load the input data for a pipeline lazily, in batches of at most batch_size documents."""
+    root_dir = root_dir or ""
+    log.info("streaming input from root_dir=%s", config.base_dir)
+    progress_reporter = progress_reporter or NullProgressReporter()
+
+    if config is None:
+        msg = "No input specified!"
+        raise ValueError(msg)
+
+    storage = _create_input_storage(config, root_dir)
+
+    if config.file_type in batch_loaders:
+        progress = progress_reporter.child(
+            f"Loading Input ({config.file_type})", transient=False
+        )
+        loader = batch_loaders[config.file_type]
+        async for batch in loader(config, progress, storage, batch_size):
+            yield batch
+        return
+
+    msg = f"Unknown input type {config.file_type}"
+    raise ValueError(msg)
+
+
+def _create_input_storage(
+    config: PipelineInputConfig | InputConfig, root_dir: str
+) -> PipelineStorage:
     match config.type:
         case InputType.blob:
             log.info("using blob storage input")
@@ -73,13 +127,4 @@ async def load_input(
                 root_dir=str(Path(root_dir) / (config.base_dir or ""))
             )
 
-    if config.file_type in loaders:
-        progress = progress_reporter.child(
-            f"Loading Input ({config.file_type})", transient=False
-        )
-        loader = loaders[config.file_type]
-        results = await loader(config, progress, storage)
-        return cast(pd.DataFrame, results)
-
-    msg = f"Unknown input type {config.file_type}"
-    raise ValueError(msg)
+    return storage
@@ -5,6 +5,7 @@
 
 import logging
 import re
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +29,17 @@ async def load(
     storage: PipelineStorage,
 ) -> pd.DataFrame:
     """Load text inputs from a directory."""
+    batches = [batch async for batch in load_batches(config, progress, storage)]
+    return batches[0] if len(batches) > 0 else pd.DataFrame()
+
+
+async def load_batches(
+    config: PipelineInputConfig,
+    progress: ProgressReporter | None,
+    storage: PipelineStorage,
+    batch_size: int | None = None,
+) -> AsyncIterator[pd.DataFrame]:
+    """Load text inputs from a directory, batch_size files at a time (all files if None)."""
 
     async def load_file(
         path: str, group: dict | None = None, _encoding: str = "utf-8"
@@ -40,27 +52,33 @@ async def load(
         new_item["title"] = str(Path(path).name)
         return new_item
 
-    files = list(
-        storage.find(
-            re.compile(config.file_pattern),
-            progress=progress,
-            file_filter=config.file_filter,
-        )
+    files = storage.find(
+        re.compile(config.file_pattern),
+        progress=progress,
+        file_filter=config.file_filter,
     )
-    if len(files) == 0:
-        msg = f"No text files found in {config.base_dir}"
-        raise ValueError(msg)
-    found_files = f"found text files from {config.base_dir}, found {files}"
-    log.info(found_files)
 
+    num_files = 0
+    num_loaded = 0
     files_loaded = []
 
     for file, group in files:
+        num_files += 1
         try:
             files_loaded.append(await load_file(file, group))
         except Exception:  # noqa: BLE001 (catching Exception is fine here)
             log.warning("Warning! Error loading file %s. Skipping...", file)
+            continue
+
+        num_loaded += 1
+        if batch_size is not None and len(files_loaded) >= batch_size:
+            yield pd.DataFrame(files_loaded)
+            files_loaded = []
 
-    log.info("Found %d files, loading %d", len(files), len(files_loaded))
+    if num_files == 0:
+        msg = f"No text files found in {config.base_dir}"
+        raise ValueError(msg)
 
-    return pd.DataFrame(files_loaded)
+    log.info("Found %d files, loading %d", num_files, num_loaded)
+    if len(files_loaded) > 0 or num_loaded == 0:
+        yield pd.DataFrame(files_loaded)
@@ -6,17 +6,36 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from graphrag.config.enums import LLMType
+from graphrag.index.telemetry import (
+    LLM_CACHE_HIT,
+    LLM_CACHE_MISS,
+    LLM_INPUT_TOKENS,
+    LLM_LATENCY,
+    LLM_LIMITER_WAIT,
+    LLM_OUTPUT_TOKENS,
+    LLM_RETRIES,
+    LLM_SEMAPHORE_WAIT,
+    llm_measure_name,
+)
 from graphrag.llm import (
     CompletionLLM,
     EmbeddingLLM,
     LLMCache,
+    LLMInvocationFn,
+    LLMInvocationResult,
     LLMLimiter,
     MockCompletionLLM,
+    OnCacheActionFn,
     OpenAIConfiguration,
+    create_adaptive_limiter,
     create_openai_chat_llm,
     create_openai_client,
     create_openai_completion_llm,
@@ -32,9 +51,26 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+
+@dataclass
+class _LLMHandlers:
+    """The handlers reporting the errors and measurements of an LLM to its verb."""
+
+    on_error: ErrorHandlerFn
+    on_invoke: LLMInvocationFn
+    on_cache_hit: OnCacheActionFn
+    on_cache_miss: OnCacheActionFn
+
+
 _semaphores: dict[str, asyncio.Semaphore] = {}
 _rate_limiters: dict[str, LLMLimiter] = {}
 
+# the most recently loaded LLMs, by the name, type, config, cache and callbacks they
+# were loaded with, along with the cache and callbacks so their ids aren't reused
+MAX_LOADED_LLMS = 64
+_loaded_llms: OrderedDict[tuple, tuple[Any, Any, Any]] = OrderedDict()
+_loaded_llms_lock = threading.Lock()
+
 
 def load_llm(
     name: str,
@@ -44,18 +80,16 @@ def load_llm(
     llm_config: dict[str, Any] | None = None,
     chat_only=False,
 ) -> CompletionLLM:
-    """Load the LLM for the entity extraction chain."""
-    on_error = _create_error_handler(callbacks)
+    """Load the LLM for the entity extraction chain.
 
+    Strategies load their LLM for every row, the rows of a verb share one LLM.
+    """
     if llm_type in loaders:
         if chat_only and not loaders[llm_type]["chat"]:
             msg = f"LLM type {llm_type} does not support chat"
             raise ValueError(msg)
-        if cache is not None:
-            cache = cache.child(name)
 
-        loader = loaders[llm_type]
-        return loader["load"](on_error, cache, llm_config or {})
+        return _get_or_load_llm(name, llm_type, callbacks, cache, llm_config)
 
     msg = f"Unknown LLM type {llm_type}"
     raise ValueError(msg)
@@ -69,21 +103,53 @@ def load_llm_embeddings(
     llm_config: dict[str, Any] | None = None,
     chat_only=False,
 ) -> EmbeddingLLM:
-    """Load the LLM for the entity extraction chain."""
-    on_error = _create_error_handler(callbacks)
+    """Load the LLM for the entity extraction chain.
+
+    Strategies load their LLM for every row, the rows of a verb share one LLM.
+    """
     if llm_type in loaders:
         if chat_only and not loaders[llm_type]["chat"]:
             msg = f"LLM type {llm_type} does not support chat"
             raise ValueError(msg)
-        if cache is not None:
-            cache = cache.child(name)
 
-        return loaders[llm_type]["load"](on_error, cache, llm_config or {})
+        return _get_or_load_llm(name, llm_type, callbacks, cache, llm_config)
 
     msg = f"Unknown LLM type {llm_type}"
     raise ValueError(msg)
 
 
+def _get_or_load_llm(
+    name: str,
+    llm_type: LLMType,
+    callbacks: VerbCallbacks,
+    cache: PipelineCache | None,
+    llm_config: dict[str, Any] | None,
+) -> Any:
+    key = (
+        name,
+        llm_type,
+        json.dumps(llm_config, sort_keys=True, default=str),
+        id(cache),
+        id(callbacks),
+    )
+    with _loaded_llms_lock:
+        loaded = _loaded_llms.get(key)
+        if loaded is not None:
+            _loaded_llms.move_to_end(key)
+            return loaded[0]
+
+    llm = loaders[llm_type]["load"](
+        _create_handlers(name, callbacks),
+        cache.child(name) if cache is not None else None,
+        llm_config or {},
+    )
+    with _loaded_llms_lock:
+        _loaded_llms[key] = (llm, cache, callbacks)
+        while len(_loaded_llms) > MAX_LOADED_LLMS:
+            _loaded_llms.popitem(last=False)
+    return llm
+
+
 def _create_error_handler(callbacks: VerbCallbacks) -> ErrorHandlerFn:
     def on_error(
         error: BaseException | None = None,
@@ -95,8 +161,28 @@ def _create_error_handler(callbacks: VerbCallbacks) -> ErrorHandlerFn:
     return on_error
 
 
+def _create_handlers(name: str, callbacks: VerbCallbacks) -> _LLMHandlers:
+    def measure(metric: str, value: float) -> None:
+        callbacks.measure(llm_measure_name(name, metric), value)
+
+    def on_invoke(result: LLMInvocationResult) -> None:
+        measure(LLM_LATENCY, result.total_time)
+        measure(LLM_RETRIES, result.num_retries)
+        measure(LLM_INPUT_TOKENS, max(result.input_tokens, 0))
+        measure(LLM_OUTPUT_TOKENS, result.output_tokens)
+        measure(LLM_SEMAPHORE_WAIT, result.semaphore_wait_time)
+        measure(LLM_LIMITER_WAIT, result.limiter_wait_time)
+
+    return _LLMHandlers(
+        on_error=_create_error_handler(callbacks),
+        on_invoke=on_invoke,
+        on_cache_hit=lambda _key, _name: measure(LLM_CACHE_HIT, 1),
+        on_cache_miss=lambda _key, _name: measure(LLM_CACHE_MISS, 1),
+    )
+
+
 def _load_openai_completion_llm(
-    on_error: ErrorHandlerFn,
+    handlers: _LLMHandlers,
     cache: LLMCache,
     config: dict[str, Any],
     azure=False,
@@ -113,14 +199,14 @@ def _load_openai_completion_llm(
             "max_tokens": config.get("max_tokens", 4000),
             "n": config.get("n"),
         }),
-        on_error,
+        handlers,
         cache,
         azure,
     )
 
 
 def _load_openai_chat_llm(
-    on_error: ErrorHandlerFn,
+    handlers: _LLMHandlers,
     cache: LLMCache,
     config: dict[str, Any],
     azure=False,
@@ -138,14 +224,14 @@ def _load_openai_chat_llm(
             "max_tokens": config.get("max_tokens"),
             "n": config.get("n"),
         }),
-        on_error,
+        handlers,
         cache,
         azure,
     )
 
 
 def _load_openai_embeddings_llm(
-    on_error: ErrorHandlerFn,
+    handlers: _LLMHandlers,
     cache: LLMCache,
     config: dict[str, Any],
     azure=False,
@@ -159,28 +245,28 @@ def _load_openai_embeddings_llm(
             ),
             "deployment_name": config.get("deployment_name"),
         }),
-        on_error,
+        handlers,
         cache,
         azure,
     )
 
 
 def _load_azure_openai_completion_llm(
-    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any]
+    handlers: _LLMHandlers, cache: LLMCache, config: dict[str, Any]
 ):
-    return _load_openai_completion_llm(on_error, cache, config, True)
+    return _load_openai_completion_llm(handlers, cache, config, True)
 
 
 def _load_azure_openai_chat_llm(
-    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any]
+    handlers: _LLMHandlers, cache: LLMCache, config: dict[str, Any]
 ):
-    return _load_openai_chat_llm(on_error, cache, config, True)
+    return _load_openai_chat_llm(handlers, cache, config, True)
 
 
 def _load_azure_openai_embeddings_llm(
-    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any]
+    handlers: _LLMHandlers, cache: LLMCache, config: dict[str, Any]
 ):
-    return _load_openai_embeddings_llm(on_error, cache, config, True)
+    return _load_openai_embeddings_llm(handlers, cache, config, True)
 
 
 def _get_base_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -205,7 +291,7 @@ def _get_base_config(config: dict[str, Any]) -> dict[str, Any]:
 
 
 def _load_static_response(
-    _on_error: ErrorHandlerFn, _cache: PipelineCache, config: dict[str, Any]
+    _handlers: _LLMHandlers, _cache: PipelineCache, config: dict[str, Any]
 ) -> CompletionLLM:
     return MockCompletionLLM(config.get("responses", []))
 
@@ -244,7 +330,7 @@ loaders = {
 
 def _create_openai_chat_llm(
     configuration: OpenAIConfiguration,
-    on_error: ErrorHandlerFn,
+    handlers: _LLMHandlers,
     cache: LLMCache,
     azure=False,
 ) -> CompletionLLM:
@@ -253,13 +339,21 @@ def _create_openai_chat_llm(
     limiter = _create_limiter(configuration)
     semaphore = _create_semaphore(configuration)
     return create_openai_chat_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_invoke=handlers.on_invoke,
+        on_error=handlers.on_error,
+        on_cache_hit=handlers.on_cache_hit,
+        on_cache_miss=handlers.on_cache_miss,
     )
 
 
 def _create_openai_completion_llm(
     configuration: OpenAIConfiguration,
-    on_error: ErrorHandlerFn,
+    handlers: _LLMHandlers,
     cache: LLMCache,
     azure=False,
 ) -> CompletionLLM:
@@ -268,13 +362,21 @@ def _create_openai_completion_llm(
     limiter = _create_limiter(configuration)
     semaphore = _create_semaphore(configuration)
     return create_openai_completion_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_invoke=handlers.on_invoke,
+        on_error=handlers.on_error,
+        on_cache_hit=handlers.on_cache_hit,
+        on_cache_miss=handlers.on_cache_miss,
     )
 
 
 def _create_openai_embeddings_llm(
     configuration: OpenAIConfiguration,
-    on_error: ErrorHandlerFn,
+    handlers: _LLMHandlers,
     cache: LLMCache,
     azure=False,
 ) -> EmbeddingLLM:
@@ -283,17 +385,44 @@ def _create_openai_embeddings_llm(
     limiter = _create_limiter(configuration)
     semaphore = _create_semaphore(configuration)
     return create_openai_embedding_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_invoke=handlers.on_invoke,
+        on_error=handlers.on_error,
+        on_cache_hit=handlers.on_cache_hit,
+        on_cache_miss=handlers.on_cache_miss,
     )
 
 
 def _create_limiter(configuration: OpenAIConfiguration) -> LLMLimiter:
     limit_name = configuration.model or configuration.deployment_name or "default"
+    if configuration.adaptive_rate_limit:
+        # every workflow calling the model shares the budgets of the adaptive limiter
+        limit_name = f"{limit_name} (adaptive)"
     if limit_name not in _rate_limiters:
         tpm = configuration.tokens_per_minute
         rpm = configuration.requests_per_minute
-        log.info("create TPM/RPM limiter for %s: TPM=%s, RPM=%s", limit_name, tpm, rpm)
-        _rate_limiters[limit_name] = create_tpm_rpm_limiters(configuration)
+        if configuration.adaptive_rate_limit:
+            log.info(
+                "create adaptive limiter for %s: TPM=%s, RPM=%s, concurrency=%s",
+                limit_name,
+                tpm,
+                rpm,
+                configuration.concurrent_requests,
+            )
+            _rate_limiters[limit_name] = create_adaptive_limiter(
+                configuration,
+                configuration.concurrent_requests,
+                configuration.max_connections,
+            )
+        else:
+            log.info(
+                "create TPM/RPM limiter for %s: TPM=%s, RPM=%s", limit_name, tpm, rpm
+            )
+            _rate_limiters[limit_name] = create_tpm_rpm_limiters(configuration)
     return _rate_limiters[limit_name]
 
 
@@ -301,8 +430,8 @@ def _create_semaphore(configuration: OpenAIConfiguration) -> asyncio.Semaphore |
     limit_name = configuration.model or configuration.deployment_name or "default"
     concurrency = configuration.concurrent_requests
 
-    # bypass the semaphore if concurrency is zero
-    if not concurrency:
+    # bypass the semaphore if concurrency is zero, or the limiter adapts it
+    if not concurrency or configuration.adaptive_rate_limit:
         log.info("no concurrency limiter for %s", limit_name)
         return None
 
@@ -8,7 +8,8 @@ import json
 import logging
 import time
 import traceback
-from collections.abc import AsyncIterable
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator
 from dataclasses import asdict
 from io import BytesIO
 from pathlib import Path
@@ -44,7 +45,7 @@ from .config import (
 )
 from .context import PipelineRunContext, PipelineRunStats
 from .emit import TableEmitterType, create_table_emitters
-from .input import load_input
+from .input import load_input, stream_input
 from .load_pipeline_config import load_pipeline_config
 from .progress import NullProgressReporter, ProgressReporter
 from .reporting import (
@@ -53,15 +54,21 @@ from .reporting import (
     load_pipeline_reporter,
 )
 from .storage import MemoryPipelineStorage, PipelineStorage, load_storage
+from .telemetry import MetricsExporter, MetricsWorkflowCallbacks, PipelineMetrics
 from .typing import PipelineRunResult
+from .update import DOCUMENTS_TABLE, index_in_batches, update_from_previous_run
+from .utils import TableCache
 
 # Register all verbs
 from .verbs import *  # noqa
+from .verbs.graph.report import PREVIOUS_REPORTS_TABLE
 from .workflows import (
     VerbDefinitions,
     WorkflowDefinitions,
+    WorkflowToRun,
     create_workflow,
     load_workflows,
+    schedule_workflows,
 )
 
 log = logging.getLogger(__name__)
@@ -70,7 +77,7 @@ log = logging.getLogger(__name__)
 async def run_pipeline_with_config(
     config_or_path: PipelineConfig | str,
     workflows: list[PipelineWorkflowReference] | None = None,
-    dataset: pd.DataFrame | None = None,
+    dataset: pd.DataFrame | AsyncIterable[pd.DataFrame] | None = None,
     storage: PipelineStorage | None = None,
     cache: PipelineCache | None = None,
     callbacks: WorkflowCallbacks | None = None,
@@ -82,6 +89,9 @@ async def run_pipeline_with_config(
     memory_profile: bool = False,
     run_id: str | None = None,
     is_resume_run: bool = False,
+    max_concurrent_workflows: int | None = None,
+    update_from: str | None = None,
+    metrics_exporters: list[MetricsExporter] | None = None,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run a pipeline with the given config.
@@ -89,7 +99,7 @@ async def run_pipeline_with_config(
     Args:
         - config_or_path - The config to run the pipeline with
         - workflows - The workflows to run (this overrides the config)
-        - dataset - The dataset to run the pipeline on (this overrides the config)
+        - dataset - The dataset, or batches of the dataset, to run the pipeline on (this overrides the config)
         - storage - The storage to use for the pipeline (this overrides the config)
         - cache - The cache to use for the pipeline (this overrides the config)
         - reporter - The reporter to use for the pipeline (this overrides the config)
@@ -99,6 +109,9 @@ async def run_pipeline_with_config(
         - emit - The table emitters to use for the pipeline.
         - memory_profile - Whether or not to profile the memory.
         - run_id - The run id to start or resume from.
+        - max_concurrent_workflows - The maximum number of independent workflows to run at the same time (this overrides the config)
+        - update_from - The run id of a previous run to incrementally update with the new input documents.
+        - metrics_exporters - The exporters to hand the performance measurements of the run to, as well as metrics.json.
     """
     if isinstance(config_or_path, str):
         log.info("Running pipeline with config %s", config_or_path)
@@ -107,6 +120,11 @@ async def run_pipeline_with_config(
 
     run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
     config = load_pipeline_config(config_or_path)
+    previous_config = (
+        _apply_substitutions(config.model_copy(deep=True), update_from)
+        if update_from
+        else None
+    )
     config = _apply_substitutions(config, run_id)
     root_dir = config.root_dir
 
@@ -126,9 +144,17 @@ async def run_pipeline_with_config(
 
     async def _create_input(
         config: PipelineInputConfigTypes | None,
-    ) -> pd.DataFrame | None:
+    ) -> pd.DataFrame | AsyncIterable[pd.DataFrame] | None:
         if config is None:
             return None
+        if config.batch_size > 0:
+            if not update_from:
+                return stream_input(
+                    config, config.batch_size, progress_reporter, root_dir
+                )
+            log.warning(
+                "incremental updates need every input document, loading the input at once"
+            )
 
         return await load_input(config, progress_reporter, root_dir)
 
@@ -146,6 +172,9 @@ async def run_pipeline_with_config(
         config.input
     )
     workflows = workflows or config.workflows
+    previous_storage = (
+        _create_storage(previous_config.storage) if previous_config else None
+    )
 
     if dataset is None:
         msg = "No dataset provided!"
@@ -164,13 +193,18 @@ async def run_pipeline_with_config(
         progress_reporter=progress_reporter,
         emit=emit,
         is_resume_run=is_resume_run,
+        max_concurrent_workflows=max_concurrent_workflows
+        or config.max_concurrent_workflows,
+        table_cache_max_mb=config.table_cache_max_mb,
+        previous_storage=previous_storage,
+        metrics_exporters=metrics_exporters,
     ):
         yield table
 
 
 async def run_pipeline(
     workflows: list[PipelineWorkflowReference],
-    dataset: pd.DataFrame,
+    dataset: pd.DataFrame | AsyncIterable[pd.DataFrame],
     storage: PipelineStorage | None = None,
     cache: PipelineCache | None = None,
     callbacks: WorkflowCallbacks | None = None,
@@ -181,6 +215,10 @@ async def run_pipeline(
     emit: list[TableEmitterType] | None = None,
     memory_profile: bool = False,
     is_resume_run: bool = False,
+    max_concurrent_workflows: int = 1,
+    table_cache_max_mb: int = 1024,
+    previous_storage: PipelineStorage | None = None,
+    metrics_exporters: list[MetricsExporter] | None = None,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run the pipeline.
@@ -192,6 +230,7 @@ async def run_pipeline(
             - text - The text of the document
             - title - The title of the document
             These must exist after any post process steps are run if there are any!
+          Or an async iterable of batches of documents, which are chunked and extracted one batch at a time before the remaining workflows run on the merged results
         - storage - The storage to use for the pipeline
         - cache - The cache to use for the pipeline
         - reporter - The reporter to use for the pipeline
@@ -199,11 +238,16 @@ async def run_pipeline(
         - additional_verbs - The custom verbs to use for the pipeline
         - additional_workflows - The custom workflows to use for the pipeline
         - debug - Whether or not to run in debug mode
+        - max_concurrent_workflows - The maximum number of workflows to run at the same time, each starting once its dependencies are emitted
+        - table_cache_max_mb - The memory budget for handing workflow outputs to downstream workflows without reading them back from storage, 0 disables it
+        - previous_storage - The storage of a previous run to incrementally update, only the documents that are new since that run are chunked and extracted
+        - metrics_exporters - The exporters to hand the performance measurements of the run to, they are written to metrics.json next to stats.json as well
     Returns:
         - output - An iterable of workflow results as they complete running, as well as any errors that occur
     """
     start_time = time.time()
     stats = PipelineRunStats()
+    metrics = PipelineMetrics(metrics_exporters)
     storage = storage or MemoryPipelineStorage()
     cache = cache or InMemoryCache()
     progress_reporter = progress_reporter or NullProgressReporter()
@@ -227,6 +271,9 @@ async def run_pipeline(
     workflow_dependencies = loaded_workflows.dependencies
 
     context = _create_run_context(storage, cache, stats)
+    table_cache = TableCache(table_cache_max_mb * 1024 * 1024)
+    # the number of workflows still waiting to read each workflow's output
+    pending_reads: Counter[str] = Counter()
 
     if len(emitters) == 0:
         log.info(
@@ -237,6 +284,10 @@ async def run_pipeline(
         await storage.set(
             "stats.json", json.dumps(asdict(stats), indent=4, ensure_ascii=False)
         )
+        await storage.set(
+            "metrics.json",
+            json.dumps(metrics.export(), indent=4, ensure_ascii=False),
+        )
 
     async def load_table_from_storage(name: str) -> pd.DataFrame:
         if not await storage.has(name):
@@ -249,15 +300,28 @@ async def run_pipeline(
             log.exception("error loading table from storage: %s", name)
             raise
 
+    async def load_documents() -> pd.DataFrame:
+        if document_batches is None:
+            return cast(pd.DataFrame, dataset)
+        # the batches were written to storage as they were indexed
+        return await load_table_from_storage(f"{DOCUMENTS_TABLE}.parquet")
+
     async def inject_workflow_data_dependencies(workflow: Workflow) -> None:
-        workflow.add_table(DEFAULT_INPUT_NAME, dataset)
+        if DEFAULT_INPUT_NAME in workflow.dependencies:
+            workflow.add_table(DEFAULT_INPUT_NAME, await load_documents())
         deps = workflow_dependencies[workflow.name]
         log.info("dependencies for %s: %s", workflow.name, deps)
         for id in deps:
             workflow_id = f"workflow:{id}"
-            table = await load_table_from_storage(f"{id}.parquet")
+            table = table_cache.get(id)
+            if table is None:
+                table = await load_table_from_storage(f"{id}.parquet")
             workflow.add_table(workflow_id, table)
 
+            pending_reads[id] -= 1
+            if pending_reads[id] <= 0:
+                table_cache.discard(id)
+
     async def write_workflow_stats(
         workflow: Workflow,
         workflow_result: WorkflowRunResult,
@@ -278,59 +342,146 @@ async def run_pipeline(
                 storage, workflow.name, workflow_result.memory_profile
             )
 
-        log.debug(
-            "first row of %s => %s", workflow_name, workflow.output().iloc[0].to_json()
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "first row of %s => %s",
+                workflow.name,
+                workflow.output().iloc[0].to_dict(),
+            )
 
     async def emit_workflow_output(workflow: Workflow) -> pd.DataFrame:
         output = cast(pd.DataFrame, workflow.output())
         for emitter in emitters:
             await emitter.emit(workflow.name, output)
+        if pending_reads[workflow.name] > 0:
+            table_cache.set(workflow.name, output)
         return output
 
-    dataset = await _run_post_process_steps(
-        input_post_process_steps, dataset, context, callbacks
-    )
-
-    # Make sure the incoming data is valid
-    _validate_dataset(dataset)
-
-    log.info("Final # of rows loaded: %s", len(dataset))
-    stats.num_documents = len(dataset)
-    last_workflow = "input"
-
-    try:
-        await dump_stats()
+    async def prepare_batches(
+        batches: AsyncIterable[pd.DataFrame],
+    ) -> AsyncIterator[pd.DataFrame]:
+        async for batch in batches:
+            batch = await _run_post_process_steps(
+                input_post_process_steps, batch, context, callbacks
+            )
+            _validate_dataset(batch)
+            yield batch
 
-        for workflow_to_run in workflows_to_run:
-            # Try to flush out any intermediate dataframes
-            gc.collect()
+    document_batches = None
+    if isinstance(dataset, pd.DataFrame):
+        dataset = await _run_post_process_steps(
+            input_post_process_steps, dataset, context, callbacks
+        )
 
-            workflow = workflow_to_run.workflow
-            workflow_name: str = workflow.name
-            last_workflow = workflow_name
+        # Make sure the incoming data is valid
+        _validate_dataset(dataset)
 
-            log.info("Running workflow: %s...", workflow_name)
+        log.info("Final # of rows loaded: %s", len(dataset))
+        stats.num_documents = len(dataset)
+    else:
+        if previous_storage is not None:
+            msg = "Incremental updates can't be run on batches of documents"
+            raise ValueError(msg)
+        document_batches = prepare_batches(dataset)
+    last_workflow = "input"
 
-            if is_resume_run and await storage.has(
-                f"{workflow_to_run.workflow.name}.parquet"
-            ):
-                log.info("Skipping %s because it already exists", workflow_name)
-                continue
+    async def run_delta(
+        delta_workflows: list[PipelineWorkflowReference], documents: pd.DataFrame
+    ) -> PipelineStorage:
+        delta_storage = MemoryPipelineStorage()
+        async for result in run_pipeline(
+            delta_workflows,
+            documents,
+            storage=delta_storage,
+            cache=cache,
+            callbacks=callbacks,
+            progress_reporter=progress_reporter,
+            additional_verbs=additional_verbs,
+            additional_workflows=additional_workflows,
+            max_concurrent_workflows=max_concurrent_workflows,
+            table_cache_max_mb=table_cache_max_mb,
+        ):
+            if result.errors:
+                raise result.errors[0]
+        return delta_storage
+
+    async def run_workflow(workflow_to_run: WorkflowToRun) -> PipelineRunResult:
+        nonlocal last_workflow
+        workflow = workflow_to_run.workflow
+        log.info("Running workflow: %s...", workflow.name)
 
-            stats.workflows[workflow_name] = {"overall": 0.0}
+        try:
+            stats.workflows[workflow.name] = {"overall": 0.0}
             await inject_workflow_data_dependencies(workflow)
 
             workflow_start_time = time.time()
-            result = await workflow.run(context, callbacks)
+            result = await workflow.run(
+                context, _with_metrics(callbacks, metrics, workflow.name)
+            )
             await write_workflow_stats(workflow, result, workflow_start_time)
 
             # Save the output from the workflow
             output = await emit_workflow_output(workflow)
-            yield PipelineRunResult(workflow_name, output, None)
-            output = None
-            workflow.dispose()
-            workflow = None
+        except Exception:
+            last_workflow = workflow.name
+            raise
+        finally:
+            # persist the cached llm responses, even from a failed workflow, so that
+            # a resumed run can use them
+            await cache.flush()
+        run_result = PipelineRunResult(workflow.name, output, None)
+        workflow.dispose()
+        return run_result
+
+    try:
+        await dump_stats()
+
+        completed_workflows = set()
+        if is_resume_run:
+            for workflow_to_run in workflows_to_run:
+                workflow_name = workflow_to_run.workflow.name
+                if await storage.has(f"{workflow_name}.parquet"):
+                    log.info("Skipping %s because it already exists", workflow_name)
+                    completed_workflows.add(workflow_name)
+
+        if previous_storage is not None:
+            completed_workflows |= await update_from_previous_run(
+                workflows,
+                cast(pd.DataFrame, dataset),
+                storage,
+                previous_storage,
+                run_delta,
+            )
+        if document_batches is not None:
+            num_documents, indexed_workflows = await index_in_batches(
+                workflows, document_batches, storage, run_delta, completed_workflows
+            )
+            completed_workflows |= indexed_workflows
+            log.info("Final # of rows loaded: %s", num_documents)
+            stats.num_documents = num_documents
+
+        for workflow_to_run in workflows_to_run:
+            workflow_name = workflow_to_run.workflow.name
+            if workflow_name not in completed_workflows:
+                pending_reads.update(workflow_dependencies[workflow_name])
+
+        async for _, run_result in schedule_workflows(
+            workflows_to_run,
+            workflow_dependencies,
+            run_workflow,
+            max_concurrency=max_concurrent_workflows,
+            completed=completed_workflows,
+        ):
+            yield run_result
+            run_result = None
+            # Try to flush out any intermediate dataframes
+            gc.collect()
+
+        if previous_storage is not None and await storage.has(
+            f"{PREVIOUS_REPORTS_TABLE}.parquet"
+        ):
+            # the previous reports were only kept for the community reports workflow
+            await storage.delete(f"{PREVIOUS_REPORTS_TABLE}.parquet")
 
         stats.total_runtime = time.time() - start_time
         await dump_stats()
@@ -354,6 +505,16 @@ def _create_callback_chain(
     return manager
 
 
+def _with_metrics(
+    callbacks: WorkflowCallbacks, metrics: PipelineMetrics, workflow_name: str
+) -> WorkflowCallbacks:
+    """Add the callbacks measuring a workflow to the callbacks of the run."""
+    manager = WorkflowCallbacksManager()
+    manager.register(callbacks)
+    manager.register(MetricsWorkflowCallbacks(metrics, workflow_name))
+    return manager
+
+
 async def _save_profiler_stats(
     storage: PipelineStorage, workflow_name: str, profile: MemoryProfile
 ):
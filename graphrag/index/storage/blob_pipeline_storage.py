@@ -3,25 +3,42 @@
 
 """Azure Blob Storage implementation of PipelineStorage."""
 
+import asyncio
+import copy
 import logging
 import re
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobServiceClient
 from datashaper import Progress
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 from graphrag.index.progress import ProgressReporter
 
+from .file_pattern import get_literal_prefix
 from .typing import PipelineStorage
 
 log = logging.getLogger(__name__)
 
+# the number of parallel connections used to transfer a large blob in chunks, and
+# the number of blobs transferred at once by the batch methods
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class BlobPipelineStorage(PipelineStorage):
-    """The Blob-Storage implementation."""
+    """The Blob-Storage implementation.
+
+    The blob client is synchronous, so its calls run on worker threads and don't
+    block the event loop. All the storages of a container, children included, share
+    one client and its pool of HTTP connections. Large blobs are transferred in
+    chunks over max_concurrency connections, and the batch methods transfer up to
+    max_concurrency blobs at once.
+    """
 
     _connection_string: str | None
     _container_name: str
@@ -36,11 +53,17 @@ class BlobPipelineStorage(PipelineStorage):
         encoding: str | None = None,
         path_prefix: str | None = None,
         storage_account_blob_url: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Create a new BlobStorage instance."""
+        # every concurrent chunk of every concurrent transfer needs a connection
+        session = Session()
+        adapter = HTTPAdapter(pool_maxsize=max_concurrency * max_concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         if connection_string:
             self._blob_service_client = BlobServiceClient.from_connection_string(
-                connection_string
+                connection_string, session=session
             )
         else:
             if storage_account_blob_url is None:
@@ -50,7 +73,12 @@ class BlobPipelineStorage(PipelineStorage):
             self._blob_service_client = BlobServiceClient(
                 account_url=storage_account_blob_url,
                 credential=DefaultAzureCredential(),
+                session=session,
             )
+        self._container_client = self._blob_service_client.get_container_client(
+            container_name
+        )
+        self._max_concurrency = max_concurrency
         self._encoding = encoding or "utf-8"
         self._container_name = container_name
         self._connection_string = connection_string
@@ -71,26 +99,16 @@ class BlobPipelineStorage(PipelineStorage):
     def create_container(self) -> None:
         """Create the container if it does not exist."""
         if not self.container_exists():
-            container_name = self._container_name
-            container_names = [
-                container.name
-                for container in self._blob_service_client.list_containers()
-            ]
-            if container_name not in container_names:
-                self._blob_service_client.create_container(container_name)
+            self._container_client.create_container()
 
     def delete_container(self) -> None:
         """Delete the container."""
         if self.container_exists():
-            self._blob_service_client.delete_container(self._container_name)
+            self._container_client.delete_container()
 
     def container_exists(self) -> bool:
         """Check if the container exists."""
-        container_name = self._container_name
-        container_names = [
-            container.name for container in self._blob_service_client.list_containers()
-        ]
-        return container_name in container_names
+        return self._container_client.exists()
 
     def find(
         self,
@@ -103,7 +121,7 @@ class BlobPipelineStorage(PipelineStorage):
         """Find blobs in a container using a file pattern, as well as a custom filter function.
 
         Params:
-            base_dir: The name of the base container.
+            base_dir: The directory to search, relative to the storage path prefix.
             file_pattern: The file pattern to use.
             file_filter: A dictionary of key-value pairs to filter the blobs.
             max_count: The maximum number of blobs to return. If -1, all blobs are returned.
@@ -112,7 +130,7 @@ class BlobPipelineStorage(PipelineStorage):
         -------
                 An iterator of blob names and their corresponding regex matches.
         """
-        base_dir = base_dir or ""
+        base_dir = self._keyname(base_dir) if base_dir else self._path_prefix
 
         log.info(
             "search container %s for files matching %s",
@@ -134,13 +152,19 @@ class BlobPipelineStorage(PipelineStorage):
             return all(re.match(value, item[key]) for key, value in file_filter.items())
 
         try:
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
+            container_client = self._container_client
+            # list only the blobs that can match, page by page
+            pattern_prefix = get_literal_prefix(file_pattern)
+            if not (
+                pattern_prefix.startswith(base_dir)
+                or base_dir.startswith(pattern_prefix)
+            ):
+                return
+            all_blobs = container_client.list_blobs(
+                name_starts_with=max(base_dir, pattern_prefix, key=len) or None
             )
-            all_blobs = list(container_client.list_blobs())
 
             num_loaded = 0
-            num_total = len(list(all_blobs))
             num_filtered = 0
             for blob in all_blobs:
                 match = file_pattern.match(blob.name)
@@ -156,9 +180,7 @@ class BlobPipelineStorage(PipelineStorage):
                 else:
                     num_filtered += 1
                 if progress is not None:
-                    progress(
-                        _create_progress_status(num_loaded, num_filtered, num_total)
-                    )
+                    progress(_create_progress_status(num_loaded, num_filtered))
         except Exception:
             log.exception(
                 "Error finding blobs: base_dir=%s, file_pattern=%s, file_filter=%s",
@@ -174,14 +196,17 @@ class BlobPipelineStorage(PipelineStorage):
         """Get a value from the cache."""
         try:
             key = self._keyname(key)
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
+            blob_client = self._container_client.get_blob_client(key)
+            blob_data = await asyncio.to_thread(
+                lambda: blob_client.download_blob(
+                    max_concurrency=self._max_concurrency
+                ).readall()
             )
-            blob_client = container_client.get_blob_client(key)
-            blob_data = blob_client.download_blob().readall()
             if not as_bytes:
                 coding = encoding or "utf-8"
                 blob_data = blob_data.decode(coding)
+        except ResourceNotFoundError:
+            return None
         except Exception:
             log.exception("Error getting key %s", key)
             return None
@@ -192,17 +217,55 @@ class BlobPipelineStorage(PipelineStorage):
         """Set a value in the cache."""
         try:
             key = self._keyname(key)
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
-            )
-            blob_client = container_client.get_blob_client(key)
-            if isinstance(value, bytes):
-                blob_client.upload_blob(value, overwrite=True)
-            else:
+            blob_client = self._container_client.get_blob_client(key)
+            if not isinstance(value, bytes):
                 coding = encoding or "utf-8"
-                blob_client.upload_blob(value.encode(coding), overwrite=True)
+                value = value.encode(coding)
+            await asyncio.to_thread(
+                blob_client.upload_blob,
+                value,
+                overwrite=True,
+                max_concurrency=self._max_concurrency,
+            )
         except Exception:
-            log.exception("Error setting key %s: %s", key)
+            log.exception("Error setting key %s", key)
+
+    async def get_many(
+        self,
+        keys: list[str],
+        as_bytes: bool | None = None,
+        encoding: str | None = None,
+    ) -> list[Any]:
+        """Get the values for the given keys, downloading up to max_concurrency blobs at once."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _get(key: str) -> Any:
+            async with semaphore:
+                return await self.get(key, as_bytes, encoding)
+
+        return list(await asyncio.gather(*(_get(key) for key in keys)))
+
+    async def set_many(
+        self, values: dict[str, str | bytes | None], encoding: str | None = None
+    ) -> None:
+        """Set the values for the given keys, uploading up to max_concurrency blobs at once."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _set(key: str, value: str | bytes | None) -> None:
+            async with semaphore:
+                await self.set(key, value, encoding)
+
+        await asyncio.gather(*(_set(key, value) for key, value in values.items()))
+
+    async def has_many(self, keys: list[str]) -> list[bool]:
+        """Check which of the given keys exist, up to max_concurrency at once."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _has(key: str) -> bool:
+            async with semaphore:
+                return await self.has(key)
+
+        return list(await asyncio.gather(*(_has(key) for key in keys)))
 
     def set_df_json(self, key: str, dataframe: Any) -> None:
         """Set a json dataframe."""
@@ -245,20 +308,14 @@ class BlobPipelineStorage(PipelineStorage):
     async def has(self, key: str) -> bool:
         """Check if a key exists in the cache."""
         key = self._keyname(key)
-        container_client = self._blob_service_client.get_container_client(
-            self._container_name
-        )
-        blob_client = container_client.get_blob_client(key)
-        return blob_client.exists()
+        blob_client = self._container_client.get_blob_client(key)
+        return await asyncio.to_thread(blob_client.exists)
 
     async def delete(self, key: str) -> None:
         """Delete a key from the cache."""
         key = self._keyname(key)
-        container_client = self._blob_service_client.get_container_client(
-            self._container_name
-        )
-        blob_client = container_client.get_blob_client(key)
-        blob_client.delete_blob()
+        blob_client = self._container_client.get_blob_client(key)
+        await asyncio.to_thread(blob_client.delete_blob)
 
     async def clear(self) -> None:
         """Clear the cache."""
@@ -267,14 +324,10 @@ class BlobPipelineStorage(PipelineStorage):
         """Create a child storage instance."""
         if name is None:
             return self
-        path = str(Path(self._path_prefix) / name)
-        return BlobPipelineStorage(
-            self._connection_string,
-            self._container_name,
-            self._encoding,
-            path,
-            self._storage_account_blob_url,
-        )
+        # the child shares the client, its connections and the transfer limit
+        child = copy.copy(self)
+        child._path_prefix = str(Path(self._path_prefix) / name)  # noqa: SLF001
+        return child
 
     def _keyname(self, key: str) -> str:
         """Get the key name."""
@@ -361,11 +414,10 @@ def validate_blob_container_name(container_name: str):
     return True
 
 
-def _create_progress_status(
-    num_loaded: int, num_filtered: int, num_total: int
-) -> Progress:
+def _create_progress_status(num_loaded: int, num_filtered: int) -> Progress:
+    # blobs are listed lazily, so the total is the number of blobs seen so far
     return Progress(
-        total_items=num_total,
+        total_items=num_loaded + num_filtered,
         completed_items=num_loaded + num_filtered,
         description=f"{num_loaded} files loaded ({num_filtered} filtered)",
     )
@@ -0,0 +1,50 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the get_literal_prefix method definition."""
+
+import re
+
+_SPECIAL_CHARACTERS = set(".^$*+?{}[]|()")
+_OPTIONAL_QUANTIFIERS = set("*?{")
+
+
+def get_literal_prefix(file_pattern: re.Pattern[str]) -> str:
+    """Get the literal text that every string matched by the file pattern starts with.
+
+    The prefix is used to skip listing files that can't match the pattern. It is
+    conservative, an empty prefix means any file may match.
+    """
+    pattern = file_pattern.pattern
+    if "|" in pattern or file_pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return ""
+
+    prefix = []
+    position = 1 if pattern.startswith("^") else 0
+    while position < len(pattern):
+        char = pattern[position]
+        step = 1
+        if char == "\\":
+            escaped = pattern[position + 1 : position + 2]
+            # \d, \w, \n, backreferences etc. are not literal characters
+            if escaped == "" or escaped.isalnum():
+                break
+            char = escaped
+            step = 2
+        elif char in _SPECIAL_CHARACTERS:
+            break
+
+        quantifier = pattern[position + step : position + step + 1]
+        if quantifier in _OPTIONAL_QUANTIFIERS:
+            break
+        prefix.append(char)
+        if quantifier == "+":
+            break
+        position += step
+    return "".join(prefix)
+
+
+def could_contain_prefix(directory: str, prefix: str, sep: str) -> bool:
+    """Check whether the paths of files in a directory can start with the prefix."""
+    directory = f"{directory}{sep}"
+    return directory.startswith(prefix) or prefix.startswith(directory)
@@ -18,6 +18,7 @@ from datashaper import Progress
 
 from graphrag.index.progress import ProgressReporter
 
+from .file_pattern import could_contain_prefix, get_literal_prefix
 from .typing import PipelineStorage
 
 log = logging.getLogger(__name__)
@@ -53,11 +54,9 @@ class FilePipelineStorage(PipelineStorage):
 
         search_path = Path(self._root_dir) / (base_dir or "")
         log.info("search %s for files matching %s", search_path, file_pattern.pattern)
-        all_files = list(search_path.rglob("**/*"))
         num_loaded = 0
-        num_total = len(all_files)
         num_filtered = 0
-        for file in all_files:
+        for file in _walk_files(search_path, get_literal_prefix(file_pattern)):
             match = file_pattern.match(f"{file}")
             if match:
                 group = match.groupdict()
@@ -74,7 +73,7 @@ class FilePipelineStorage(PipelineStorage):
             else:
                 num_filtered += 1
             if progress is not None:
-                progress(_create_progress_status(num_loaded, num_filtered, num_total))
+                progress(_create_progress_status(num_loaded, num_filtered))
 
     async def get(
         self, key: str, as_bytes: bool | None = False, encoding: str | None = None
@@ -113,8 +112,10 @@ class FilePipelineStorage(PipelineStorage):
         is_bytes = isinstance(value, bytes)
         write_type = "wb" if is_bytes else "w"
         encoding = None if is_bytes else encoding or self._encoding
+        file_path = join_path(self._root_dir, key)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
         async with aiofiles.open(
-            join_path(self._root_dir, key),
+            file_path,
             cast(Any, write_type),
             encoding=encoding,
         ) as f:
@@ -155,11 +156,22 @@ def create_file_storage(out_dir: str | None) -> PipelineStorage:
     return FilePipelineStorage(out_dir)
 
 
-def _create_progress_status(
-    num_loaded: int, num_filtered: int, num_total: int
-) -> Progress:
+def _walk_files(search_path: Path, prefix: str) -> Iterator[Path]:
+    """Lazily list the files under a path, skipping directories whose files can't start with the prefix."""
+    for root, dirs, files in os.walk(search_path):
+        dirs[:] = [
+            name
+            for name in sorted(dirs)
+            if could_contain_prefix(str(Path(root) / name), prefix, os.sep)
+        ]
+        for name in sorted(files):
+            yield Path(root) / name
+
+
+def _create_progress_status(num_loaded: int, num_filtered: int) -> Progress:
+    # files are discovered lazily, so the total is the number of files seen so far
     return Progress(
-        total_items=num_total,
+        total_items=num_loaded + num_filtered,
         completed_items=num_loaded + num_filtered,
         description=f"{num_loaded} files loaded ({num_filtered} filtered)",
     )
@@ -3,6 +3,7 @@
 
 """A module containing 'PipelineStorage' model."""
 
+import asyncio
 import re
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterator
@@ -75,6 +76,50 @@ class PipelineStorage(metaclass=ABCMeta):
     async def clear(self) -> None:
         """Clear the storage."""
 
+    async def get_many(
+        self,
+        keys: list[str],
+        as_bytes: bool | None = None,
+        encoding: str | None = None,
+    ) -> list[Any]:
+        """Get the values for the given keys.
+
+        Args:
+            - keys - The keys to get the values for.
+            - as_bytes - Whether or not to return the values as bytes.
+
+        Returns
+        -------
+            - output - The value for each key.
+        """
+        return list(
+            await asyncio.gather(*(self.get(key, as_bytes, encoding) for key in keys))
+        )
+
+    async def set_many(
+        self, values: dict[str, str | bytes | None], encoding: str | None = None
+    ) -> None:
+        """Set the values for the given keys.
+
+        Args:
+            - values - The value to set for each key.
+        """
+        await asyncio.gather(
+            *(self.set(key, value, encoding) for key, value in values.items())
+        )
+
+    async def has_many(self, keys: list[str]) -> list[bool]:
+        """Return whether each of the given keys exists in the storage.
+
+        Args:
+            - keys - The keys to check for.
+
+        Returns
+        -------
+            - output - True for each key that exists in the storage, False otherwise.
+        """
+        return list(await asyncio.gather(*(self.has(key) for key in keys)))
+
     @abstractmethod
     def child(self, name: str | None) -> "PipelineStorage":
         """Create a child storage instance."""
@@ -0,0 +1,37 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Performance measurements of the indexing engine."""
+
+from .exporters import MetricsExporter, OpenTelemetryMetricsExporter
+from .metrics import (
+    LLM_CACHE_HIT,
+    LLM_CACHE_MISS,
+    LLM_INPUT_TOKENS,
+    LLM_LATENCY,
+    LLM_LIMITER_WAIT,
+    LLM_OUTPUT_TOKENS,
+    LLM_RETRIES,
+    LLM_SEMAPHORE_WAIT,
+    Histogram,
+    PipelineMetrics,
+    llm_measure_name,
+)
+from .metrics_workflow_callbacks import MetricsWorkflowCallbacks
+
+__all__ = [
+    "LLM_CACHE_HIT",
+    "LLM_CACHE_MISS",
+    "LLM_INPUT_TOKENS",
+    "LLM_LATENCY",
+    "LLM_LIMITER_WAIT",
+    "LLM_OUTPUT_TOKENS",
+    "LLM_RETRIES",
+    "LLM_SEMAPHORE_WAIT",
+    "Histogram",
+    "MetricsExporter",
+    "MetricsWorkflowCallbacks",
+    "OpenTelemetryMetricsExporter",
+    "PipelineMetrics",
+    "llm_measure_name",
+]
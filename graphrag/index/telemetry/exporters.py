@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the metrics exporters."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+# the measurements that add up, the others are distributions
+_COUNTERS = {
+    "graphrag.llm.retries",
+    "graphrag.llm.input_tokens",
+    "graphrag.llm.output_tokens",
+    "graphrag.llm.cache_hit",
+    "graphrag.llm.cache_miss",
+}
+_UNITS = {
+    "graphrag.verb.wall_time": "s",
+    "graphrag.verb.cpu_time": "s",
+    "graphrag.verb.peak_rss": "By",
+    "graphrag.llm.latency": "s",
+    "graphrag.llm.semaphore_wait": "s",
+    "graphrag.llm.limiter_wait": "s",
+    "graphrag.llm.input_tokens": "{token}",
+    "graphrag.llm.output_tokens": "{token}",
+}
+
+
+class MetricsExporter(ABC):
+    """Receive the performance measurements of a pipeline run."""
+
+    @abstractmethod
+    def record(self, name: str, value: float, attributes: dict[str, str]) -> None:
+        """Receive a measurement, as it's made."""
+
+    def export(self, metrics: dict[str, Any]) -> None:  # noqa: B027
+        """Receive the summary of the measurements, each time it's written."""
+
+
+class OpenTelemetryMetricsExporter(MetricsExporter):
+    """Record the measurements with the instruments of an OpenTelemetry meter.
+
+    The meter is any object with the create_counter and create_histogram methods of
+    the OpenTelemetry metrics API, e.g. opentelemetry.metrics.get_meter("graphrag").
+    The counts and token totals are recorded with counters, the times and memory
+    with histograms.
+    """
+
+    def __init__(self, meter: Any):
+        """Init method definition."""
+        self._meter = meter
+        self._instruments: dict[str, Any] = {}
+
+    def record(self, name: str, value: float, attributes: dict[str, str]) -> None:
+        """Record a measurement with the instrument of its name."""
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            unit = _UNITS.get(name, "")
+            if name in _COUNTERS:
+                instrument = self._meter.create_counter(name, unit=unit)
+            else:
+                instrument = self._meter.create_histogram(name, unit=unit)
+            self._instruments[name] = instrument
+        if name in _COUNTERS:
+            instrument.add(value, attributes=attributes)
+        else:
+            instrument.record(value, attributes=attributes)
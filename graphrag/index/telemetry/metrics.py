@@ -0,0 +1,197 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'PipelineMetrics' collector."""
+
+import math
+import threading
+from collections import defaultdict
+from typing import Any
+
+from .exporters import MetricsExporter
+
+# the LLM measurements, reported through the verb callbacks as llm.<llm name>.<metric>
+LLM_MEASURE_PREFIX = "llm."
+LLM_LATENCY = "latency"
+LLM_RETRIES = "retries"
+LLM_INPUT_TOKENS = "input_tokens"
+LLM_OUTPUT_TOKENS = "output_tokens"
+LLM_CACHE_HIT = "cache_hit"
+LLM_CACHE_MISS = "cache_miss"
+LLM_SEMAPHORE_WAIT = "semaphore_wait"
+LLM_LIMITER_WAIT = "limiter_wait"
+
+# the upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def llm_measure_name(llm: str, metric: str) -> str:
+    """Get the name a measurement of an LLM is reported with."""
+    return f"{LLM_MEASURE_PREFIX}{llm}.{metric}"
+
+
+class Histogram:
+    """Count values into buckets by their upper bounds, along with their sum and range."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """Init method definition."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Record a value."""
+        index = next(
+            (i for i, bound in enumerate(self.buckets) if value <= bound),
+            len(self.buckets),
+        )
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the histogram as JSON values, the last bucket has no upper bound."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.sum / self.count if self.count else None,
+            "buckets": [
+                {"le": bound, "count": count}
+                for bound, count in zip([*self.buckets, None], self.counts, strict=True)
+            ],
+        }
+
+
+class _LLMMetrics:
+    def __init__(self):
+        self.latency = Histogram()
+        self.semaphore_wait = Histogram()
+        self.limiter_wait = Histogram()
+        self.calls = 0
+        self.retries = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def record(self, metric: str, value: float) -> bool:
+        if metric == LLM_LATENCY:
+            self.calls += 1
+            self.latency.record(value)
+        elif metric == LLM_RETRIES:
+            self.retries += int(value)
+        elif metric == LLM_INPUT_TOKENS:
+            self.input_tokens += int(value)
+        elif metric == LLM_OUTPUT_TOKENS:
+            self.output_tokens += int(value)
+        elif metric == LLM_CACHE_HIT:
+            self.cache_hits += int(value)
+        elif metric == LLM_CACHE_MISS:
+            self.cache_misses += int(value)
+        elif metric == LLM_SEMAPHORE_WAIT:
+            self.semaphore_wait.record(value)
+        elif metric == LLM_LIMITER_WAIT:
+            self.limiter_wait.record(value)
+        else:
+            return False
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": self.cache_hits / lookups if lookups else None,
+            "latency": self.latency.to_dict(),
+            "semaphore_wait": self.semaphore_wait.to_dict(),
+            "limiter_wait": self.limiter_wait.to_dict(),
+        }
+
+
+class PipelineMetrics:
+    """Collect the performance measurements of a pipeline run.
+
+    The verbs are measured by their wall time, the CPU time of the process while they
+    ran and the peak memory of the process when they ended. The LLMs are measured by
+    the latency, retries and tokens of their calls, their cache hits and the time the
+    calls waited for the concurrency limit and the rate limiter.
+
+    Measurements are made from the threads of threaded verbs, and handed to the
+    exporters as they are made.
+    """
+
+    def __init__(self, exporters: list[MetricsExporter] | None = None):
+        """Init method definition."""
+        self._exporters = exporters or []
+        self._verbs: dict[str, dict[str, dict[str, float | None]]] = defaultdict(dict)
+        self._llms: dict[str, _LLMMetrics] = defaultdict(_LLMMetrics)
+        self._lock = threading.Lock()
+
+    def record_verb(
+        self,
+        workflow: str,
+        verb: str,
+        wall_time: float,
+        cpu_time: float,
+        peak_rss: int | None,
+    ) -> None:
+        """Record the measurements of a verb run, the peak memory is in bytes."""
+        with self._lock:
+            self._verbs[workflow][verb] = {
+                "wall_time": wall_time,
+                "cpu_time": cpu_time,
+                "peak_rss_mb": peak_rss / (1024 * 1024) if peak_rss else None,
+            }
+        attributes = {"workflow": workflow, "verb": verb}
+        self._export("graphrag.verb.wall_time", wall_time, attributes)
+        self._export("graphrag.verb.cpu_time", cpu_time, attributes)
+        if peak_rss:
+            self._export("graphrag.verb.peak_rss", peak_rss, attributes)
+
+    def record_llm(self, llm: str, metric: str, value: float) -> None:
+        """Record a measurement of an LLM."""
+        with self._lock:
+            if not self._llms[llm].record(metric, value):
+                return
+        self._export(f"graphrag.llm.{metric}", value, {"llm": llm})
+
+    def record_measure(self, name: str, value: float) -> None:
+        """Record a measurement reported through the callbacks, if it's known."""
+        if not name.startswith(LLM_MEASURE_PREFIX):
+            return
+        llm, _, metric = name[len(LLM_MEASURE_PREFIX) :].rpartition(".")
+        if llm:
+            self.record_llm(llm, metric, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the measurements as JSON values."""
+        with self._lock:
+            return {
+                "workflows": {
+                    workflow: {"verbs": dict(verbs)}
+                    for workflow, verbs in self._verbs.items()
+                },
+                "llm": {llm: metrics.to_dict() for llm, metrics in self._llms.items()},
+            }
+
+    def export(self) -> dict[str, Any]:
+        """Hand the measurements to the exporters, and get them as JSON values."""
+        metrics = self.to_dict()
+        for exporter in self._exporters:
+            exporter.export(metrics)
+        return metrics
+
+    def _export(self, name: str, value: float, attributes: dict[str, str]) -> None:
+        for exporter in self._exporters:
+            exporter.record(name, value, attributes)
@@ -0,0 +1,69 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A workflow callback manager that measures the verbs of a workflow."""
+
+import sys
+import time
+from typing import Any
+
+from datashaper import ExecutionNode, NoopWorkflowCallbacks, TableContainer
+
+from .metrics import PipelineMetrics
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class MetricsWorkflowCallbacks(NoopWorkflowCallbacks):
+    """Record the measurements of the verbs of a workflow, and of the LLMs they call.
+
+    The verbs are keyed by their index and name, as in stats.json. The CPU time is
+    the time of the whole process while the verb ran, which includes the other
+    workflows running at the same time.
+    """
+
+    def __init__(self, metrics: PipelineMetrics, workflow: str) -> None:
+        """Create a new MetricsWorkflowCallbacks."""
+        self._metrics = metrics
+        self._workflow = workflow
+        self._index = 0
+        self._started: dict[int, tuple[str, float, float]] = {}
+
+    def on_step_start(self, node: ExecutionNode, inputs: dict[str, Any]) -> None:
+        """Execute this callback every time a step starts."""
+        self._started[id(node)] = (
+            f"{self._index}_{node.verb.name}",
+            time.perf_counter(),
+            time.process_time(),
+        )
+        self._index += 1
+
+    def on_step_end(self, node: ExecutionNode, result: TableContainer | None) -> None:
+        """Execute this callback every time a step ends."""
+        started = self._started.pop(id(node), None)
+        if started is None:
+            return
+        verb, wall_start, cpu_start = started
+        self._metrics.record_verb(
+            self._workflow,
+            verb,
+            wall_time=time.perf_counter() - wall_start,
+            cpu_time=time.process_time() - cpu_start,
+            peak_rss=_peak_rss(),
+        )
+
+    def on_measure(self, name: str, value: float, details: dict | None = None) -> None:
+        """Handle when a measurement occurs."""
+        self._metrics.record_measure(name, value)
+
+
+def _peak_rss() -> int | None:
+    """Get the peak resident memory of the process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS, in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -15,10 +15,12 @@ import pandas as pd
 import tiktoken
 
 from graphrag.index.utils import num_tokens_from_string
+from graphrag.llm.tokenizer import get_tokenizer
 
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
 EncodeFn = Callable[[str], EncodedText]
+EncodeBatchFn = Callable[[list[str]], list[EncodedText]]
 LengthFn = Callable[[str], int]
 
 log = logging.getLogger(__name__)
@@ -36,6 +38,8 @@ class Tokenizer:
     """ Function to decode a list of token ids to a string"""
     encode: EncodeFn
     """ Function to encode a string to a list of token ids"""
+    encode_batch: EncodeBatchFn | None = None
+    """ Function to encode a list of strings, used instead of encode when given"""
 
 
 class TextSplitter(ABC):
@@ -98,13 +102,10 @@ class TokenTextSplitter(TextSplitter):
         super().__init__(**kwargs)
         if model_name is not None:
             try:
-                enc = tiktoken.encoding_for_model(model_name)
+                encoding_name = tiktoken.encoding_name_for_model(model_name)
             except KeyError:
                 log.exception("Model %s not found, using %s", model_name, encoding_name)
-                enc = tiktoken.get_encoding(encoding_name)
-        else:
-            enc = tiktoken.get_encoding(encoding_name)
-        self._tokenizer = enc
+        self._tokenizer = get_tokenizer(encoding_name)
         self._allowed_special = allowed_special or set()
         self._disallowed_special = disallowed_special
 
@@ -118,7 +119,23 @@ class TokenTextSplitter(TextSplitter):
 
     def num_tokens(self, text: str) -> int:
         """Return the number of tokens in a string."""
-        return len(self.encode(text))
+        if self._allowed_special:
+            return len(self.encode(text))
+        return self._tokenizer.num_tokens(text)
+
+    def num_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Return the number of tokens in each string."""
+        if self._allowed_special:
+            return [len(tokens) for tokens in self.encode_batch(texts)]
+        return self._tokenizer.num_tokens_batch(texts)
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode the given texts into int-vectors, across threads."""
+        return self._tokenizer.encode_batch(
+            texts,
+            allowed_special=self._allowed_special,
+            disallowed_special=self._disallowed_special,
+        )
 
     def split_text(self, text: str | list[str]) -> list[str]:
         """Split text method."""
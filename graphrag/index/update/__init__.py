@@ -0,0 +1,28 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Incremental indexing of input documents."""
+
+from .incremental import (
+    DOCUMENTS_TABLE,
+    DocumentDelta,
+    RunDelta,
+    get_document_delta,
+    index_in_batches,
+    merge_covariates,
+    merge_extracted_entities,
+    merge_text_units,
+    update_from_previous_run,
+)
+
+__all__ = [
+    "DOCUMENTS_TABLE",
+    "DocumentDelta",
+    "RunDelta",
+    "get_document_delta",
+    "index_in_batches",
+    "merge_covariates",
+    "merge_extracted_entities",
+    "merge_text_units",
+    "update_from_previous_run",
+]
@@ -0,0 +1,436 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Incrementally index input documents, in batches or on top of a previous run."""
+
+import logging
+from collections import Counter
+from collections.abc import AsyncIterable, Awaitable, Callable
+from dataclasses import dataclass
+from io import BytesIO
+from typing import cast
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datashaper import NoopVerbCallbacks, TableContainer, VerbInput
+
+import graphrag.index.graph.extractors.community_reports.schemas as schemas
+from graphrag.index.config import PipelineWorkflowReference
+from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import load_graph, serialize_graph
+from graphrag.index.verbs.graph.merge import (
+    GraphMerger,
+    get_merge_operations,
+    merge_graphs,
+)
+from graphrag.index.verbs.graph.merge.defaults import (
+    DEFAULT_EDGE_OPERATIONS,
+    DEFAULT_NODE_OPERATIONS,
+)
+from graphrag.index.verbs.graph.report import (
+    PREVIOUS_REPORTS_TABLE,
+    get_community_members,
+)
+from graphrag.index.verbs.graph.report.strategies.typing import CommunityReport
+from graphrag.index.workflows.v1.create_base_extracted_entities import (
+    DEFAULT_GRAPH_MERGE_OPERATIONS,
+    TEXT_UNIT_GRAPHS_TABLE,
+)
+
+log = logging.getLogger(__name__)
+
+DOCUMENTS_WORKFLOW = "create_base_documents"
+TEXT_UNITS_WORKFLOW = "create_base_text_units"
+EXTRACTED_ENTITIES_WORKFLOW = "create_base_extracted_entities"
+COVARIATES_WORKFLOW = "create_final_covariates"
+NODES_WORKFLOW = "create_final_nodes"
+COMMUNITY_REPORTS_WORKFLOW = "create_final_community_reports"
+
+DOCUMENTS_TABLE = "input_documents"
+"""The table of storage that batches of input documents are written to."""
+
+RunDelta = Callable[
+    [list[PipelineWorkflowReference], pd.DataFrame], Awaitable[PipelineStorage]
+]
+"""Run a subset of the workflows on a subset of the documents, returning the storage holding their outputs."""
+
+
+@dataclass
+class DocumentDelta:
+    """The difference between the input documents and a previous run."""
+
+    new_documents: pd.DataFrame
+    """Input documents that were not indexed by the previous run."""
+
+    removed_ids: set[str]
+    """Ids of previously indexed documents that are no longer in the input."""
+
+
+def get_document_delta(
+    dataset: pd.DataFrame, previous_documents: pd.DataFrame
+) -> DocumentDelta:
+    """Diff the input documents against a previous run by id, which is a hash of the document content."""
+    previous_ids = set(previous_documents["id"])
+    current_ids = set(dataset["id"])
+    return DocumentDelta(
+        new_documents=cast(
+            pd.DataFrame, dataset[~dataset["id"].isin(list(previous_ids))]
+        ).reset_index(drop=True),
+        removed_ids=previous_ids - current_ids,
+    )
+
+
+def merge_text_units(
+    previous: pd.DataFrame, delta: pd.DataFrame | None, removed_ids: set[str]
+) -> pd.DataFrame:
+    """Drop the text units of removed documents and append the text units of new documents."""
+    kept = cast(
+        pd.DataFrame,
+        previous[
+            ~previous["document_ids"].map(
+                lambda ids: all(id in removed_ids for id in ids)
+            )
+        ],
+    )
+    merged = _concat(kept, delta)
+    # keep the document order of a full run, which chunks the documents sorted by id
+    order = merged["document_ids"].map(min).argsort(kind="stable")
+    return merged.iloc[order].reset_index(drop=True)
+
+
+def merge_covariates(
+    previous: pd.DataFrame, delta: pd.DataFrame | None, text_units: pd.DataFrame
+) -> pd.DataFrame:
+    """Drop the covariates of removed text units, append the new ones and renumber them."""
+    kept = cast(pd.DataFrame, previous[previous["text_unit_id"].isin(text_units["id"])])
+    merged = _concat(kept, delta)
+    merged["human_readable_id"] = [str(i + 1) for i in range(len(merged))]
+    return merged
+
+
+def merge_extracted_entities(
+    previous: pd.DataFrame,
+    delta: pd.DataFrame | None,
+    operations: dict | None = None,
+    column: str = "entity_graph",
+) -> pd.DataFrame:
+    """Merge the graph extracted from new documents into the previously extracted graph, or merge the graphs of the previous table alone."""
+    operations = operations or DEFAULT_GRAPH_MERGE_OPERATIONS
+    graphs = cast(pd.DataFrame, _concat(previous, delta)[[column]])
+    output = merge_graphs(
+        VerbInput(input=TableContainer(table=graphs)),
+        callbacks=NoopVerbCallbacks(),
+        column=column,
+        to=column,
+        **operations,
+    )
+    return cast(pd.DataFrame, output.table)
+
+
+def merge_text_unit_graphs(
+    previous: pd.DataFrame, delta: pd.DataFrame | None, text_units: pd.DataFrame
+) -> pd.DataFrame:
+    """Keep the graphs extracted from the merged text units, in the order of the text units, like the graphs merged by a full run."""
+    graphs = _concat(previous, delta).drop_duplicates("id", keep="last")
+    return text_units[["id"]].merge(graphs, on="id")
+
+
+def get_previous_community_reports(
+    nodes: pd.DataFrame, reports: pd.DataFrame
+) -> pd.DataFrame:
+    """Add the members of each community to the community reports of a previous run."""
+    members = get_community_members(nodes)
+    keys = [schemas.COMMUNITY_LEVEL, schemas.NODE_COMMUNITY]
+    # the community ids may be read back as numbers in one table and strings in the other
+    members[schemas.NODE_COMMUNITY] = members[schemas.NODE_COMMUNITY].astype(str)
+    reports = reports.assign(**{
+        schemas.NODE_COMMUNITY: reports[schemas.NODE_COMMUNITY].astype(str)
+    })
+    columns = [
+        column for column in CommunityReport.__annotations__ if column in reports
+    ]
+    return reports[columns].merge(members, on=keys)
+
+
+async def index_in_batches(
+    workflows: list[PipelineWorkflowReference],
+    batches: AsyncIterable[pd.DataFrame],
+    storage: PipelineStorage,
+    run_delta: RunDelta,
+    completed: set[str] | None = None,
+) -> tuple[int, set[str]]:
+    """Chunk and extract the input documents one batch at a time, and merge the results into storage.
+
+    Only one batch of documents, with the intermediate outputs of its chunking and
+    extraction, is held at a time. The documents, text units and covariates of each
+    batch are appended to storage as parquet parts, which are concatenated part by
+    part once every batch is indexed. The extracted graphs are collected as node and
+    edge records and merged once, into the graph written to storage. The remaining
+    workflows read the documents from the `DOCUMENTS_TABLE` table of storage.
+
+    Args:
+        - workflows - The workflows of the pipeline
+        - batches - The input documents, in batches
+        - storage - The storage of the current run
+        - run_delta - The callback used to run workflows on a batch of documents
+        - completed - The workflows whose outputs are already in storage
+    Returns:
+        - output - The number of input documents, and the names of the workflows whose outputs were written to storage, and can be skipped
+    """
+    by_name = {workflow.name: workflow for workflow in workflows}
+    batch_names = [TEXT_UNITS_WORKFLOW, EXTRACTED_ENTITIES_WORKFLOW]
+    if COVARIATES_WORKFLOW in by_name:
+        batch_names.append(COVARIATES_WORKFLOW)
+    if not _supports_update(by_name) or all(
+        name in (completed or set()) for name in batch_names
+    ):
+        # only the documents are written, the text units are chunked from them by a
+        # full index, or were written by the run that is resumed
+        batch_names = []
+
+    operations = (
+        (by_name[EXTRACTED_ENTITIES_WORKFLOW].config or {}).get(
+            "graph_merge_operations"
+        )
+        if len(batch_names) > 0
+        else None
+    ) or DEFAULT_GRAPH_MERGE_OPERATIONS
+    graphs = GraphMerger(
+        get_merge_operations(operations.get("nodes", DEFAULT_NODE_OPERATIONS)),
+        get_merge_operations(operations.get("edges", DEFAULT_EDGE_OPERATIONS)),
+    )
+    parts: Counter[str] = Counter()
+    num_documents = 0
+    num_covariates = 0
+    async for batch in batches:
+        if len(batch) == 0:
+            continue
+        await _append_part(storage, DOCUMENTS_TABLE, parts, batch)
+        num_documents += len(batch)
+        if len(batch_names) == 0:
+            continue
+
+        log.info("indexing batch %s: %s documents", parts[DOCUMENTS_TABLE], len(batch))
+        batch_storage = await run_delta([by_name[name] for name in batch_names], batch)
+        for graph in cast(
+            pd.DataFrame, await _load_table(batch_storage, EXTRACTED_ENTITIES_WORKFLOW)
+        )["entity_graph"]:
+            graphs.add(load_graph(graph))
+        for name in [TEXT_UNITS_WORKFLOW, TEXT_UNIT_GRAPHS_TABLE]:
+            table = await _load_table(batch_storage, name)
+            if table is not None:
+                await _append_part(storage, name, parts, table)
+        if COVARIATES_WORKFLOW in batch_names:
+            covariates = cast(
+                pd.DataFrame, await _load_table(batch_storage, COVARIATES_WORKFLOW)
+            )
+            # number the covariates across batches, like merge_covariates
+            covariates["human_readable_id"] = [
+                str(num_covariates + i + 1) for i in range(len(covariates))
+            ]
+            num_covariates += len(covariates)
+            await _append_part(storage, COVARIATES_WORKFLOW, parts, covariates)
+
+    await _concat_parts(storage, DOCUMENTS_TABLE, parts[DOCUMENTS_TABLE])
+    if len(batch_names) == 0 or num_documents == 0:
+        return num_documents, set()
+
+    for name in [*batch_names, TEXT_UNIT_GRAPHS_TABLE]:
+        if name in parts:
+            await _concat_parts(storage, name, parts[name])
+    await storage.set(
+        f"{EXTRACTED_ENTITIES_WORKFLOW}.parquet",
+        pd.DataFrame({"entity_graph": [serialize_graph(graphs.merged())]}).to_parquet(),
+    )
+    return num_documents, set(batch_names)
+
+
+async def update_from_previous_run(
+    workflows: list[PipelineWorkflowReference],
+    dataset: pd.DataFrame,
+    storage: PipelineStorage,
+    previous_storage: PipelineStorage,
+    run_delta: RunDelta,
+) -> set[str]:
+    """Index only the documents that are new since a previous run, and merge the results into storage.
+
+    Chunking, entity extraction and claim extraction run on the new documents only. Their
+    outputs are merged with the previous run's outputs and written to storage, so the
+    remaining workflows can run on the merged tables. The graphs extracted from the
+    text units of removed documents are dropped, and the graphs of the other text
+    units merged again. The previous run's community reports are written to storage
+    with the members of their communities, so only the communities whose members
+    changed are reported on again.
+
+    Args:
+        - workflows - The workflows of the pipeline
+        - dataset - The input documents
+        - storage - The storage of the current run
+        - previous_storage - The storage holding the outputs of the previous run
+        - run_delta - The callback used to run workflows on the new documents
+    Returns:
+        - output - The names of the workflows whose outputs were written to storage, and can be skipped
+    """
+    by_name = {workflow.name: workflow for workflow in workflows}
+    if not _supports_update(by_name):
+        return set()
+
+    previous = {}
+    for name in [DOCUMENTS_WORKFLOW, TEXT_UNITS_WORKFLOW, EXTRACTED_ENTITIES_WORKFLOW]:
+        previous[name] = await _load_table(previous_storage, name)
+    if COVARIATES_WORKFLOW in by_name:
+        previous[COVARIATES_WORKFLOW] = await _load_table(
+            previous_storage, COVARIATES_WORKFLOW
+        )
+    if any(table is None for table in previous.values()):
+        log.warning("previous run is incomplete, running a full index")
+        return set()
+
+    delta = get_document_delta(dataset, previous[DOCUMENTS_WORKFLOW])
+    log.info(
+        "incremental update: %s new documents, %s removed documents",
+        len(delta.new_documents),
+        len(delta.removed_ids),
+    )
+
+    # runs from before the graph of each text unit was kept can't drop the entities of
+    # removed documents, so those are re-extracted from the remaining text units
+    # (mostly from the llm cache)
+    previous_graphs = await _load_table(previous_storage, TEXT_UNIT_GRAPHS_TABLE)
+    merge_entities = len(delta.removed_ids) == 0 or previous_graphs is not None
+    delta_names = [TEXT_UNITS_WORKFLOW]
+    if merge_entities:
+        delta_names.append(EXTRACTED_ENTITIES_WORKFLOW)
+    if COVARIATES_WORKFLOW in by_name:
+        delta_names.append(COVARIATES_WORKFLOW)
+
+    outputs: dict[str, pd.DataFrame | None] = dict.fromkeys([
+        *delta_names,
+        TEXT_UNIT_GRAPHS_TABLE,
+    ])
+    if len(delta.new_documents) > 0:
+        delta_storage = await run_delta(
+            [by_name[name] for name in delta_names], delta.new_documents
+        )
+        for name in outputs:
+            outputs[name] = await _load_table(delta_storage, name)
+
+    text_units = merge_text_units(
+        previous[TEXT_UNITS_WORKFLOW],
+        outputs[TEXT_UNITS_WORKFLOW],
+        delta.removed_ids,
+    )
+    merged = {TEXT_UNITS_WORKFLOW: text_units}
+    if merge_entities:
+        operations = (by_name[EXTRACTED_ENTITIES_WORKFLOW].config or {}).get(
+            "graph_merge_operations"
+        )
+        graphs = (
+            merge_text_unit_graphs(
+                previous_graphs, outputs[TEXT_UNIT_GRAPHS_TABLE], text_units
+            )
+            if previous_graphs is not None
+            else None
+        )
+        delta_entities = outputs[EXTRACTED_ENTITIES_WORKFLOW]
+        if len(delta.removed_ids) > 0:
+            merged[EXTRACTED_ENTITIES_WORKFLOW] = merge_extracted_entities(
+                cast(pd.DataFrame, graphs), None, operations
+            )
+        elif delta_entities is not None:
+            merged[EXTRACTED_ENTITIES_WORKFLOW] = merge_extracted_entities(
+                previous[EXTRACTED_ENTITIES_WORKFLOW], delta_entities, operations
+            )
+        else:
+            merged[EXTRACTED_ENTITIES_WORKFLOW] = previous[EXTRACTED_ENTITIES_WORKFLOW]
+        if graphs is not None:
+            await storage.set(f"{TEXT_UNIT_GRAPHS_TABLE}.parquet", graphs.to_parquet())
+    if COVARIATES_WORKFLOW in by_name:
+        merged[COVARIATES_WORKFLOW] = merge_covariates(
+            previous[COVARIATES_WORKFLOW], outputs[COVARIATES_WORKFLOW], text_units
+        )
+
+    for name, table in merged.items():
+        await storage.set(f"{name}.parquet", table.to_parquet())
+
+    previous_nodes = await _load_table(previous_storage, NODES_WORKFLOW)
+    previous_reports = await _load_table(previous_storage, COMMUNITY_REPORTS_WORKFLOW)
+    if previous_nodes is not None and previous_reports is not None:
+        await storage.set(
+            f"{PREVIOUS_REPORTS_TABLE}.parquet",
+            get_previous_community_reports(
+                previous_nodes, previous_reports
+            ).to_parquet(),
+        )
+    return set(merged)
+
+
+def _supports_update(workflows: dict[str | None, PipelineWorkflowReference]) -> bool:
+    if TEXT_UNITS_WORKFLOW not in workflows:
+        log.warning("pipeline does not chunk documents, running a full index")
+        return False
+    if EXTRACTED_ENTITIES_WORKFLOW not in workflows:
+        log.warning("pipeline does not extract entities, running a full index")
+        return False
+    if "id" not in (workflows[TEXT_UNITS_WORKFLOW].config or {}).get("chunk_by", []):
+        # chunks may span documents, so new documents can change existing chunks
+        log.warning("text units are not chunked by document, running a full index")
+        return False
+    return True
+
+
+async def _load_table(storage: PipelineStorage, name: str) -> pd.DataFrame | None:
+    if not await storage.has(f"{name}.parquet"):
+        return None
+    return pd.read_parquet(BytesIO(await storage.get(f"{name}.parquet", as_bytes=True)))
+
+
+async def _append_part(
+    storage: PipelineStorage, name: str, parts: Counter[str], table: pd.DataFrame
+) -> None:
+    await storage.set(_part_key(name, parts[name]), table.to_parquet(index=False))
+    parts[name] += 1
+
+
+async def _concat_parts(storage: PipelineStorage, name: str, num_parts: int) -> None:
+    """Concatenate the parquet parts of a table into a single parquet file, reading one part at a time."""
+    keys = [_part_key(name, index) for index in range(num_parts)]
+    if len(keys) == 0:
+        await storage.set(f"{name}.parquet", pd.DataFrame().to_parquet())
+        return
+
+    # a column that is empty in one part may be typed in another
+    schemas = [
+        pq.read_schema(BytesIO(await storage.get(key, as_bytes=True))) for key in keys
+    ]
+    schema = pa.unify_schemas(schemas, promote_options="permissive").remove_metadata()
+
+    sink = BytesIO()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for key in keys:
+            table = pq.read_table(BytesIO(await storage.get(key, as_bytes=True)))
+            writer.write_table(_conform_table(table, schema))
+    await storage.set(f"{name}.parquet", sink.getvalue())
+    for key in keys:
+        await storage.delete(key)
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    columns = [
+        table.column(field.name)
+        if field.name in table.column_names
+        else pa.nulls(len(table), field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, names=schema.names).cast(schema)
+
+
+def _part_key(name: str, index: int) -> str:
+    return f"{name}.part-{index:05d}.parquet"
+
+
+def _concat(previous: pd.DataFrame, delta: pd.DataFrame | None) -> pd.DataFrame:
+    if delta is None or len(delta) == 0:
+        return previous.reset_index(drop=True)
+    return pd.concat([previous, delta], ignore_index=True)
@@ -4,22 +4,30 @@
 """Utils methods definition."""
 
 from .dicts import dict_has_keys_with_types
+from .graph_serialization import graph_to_graphml, graphs_to_graphml, serialize_graph
 from .hashing import gen_md5_hash
 from .is_null import is_null
 from .load_graph import load_graph
+from .process_pool import map_in_processes
 from .string import clean_str
+from .table_cache import TableCache
 from .tokens import num_tokens_from_string, string_from_tokens
 from .topological_sort import topological_sort
 from .uuid import gen_uuid
 
 __all__ = [
+    "TableCache",
     "clean_str",
     "dict_has_keys_with_types",
     "gen_md5_hash",
     "gen_uuid",
+    "graph_to_graphml",
+    "graphs_to_graphml",
     "is_null",
     "load_graph",
+    "map_in_processes",
     "num_tokens_from_string",
+    "serialize_graph",
     "string_from_tokens",
     "topological_sort",
 ]
@@ -0,0 +1,185 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Binary (Arrow) graph interchange format used between the graph verbs.
+
+A serialized graph is a small header followed by two Arrow IPC streams: a node
+table and an edge table. Every node and edge attribute becomes a column, so
+parsing a graph is a columnar read instead of an XML parse. GraphML is still
+available as an export through `graph_to_graphml`.
+"""
+
+import json
+import logging
+import struct
+from typing import Any
+
+import networkx as nx
+import pandas as pd
+import pyarrow as pa
+from pyarrow.lib import ArrowInvalid, ArrowTypeError
+
+log = logging.getLogger(__name__)
+
+GRAPH_MAGIC = b"GRGRAPH1"
+NODE_KEY_COLUMN = "__node__"
+EDGE_SOURCE_COLUMN = "__source__"
+EDGE_TARGET_COLUMN = "__target__"
+
+_LENGTH = struct.Struct("<Q")
+_DIRECTED_METADATA_KEY = b"directed"
+_GRAPH_ATTRS_METADATA_KEY = b"graph"
+
+
+def is_serialized_graph(value: Any) -> bool:
+    """Check whether a value holds a graph in the binary interchange format."""
+    return isinstance(value, bytes) and value.startswith(GRAPH_MAGIC)
+
+
+def serialize_graph(graph: nx.Graph) -> bytes | str:
+    """Serialize a graph into the binary interchange format.
+
+    Falls back to GraphML when an attribute cannot be represented as a single Arrow
+    column (e.g. a column mixing strings and numbers).
+    """
+    try:
+        return graph_to_bytes(graph)
+    except (ArrowInvalid, ArrowTypeError, TypeError):
+        log.warning(
+            "graph attributes could not be stored as columns, falling back to graphml"
+        )
+        return "\n".join(nx.generate_graphml(graph))
+
+
+def graph_to_bytes(graph: nx.Graph) -> bytes:
+    """Encode a graph as node and edge Arrow tables."""
+    metadata = {
+        _DIRECTED_METADATA_KEY: b"1" if graph.is_directed() else b"0",
+        _GRAPH_ATTRS_METADATA_KEY: json.dumps(graph.graph).encode("utf-8"),
+    }
+    nodes = _to_table(
+        {NODE_KEY_COLUMN: list(graph.nodes)},
+        [data for _, data in graph.nodes(data=True)],
+        metadata,
+    )
+    sources = []
+    targets = []
+    edge_data = []
+    for source, target, data in graph.edges(data=True):  # type: ignore
+        sources.append(source)
+        targets.append(target)
+        edge_data.append(data)
+    edges = _to_table(
+        {EDGE_SOURCE_COLUMN: sources, EDGE_TARGET_COLUMN: targets}, edge_data, None
+    )
+
+    nodes_buffer = _write_ipc(nodes)
+    edges_buffer = _write_ipc(edges)
+    return b"".join([
+        GRAPH_MAGIC,
+        _LENGTH.pack(len(nodes_buffer)),
+        nodes_buffer,
+        edges_buffer,
+    ])
+
+
+def graph_from_bytes(data: bytes) -> nx.Graph:
+    """Decode a graph stored in the binary interchange format."""
+    if not is_serialized_graph(data):
+        msg = "Data is not a serialized graph"
+        raise ValueError(msg)
+    nodes, edges = graph_tables_from_bytes(data)
+    metadata = nodes.schema.metadata or {}
+    graph = nx.DiGraph() if metadata.get(_DIRECTED_METADATA_KEY) == b"1" else nx.Graph()
+    graph.graph.update(json.loads(metadata.get(_GRAPH_ATTRS_METADATA_KEY, b"{}")))
+
+    node_keys = nodes.column(NODE_KEY_COLUMN).to_pylist()
+    graph.add_nodes_from(zip(node_keys, _table_records(nodes, 1), strict=True))
+
+    sources = edges.column(EDGE_SOURCE_COLUMN).to_pylist()
+    targets = edges.column(EDGE_TARGET_COLUMN).to_pylist()
+    graph.add_edges_from(zip(sources, targets, _table_records(edges, 2), strict=True))
+    return graph
+
+
+def graph_tables_from_bytes(data: bytes) -> tuple[pa.Table, pa.Table]:
+    """Read the node and edge tables of a serialized graph without building a networkx graph."""
+    view = memoryview(data)
+    offset = len(GRAPH_MAGIC)
+    (nodes_length,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    nodes = _read_ipc(view[offset : offset + nodes_length])
+    edges = _read_ipc(view[offset + nodes_length :])
+    return nodes, edges
+
+
+def graph_to_graphml(graph: str | bytes | nx.Graph) -> str:
+    """Export a graph, in any supported representation, as a GraphML string."""
+    if isinstance(graph, str):
+        return graph
+    if isinstance(graph, bytes):
+        graph = graph_from_bytes(graph)
+    return "\n".join(nx.generate_graphml(graph))
+
+
+def graphs_to_graphml(data: pd.DataFrame) -> pd.DataFrame:
+    """Replace serialized graphs in a table with GraphML strings, for text-based exports."""
+    columns = [
+        column
+        for column in data.columns
+        if data[column].dtype == object
+        and any(is_serialized_graph(value) for value in data[column])
+    ]
+    if len(columns) == 0:
+        return data
+
+    data = data.copy()
+    for column in columns:
+        data[column] = data[column].map(
+            lambda value: graph_to_graphml(value)
+            if is_serialized_graph(value)
+            else value
+        )
+    return data
+
+
+def _to_table(
+    key_columns: dict[str, list[Any]],
+    records: list[dict[str, Any]],
+    metadata: dict[bytes, bytes] | None,
+) -> pa.Table:
+    attribute_names: dict[str, None] = {}
+    for record in records:
+        for name in record or {}:
+            attribute_names[name] = None
+
+    columns = {name: pa.array(values) for name, values in key_columns.items()}
+    for name in attribute_names:
+        columns[name] = pa.array([(record or {}).get(name) for record in records])
+    return pa.table(columns).replace_schema_metadata(metadata)
+
+
+def _table_records(table: pa.Table, num_key_columns: int) -> list[dict[str, Any]]:
+    """Convert the attribute columns of a table to one dict per row, dropping nulls."""
+    names = table.column_names[num_key_columns:]
+    columns = [table.column(name).to_pylist() for name in names]
+    return [
+        {
+            name: value
+            for name, value in zip(names, row, strict=True)
+            if value is not None
+        }
+        for row in zip(*columns, strict=True)
+    ] or [{} for _ in range(table.num_rows)]
+
+
+def _write_ipc(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _read_ipc(buffer: memoryview) -> pa.Table:
+    with pa.ipc.open_stream(pa.py_buffer(buffer)) as reader:
+        return reader.read_all()
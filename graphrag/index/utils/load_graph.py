@@ -5,7 +5,13 @@
 
 import networkx as nx
 
+from .graph_serialization import graph_from_bytes
 
-def load_graph(graphml: str | nx.Graph) -> nx.Graph:
-    """Load a graph from a graphml file or a networkx graph."""
-    return nx.parse_graphml(graphml) if isinstance(graphml, str) else graphml
+
+def load_graph(graphml: str | bytes | nx.Graph) -> nx.Graph:
+    """Load a graph from a graphml string, a serialized graph or a networkx graph."""
+    if isinstance(graphml, str):
+        return nx.parse_graphml(graphml)
+    if isinstance(graphml, bytes):
+        return graph_from_bytes(graphml)
+    return graphml
@@ -0,0 +1,81 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Run CPU-bound work on a pool of worker processes."""
+
+import logging
+import math
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# the number of shards handed to each worker, more shards balance uneven rows better
+SHARDS_PER_PROCESS = 4
+
+_shared: Any = None
+
+
+def map_in_processes(
+    fn: Callable[[T, Any], R],
+    items: Iterable[T],
+    num_processes: int,
+    shared: Any = None,
+) -> Iterator[R]:
+    """Call fn(item, shared) for every item, on up to num_processes worker processes.
+
+    The items are split into contiguous shards, and the results are yielded in item
+    order. shared holds the immutable inputs common to every item. It is sent to each
+    worker once when the worker starts, instead of with every item. fn must be a
+    module level function so that it can be sent to the workers.
+
+    The workers are not forked from the current process, whose threads, such as those
+    of concurrent workflows calling the LLMs, may hold locks that a forked worker
+    would inherit held and never see released. They are forked from a single-threaded
+    fork server that has imported graphrag once, or spawned where there is no fork
+    server.
+
+    With num_processes <= 1, or a single item, everything runs in the current process.
+    """
+    items = list(items)
+    num_processes = min(num_processes, len(items))
+    if num_processes <= 1:
+        for item in items:
+            yield fn(item, shared)
+        return
+
+    chunksize = math.ceil(len(items) / (num_processes * SHARDS_PER_PROCESS))
+    log.info(
+        "running %s on %s processes: %s items", fn.__name__, num_processes, len(items)
+    )
+    with ProcessPoolExecutor(
+        max_workers=num_processes,
+        mp_context=_get_context(),
+        initializer=_set_shared,
+        initargs=(shared,),
+    ) as executor:
+        yield from executor.map(partial(_call, fn), items, chunksize=chunksize)
+
+
+def _get_context() -> Any:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # the workers are forked with the modules of the verbs they run already imported
+    context.set_forkserver_preload(["graphrag.index"])
+    return context
+
+
+def _set_shared(shared: Any) -> None:
+    global _shared
+    _shared = shared
+
+
+def _call(fn: Callable[[T, Any], R], item: T) -> R:
+    return fn(item, _shared)
@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A bounded in-memory cache for the tables handed between workflows."""
+
+import logging
+from collections import OrderedDict
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+class TableCache:
+    """Keep recently emitted workflow outputs in memory, within a memory budget.
+
+    Tables are evicted least recently used first once the budget is exceeded, so a
+    miss always means the caller has to read the table back from storage.
+    """
+
+    _tables: OrderedDict[str, tuple[pd.DataFrame, int]]
+    _max_size: int
+    _size: int
+
+    def __init__(self, max_size: int):
+        """Create a cache holding at most max_size bytes of table data."""
+        self._tables = OrderedDict()
+        self._max_size = max_size
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The estimated number of bytes held by the cache."""
+        return self._size
+
+    def get(self, name: str) -> pd.DataFrame | None:
+        """Get a copy of a cached table, or None if it is not cached."""
+        entry = self._tables.get(name)
+        if entry is None:
+            return None
+        self._tables.move_to_end(name)
+        # verbs are free to modify their inputs, so never hand out the cached frame
+        return entry[0].copy()
+
+    def set(self, name: str, table: pd.DataFrame) -> None:
+        """Cache a table, evicting the least recently used tables to stay within budget."""
+        self.discard(name)
+        size = int(table.memory_usage(index=True, deep=True).sum())
+        if size > self._max_size:
+            log.debug(
+                "table %s (%s bytes) exceeds the table cache budget, not caching",
+                name,
+                size,
+            )
+            return
+
+        self._tables[name] = (table, size)
+        self._size += size
+        while self._size > self._max_size:
+            evicted, (_, evicted_size) = self._tables.popitem(last=False)
+            self._size -= evicted_size
+            log.info("evicted table %s from the table cache", evicted)
+
+    def discard(self, name: str) -> None:
+        """Remove a table from the cache, if present."""
+        entry = self._tables.pop(name, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def clear(self) -> None:
+        """Remove every table from the cache."""
+        self._tables.clear()
+        self._size = 0
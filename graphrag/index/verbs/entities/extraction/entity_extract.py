@@ -66,7 +66,7 @@ async def entity_extract(
             "column": "the_document_text_column_to_extract_entities_from", /* In general this will be your document text column */
             "id_column": "the_column_with_the_unique_id_for_each_row", /* In general this will be your document id */
             "to": "the_column_to_output_the_entities_to", /* This will be a list[dict[str, Any]] a list of entities, with a name, and additional attributes */
-            "graph_to": "the_column_to_output_the_graphml_to", /* Optional: This will be a graphml graph in string form which represents the entities and their relationships */
+            "graph_to": "the_column_to_output_the_graph_to", /* Optional: This will be a serialized graph (see graphrag.index.utils.serialize_graph) which represents the entities and their relationships */
             "strategy": {...} <strategy_config>, see strategies section below
             "entity_types": ["list", "of", "entity", "types", "to", "extract"] /* Optional: This will limit the entity types extracted, default: ["organization", "person", "geo", "event"] */
             "summarize_descriptions" : true | false /* Optional: This will summarize the descriptions of the entities and relationships, default: true */
@@ -80,7 +80,7 @@ async def entity_extract(
         column: the_document_text_column_to_extract_entities_from
         id_column: the_column_with_the_unique_id_for_each_row
         to: the_column_to_output_the_entities_to
-        graph_to: the_column_to_output_the_graphml_to
+        graph_to: the_column_to_output_the_graph_to
         strategy: <strategy_config>, see strategies section below
         summarize_descriptions: true | false /* Optional: This will summarize the descriptions of the entities and relationships, default: true */
         entity_types:
@@ -156,7 +156,7 @@ async def entity_extract(
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.graphml_graph]
+        return [result.entities, result.graph]
 
     results = await derive_from_rows(
         output,
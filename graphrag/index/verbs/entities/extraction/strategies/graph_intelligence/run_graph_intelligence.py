@@ -3,7 +3,6 @@
 
 """A module containing run_gi,  run_extract_entities and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
 from datashaper import VerbCallbacks
 
 import graphrag.config.defaults as defs
@@ -16,6 +15,7 @@ from graphrag.index.text_splitting import (
     TextSplitter,
     TokenTextSplitter,
 )
+from graphrag.index.utils import serialize_graph
 from graphrag.index.verbs.entities.extraction.strategies.typing import (
     Document,
     EntityExtractionResult,
@@ -115,8 +115,7 @@ async def run_extract_entities(
         if item is not None
     ]
 
-    graph_data = "".join(nx.generate_graphml(graph))
-    return EntityExtractionResult(entities, graph_data)
+    return EntityExtractionResult(entities, serialize_graph(graph))
 
 
 def _create_text_splitter(
@@ -29,7 +29,7 @@ class EntityExtractionResult:
     """Entity extraction result class definition."""
 
     entities: list[ExtractedEntity]
-    graphml_graph: str | None
+    graph: bytes | str | None
 
 
 EntityExtractStrategy = Callable[
@@ -6,12 +6,11 @@
 import asyncio
 import logging
 from enum import Enum
-from typing import Any, NamedTuple, cast
+from typing import Any, cast
 
 import networkx as nx
 import pandas as pd
 from datashaper import (
-    ProgressTicker,
     TableContainer,
     VerbCallbacks,
     VerbInput,
@@ -20,19 +19,13 @@ from datashaper import (
 )
 
 from graphrag.index.cache import PipelineCache
-from graphrag.index.utils import load_graph
+from graphrag.index.utils import load_graph, serialize_graph
 
 from .strategies.typing import SummarizationStrategy
 
 log = logging.getLogger(__name__)
 
 
-class DescriptionSummarizeRow(NamedTuple):
-    """DescriptionSummarizeRow class definition."""
-
-    graph: Any
-
-
 class SummarizeStrategyType(str, Enum):
     """SummarizeStrategyType class definition."""
 
@@ -66,8 +59,8 @@ async def summarize_descriptions(
     {
         "verb": "",
         "args": {
-            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a graphml graph in string form which represents the entities and their relationships */
-            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a graphml graph in string form which represents the entities and their relationships after being summarized */
+            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a serialized graph which represents the entities and their relationships */
+            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a serialized graph which represents the entities and their relationships after being summarized */
             "strategy": {...} <strategy_config>, see strategies section below
         }
     }
@@ -118,81 +111,71 @@ async def summarize_descriptions(
     )
     strategy_config = {**strategy}
 
-    async def get_resolved_entities(row, semaphore: asyncio.Semaphore):
-        graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
-
-        ticker_length = len(graph.nodes) + len(graph.edges)
-
-        ticker = progress_ticker(callbacks.progress, ticker_length)
-
-        futures = [
-            do_summarize_descriptions(
-                node,
-                sorted(set(graph.nodes[node].get("description", "").split("\n"))),
-                ticker,
-                semaphore,
-            )
-            for node in graph.nodes()
-        ]
-        futures += [
-            do_summarize_descriptions(
-                edge,
-                sorted(set(graph.edges[edge].get("description", "").split("\n"))),
-                ticker,
-                semaphore,
-            )
-            for edge in graph.edges()
-        ]
-
-        results = await asyncio.gather(*futures)
-
-        for result in results:
-            graph_item = result.items
-            if isinstance(graph_item, str) and graph_item in graph.nodes():
-                graph.nodes[graph_item]["description"] = result.description
-            elif isinstance(graph_item, tuple) and graph_item in graph.edges():
-                graph.edges[graph_item]["description"] = result.description
-
-        return DescriptionSummarizeRow(
-            graph="\n".join(nx.generate_graphml(graph)),
-        )
+    # Graph is always on row 0, but the summaries of all rows are planned together.
+    # Items with a single description need no summary, and the same item with the
+    # same descriptions in several rows is summarized once. The remaining requests
+    # run concurrently, limited by num_threads.
+    graphs: list[nx.Graph] = [
+        load_graph(cast(str | bytes | nx.Graph, getattr(row, column)))
+        for row in output.itertuples()
+    ]
+    requests = _plan_summaries(graphs)
+    log.info("summarizing %s descriptions in %s rows", len(requests), len(graphs))
+    ticker = progress_ticker(callbacks.progress, len(requests))
+    semaphore = asyncio.Semaphore(kwargs.get("num_threads", 4))
 
     async def do_summarize_descriptions(
         graph_item: str | tuple[str, str],
-        descriptions: list[str],
-        ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
-    ):
+        descriptions: tuple[str, ...],
+        targets: list[dict],
+    ) -> None:
         async with semaphore:
-            results = await strategy_exec(
+            result = await strategy_exec(
                 graph_item,
-                descriptions,
+                list(descriptions),
                 callbacks,
                 cache,
                 strategy_config,
             )
             ticker(1)
-        return results
+        for target in targets:
+            target["description"] = result.description
 
-    # Graph is always on row 0, so here a derive from rows does not work
-    # This iteration will only happen once, but avoids hardcoding a iloc[0]
-    # Since parallelization is at graph level (nodes and edges), we can't use
-    # the parallelization of the derive_from_rows
-    semaphore = asyncio.Semaphore(kwargs.get("num_threads", 4))
+    await asyncio.gather(
+        *(
+            do_summarize_descriptions(graph_item, descriptions, targets)
+            for (graph_item, descriptions), targets in requests.items()
+        )
+    )
+
+    output[to] = [serialize_graph(graph) for graph in graphs]
+    return TableContainer(table=output)
 
-    results = [
-        await get_resolved_entities(row, semaphore) for row in output.itertuples()
-    ]
 
-    to_result = []
+def _plan_summaries(
+    graphs: list[nx.Graph],
+) -> dict[tuple[str | tuple[str, str], tuple[str, ...]], list[dict]]:
+    """Plan the summaries of the nodes and edges of the graphs.
 
-    for result in results:
-        if result:
-            to_result.append(result.graph)
+    Items with at most one distinct description get it as their description. The
+    others are grouped by item and descriptions, each group maps to the attributes of
+    the nodes and edges to update with its summary.
+    """
+    requests: dict[tuple[str | tuple[str, str], tuple[str, ...]], list[dict]] = {}
+
+    def plan(graph_item: str | tuple[str, str], attributes: dict) -> None:
+        descriptions = tuple(sorted(set(attributes.get("description", "").split("\n"))))
+        if len(descriptions) == 1:
+            attributes["description"] = descriptions[0]
         else:
-            to_result.append(None)
-    output[to] = to_result
-    return TableContainer(table=output)
+            requests.setdefault((graph_item, descriptions), []).append(attributes)
+
+    for graph in graphs:
+        for node, attributes in graph.nodes(data=True):
+            plan(node, attributes)
+        for source, target, attributes in graph.edges(data=True):
+            plan((source, target), attributes)
+    return requests
 
 
 def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy:
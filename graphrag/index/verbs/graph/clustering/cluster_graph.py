@@ -3,6 +3,8 @@
 
 """A module containing cluster_graph, apply_clustering and run_layout methods definition."""
 
+import hashlib
+import json
 import logging
 from enum import Enum
 from random import Random
@@ -12,31 +14,44 @@ import networkx as nx
 import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, progress_iterable, verb
 
-from graphrag.index.utils import gen_uuid, load_graph
+from graphrag.index.cache import PipelineCache
+from graphrag.index.graph.utils import CSRGraph
+from graphrag.index.utils import (
+    gen_uuid,
+    load_graph,
+    map_in_processes,
+    serialize_graph,
+)
 
 from .typing import Communities
 
 log = logging.getLogger(__name__)
 
+# the version of the clustering algorithms, part of the key of the cached communities
+# so a change to how graphs are clustered isn't served communities cached before it
+CLUSTERING_VERSION = 3
+
 
 @verb(name="cluster_graph")
-def cluster_graph(
+async def cluster_graph(
     input: VerbInput,
+    cache: PipelineCache,
     callbacks: VerbCallbacks,
     strategy: dict[str, Any],
     column: str,
     to: str,
     level_to: str | None = None,
+    num_processes: int = 1,
     **_kwargs,
 ) -> TableContainer:
     """
-    Apply a hierarchical clustering algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the clustered graph, and a new column containing the level of the graph.
+    Apply a hierarchical clustering algorithm to a graph. The graph is expected to be a serialized graph or a graphml string. The verb outputs a new column containing the clustered graph, and a new column containing the level of the graph.
 
     ## Usage
     ```yaml
     verb: cluster_graph
     args:
-        column: entity_graph # The name of the column containing the graph, should be a graphml graph
+        column: entity_graph # The name of the column containing the graph, should be a serialized graph or a graphml graph
         to: clustered_graph # The name of the column to output the clustered graph to
         level_to: level # The name of the column to output the level to
         strategy: <strategy config> # See strategies section below
@@ -56,9 +71,21 @@ def cluster_graph(
         levels: [0, 1] # Optional, the levels to output, default: all the levels detected
 
     ```
+
+    ## Cache
+    The communities of each graph are cached, keyed by a fingerprint of its nodes and edges, the strategy config and the version of the clustering, so a graph clustered by an earlier run isn't clustered again. Without `use_lcc`, each connected component is clustered and cached on its own, so only the components changed since an earlier run are clustered again.
+
+    ## Process pool
+    With `num_processes` above 1, the clustered graph of each level is built on a pool of worker processes.
     """
     output_df = cast(pd.DataFrame, input.get_input())
-    results = output_df[column].apply(lambda graph: run_layout(strategy, graph))
+    # Parse each graph once, it is shared by the clustering and every output level
+    graphs = [load_graph(graph) for graph in output_df[column]]
+    cluster_cache = cache.child("cluster_graph")
+    results = pd.Series(
+        [await _cached_layout(cluster_cache, strategy, graph) for graph in graphs],
+        index=output_df.index,
+    )
 
     community_map_to = "communities"
     output_df[community_map_to] = results
@@ -71,27 +98,27 @@ def cluster_graph(
 
     num_total = len(output_df)
 
+    # The graphs and communities are sent to each worker once, and every
+    # (row, level) pair is clustered and serialized on its own
+    row_levels = [
+        (position, level)
+        for position, levels in enumerate(output_df[level_to])
+        for level in levels
+    ]
+    clustered_graphs = map_in_processes(
+        _apply_clustering,
+        row_levels,
+        num_processes,
+        (graphs, output_df[community_map_to].tolist()),
+    )
+
     # Go through each of the rows
-    graph_level_pairs_column: list[list[tuple[int, str]]] = []
-    for _, row in progress_iterable(
-        output_df.iterrows(), callbacks.progress, num_total
-    ):
-        levels = row[level_to]
-        graph_level_pairs: list[tuple[int, str]] = []
-
-        # For each of the levels, get the graph and add it to the list
-        for level in levels:
-            graph = "\n".join(
-                nx.generate_graphml(
-                    apply_clustering(
-                        cast(str, row[column]),
-                        cast(Communities, row[community_map_to]),
-                        level,
-                    )
-                )
-            )
-            graph_level_pairs.append((level, graph))
-        graph_level_pairs_column.append(graph_level_pairs)
+    graph_level_pairs_column: list[list[tuple[int, bytes | str]]] = [
+        [(level, next(clustered_graphs)) for level in levels]
+        for levels in progress_iterable(
+            output_df[level_to], callbacks.progress, num_total
+        )
+    ]
     output_df[to] = graph_level_pairs_column
 
     # explode the list of (level, graph) pairs into separate rows
@@ -109,13 +136,61 @@ def cluster_graph(
     return TableContainer(table=output_df)
 
 
-# TODO: This should support str | nx.Graph as a graphml param
+async def _cached_layout(
+    cache: PipelineCache, strategy: dict[str, Any], graph: nx.Graph
+) -> Communities:
+    csr_graph = CSRGraph.from_graph(graph)
+    if strategy.get("use_lcc", True):
+        return await _cached_communities(cache, strategy, csr_graph)
+
+    # communities never span connected components, so each component is clustered
+    # and cached on its own, and a component an update didn't touch keeps its
+    # communities. The cluster ids are numbered across the components.
+    communities: Communities = []
+    cluster_ids: dict[tuple[int, str], str] = {}
+    for index, component in enumerate(csr_graph.connected_components()):
+        if component.num_edges == 0:
+            continue
+        for level, cluster_id, nodes in await _cached_communities(
+            cache, strategy, component
+        ):
+            new_id = cluster_ids.setdefault((index, cluster_id), str(len(cluster_ids)))
+            communities.append((level, new_id, nodes))
+    return communities
+
+
+async def _cached_communities(
+    cache: PipelineCache, strategy: dict[str, Any], csr_graph: CSRGraph
+) -> Communities:
+    key = hashlib.sha256(
+        f"{CLUSTERING_VERSION}:{csr_graph.fingerprint()}:{json.dumps(strategy, sort_keys=True, default=str)}".encode()
+    ).hexdigest()
+    cached = await cache.get(key)
+    if cached is not None:
+        # the cache may hand the tuples back as lists
+        return [cast(tuple[int, str, list[str]], tuple(row)) for row in cached]
+
+    communities = run_layout(strategy, csr_graph)
+    await cache.set(key, communities)
+    return communities
+
+
+def _apply_clustering(
+    row_level: tuple[int, int], shared: tuple[list[nx.Graph], list[Communities]]
+) -> bytes | str:
+    position, level = row_level
+    graphs, communities = shared
+    return serialize_graph(
+        apply_clustering(graphs[position], communities[position], level)
+    )
+
+
 def apply_clustering(
-    graphml: str, communities: Communities, level=0, seed=0xF001
+    graphml: str | bytes | nx.Graph, communities: Communities, level=0, seed=0xF001
 ) -> nx.Graph:
-    """Apply clustering to a graphml string."""
+    """Apply clustering to a graph, networkx graphs are copied rather than modified."""
     random = Random(seed)  # noqa S311
-    graph = nx.parse_graphml(graphml)
+    graph = graphml.copy() if isinstance(graphml, nx.Graph) else load_graph(graphml)
     for community_level, community_id, nodes in communities:
         if level == community_level:
             for node in nodes:
@@ -150,11 +225,15 @@ class GraphCommunityStrategyType(str, Enum):
 
 
 def run_layout(
-    strategy: dict[str, Any], graphml_or_graph: str | nx.Graph
+    strategy: dict[str, Any], graphml_or_graph: str | bytes | nx.Graph | CSRGraph
 ) -> Communities:
     """Run layout method definition."""
-    graph = load_graph(graphml_or_graph)
-    if len(graph.nodes) == 0:
+    graph = (
+        graphml_or_graph
+        if isinstance(graphml_or_graph, CSRGraph)
+        else CSRGraph.from_graph(load_graph(graphml_or_graph))
+    )
+    if graph.num_nodes == 0:
         log.warning("Graph has no nodes")
         return []
 
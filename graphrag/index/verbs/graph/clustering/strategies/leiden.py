@@ -6,15 +6,17 @@
 import logging
 from typing import Any
 
+import graspologic_native as gn
 import networkx as nx
-from graspologic.partition import hierarchical_leiden
 
-from graphrag.index.graph.utils import stable_largest_connected_component
+from graphrag.index.graph.utils import CSRGraph
 
 log = logging.getLogger(__name__)
 
 
-def run(graph: nx.Graph, args: dict[str, Any]) -> dict[int, dict[str, list[str]]]:
+def run(
+    graph: nx.Graph | CSRGraph, args: dict[str, Any]
+) -> dict[int, dict[str, list[str]]]:
     """Run method definition."""
     max_cluster_size = args.get("max_cluster_size", 10)
     use_lcc = args.get("use_lcc", True)
@@ -49,21 +51,36 @@ def run(graph: nx.Graph, args: dict[str, Any]) -> dict[int, dict[str, list[str]]
 
 # Taken from graph_intelligence & adapted
 def _compute_leiden_communities(
-    graph: nx.Graph | nx.DiGraph,
+    graph: nx.Graph | CSRGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed=0xDEADBEEF,
 ) -> dict[int, dict[str, int]]:
     """Return Leiden root communities."""
+    if isinstance(graph, nx.Graph):
+        graph = CSRGraph.from_graph(graph)
     if use_lcc:
-        graph = stable_largest_connected_component(graph)
+        graph = graph.stable_largest_connected_component()
 
-    community_mapping = hierarchical_leiden(
-        graph, max_cluster_size=max_cluster_size, random_seed=seed
+    # Leiden runs over the integer node ids, with the arguments graspologic's
+    # hierarchical_leiden gives it. graspologic leaves the self loops out of edge
+    # lists, but not out of the networkx graphs this was run on before.
+    community_mapping = gn.hierarchical_leiden(  # type: ignore
+        edges=[
+            (str(source), str(target), weight)
+            for source, target, weight in graph.edge_list()
+        ],
+        starting_communities=None,
+        resolution=1.0,
+        randomness=0.001,
+        iterations=1,
+        use_modularity=True,
+        max_cluster_size=max_cluster_size,
+        seed=seed,
     )
     results: dict[int, dict[str, int]] = {}
     for partition in community_mapping:
         results[partition.level] = results.get(partition.level, {})
-        results[partition.level][partition.node] = partition.cluster
+        results[partition.level][graph.names[int(partition.node)]] = partition.cluster
 
     return results
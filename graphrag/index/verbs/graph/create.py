@@ -9,7 +9,7 @@ import networkx as nx
 import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, progress_iterable, verb
 
-from graphrag.index.utils import clean_str
+from graphrag.index.utils import clean_str, serialize_graph
 
 DEFAULT_NODE_ATTRIBUTES = ["label", "type", "id", "name", "description", "community"]
 DEFAULT_EDGE_ATTRIBUTES = ["label", "type", "name", "source", "target"]
@@ -34,7 +34,7 @@ def create_graph(
     verb: create_graph
     args:
         type: node # The type of graph to create, one of: node, edge
-        to: <column name> # The name of the column to output the graph to, this will be a graphml graph
+        to: <column name> # The name of the column to output the graph to, this will be a serialized graph
         attributes: # The attributes for the nodes / edges
             # If using the node type, the following attributes are required:
             id: <id_column_name>
@@ -81,8 +81,7 @@ def create_graph(
             target = clean_str(row[target_col])
             out_graph.add_edge(source, target, **item_attributes)
 
-    graphml_string = "".join(nx.generate_graphml(out_graph))
-    output_df = pd.DataFrame([{to: graphml_string}])
+    output_df = pd.DataFrame([{to: serialize_graph(out_graph)}])
     return TableContainer(table=output_df)
 
 
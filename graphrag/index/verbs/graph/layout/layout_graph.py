@@ -11,7 +11,7 @@ import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, progress_callback, verb
 
 from graphrag.index.graph.visualization import GraphLayout
-from graphrag.index.utils import load_graph
+from graphrag.index.utils import load_graph, serialize_graph
 from graphrag.index.verbs.graph.embed.typing import NodeEmbeddings
 
 
@@ -38,13 +38,13 @@ def layout_graph(
     **_kwargs: dict,
 ) -> TableContainer:
     """
-    Apply a layout algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the laid out graph.
+    Apply a layout algorithm to a graph. The graph is expected to be a serialized graph or a graphml string. The verb outputs a new column containing the laid out graph.
 
     ## Usage
     ```yaml
     verb: layout_graph
     args:
-        graph_column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        graph_column: clustered_graph # The name of the column containing the graph, should be a serialized graph or a graphml graph
         embeddings_column: embeddings # The name of the column containing the embeddings
         to: node_positions # The name of the column to output the node positions to
         graph_to: positioned_graph # The name of the column to output the positioned graph to
@@ -98,7 +98,7 @@ def layout_graph(
 
 def _run_layout(
     strategy: LayoutGraphStrategyType,
-    graphml_or_graph: str | nx.Graph,
+    graphml_or_graph: str | bytes | nx.Graph,
     embeddings: NodeEmbeddings,
     args: dict[str, Any],
     reporter: VerbCallbacks,
@@ -128,12 +128,12 @@ def _run_layout(
 
 
 def _apply_layout_to_graph(
-    graphml_or_graph: str | nx.Graph, layout: GraphLayout
-) -> str:
+    graphml_or_graph: str | bytes | nx.Graph, layout: GraphLayout
+) -> bytes | str:
     graph = load_graph(graphml_or_graph)
     for node_position in layout:
         if node_position.label in graph.nodes:
             graph.nodes[node_position.label]["x"] = node_position.x
             graph.nodes[node_position.label]["y"] = node_position.y
             graph.nodes[node_position.label]["size"] = node_position.size
-    return "\n".join(nx.generate_graphml(graph))
+    return serialize_graph(graph)
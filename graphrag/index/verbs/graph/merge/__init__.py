@@ -3,6 +3,6 @@
 
 """The Indexing Engine graph merge package root."""
 
-from .merge_graphs import merge_graphs
+from .merge_graphs import GraphMerger, get_merge_operations, merge_graphs
 
-__all__ = ["merge_graphs"]
+__all__ = ["GraphMerger", "get_merge_operations", "merge_graphs"]
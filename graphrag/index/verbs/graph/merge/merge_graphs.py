@@ -1,15 +1,16 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing merge_graphs, merge_nodes, merge_edges, merge_attributes, apply_merge_operation and _get_detailed_attribute_merge_operation methods definitions."""
+"""A module containing merge_graphs, merge_all_graphs, GraphMerger, get_merge_operations, merge_nodes, merge_edges, merge_attributes, apply_merge_operation and _get_detailed_attribute_merge_operation methods definitions."""
 
-from typing import Any, cast
+from collections.abc import Iterable
+from typing import Any
 
 import networkx as nx
 import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, progress_iterable, verb
 
-from graphrag.index.utils import load_graph
+from graphrag.index.utils import load_graph, map_in_processes, serialize_graph
 
 from .defaults import (
     DEFAULT_CONCAT_SEPARATOR,
@@ -32,10 +33,11 @@ def merge_graphs(
     to: str,
     nodes: dict[str, Any] = DEFAULT_NODE_OPERATIONS,
     edges: dict[str, Any] = DEFAULT_EDGE_OPERATIONS,
+    num_processes: int = 1,
     **_kwargs,
 ) -> TableContainer:
     """
-    Merge multiple graphs together. The graphs are expected to be in graphml format. The verb outputs a new column containing the merged graph.
+    Merge multiple graphs together. The graphs are expected to be serialized graphs or graphml strings. The verb outputs a new column containing the merged graph.
 
     > Note: This will merge all rows into a single graph.
 
@@ -43,7 +45,7 @@ def merge_graphs(
     ```yaml
     verb: merge_graph
     args:
-        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        column: clustered_graph # The name of the column containing the graph, should be a serialized graph or a graphml graph
         to: merged_graph # The name of the column to output the merged graph to
         nodes: <node operations> # See node operations section below
         edges: <edge operations> # See edge operations section below
@@ -81,31 +83,159 @@ def merge_graphs(
     - __min__: This operation takes the min of the attribute with the last value seen.
     - __average__: This operation takes the mean of the attribute with the last value seen.
     - __multiply__: This operation multiplies the attribute with the last value seen.
+
+    ## Process pool
+    With `num_processes` above 1, the graphs are parsed on a pool of worker processes.
     """
     input_df = input.get_input()
     output = pd.DataFrame()
 
-    node_ops = {
-        attrib: _get_detailed_attribute_merge_operation(value)
-        for attrib, value in nodes.items()
-    }
-    edge_ops = {
-        attrib: _get_detailed_attribute_merge_operation(value)
-        for attrib, value in edges.items()
-    }
+    node_ops = get_merge_operations(nodes)
+    edge_ops = get_merge_operations(edges)
 
-    mega_graph = nx.Graph()
     num_total = len(input_df)
-    for graphml in progress_iterable(input_df[column], callbacks.progress, num_total):
-        graph = load_graph(cast(str | nx.Graph, graphml))
-        merge_nodes(mega_graph, graph, node_ops)
-        merge_edges(mega_graph, graph, edge_ops)
+    # parsing dominates, so only the parsing is spread over the process pool, and
+    # the graphs are still merged in row order
+    graphs = map_in_processes(_load_graph, input_df[column].tolist(), num_processes)
+    mega_graph = merge_all_graphs(
+        progress_iterable(graphs, callbacks.progress, num_total), node_ops, edge_ops
+    )
 
-    output[to] = ["\n".join(nx.generate_graphml(mega_graph))]
+    output[to] = [serialize_graph(mega_graph)]
 
     return TableContainer(table=output)
 
 
+def _load_graph(graphml: str | bytes | nx.Graph, _shared: None) -> nx.Graph:
+    return load_graph(graphml)
+
+
+def merge_all_graphs(
+    graphs: Iterable[nx.Graph],
+    node_ops: dict[str, DetailedAttributeMergeOperation],
+    edge_ops: dict[str, DetailedAttributeMergeOperation],
+) -> nx.Graph:
+    """Merge the graphs in order into a new graph.
+
+    The result is identical to calling merge_nodes and merge_edges with every graph,
+    but the node and edge records of all graphs are collected first and each item is
+    merged once, so concat operations don't rebuild the accumulated string for every
+    duplicate.
+    """
+    merger = GraphMerger(node_ops, edge_ops)
+    for graph in graphs:
+        merger.add(graph)
+    return merger.merged()
+
+
+class GraphMerger:
+    """Collect the node and edge records of graphs added one at a time, and merge them once at the end, like merge_all_graphs."""
+
+    def __init__(
+        self,
+        node_ops: dict[str, DetailedAttributeMergeOperation],
+        edge_ops: dict[str, DetailedAttributeMergeOperation],
+    ):
+        """Create a merger with the operations of merge_all_graphs."""
+        self._node_ops = node_ops
+        self._edge_ops = edge_ops
+        self._nodes: dict[Any, list[dict[str, Any]]] = {}
+        self._edges: dict[tuple[Any, Any], list[dict[str, Any]]] = {}
+
+    def add(self, graph: nx.Graph) -> None:
+        """Add the records of a graph, the graph itself is not kept."""
+        for node, node_data in graph.nodes(data=True):
+            self._nodes.setdefault(node, []).append(node_data)
+        for source, target, edge_data in graph.edges(data=True):  # type: ignore
+            # the merged graph is undirected, so either direction is the same edge
+            key = (
+                (target, source)
+                if (target, source) in self._edges
+                else (source, target)
+            )
+            self._edges.setdefault(key, []).append(edge_data)
+
+    def merged(self) -> nx.Graph:
+        """Merge the records of every graph added so far into a new graph."""
+        merged = nx.Graph()
+        merged.add_nodes_from(
+            (node, _merge_records(records, self._node_ops))
+            for node, records in self._nodes.items()
+        )
+        merged.add_edges_from(
+            (source, target, _merge_records(records, self._edge_ops))
+            for (source, target), records in self._edges.items()
+        )
+        return merged
+
+
+def get_merge_operations(
+    ops: dict[str, Any],
+) -> dict[str, DetailedAttributeMergeOperation]:
+    """Normalize the operations of the merge_graphs verb arguments."""
+    return {
+        attrib: _get_detailed_attribute_merge_operation(value)
+        for attrib, value in ops.items()
+    }
+
+
+def _merge_records(
+    records: list[dict[str, Any]],
+    ops: dict[str, DetailedAttributeMergeOperation],
+) -> dict[str, Any]:
+    """Merge the attributes of every record of an item into the first one, like merge_attributes."""
+    target_item = dict(records[0] or {})
+    if not target_item:
+        # merge_attributes drops merges into an item without attributes
+        return target_item
+
+    # the parts of concatenated attributes, joined once every record is merged
+    concats: dict[
+        str, tuple[DetailedAttributeMergeOperation, list[str] | set[str]]
+    ] = {}
+
+    def merge(
+        source_item: dict[str, Any], attrib: str, op: DetailedAttributeMergeOperation
+    ):
+        if op.operation != StringOperation.Concat:
+            apply_merge_operation(target_item, source_item, attrib, op)
+            return
+
+        separator = op.separator or DEFAULT_CONCAT_SEPARATOR
+        if attrib not in concats:
+            value = f"{target_item.get(attrib, '') or ''}"
+            concats[attrib] = (
+                op,
+                set(value.split(separator)) if op.distinct else [value],
+            )
+            # keep the attribute order of merge_attributes
+            target_item[attrib] = value
+        value = f"{source_item.get(attrib, '') or ''}"
+        parts = concats[attrib][1]
+        if isinstance(parts, set):
+            parts.update(value.split(separator))
+        else:
+            parts.append(value)
+
+    for source_item in records[1:]:
+        source_item = source_item or {}
+        for op_attrib, op in ops.items():
+            if op_attrib == "*":
+                for attrib in source_item:
+                    if attrib not in ops:
+                        merge(source_item, attrib, op)
+            elif op_attrib in source_item or op_attrib in target_item:
+                merge(source_item, op_attrib, op)
+
+    for attrib, (op, parts) in concats.items():
+        separator = op.separator or DEFAULT_CONCAT_SEPARATOR
+        # distinct parts are sorted, like the merges of apply_merge_operation
+        target_item[attrib] = separator.join(
+            sorted(parts) if isinstance(parts, set) else parts
+        )
+    return target_item
+
+
 def merge_nodes(
     target: nx.Graph,
     subgraph: nx.Graph,
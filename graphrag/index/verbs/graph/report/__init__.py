@@ -4,8 +4,10 @@
 """The Indexing Engine graph report package root."""
 
 from .create_community_reports import (
+    PREVIOUS_REPORTS_TABLE,
     CreateCommunityReportsStrategyType,
     create_community_reports,
+    get_community_members,
 )
 from .prepare_community_reports import prepare_community_reports
 from .prepare_community_reports_claims import prepare_community_reports_claims
@@ -14,9 +16,10 @@ from .prepare_community_reports_nodes import prepare_community_reports_nodes
 from .restore_community_hierarchy import restore_community_hierarchy
 
 __all__ = [
+    "PREVIOUS_REPORTS_TABLE",
     "CreateCommunityReportsStrategyType",
     "create_community_reports",
-    "create_community_reports",
+    "get_community_members",
     "prepare_community_reports",
     "prepare_community_reports_claims",
     "prepare_community_reports_edges",
@@ -1,10 +1,11 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing create_community_reports and load_strategy methods definition."""
+"""A module containing create_community_reports, get_community_members and load_strategy methods definition."""
 
 import logging
 from enum import Enum
+from io import BytesIO
 from typing import cast
 
 import pandas as pd
@@ -26,12 +27,18 @@ from graphrag.index.graph.extractors.community_reports import (
     get_levels,
     prep_community_report_context,
 )
+from graphrag.index.storage import PipelineStorage
 from graphrag.index.utils.ds_util import get_required_input_table
 
 from .strategies.typing import CommunityReport, CommunityReportsStrategy
 
 log = logging.getLogger(__name__)
 
+PREVIOUS_REPORTS_TABLE = "previous_community_reports"
+"""The table of storage holding the reports of the run an update starts from, with the members of their communities."""
+
+CommunityKey = tuple[int, tuple[str, ...]]
+
 
 class CreateCommunityReportsStrategyType(str, Enum):
     """CreateCommunityReportsStrategyType class definition."""
@@ -48,12 +55,16 @@ async def create_community_reports(
     input: VerbInput,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
+    storage: PipelineStorage,
     strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
     **_kwargs,
 ) -> TableContainer:
-    """Generate entities for each row, and optionally a graph of those entities."""
+    """Generate entities for each row, and optionally a graph of those entities.
+
+    When an update has written the reports of the previous run to the `PREVIOUS_REPORTS_TABLE` table of storage, a community with the same level and members as a previous one gets a copy of its report, and only the other communities are reported on.
+    """
     log.debug("create_community_reports strategy=%s", strategy)
     local_contexts = cast(pd.DataFrame, input.get_input())
     nodes_ctr = get_required_input_table(input, "nodes")
@@ -65,6 +76,14 @@ async def create_community_reports(
     reports: list[CommunityReport | None] = []
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     runner = load_strategy(strategy["type"])
+    previous_reports = await _load_previous_reports(storage)
+    community_keys = {
+        (row[schemas.NODE_LEVEL], row[schemas.NODE_COMMUNITY]): (
+            int(row[schemas.NODE_LEVEL]),
+            tuple(row[schemas.COMMUNITY_MEMBERS]),
+        )
+        for row in get_community_members(nodes).to_dict("records")
+    }
 
     for level in levels:
         level_contexts = prep_community_report_context(
@@ -76,6 +95,28 @@ async def create_community_reports(
                 "max_input_tokens", defaults.COMMUNITY_REPORT_MAX_INPUT_LENGTH
             ),
         )
+        if len(previous_reports) > 0:
+            reused = [
+                community_keys.get((level, community)) in previous_reports
+                for community in level_contexts[schemas.NODE_COMMUNITY]
+            ]
+            for community in level_contexts[schemas.NODE_COMMUNITY][reused]:
+                key = community_keys[level, community]
+                reports.append({
+                    **previous_reports[key],
+                    "community": community,
+                    "level": level,
+                })
+                tick()
+            level_contexts = cast(pd.DataFrame, level_contexts[[not r for r in reused]])
+            log.info(
+                "level %s: reusing %s reports of the previous run, %s to generate",
+                level,
+                sum(reused),
+                len(level_contexts),
+            )
+            if len(level_contexts) == 0:
+                continue
 
         async def run_generate(record):
             result = await _generate_report(
@@ -102,6 +143,36 @@ async def create_community_reports(
     return TableContainer(table=pd.DataFrame(reports))
 
 
+def get_community_members(nodes: pd.DataFrame) -> pd.DataFrame:
+    """Get the sorted names of the member nodes of each community, by level and community."""
+    clustered = cast(pd.DataFrame, nodes[nodes[schemas.NODE_COMMUNITY].notna()])
+    members = clustered.groupby([schemas.NODE_LEVEL, schemas.NODE_COMMUNITY])[
+        schemas.NODE_NAME
+    ].agg(lambda names: sorted(set(names)))
+    return cast(pd.Series, members).rename(schemas.COMMUNITY_MEMBERS).reset_index()
+
+
+async def _load_previous_reports(
+    storage: PipelineStorage,
+) -> dict[CommunityKey, CommunityReport]:
+    if not await storage.has(f"{PREVIOUS_REPORTS_TABLE}.parquet"):
+        return {}
+    table = pd.read_parquet(
+        BytesIO(await storage.get(f"{PREVIOUS_REPORTS_TABLE}.parquet", as_bytes=True))
+    )
+    reports: dict[CommunityKey, CommunityReport] = {}
+    for row in table.to_dict("records"):
+        key = (int(row[schemas.COMMUNITY_LEVEL]), tuple(row[schemas.COMMUNITY_MEMBERS]))
+        reports[key] = cast(
+            CommunityReport,
+            {
+                field: list(row[field]) if field == schemas.FINDINGS else row[field]
+                for field in CommunityReport.__annotations__
+            },
+        )
+    return reports
+
+
 async def _generate_report(
     runner: CommunityReportsStrategy,
     cache: PipelineCache,
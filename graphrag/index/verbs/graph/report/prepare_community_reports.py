@@ -4,7 +4,8 @@
 """A module containing create_community_reports and load_strategy methods definition."""
 
 import logging
-from typing import cast
+import math
+from typing import Any, cast
 
 import pandas as pd
 from datashaper import (
@@ -25,7 +26,9 @@ from graphrag.index.graph.extractors.community_reports import (
     set_context_size,
     sort_context,
 )
+from graphrag.index.utils import map_in_processes
 from graphrag.index.utils.ds_util import get_named_input_table, get_required_input_table
+from graphrag.index.utils.process_pool import SHARDS_PER_PROCESS
 
 log = logging.getLogger(__name__)
 
@@ -35,9 +38,14 @@ def prepare_community_reports(
     input: VerbInput,
     callbacks: VerbCallbacks,
     max_tokens: int = 16_000,
+    num_processes: int = 1,
     **_kwargs,
 ) -> TableContainer:
-    """Generate entities for each row, and optionally a graph of those entities."""
+    """Generate entities for each row, and optionally a graph of those entities.
+
+    With num_processes above 1, the communities of each level are split into shards
+    that are prepared on a pool of worker processes.
+    """
     # Prepare Community Reports
     node_df = cast(pd.DataFrame, get_required_input_table(input, "nodes").table)
     edge_df = cast(pd.DataFrame, get_required_input_table(input, "edges").table)
@@ -45,25 +53,66 @@ def prepare_community_reports(
     if claim_df is not None:
         claim_df = cast(pd.DataFrame, claim_df.table)
 
-    levels = get_levels(node_df, schemas.NODE_LEVEL)
-    dfs = []
-
-    for level in progress_iterable(levels, callbacks.progress, len(levels)):
-        communities_at_level_df = _prepare_reports_at_level(
-            node_df, edge_df, claim_df, level, max_tokens
+    shards = _community_shards(node_df, num_processes)
+    # the tables are sent to each worker once, not with every shard
+    dfs = list(
+        progress_iterable(
+            map_in_processes(
+                _prepare_reports_in_process,
+                shards,
+                num_processes,
+                (node_df, edge_df, claim_df, max_tokens),
+            ),
+            callbacks.progress,
+            len(shards),
         )
-        dfs.append(communities_at_level_df)
+    )
 
     # build initial local context for all communities
     return TableContainer(table=pd.concat(dfs))
 
 
+def _community_shards(
+    node_df: pd.DataFrame, num_processes: int
+) -> list[tuple[int, list[Any] | None]]:
+    # contiguous shards of the sorted communities keep the order of a single process
+    levels = get_levels(node_df, schemas.NODE_LEVEL)
+    if num_processes <= 1:
+        return [(level, None) for level in levels]
+
+    shards: list[tuple[int, list[Any] | None]] = []
+    for level in levels:
+        communities = sorted(
+            filter_nodes_to_level(node_df, level)[schemas.NODE_COMMUNITY]
+            .dropna()
+            .unique()
+        )
+        size = math.ceil(len(communities) / (num_processes * SHARDS_PER_PROCESS))
+        shards.extend(
+            (level, communities[start : start + size])
+            for start in range(0, len(communities), max(size, 1))
+        )
+    return shards
+
+
+def _prepare_reports_in_process(
+    shard: tuple[int, list[Any] | None],
+    shared: tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame | None, int],
+) -> pd.DataFrame:
+    level, communities = shard
+    node_df, edge_df, claim_df, max_tokens = shared
+    return _prepare_reports_at_level(
+        node_df, edge_df, claim_df, level, max_tokens, communities=communities
+    )
+
+
 def _prepare_reports_at_level(
     node_df: pd.DataFrame,
     edge_df: pd.DataFrame,
     claim_df: pd.DataFrame | None,
     level: int,
     max_tokens: int = 16_000,
+    communities: list[Any] | None = None,
     community_id_column: str = schemas.COMMUNITY_ID,
     node_id_column: str = schemas.NODE_ID,
     node_name_column: str = schemas.NODE_NAME,
@@ -96,6 +145,13 @@ def _prepare_reports_at_level(
 
     # Filter edges & claims to those containing the target nodes
     level_edge_df = filter_edges_to_nodes(edge_df, nodes)
+    if communities is not None:
+        # the nodes of the shard keep their edges to the nodes of other communities
+        level_node_df = cast(
+            pd.DataFrame,
+            level_node_df[level_node_df[node_community_column].isin(communities)],
+        )
+        nodes = level_node_df[node_name_column].tolist()
     level_claim_df = (
         filter_claims_to_nodes(claim_df, nodes) if claim_df is not None else None
     )
@@ -25,7 +25,7 @@ def unpack_graph(
     **kwargs,
 ) -> TableContainer:
     """
-    Unpack nodes or edges from a graphml graph, into a list of nodes or edges.
+    Unpack nodes or edges from a serialized or graphml graph, into a list of nodes or edges.
 
     This verb will create columns for each attribute in a node or edge.
 
@@ -34,7 +34,7 @@ def unpack_graph(
     verb: unpack_graph
     args:
         type: node # The type of data to unpack, one of: node, edge. node will create a node list, edge will create an edge list
-        column: <column name> # The name of the column containing the graph, should be a graphml graph
+        column: <column name> # The name of the column containing the graph, should be a serialized graph or a graphml graph
     ```
     """
     if copy is None:
@@ -57,7 +57,7 @@ def unpack_graph(
         result.extend([
             {**cleaned_row, **graph_id}
             for graph_id in _run_unpack(
-                cast(str | nx.Graph, row[column]),
+                cast(str | bytes | nx.Graph, row[column]),
                 type,
                 embeddings,
                 kwargs,
@@ -69,7 +69,7 @@ def unpack_graph(
 
 
 def _run_unpack(
-    graphml_or_graph: str | nx.Graph,
+    graphml_or_graph: str | bytes | nx.Graph,
     unpack_type: str,
     embeddings: dict[str, list[float]],
     args: dict[str, Any],
@@ -5,11 +5,12 @@
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
 from datashaper import TableContainer, VerbInput, verb
 
 from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import graph_to_graphml
 
 
 @dataclass
@@ -60,6 +61,14 @@ async def snapshot_rows(
                     msg = "column must be specified for text format"
                     raise ValueError(msg)
                 await storage.set(f"{row_name}.{extension}", str(row[column]))
+            elif fmt.format == "graphml":
+                if column is None:
+                    msg = "column must be specified for graphml format"
+                    raise ValueError(msg)
+                await storage.set(
+                    f"{row_name}.{extension}",
+                    graph_to_graphml(cast(bytes | str, row[column])),
+                )
 
     return TableContainer(table=data)
 
@@ -86,5 +95,7 @@ def _get_format_extension(fmt: str) -> str:
         return "parquet"
     if fmt == "csv":
         return "csv"
+    if fmt == "graphml":
+        return "graphml"
     msg = f"Unknown format: {fmt}"
     raise ValueError(msg)
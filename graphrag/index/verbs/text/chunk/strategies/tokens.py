@@ -6,12 +6,17 @@
 from collections.abc import Iterable
 from typing import Any
 
-import tiktoken
+import numpy as np
 from datashaper import ProgressTicker
 
 import graphrag.config.defaults as defs
 from graphrag.index.text_splitting import Tokenizer
 from graphrag.index.verbs.text.chunk.typing import TextChunk
+from graphrag.llm.tokenizer import get_tokenizer
+
+# the number of texts encoded at once, their token lists are packed into arrays
+# before the next batch is encoded
+ENCODE_BATCH_SIZE = 256
 
 
 def run(
@@ -21,13 +26,18 @@ def run(
     tokens_per_chunk = args.get("chunk_size", defs.CHUNK_SIZE)
     chunk_overlap = args.get("chunk_overlap", defs.CHUNK_OVERLAP)
     encoding_name = args.get("encoding_name", defs.ENCODING_MODEL)
-    enc = tiktoken.get_encoding(encoding_name)
+    enc = get_tokenizer(encoding_name)
 
     def encode(text: str) -> list[int]:
         if not isinstance(text, str):
             text = f"{text}"
         return enc.encode(text)
 
+    def encode_batch(texts: list[str]) -> list[list[int]]:
+        return enc.encode_batch([
+            text if isinstance(text, str) else f"{text}" for text in texts
+        ])
+
     def decode(tokens: list[int]) -> str:
         return enc.decode(tokens)
 
@@ -38,6 +48,7 @@ def run(
             tokens_per_chunk=tokens_per_chunk,
             encode=encode,
             decode=decode,
+            encode_batch=encode_batch,
         ),
         tick,
     )
@@ -48,34 +59,58 @@ def run(
 def split_text_on_tokens(
     texts: list[str], enc: Tokenizer, tick: ProgressTicker
 ) -> list[TextChunk]:
-    """Split incoming text and return chunks."""
+    """Split incoming text and return chunks.
+
+    The tokens of all texts are kept in one int32 array. Chunks are windows of
+    tokens_per_chunk tokens over it, starting every tokens_per_chunk - chunk_overlap
+    tokens, so a chunk can span several texts.
+    """
+    step = enc.tokens_per_chunk - enc.chunk_overlap
+    if step <= 0:
+        msg = "chunk_overlap must be smaller than the chunk size"
+        raise ValueError(msg)
+
+    token_ids, doc_lengths = _encode_texts(texts, enc, tick)
+    num_tokens = len(token_ids)
+    starts = np.arange(0, num_tokens, step)
+    ends = np.minimum(starts + enc.tokens_per_chunk, num_tokens)
+
+    # texts without tokens don't belong to any chunk
+    docs = np.flatnonzero(doc_lengths)
+    token_docs = np.repeat(np.arange(len(docs)), doc_lengths[docs])
+    first_docs = token_docs[starts].tolist()
+    last_docs = token_docs[ends - 1].tolist()
+
     result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = enc.encode(text)
-        tick(1)
-        mapped_ids.append((source_doc_idx, encoded))
-
-    input_ids: list[tuple[int, int]] = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
-
-    start_idx = 0
-    cur_idx = min(start_idx + enc.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
-    while start_idx < len(input_ids):
-        chunk_text = enc.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
+    for start, end, first_doc, last_doc in zip(
+        starts.tolist(), ends.tolist(), first_docs, last_docs, strict=True
+    ):
         result.append(
             TextChunk(
-                text_chunk=chunk_text,
-                source_doc_indices=doc_indices,
-                n_tokens=len(chunk_ids),
+                text_chunk=enc.decode(token_ids[start:end].tolist()),
+                # the order of a set of the indices, as chunks always listed them
+                source_doc_indices=list(set(docs[first_doc : last_doc + 1].tolist())),
+                n_tokens=end - start,
             )
         )
-        start_idx += enc.tokens_per_chunk - enc.chunk_overlap
-        cur_idx = min(start_idx + enc.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
-
     return result
+
+
+def _encode_texts(
+    texts: list[str], enc: Tokenizer, tick: ProgressTicker
+) -> tuple[np.ndarray, np.ndarray]:
+    """Encode texts into an array of all token ids and an array of the text lengths."""
+    arrays: list[np.ndarray] = []
+    for batch_start in range(0, len(texts), ENCODE_BATCH_SIZE):
+        batch = texts[batch_start : batch_start + ENCODE_BATCH_SIZE]
+        if enc.encode_batch is not None:
+            encoded = enc.encode_batch(batch)
+        else:
+            encoded = [enc.encode(text) for text in batch]
+        for tokens in encoded:
+            arrays.append(np.fromiter(tokens, dtype=np.int32, count=len(tokens)))
+            tick(1)
+
+    doc_lengths = np.array([len(array) for array in arrays], dtype=np.int64)
+    token_ids = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int32)
+    return token_ids, doc_lengths
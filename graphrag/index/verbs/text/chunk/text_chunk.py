@@ -16,6 +16,8 @@ from datashaper import (
     verb,
 )
 
+from graphrag.index.utils import map_in_processes
+
 from .strategies.typing import ChunkStrategy as ChunkStrategy
 from .typing import ChunkInput
 
@@ -48,6 +50,7 @@ def chunk(
     to: str,
     callbacks: VerbCallbacks,
     strategy: dict[str, Any] | None = None,
+    num_processes: int = 1,
     **_kwargs,
 ) -> TableContainer:
     """
@@ -84,6 +87,9 @@ def chunk(
     strategy:
         type: sentence
     ```
+
+    ## Process pool
+    With `num_processes` above 1, the rows are chunked on a pool of worker processes.
     """
     if strategy is None:
         strategy = {}
@@ -95,6 +101,24 @@ def chunk(
     num_total = _get_num_total(output, column)
     tick = progress_ticker(callbacks.progress, num_total)
 
+    if num_processes > 1:
+        # the ticker stays in this process, so progress is reported per row
+        results = []
+        for row, chunks in zip(
+            output[column],
+            map_in_processes(
+                _run_strategy_in_process,
+                output[column],
+                num_processes,
+                (strategy_name, strategy_config),
+            ),
+            strict=True,
+        ):
+            results.append(chunks)
+            tick(1 if isinstance(row, str) else len(row))
+        output[to] = results
+        return TableContainer(table=output)
+
     output[to] = output.apply(
         cast(
             Any,
@@ -105,6 +129,15 @@ def chunk(
     return TableContainer(table=output)
 
 
+def _run_strategy_in_process(
+    input: ChunkInput, shared: tuple[ChunkStrategyType, dict[str, Any]]
+) -> list[str | tuple[list[str] | None, str, int]]:
+    strategy_name, strategy_config = shared
+    return run_strategy(
+        load_strategy(strategy_name), input, strategy_config, ProgressTicker(None, 0)
+    )
+
+
 def run_strategy(
     strategy: ChunkStrategy,
     input: ChunkInput,
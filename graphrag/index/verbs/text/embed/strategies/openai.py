@@ -121,8 +121,7 @@ def _create_text_batches(
     current_batch = []
     current_batch_tokens = 0
 
-    for text in texts:
-        token_count = splitter.num_tokens(text)
+    for text, token_count in zip(texts, splitter.num_tokens_batch(texts), strict=True):
         if (
             len(current_batch) >= max_batch_size
             or current_batch_tokens + token_count > max_batch_tokens
@@ -161,9 +160,9 @@ def _prepare_embed_texts(
 
 def _reconstitute_embeddings(
     raw_embeddings: list[list[float]], sizes: list[int]
-) -> list[list[float] | None]:
+) -> list[list[float] | np.ndarray | None]:
     """Reconstitute the embeddings into the original input texts."""
-    embeddings: list[list[float] | None] = []
+    embeddings: list[list[float] | np.ndarray | None] = []
     cursor = 0
     for size in sizes:
         if size == 0:
@@ -176,6 +175,6 @@ def _reconstitute_embeddings(
             chunk = raw_embeddings[cursor : cursor + size]
             average = np.average(chunk, axis=0)
             normalized = average / np.linalg.norm(average)
-            embeddings.append(normalized.tolist())
+            embeddings.append(normalized)
             cursor += size
     return embeddings
@@ -6,6 +6,7 @@
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
+import numpy as np
 from datashaper import VerbCallbacks
 
 from graphrag.index.cache import PipelineCache
@@ -15,7 +16,7 @@ from graphrag.index.cache import PipelineCache
 class TextEmbeddingResult:
     """Text embedding result class definition."""
 
-    embeddings: list[list[float] | None] | None
+    embeddings: list[list[float] | np.ndarray | None] | None
 
 
 TextEmbeddingStrategy = Callable[
@@ -11,7 +11,9 @@ import numpy as np
 import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, verb
 
+import graphrag.config.defaults as defs
 from graphrag.index.cache import PipelineCache
+from graphrag.model.embedding import decode_embedding, encode_embedding
 from graphrag.vector_stores import (
     BaseVectorStore,
     VectorStoreDocument,
@@ -45,6 +47,7 @@ async def text_embed(
     cache: PipelineCache,
     column: str,
     strategy: dict,
+    dtype: str = defs.EMBEDDING_DTYPE,
     **kwargs,
 ) -> TableContainer:
     """
@@ -56,6 +59,7 @@ async def text_embed(
     args:
         column: text # The name of the column containing the text to embed, this can either be a column with text, or a column with a list[tuple[doc_id, str]]
         to: embedding # The name of the column to output the embedding to
+        dtype: float32 # The data type to store the embeddings as: float32, float16 or int8
         strategy: <strategy config> # See strategies section below
     ```
 
@@ -98,6 +102,7 @@ async def text_embed(
             strategy,
             vector_store,
             vector_store_workflow_config,
+            dtype,
             vector_store_config.get("store_in_table", False),
             kwargs.get("to", f"{column}_embedding"),
         )
@@ -108,6 +113,7 @@ async def text_embed(
         cache,
         column,
         strategy,
+        dtype,
         kwargs.get("to", f"{column}_embedding"),
     )
 
@@ -118,6 +124,7 @@ async def _text_embed_in_memory(
     cache: PipelineCache,
     column: str,
     strategy: dict,
+    dtype: str,
     to: str,
 ):
     output_df = cast(pd.DataFrame, input.get_input())
@@ -129,7 +136,7 @@ async def _text_embed_in_memory(
     texts: list[str] = input_table[column].to_numpy().tolist()
     result = await strategy_exec(texts, callbacks, cache, strategy_args)
 
-    output_df[to] = result.embeddings
+    output_df[to] = _encode_embeddings(result.embeddings, dtype)
     return TableContainer(table=output_df)
 
 
@@ -141,6 +148,7 @@ async def _text_embed_with_vector_store(
     strategy: dict[str, Any],
     vector_store: BaseVectorStore,
     vector_store_config: dict,
+    dtype: str,
     store_in_table: bool = False,
     to: str = "",
 ):
@@ -192,21 +200,20 @@ async def _text_embed_with_vector_store(
             cache,
             strategy_args,
         )
-        if store_in_table and result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
+        embeddings = _encode_embeddings(result.embeddings, dtype) or []
+        if store_in_table:
+            all_results.extend(
+                embedding for embedding in embeddings if embedding is not None
+            )
 
-        vectors = result.embeddings or []
         documents: list[VectorStoreDocument] = []
-        for id, text, title, vector in zip(ids, texts, titles, vectors, strict=True):
-            if type(vector) is np.ndarray:
-                vector = vector.tolist()
+        for id, text, title, embedding in zip(
+            ids, texts, titles, embeddings, strict=True
+        ):
             document = VectorStoreDocument(
                 id=id,
                 text=text,
-                vector=vector,
+                vector=decode_embedding(embedding) if embedding is not None else None,
                 attributes={"title": title},
             )
             documents.append(document)
@@ -221,6 +228,18 @@ async def _text_embed_with_vector_store(
     return TableContainer(table=output_df)
 
 
+def _encode_embeddings(
+    embeddings: list[list[float] | np.ndarray | None] | None, dtype: str
+) -> list[np.ndarray | None] | None:
+    """Convert the embeddings to compact arrays of the given dtype."""
+    if embeddings is None:
+        return None
+    return [
+        encode_embedding(embedding, dtype) if embedding is not None else None
+        for embedding in embeddings
+    ]
+
+
 def _create_vector_store(
     vector_store_config: dict, collection_name: str
 ) -> BaseVectorStore:
@@ -4,6 +4,7 @@
 """The Indexing Engine workflows package root."""
 
 from .load import create_workflow, load_workflows
+from .schedule import schedule_workflows
 from .typing import (
     StepDefinition,
     VerbDefinitions,
@@ -22,4 +23,5 @@ __all__ = [
     "WorkflowToRun",
     "create_workflow",
     "load_workflows",
+    "schedule_workflows",
 ]
@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the schedule_workflows method definition."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Callable, Coroutine
+from typing import Any, TypeVar
+
+from .typing import WorkflowToRun
+
+T = TypeVar("T")
+log = logging.getLogger(__name__)
+
+
+async def schedule_workflows(
+    workflows: list[WorkflowToRun],
+    dependencies: dict[str, list[str]],
+    run_workflow: Callable[[WorkflowToRun], Coroutine[Any, Any, T]],
+    max_concurrency: int = 1,
+    completed: set[str] | None = None,
+) -> AsyncIterable[tuple[WorkflowToRun, T]]:
+    """Run workflows as soon as all of their dependencies have completed.
+
+    With a max_concurrency of 1 the workflows run one at a time in the given order. If a
+    workflow fails, the workflows still running are cancelled and the error is raised.
+
+    Args:
+        - workflows - The workflows to run, in topological order
+        - dependencies - A dictionary of workflow name to workflow dependencies
+        - run_workflow - The coroutine that runs (and emits) a single workflow
+        - max_concurrency - The maximum number of workflows running at the same time
+        - completed - Names of workflows that are already complete, when resuming a run
+    Returns:
+        - output - An iterable of (workflow, result) pairs, in completion order
+    """
+    # resolve names up front, running a workflow may dispose of it
+    names = {id(w): w.workflow.name for w in workflows}
+    order = {id(w): index for index, w in enumerate(workflows)}
+    done = set(completed or [])
+    pending = [w for w in workflows if names[id(w)] not in done]
+    running: dict[asyncio.Task, WorkflowToRun] = {}
+    max_concurrency = max(1, max_concurrency)
+
+    def is_ready(workflow: WorkflowToRun) -> bool:
+        return all(dep in done for dep in dependencies.get(names[id(workflow)], []))
+
+    try:
+        while pending or running:
+            for workflow in [w for w in pending if is_ready(w)]:
+                if len(running) >= max_concurrency:
+                    break
+                pending.remove(workflow)
+                log.info("Scheduling workflow: %s", names[id(workflow)])
+                running[asyncio.create_task(run_workflow(workflow))] = workflow
+
+            if not running:
+                blocked = [names[id(w)] for w in pending]
+                msg = f"Workflows have unsatisfiable dependencies: {blocked}"
+                raise ValueError(msg)
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            # keep the completion order stable when several workflows finish together
+            for task in sorted(finished, key=lambda t: order[id(running[t])]):
+                workflow = running.pop(task)
+                result = task.result()
+                done.add(names[id(workflow)])
+                yield workflow, result
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
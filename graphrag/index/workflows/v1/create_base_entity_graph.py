@@ -42,6 +42,7 @@ def build_steps(
         {
             "verb": "cluster_graph",
             "args": {
+                "num_processes": config.get("num_processes", 1),
                 **clustering_config,
                 "column": "entity_graph",
                 "to": "clustered_graph",
@@ -55,7 +56,7 @@ def build_steps(
             "args": {
                 "base_name": "clustered_graph",
                 "column": "clustered_graph",
-                "formats": [{"format": "text", "extension": "graphml"}],
+                "formats": [{"format": "graphml", "extension": "graphml"}],
             },
         },
         {
@@ -73,7 +74,7 @@ def build_steps(
             "args": {
                 "base_name": "embedded_graph",
                 "column": "entity_graph",
-                "formats": [{"format": "text", "extension": "graphml"}],
+                "formats": [{"format": "graphml", "extension": "graphml"}],
             },
         },
         {
@@ -9,6 +9,37 @@ from graphrag.index.config import PipelineWorkflowConfig, PipelineWorkflowStep
 
 workflow_name = "create_base_extracted_entities"
 
+TEXT_UNIT_GRAPHS_TABLE = "text_unit_entity_graphs"
+"""The table of storage holding the graph extracted from each text unit, before they are merged."""
+
+DEFAULT_GRAPH_MERGE_OPERATIONS = {
+    "nodes": {
+        "source_id": {
+            "operation": "concat",
+            "delimiter": ", ",
+            "distinct": True,
+        },
+        "description": ({
+            "operation": "concat",
+            "separator": "\n",
+            "distinct": False,
+        }),
+    },
+    "edges": {
+        "source_id": {
+            "operation": "concat",
+            "delimiter": ", ",
+            "distinct": True,
+        },
+        "description": ({
+            "operation": "concat",
+            "separator": "\n",
+            "distinct": False,
+        }),
+        "weight": "sum",
+    },
+}
+
 
 def build_steps(
     config: PipelineWorkflowConfig,
@@ -46,41 +77,23 @@ def build_steps(
                 "formats": ["json"],
             },
         },
+        {
+            "verb": "select",
+            "args": {"columns": ["id", "document_ids", "entity_graph"]},
+        },
+        {
+            # an incremental update drops the graphs of removed documents and merges
+            # the other graphs again, rather than extracting them again
+            "verb": "snapshot",
+            "args": {"name": TEXT_UNIT_GRAPHS_TABLE, "formats": ["parquet"]},
+        },
         {
             "verb": "merge_graphs",
             "args": {
                 "column": "entity_graph",
                 "to": "entity_graph",
-                **config.get(
-                    "graph_merge_operations",
-                    {
-                        "nodes": {
-                            "source_id": {
-                                "operation": "concat",
-                                "delimiter": ", ",
-                                "distinct": True,
-                            },
-                            "description": ({
-                                "operation": "concat",
-                                "separator": "\n",
-                                "distinct": False,
-                            }),
-                        },
-                        "edges": {
-                            "source_id": {
-                                "operation": "concat",
-                                "delimiter": ", ",
-                                "distinct": True,
-                            },
-                            "description": ({
-                                "operation": "concat",
-                                "separator": "\n",
-                                "distinct": False,
-                            }),
-                            "weight": "sum",
-                        },
-                    },
-                ),
+                "num_processes": config.get("num_processes", 1),
+                **config.get("graph_merge_operations", DEFAULT_GRAPH_MERGE_OPERATIONS),
             },
         },
         {
@@ -89,7 +102,7 @@ def build_steps(
             "args": {
                 "base_name": "merged_graph",
                 "column": "entity_graph",
-                "formats": [{"format": "text", "extension": "graphml"}],
+                "formats": [{"format": "graphml", "extension": "graphml"}],
             },
         },
     ]
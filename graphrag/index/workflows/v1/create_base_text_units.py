@@ -22,6 +22,7 @@ def build_steps(
     chunk_column_name = config.get("chunk_column", "chunk")
     chunk_by_columns = config.get("chunk_by", []) or []
     n_tokens_column_name = config.get("n_tokens_column", "n_tokens")
+    num_processes = config.get("num_processes", 1)
     return [
         {
             "verb": "orderby",
@@ -57,7 +58,12 @@ def build_steps(
         },
         {
             "verb": "chunk",
-            "args": {"column": "texts", "to": "chunks", **config.get("text_chunk", {})},
+            "args": {
+                "column": "texts",
+                "to": "chunks",
+                "num_processes": num_processes,
+                **config.get("text_chunk", {}),
+            },
         },
         {
             "verb": "select",
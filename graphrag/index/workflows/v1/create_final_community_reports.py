@@ -81,7 +81,10 @@ def build_steps(
         {
             "id": "local_contexts",
             "verb": "prepare_community_reports",
-            "args": {"max_tokens": community_report_max_input_length},
+            "args": {
+                "max_tokens": community_report_max_input_length,
+                "num_processes": config.get("num_processes", 1),
+            },
             "input": {
                 "source": "nodes",
                 "nodes": "nodes",
@@ -41,7 +41,7 @@ def build_steps(
             "args": {
                 "base_name": "summarized_graph",
                 "column": "entity_graph",
-                "formats": [{"format": "text", "extension": "graphml"}],
+                "formats": [{"format": "graphml", "extension": "graphml"}],
             },
         },
     ]
@@ -3,13 +3,15 @@
 
 """The Datashaper OpenAI Utilities package."""
 
-from .base import BaseLLM, CachingLLM, RateLimitingLLM
+from .base import BaseLLM, CachingLLM, RateLimitingLLM, SingleFlight
 from .errors import RetriesExhaustedError
 from .limiting import (
+    AdaptiveLLMLimiter,
     CompositeLLMLimiter,
     LLMLimiter,
     NoopLLMLimiter,
     TpmRpmLLMLimiter,
+    create_adaptive_limiter,
     create_tpm_rpm_limiters,
 )
 from .mock import MockChatLLM, MockCompletionLLM
@@ -24,6 +26,7 @@ from .openai import (
     create_openai_completion_llm,
     create_openai_embedding_llm,
 )
+from .tokenizer import CachedTokenizer, get_tokenizer
 from .types import (
     LLM,
     CompletionInput,
@@ -46,7 +49,10 @@ from .types import (
 __all__ = [
     # LLM Types
     "LLM",
+    "AdaptiveLLMLimiter",
     "BaseLLM",
+    # Tokenizers
+    "CachedTokenizer",
     "CachingLLM",
     "CompletionInput",
     "CompletionLLM",
@@ -81,11 +87,14 @@ __all__ = [
     "RateLimitingLLM",
     # Errors
     "RetriesExhaustedError",
+    "SingleFlight",
     "TpmRpmLLMLimiter",
+    # Limiters
+    "create_adaptive_limiter",
     "create_openai_chat_llm",
     "create_openai_client",
     "create_openai_completion_llm",
     "create_openai_embedding_llm",
-    # Limiters
     "create_tpm_rpm_limiters",
+    "get_tokenizer",
 ]
@@ -3,8 +3,16 @@
 
 """Base LLM Implementations."""
 
+from ._create_cache_key import create_hash_key
 from .base_llm import BaseLLM
 from .caching_llm import CachingLLM
 from .rate_limiting_llm import RateLimitingLLM
+from .single_flight import SingleFlight
 
-__all__ = ["BaseLLM", "CachingLLM", "RateLimitingLLM"]
+__all__ = [
+    "BaseLLM",
+    "CachingLLM",
+    "RateLimitingLLM",
+    "SingleFlight",
+    "create_hash_key",
+]
@@ -11,6 +11,7 @@ from typing_extensions import Unpack
 from graphrag.llm.types import LLM, LLMCache, LLMInput, LLMOutput, OnCacheActionFn
 
 from ._create_cache_key import create_hash_key
+from .single_flight import SingleFlight
 
 # If there's a breaking change in what we cache, we should increment this version number to invalidate existing caches
 _cache_strategy_version = 2
@@ -24,7 +25,11 @@ def _noop_cache_fn(_k: str, _v: str | None):
 
 
 class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
-    """A class to interact with the cache."""
+    """A class to interact with the cache.
+
+    Identical calls made while the first one is running don't call the delegate,
+    they wait for the first call and share its result.
+    """
 
     _cache: LLMCache
     _delegate: LLM[TIn, TOut]
@@ -32,6 +37,7 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
     _llm_parameters: dict
     _on_cache_hit: OnCacheActionFn
     _on_cache_miss: OnCacheActionFn
+    _in_flight: SingleFlight[LLMOutput[TOut]]
 
     def __init__(
         self,
@@ -46,6 +52,7 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         self._operation = operation
         self._on_cache_hit = _noop_cache_fn
         self._on_cache_miss = _noop_cache_fn
+        self._in_flight = SingleFlight()
 
     def set_delegate(self, delegate: LLM[TIn, TOut]) -> None:
         """Set the delegate LLM. (for testing)."""
@@ -89,21 +96,35 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
                 output=cached_result,
             )
 
-        # Report the Cache Miss
-        self._on_cache_miss(cache_key, name)
-
-        # Compute the new result
-        result = await self._delegate(input, **kwargs)
-
-        # Cache the new result
-        if result.output is not None:
-            await self._cache.set(
-                cache_key,
-                result.output,
-                {
-                    "input": input,
-                    "parameters": llm_args,
-                    "history": history_in,
-                },
-            )
-        return result
+        called = False
+
+        async def call() -> LLMOutput[TOut]:
+            nonlocal called
+            called = True
+
+            # Report the Cache Miss
+            self._on_cache_miss(cache_key, name)
+
+            # Compute the new result
+            result = await self._delegate(input, **kwargs)
+
+            # Cache the new result
+            if result.output is not None:
+                await self._cache.set(
+                    cache_key,
+                    result.output,
+                    {
+                        "input": input,
+                        "parameters": llm_args,
+                        "history": history_in,
+                    },
+                )
+            return result
+
+        result = await self._in_flight.run(cache_key, call)
+        if called:
+            return result
+
+        # an identical call computed the result
+        self._on_cache_hit(cache_key, name)
+        return LLMOutput(output=result.output)
@@ -6,7 +6,7 @@
 import asyncio
 import logging
 from collections.abc import Callable
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
 from tenacity import (
     AsyncRetrying,
@@ -17,7 +17,7 @@ from tenacity import (
 from typing_extensions import Unpack
 
 from graphrag.llm.errors import RetriesExhaustedError
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.limiting import LLMLimiter, limiter_feedback
 from graphrag.llm.types import (
     LLM,
     LLMConfig,
@@ -107,6 +107,11 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             return 0
         raise TypeError(_CANNOT_MEASURE_OUTPUT_TOKENS_MSG)
 
+    def max_response_tokens(self, **kwargs: Unpack[LLMInput]) -> int:
+        """Get the most tokens a response can have, to reserve before the call."""
+        model_parameters = kwargs.get("model_parameters") or {}
+        return int(model_parameters.get("max_tokens") or self._config.max_tokens or 0)
+
     async def __call__(
         self,
         input: TIn,
@@ -117,9 +122,19 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         attempt_number = 0
         call_times: list[float] = []
         input_tokens = self.count_request_tokens(input)
+        output_tokens = 0
+        semaphore_wait_time = 0.0
+        limiter_wait_time = 0.0
         max_retries = self._config.max_retries or 10
         max_retry_wait = self._config.max_retry_wait or 10
         follow_recommendation = self._config.sleep_on_rate_limit_recommendation
+        limiter = self._rate_limiter
+        reserves_output_tokens = limiter is not None and limiter.reserves_output_tokens
+        reserved_tokens = (
+            max(input_tokens, 0) + self.max_response_tokens(**kwargs)
+            if reserves_output_tokens
+            else input_tokens
+        )
         retryer = AsyncRetrying(
             stop=stop_after_attempt(max_retries),
             wait=wait_exponential_jitter(max=max_retry_wait),
@@ -141,28 +156,57 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             raise
 
         async def do_attempt() -> LLMOutput[TOut]:
-            nonlocal call_times
+            nonlocal call_times, output_tokens
             call_start = asyncio.get_event_loop().time()
             try:
-                return await self._delegate(input, **kwargs)
+                # the rate limit headers of the responses are reported to the limiter
+                with limiter_feedback(limiter):
+                    result = await self._delegate(input, **kwargs)
             except BaseException as e:
                 if isinstance(e, tuple(self._rate_limit_errors)):
                     sleep_time = self._extract_sleep_recommendation(e)
+                    if limiter is not None:
+                        limiter.on_throttled(sleep_time)
                     await sleep_for(sleep_time)
                 raise
             finally:
                 call_end = asyncio.get_event_loop().time()
                 call_times.append(call_end - call_start)
 
+            if reserves_output_tokens:
+                output_tokens = self.count_response_tokens(result.output)
+            return result
+
+        async def acquire(num_tokens: int) -> None:
+            nonlocal limiter_wait_time
+            wait_start = asyncio.get_event_loop().time()
+            await cast(LLMLimiter, limiter).acquire(num_tokens)
+            limiter_wait_time += asyncio.get_event_loop().time() - wait_start
+
         async def execute_with_retry() -> tuple[LLMOutput[TOut], float]:
             nonlocal attempt_number
             async for attempt in retryer:
                 with attempt:
-                    if self._rate_limiter and input_tokens > 0:
-                        await self._rate_limiter.acquire(input_tokens)
+                    if reserves_output_tokens:
+                        await acquire(reserved_tokens)
+                    elif limiter and input_tokens > 0:
+                        await acquire(input_tokens)
                     start = asyncio.get_event_loop().time()
                     attempt_number += 1
-                    return await do_attempt(), start
+                    if not reserves_output_tokens:
+                        return await do_attempt(), start
+
+                    # the attempt holds its pass until it's done
+                    succeeded = False
+                    try:
+                        result = await do_attempt()
+                        succeeded = True
+                        return result, start
+                    finally:
+                        used_tokens = max(input_tokens, 0) + output_tokens
+                        cast(LLMLimiter, limiter).release(
+                            reserved_tokens, used_tokens, succeeded
+                        )
 
             log.error("Retries exhausted for %s", name)
             raise RetriesExhaustedError(name, max_retries)
@@ -173,13 +217,16 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         if self._semaphore is None:
             result, start = await execute_with_retry()
         else:
+            wait_start = asyncio.get_event_loop().time()
             async with self._semaphore:
+                semaphore_wait_time = asyncio.get_event_loop().time() - wait_start
                 result, start = await execute_with_retry()
 
         end = asyncio.get_event_loop().time()
-        output_tokens = self.count_response_tokens(result.output)
-        if self._rate_limiter and output_tokens > 0:
-            await self._rate_limiter.acquire(output_tokens)
+        if not reserves_output_tokens:
+            output_tokens = self.count_response_tokens(result.output)
+            if limiter and output_tokens > 0:
+                await acquire(output_tokens)
 
         invocation_result = LLMInvocationResult(
             result=result,
@@ -189,6 +236,8 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             call_times=call_times,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            semaphore_wait_time=semaphore_wait_time,
+            limiter_wait_time=limiter_wait_time,
         )
         self._handle_invoke_result(invocation_result)
         return result
@@ -197,12 +246,14 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         self, result: LLMInvocationResult[LLMOutput[TOut]]
     ) -> None:
         log.info(
-            'perf - llm.%s "%s" with %s retries took %s. input_tokens=%d, output_tokens=%d',
+            'perf - llm.%s "%s" with %s retries took %s. input_tokens=%d, output_tokens=%d, semaphore_wait=%s, limiter_wait=%s',
             self._operation,
             result.name,
             result.num_retries,
             result.total_time,
             result.input_tokens,
             result.output_tokens,
+            result.semaphore_wait_time,
+            result.limiter_wait_time,
         )
         self._on_invoke(result)
@@ -0,0 +1,74 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A class to share the results of identical concurrent calls."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _LeaderCancelledError(Exception):
+    """The call the others were waiting for was cancelled."""
+
+
+class SingleFlight(Generic[T]):
+    """Run one call per key at a time, the identical calls made meanwhile share its result.
+
+    The calls can be made from different event loops, as threaded verbs do. When the
+    running call fails the callers waiting for it fail with the same error, when it's
+    cancelled one of them makes the call again.
+    """
+
+    def __init__(self):
+        """Init method definition."""
+        self._calls: dict[str, Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of running calls."""
+        return len(self._calls)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Make the call, or wait for the result of the running call with this key."""
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if future is None:
+                    future = self._calls[key] = Future()
+
+            if leader:
+                return await self._lead(key, future, call)
+
+            try:
+                # shielded, so a waiting caller that's cancelled doesn't cancel the call
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderCancelledError:
+                continue
+
+    async def _lead(
+        self, key: str, future: Future[T], call: Callable[[], Awaitable[T]]
+    ) -> T:
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            self._finish(key)
+            future.set_exception(_LeaderCancelledError())
+            raise
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: str) -> None:
+        # later calls don't wait for a call that is done
+        with self._lock:
+            del self._calls[key]
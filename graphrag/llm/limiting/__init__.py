@@ -3,16 +3,22 @@
 
 """LLM limiters module."""
 
+from .adaptive_limiter import AdaptiveLLMLimiter
 from .composite_limiter import CompositeLLMLimiter
-from .create_limiters import create_tpm_rpm_limiters
+from .create_limiters import create_adaptive_limiter, create_tpm_rpm_limiters
+from .feedback import limiter_feedback, report_response_headers
 from .llm_limiter import LLMLimiter
 from .noop_llm_limiter import NoopLLMLimiter
 from .tpm_rpm_limiter import TpmRpmLLMLimiter
 
 __all__ = [
+    "AdaptiveLLMLimiter",
     "CompositeLLMLimiter",
     "LLMLimiter",
     "NoopLLMLimiter",
     "TpmRpmLLMLimiter",
+    "create_adaptive_limiter",
     "create_tpm_rpm_limiters",
+    "limiter_feedback",
+    "report_response_headers",
 ]
@@ -0,0 +1,298 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive Limiter module."""
+
+import asyncio
+import contextlib
+import logging
+import math
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+
+from .llm_limiter import LLMLimiter
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_INCREASE = 1.0
+DEFAULT_DECREASE_FACTOR = 0.5
+# the calls in flight when the service throttles were sent under the old limit, the
+# throttling they run into within this many seconds doesn't cut the limit again
+DEFAULT_DECREASE_COOLDOWN = 1.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class AdaptiveLLMLimiter(LLMLimiter):
+    """Limit the concurrency and rates of the calls by the feedback of the service.
+
+    The concurrency limit grows additively while the calls succeed, and is cut
+    multiplicatively when the service throttles them. The token and request budgets
+    refill at their rates per minute: the x-ratelimit-* headers of the responses
+    replace the configured rates with the limits of the service and bring the budgets
+    down to what the service says remains, a retry-after header pauses every call.
+
+    The input and the expected output tokens are reserved when a pass is acquired,
+    the tokens a call didn't use are given back when it's released. The limiter is
+    thread safe, so the event loops of every workflow can share it.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int | None = None,
+        requests_per_minute: int | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        increase: float = DEFAULT_INCREASE,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        decrease_cooldown: float = DEFAULT_DECREASE_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Init method definition."""
+        self._min_concurrency = max(1, min_concurrency)
+        self._max_concurrency = max(self._min_concurrency, max_concurrency)
+        self._limit = float(
+            min(max(concurrency, self._min_concurrency), self._max_concurrency)
+        )
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._decrease_cooldown = decrease_cooldown
+        self._clock = clock
+        now = clock()
+        self._tokens = _Budget(tokens_per_minute, now)
+        self._requests = _Budget(requests_per_minute, now)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = -math.inf
+        # the calls waiting for a free slot, woken in the order they came in
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def needs_token_count(self) -> bool:
+        """Whether this limiter needs the token count to be passed in."""
+        return True
+
+    @property
+    def reserves_output_tokens(self) -> bool:
+        """Whether the output tokens are acquired with the input tokens."""
+        return True
+
+    @property
+    def concurrency(self) -> int:
+        """Get the number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of calls in flight."""
+        return self._in_flight
+
+    async def acquire(self, num_tokens: int = 1) -> None:
+        """Wait for a free slot and for the tokens of the call, then reserve them."""
+        while True:
+            waiter = None
+            with self._lock:
+                now = self._clock()
+                wait = self._wait_time(num_tokens, now)
+                if wait <= 0:
+                    self._in_flight += 1
+                    self._tokens.take(num_tokens)
+                    self._requests.take(1)
+                    return
+                if math.isinf(wait):
+                    waiter = asyncio.get_running_loop().create_future()
+                    self._waiters.append(waiter)
+
+            if waiter is None:
+                await asyncio.sleep(wait)
+                continue
+            try:
+                await waiter
+            except BaseException:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    else:
+                        # this call was woken for a free slot it won't take
+                        self._wake_waiters()
+                raise
+
+    def release(
+        self, reserved_tokens: int = 0, used_tokens: int = 0, succeeded: bool = True
+    ) -> None:
+        """Free the slot of a call and give back the tokens it didn't use."""
+        with self._lock:
+            now = self._clock()
+            self._in_flight = max(0, self._in_flight - 1)
+            self._tokens.give(reserved_tokens - used_tokens, now)
+            if succeeded:
+                self._limit = min(
+                    self._max_concurrency, self._limit + self._increase / self._limit
+                )
+            self._wake_waiters()
+
+    def on_response(self, headers: Mapping[str, str]) -> None:
+        """Adapt the budgets to the rate limit headers of a response."""
+        values = {key.lower(): value for key, value in headers.items()}
+        with self._lock:
+            now = self._clock()
+            for name, budget in (
+                ("tokens", self._tokens),
+                ("requests", self._requests),
+            ):
+                limit = _parse_number(values.get(f"x-ratelimit-limit-{name}"))
+                if limit:
+                    budget.set_rate(limit, now)
+                remaining = _parse_number(values.get(f"x-ratelimit-remaining-{name}"))
+                if remaining is None:
+                    continue
+                budget.cap(remaining, now)
+                if remaining <= 0:
+                    reset = _parse_duration(values.get(f"x-ratelimit-reset-{name}"))
+                    if reset:
+                        self._pause(now + reset)
+
+            retry_after = _parse_retry_after(values)
+            if retry_after:
+                self._pause(now + retry_after)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        """Cut the concurrency limit, and pause the calls for the recommended time."""
+        with self._lock:
+            now = self._clock()
+            if now >= self._last_decrease + self._decrease_cooldown:
+                self._limit = max(
+                    self._min_concurrency, self._limit * self._decrease_factor
+                )
+                self._last_decrease = now
+                log.info("throttled, concurrency limit cut to %d", int(self._limit))
+            if retry_after:
+                self._pause(now + retry_after)
+
+    def _wait_time(self, num_tokens: int, now: float) -> float:
+        """Get the seconds to wait before a call can be made, must hold the lock.
+
+        Infinite when the call waits for a free slot.
+        """
+        if self._paused_until > now:
+            return self._paused_until - now
+        if self._in_flight >= int(self._limit):
+            return math.inf
+        return max(
+            self._tokens.wait_time(num_tokens, now), self._requests.wait_time(1, now)
+        )
+
+    def _wake_waiters(self) -> None:
+        """Wake as many waiting calls as there are free slots, must hold the lock."""
+        free = int(self._limit) - self._in_flight
+        while free > 0 and self._waiters:
+            _wake(self._waiters.popleft())
+            free -= 1
+
+    def _pause(self, until: float) -> None:
+        """Hold the calls back until a time, must hold the lock."""
+        self._paused_until = max(self._paused_until, until)
+
+
+class _Budget:
+    """A budget of tokens or requests, refilled at a rate per minute.
+
+    A budget without a rate doesn't limit anything.
+    """
+
+    def __init__(self, per_minute: int | None, now: float):
+        self.per_minute = float(per_minute or 0)
+        self.level = self.per_minute
+        self._updated = now
+
+    def wait_time(self, amount: int, now: float) -> float:
+        self._refill(now)
+        if not self.per_minute:
+            return 0.0
+        # an amount over the whole budget is let through once the budget is full
+        missing = min(amount, self.per_minute) - self.level
+        return max(0.0, missing * 60 / self.per_minute)
+
+    def take(self, amount: int) -> None:
+        # the level goes below zero for an amount over the whole budget
+        self.level -= amount
+
+    def give(self, amount: int, now: float) -> None:
+        self._refill(now)
+        self.level = min(self.per_minute, self.level + amount)
+
+    def set_rate(self, per_minute: float, now: float) -> None:
+        self._refill(now)
+        self.per_minute = per_minute
+        self.level = min(self.level, per_minute)
+
+    def cap(self, remaining: float, now: float) -> None:
+        self._refill(now)
+        if self.per_minute:
+            self.level = min(self.level, remaining)
+
+    def _refill(self, now: float) -> None:
+        if self.per_minute:
+            elapsed = max(0.0, now - self._updated)
+            self.level = min(
+                self.per_minute, self.level + elapsed * self.per_minute / 60
+            )
+        self._updated = now
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    def set_result() -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+
+    # the waiter belongs to the event loop of the call, which may run on another thread
+    with contextlib.suppress(RuntimeError):
+        waiter.get_loop().call_soon_threadsafe(set_result)
+
+
+def _parse_number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_duration(value: str | None) -> float | None:
+    """Parse a duration such as 20ms, 1.5s or 6m0s into seconds."""
+    if not value:
+        return None
+    seconds = _parse_number(value)
+    if seconds is not None:
+        return seconds
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNIT_SECONDS[unit] for amount, unit in parts)
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Get the seconds to wait from the retry-after-ms or retry-after header."""
+    retry_after_ms = _parse_number(headers.get("retry-after-ms"))
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    seconds = _parse_number(retry_after)
+    if seconds is not None:
+        return seconds
+    try:
+        return parsedate_to_datetime(retry_after).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
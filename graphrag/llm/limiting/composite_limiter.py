@@ -3,6 +3,8 @@
 
 """A module containing Composite Limiter class definition."""
 
+from collections.abc import Mapping
+
 from .llm_limiter import LLMLimiter
 
 
@@ -20,7 +22,29 @@ class CompositeLLMLimiter(LLMLimiter):
         """Whether this limiter needs the token count to be passed in."""
         return any(limiter.needs_token_count for limiter in self._limiters)
 
+    @property
+    def reserves_output_tokens(self) -> bool:
+        """Whether the output tokens are acquired with the input tokens."""
+        return any(limiter.reserves_output_tokens for limiter in self._limiters)
+
     async def acquire(self, num_tokens: int = 1) -> None:
         """Call method definition."""
         for limiter in self._limiters:
             await limiter.acquire(num_tokens)
+
+    def release(
+        self, reserved_tokens: int = 0, used_tokens: int = 0, succeeded: bool = True
+    ) -> None:
+        """Release the pass of every limiter."""
+        for limiter in self._limiters:
+            limiter.release(reserved_tokens, used_tokens, succeeded)
+
+    def on_response(self, headers: Mapping[str, str]) -> None:
+        """Pass the rate limit headers on to every limiter."""
+        for limiter in self._limiters:
+            limiter.on_response(headers)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        """Pass the throttling on to every limiter."""
+        for limiter in self._limiters:
+            limiter.on_throttled(retry_after)
@@ -9,6 +9,11 @@ from aiolimiter import AsyncLimiter
 
 from graphrag.llm.types import LLMConfig
 
+from .adaptive_limiter import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    AdaptiveLLMLimiter,
+)
 from .llm_limiter import LLMLimiter
 from .tpm_rpm_limiter import TpmRpmLLMLimiter
 
@@ -27,3 +32,24 @@ def create_tpm_rpm_limiters(
         None if tpm == 0 else AsyncLimiter(tpm or 50_000),
         None if rpm == 0 else AsyncLimiter(rpm or 10_000),
     )
+
+
+def create_adaptive_limiter(
+    configuration: LLMConfig,
+    concurrent_requests: int | None = None,
+    max_concurrent_requests: int | None = None,
+) -> LLMLimiter:
+    """Get an adaptive limiter for a given model name.
+
+    The configured rates and concurrency are where the limiter starts from, the
+    feedback of the service adjusts them.
+    """
+    concurrency = concurrent_requests or DEFAULT_CONCURRENCY
+    return AdaptiveLLMLimiter(
+        tokens_per_minute=configuration.tokens_per_minute,
+        requests_per_minute=configuration.requests_per_minute,
+        concurrency=concurrency,
+        max_concurrency=max(
+            concurrency, max_concurrent_requests or DEFAULT_MAX_CONCURRENCY
+        ),
+    )
@@ -0,0 +1,33 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Route the rate limit headers of the service responses to the limiter of the call."""
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .llm_limiter import LLMLimiter
+
+# the limiter of the call running in the current task, the responses are read by the
+# HTTP client which is shared by the LLMs of every limiter
+_current_limiter: ContextVar[LLMLimiter | None] = ContextVar(
+    "current_limiter", default=None
+)
+
+
+@contextmanager
+def limiter_feedback(limiter: LLMLimiter | None) -> Iterator[None]:
+    """Report the responses received in this block to a limiter."""
+    token = _current_limiter.set(limiter)
+    try:
+        yield
+    finally:
+        _current_limiter.reset(token)
+
+
+def report_response_headers(headers: Mapping[str, str]) -> None:
+    """Report the headers of a response to the limiter of the running call, if any."""
+    limiter = _current_limiter.get()
+    if limiter is not None:
+        limiter.on_response(headers)
@@ -4,6 +4,7 @@
 """Limiting types."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 
 class LLMLimiter(ABC):
@@ -14,6 +15,25 @@ class LLMLimiter(ABC):
     def needs_token_count(self) -> bool:
         """Whether this limiter needs the token count to be passed in."""
 
+    @property
+    def reserves_output_tokens(self) -> bool:
+        """Whether the output tokens are acquired with the input tokens, before the call is made.
+
+        Such a limiter is released once the call is done, with the tokens the call used.
+        """
+        return False
+
     @abstractmethod
     async def acquire(self, num_tokens: int = 1) -> None:
         """Acquire a pass through the limiter."""
+
+    def release(  # noqa: B027
+        self, reserved_tokens: int = 0, used_tokens: int = 0, succeeded: bool = True
+    ) -> None:
+        """Release a pass acquired through the limiter, once the call is done."""
+
+    def on_response(self, headers: Mapping[str, str]) -> None:  # noqa: B027
+        """Adapt to the rate limit headers of a response of the service."""
+
+    def on_throttled(self, retry_after: float | None = None) -> None:  # noqa: B027
+        """Adapt to a call that the service throttled."""
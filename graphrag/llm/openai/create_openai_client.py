@@ -4,10 +4,20 @@
 """Create OpenAI client instance."""
 
 import logging
+import threading
+from collections.abc import Callable
 from functools import cache
+from typing import Any
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
-from openai import AsyncAzureOpenAI, AsyncOpenAI
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+)
+
+from graphrag.llm.limiting import report_response_headers
 
 from .openai_configuration import OpenAIConfiguration
 from .types import OpenAIClientTypes
@@ -16,12 +26,42 @@ log = logging.getLogger(__name__)
 
 API_BASE_REQUIRED_FOR_AZURE = "api_base is required for Azure OpenAI client"
 
+# the clients of the process, by the settings they connect with
+_clients: dict[tuple, OpenAIClientTypes] = {}
+_clients_lock = threading.Lock()
+
 
-@cache
 def create_openai_client(
     configuration: OpenAIConfiguration, azure: bool
 ) -> OpenAIClientTypes:
-    """Create a new OpenAI client instance."""
+    """Get the OpenAI client instance for a configuration.
+
+    The configurations that connect to the same service the same way share a client,
+    so the LLMs of every workflow share its connection pool.
+    """
+    key = (
+        azure,
+        configuration.api_key,
+        configuration.api_base,
+        configuration.api_version,
+        configuration.organization,
+        configuration.deployment_name,
+        configuration.cognitive_services_endpoint,
+        configuration.request_timeout,
+        configuration.max_connections,
+        configuration.max_keepalive_connections,
+        configuration.keepalive_expiry,
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _create_openai_client(configuration, azure)
+        return client
+
+
+def _create_openai_client(
+    configuration: OpenAIConfiguration, azure: bool
+) -> OpenAIClientTypes:
     if azure:
         api_base = configuration.api_base
         if api_base is None:
@@ -39,9 +79,7 @@ def create_openai_client(
 
         return AsyncAzureOpenAI(
             api_key=configuration.api_key if configuration.api_key else None,
-            azure_ad_token_provider=get_bearer_token_provider(
-                DefaultAzureCredential(), cognitive_services_endpoint
-            )
+            azure_ad_token_provider=_get_token_provider(cognitive_services_endpoint)
             if not configuration.api_key
             else None,
             organization=configuration.organization,
@@ -52,6 +90,7 @@ def create_openai_client(
             # Timeout/Retry Configuration - Use Tenacity for Retries, so disable them here
             timeout=configuration.request_timeout or 180.0,
             max_retries=0,
+            http_client=_create_http_client(configuration),
         )
 
     log.info("Creating OpenAI client base_url=%s", configuration.api_base)
@@ -62,4 +101,35 @@ def create_openai_client(
         # Timeout/Retry Configuration - Use Tenacity for Retries, so disable them here
         timeout=configuration.request_timeout or 180.0,
         max_retries=0,
+        http_client=_create_http_client(configuration),
     )
+
+
+@cache
+def _get_token_provider(cognitive_services_endpoint: str) -> Callable[[], str]:
+    """Get the Azure AD token provider of an endpoint, shared by its clients."""
+    return get_bearer_token_provider(
+        DefaultAzureCredential(), cognitive_services_endpoint
+    )
+
+
+def _create_http_client(configuration: OpenAIConfiguration) -> DefaultAsyncHttpxClient:
+    # the limits class of the http library that the openai package uses
+    limits = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=configuration.max_connections
+        or DEFAULT_CONNECTION_LIMITS.max_connections,
+        max_keepalive_connections=configuration.max_keepalive_connections
+        or DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+        keepalive_expiry=configuration.keepalive_expiry
+        or DEFAULT_CONNECTION_LIMITS.keepalive_expiry,
+    )
+    return DefaultAsyncHttpxClient(
+        limits=limits, event_hooks={"response": [_report_rate_limit_headers]}
+    )
+
+
+async def _report_rate_limit_headers(  # noqa RUF029 async is required for async hooks
+    response: Any,
+) -> None:
+    # the hook runs in the task of the call, so it reaches the limiter of the call
+    report_response_headers(response.headers)
@@ -47,6 +47,11 @@ class OpenAIConfiguration(Hashable, LLMConfig):
     _max_retry_wait: float | None
     _request_timeout: float | None
 
+    # Connection Pool
+    _max_connections: int | None
+    _max_keepalive_connections: int | None
+    _keepalive_expiry: float | None
+
     # The raw configuration object
     _raw_config: dict
 
@@ -59,6 +64,7 @@ class OpenAIConfiguration(Hashable, LLMConfig):
     _concurrent_requests: int | None
     _encoding_model: str | None
     _sleep_on_rate_limit_recommendation: bool | None
+    _adaptive_rate_limit: bool | None
 
     def __init__(
         self,
@@ -126,6 +132,10 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         self._sleep_on_rate_limit_recommendation = lookup_bool(
             "sleep_on_rate_limit_recommendation"
         )
+        self._adaptive_rate_limit = lookup_bool("adaptive_rate_limit")
+        self._max_connections = lookup_int("max_connections")
+        self._max_keepalive_connections = lookup_int("max_keepalive_connections")
+        self._keepalive_expiry = lookup_float("keepalive_expiry")
         self._raw_config = config
 
     @property
@@ -230,6 +240,21 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         """Request timeout property definition."""
         return self._request_timeout
 
+    @property
+    def max_connections(self) -> int | None:
+        """Max connections property definition."""
+        return self._max_connections
+
+    @property
+    def max_keepalive_connections(self) -> int | None:
+        """Max keepalive connections property definition."""
+        return self._max_keepalive_connections
+
+    @property
+    def keepalive_expiry(self) -> float | None:
+        """Keepalive expiry property definition."""
+        return self._keepalive_expiry
+
     @property
     def model_supports_json(self) -> bool | None:
         """Model supports json property definition."""
@@ -260,6 +285,11 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         """Whether to sleep for <n> seconds when recommended by 429 errors (azure-specific)."""
         return self._sleep_on_rate_limit_recommendation
 
+    @property
+    def adaptive_rate_limit(self) -> bool | None:
+        """Whether to adapt the concurrency and rates to the rate limit feedback of the service."""
+        return self._adaptive_rate_limit
+
     @property
     def raw_config(self) -> dict:
         """Raw config method definition."""
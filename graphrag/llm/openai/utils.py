@@ -9,7 +9,6 @@ import re
 from collections.abc import Callable
 from typing import Any
 
-import tiktoken
 from json_repair import repair_json
 from openai import (
     APIConnectionError,
@@ -17,12 +16,12 @@ from openai import (
     RateLimitError,
 )
 
+from graphrag.llm.tokenizer import get_tokenizer
+
 from .openai_configuration import OpenAIConfiguration
 
 DEFAULT_ENCODING = "cl100k_base"
 
-_encoders: dict[str, tiktoken.Encoding] = {}
-
 RETRYABLE_ERRORS: list[type[Exception]] = [
     RateLimitError,
     APIConnectionError,
@@ -35,13 +34,7 @@ log = logging.getLogger(__name__)
 
 def get_token_counter(config: OpenAIConfiguration) -> Callable[[str], int]:
     """Get a function that counts the number of tokens in a string."""
-    model = config.encoding_model or "cl100k_base"
-    enc = _encoders.get(model)
-    if enc is None:
-        enc = tiktoken.get_encoding(model)
-        _encoders[model] = enc
-
-    return lambda s: len(enc.encode(s))
+    return get_tokenizer(config.encoding_model or DEFAULT_ENCODING).num_tokens
 
 
 def perform_variable_replacements(
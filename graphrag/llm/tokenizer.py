@@ -0,0 +1,178 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the process-wide tokenizers."""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Sequence
+from typing import Literal, cast
+
+import tiktoken
+
+DEFAULT_ENCODING_NAME = "cl100k_base"
+DEFAULT_MAX_CACHED_COUNTS = 100_000
+# texts this short are cheaper to count than to look up
+_MIN_CACHED_LENGTH = 16
+# tiktoken encodes batches on a thread pool, which only pays off with spare cores
+DEFAULT_NUM_THREADS = min(8, os.cpu_count() or 1)
+
+log = logging.getLogger(__name__)
+
+_tokenizers: dict[str, "CachedTokenizer"] = {}
+_tokenizers_lock = threading.Lock()
+
+
+class CachedTokenizer:
+    """A tiktoken encoding that remembers the token counts of the texts it counted.
+
+    The counts are kept in a least recently used cache keyed by the hash and length
+    of the text, so the cache doesn't hold on to the texts themselves. Tokenizers
+    are shared by the whole process, use get_tokenizer to get one.
+    """
+
+    def __init__(
+        self,
+        encoding: tiktoken.Encoding,
+        max_cached_counts: int = DEFAULT_MAX_CACHED_COUNTS,
+    ):
+        """Init method definition."""
+        self.encoding = encoding
+        self._max_cached_counts = max_cached_counts
+        self._counts: OrderedDict[tuple[int, int], int] = OrderedDict()
+        # tokenizers are shared by the threads of threaded verbs
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Get the name of the encoding."""
+        return self.encoding.name
+
+    def encode(
+        self,
+        text: str,
+        allowed_special: Literal["all"] | set[str] | None = None,
+        disallowed_special: Literal["all"] | Collection[str] = "all",
+    ) -> list[int]:
+        """Encode a text into token ids."""
+        return self.encoding.encode(
+            text,
+            allowed_special=allowed_special or set(),
+            disallowed_special=disallowed_special,
+        )
+
+    def encode_batch(
+        self,
+        texts: Sequence[str],
+        num_threads: int = DEFAULT_NUM_THREADS,
+        allowed_special: Literal["all"] | set[str] | None = None,
+        disallowed_special: Literal["all"] | Collection[str] = "all",
+    ) -> list[list[int]]:
+        """Encode texts into token ids, across threads."""
+        if num_threads <= 1:
+            return [
+                self.encode(text, allowed_special, disallowed_special) for text in texts
+            ]
+        return self.encoding.encode_batch(
+            list(texts),
+            num_threads=num_threads,
+            allowed_special=allowed_special or set(),
+            disallowed_special=disallowed_special,
+        )
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        """Decode token ids into a text."""
+        return self.encoding.decode(list(tokens))
+
+    def num_tokens(self, text: str) -> int:
+        """Count the tokens of a text."""
+        if len(text) < _MIN_CACHED_LENGTH:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        key = (hash(text), len(text))
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+                return count
+        count = len(self.encoding.encode(text, disallowed_special=()))
+        with self._lock:
+            self._cache_count(key, count)
+        return count
+
+    def num_tokens_batch(
+        self, texts: Sequence[str], num_threads: int = DEFAULT_NUM_THREADS
+    ) -> list[int]:
+        """Count the tokens of texts, encoding the uncounted ones in one batch."""
+        counts: list[int | None] = [None] * len(texts)
+        keys = [(hash(text), len(text)) for text in texts]
+        with self._lock:
+            for i, key in enumerate(keys):
+                count = self._counts.get(key)
+                if count is not None:
+                    self._counts.move_to_end(key)
+                    counts[i] = count
+
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if missing:
+            encoded = self.encode_batch(
+                [texts[i] for i in missing],
+                num_threads=num_threads,
+                disallowed_special=(),
+            )
+            with self._lock:
+                for i, tokens in zip(missing, encoded, strict=True):
+                    counts[i] = len(tokens)
+                    if len(texts[i]) >= _MIN_CACHED_LENGTH:
+                        self._cache_count(keys[i], len(tokens))
+        return cast(list[int], counts)
+
+    def clear(self) -> None:
+        """Forget the cached token counts."""
+        with self._lock:
+            self._counts.clear()
+
+    def _cache_count(self, key: tuple[int, int], count: int) -> None:
+        """Remember a token count, must hold the lock."""
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+        while len(self._counts) > self._max_cached_counts:
+            self._counts.popitem(last=False)
+
+
+def get_tokenizer(
+    encoding: str | tiktoken.Encoding | None = None, model: str | None = None
+) -> CachedTokenizer:
+    """Get the shared tokenizer of an encoding, or of the encoding used by a model.
+
+    The model takes precedence over an encoding name, an unknown model falls back to
+    the default encoding.
+    """
+    if isinstance(encoding, tiktoken.Encoding):
+        name = encoding.name
+    elif model is not None:
+        try:
+            name = tiktoken.encoding_name_for_model(model)
+        except KeyError:
+            log.warning(
+                "Failed to get encoding for %s, falling back to %s",
+                model,
+                DEFAULT_ENCODING_NAME,
+            )
+            name = DEFAULT_ENCODING_NAME
+    else:
+        name = encoding or DEFAULT_ENCODING_NAME
+
+    tokenizer = _tokenizers.get(name)
+    if tokenizer is None:
+        with _tokenizers_lock:
+            tokenizer = _tokenizers.get(name)
+            if tokenizer is None:
+                tokenizer = CachedTokenizer(
+                    encoding
+                    if isinstance(encoding, tiktoken.Encoding)
+                    else tiktoken.get_encoding(name)
+                )
+                _tokenizers[name] = tokenizer
+    return tokenizer
@@ -24,6 +24,11 @@ class LLMConfig(Protocol):
         """Get whether to sleep on rate limit recommendation."""
         ...
 
+    @property
+    def max_tokens(self) -> int | None:
+        """Get the maximum number of tokens to generate."""
+        ...
+
     @property
     def tokens_per_minute(self) -> int | None:
         """Get the number of tokens per minute."""
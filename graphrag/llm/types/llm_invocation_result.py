@@ -33,3 +33,9 @@ class LLMInvocationResult(Generic[T]):
 
     output_tokens: int
     """The number of output tokens."""
+
+    semaphore_wait_time: float = 0.0
+    """The time the invocation waited for the concurrency limit."""
+
+    limiter_wait_time: float = 0.0
+    """The time the invocation waited for the rate limiter."""
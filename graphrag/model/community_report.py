@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from .named import Named
 
 
@@ -25,10 +27,10 @@ class CommunityReport(Named):
     rank: float | None = 1.0
     """Rank of the report, used for sorting (optional). Higher means more important"""
 
-    summary_embedding: list[float] | None = None
+    summary_embedding: list[float] | np.ndarray | None = None
     """The semantic (i.e. text) embedding of the report summary (optional)."""
 
-    full_content_embedding: list[float] | None = None
+    full_content_embedding: list[float] | np.ndarray | None = None
     """The semantic (i.e. text) embedding of the full report content (optional)."""
 
     attributes: dict[str, Any] | None = None
@@ -6,6 +6,8 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from .named import Named
 
 
@@ -25,10 +27,10 @@ class Document(Named):
     summary: str | None = None
     """Summary of the document (optional)."""
 
-    summary_embedding: list[float] | None = None
+    summary_embedding: list[float] | np.ndarray | None = None
     """The semantic embedding for the document summary (optional)."""
 
-    raw_content_embedding: list[float] | None = None
+    raw_content_embedding: list[float] | np.ndarray | None = None
     """The semantic embedding for the document raw content (optional)."""
 
     attributes: dict[str, Any] | None = None
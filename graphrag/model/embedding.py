@@ -0,0 +1,39 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Compact storage for embeddings."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+# int8 embeddings hold unit-length vectors scaled by this factor
+INT8_EMBEDDING_SCALE = 127
+
+
+def encode_embedding(embedding: Sequence[float] | np.ndarray, dtype: str) -> np.ndarray:
+    """Convert an embedding to an array of the given dtype: float32, float16 or int8.
+
+    int8 embeddings are scaled by INT8_EMBEDDING_SCALE, which keeps the components of
+    unit-length embeddings in range. Larger components are clipped.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if np.dtype(dtype) == np.int8:
+        scaled = np.rint(vector * INT8_EMBEDDING_SCALE)
+        return np.clip(scaled, -INT8_EMBEDDING_SCALE, INT8_EMBEDDING_SCALE).astype(
+            np.int8
+        )
+    return vector.astype(dtype, copy=False)
+
+
+def decode_embedding(embedding: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Convert a stored embedding to a float array, undoing the int8 scaling.
+
+    float16 embeddings are kept as they are to save memory.
+    """
+    vector = np.asarray(embedding)
+    if np.issubdtype(vector.dtype, np.integer):
+        return vector.astype(np.float32) / INT8_EMBEDDING_SCALE
+    if vector.dtype == np.float16:
+        return vector
+    return vector.astype(np.float32, copy=False)
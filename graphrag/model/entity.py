@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from .named import Named
 
 
@@ -19,13 +21,13 @@ class Entity(Named):
     description: str | None = None
     """Description of the entity (optional)."""
 
-    description_embedding: list[float] | None = None
+    description_embedding: list[float] | np.ndarray | None = None
     """The semantic (i.e. text) embedding of the entity (optional)."""
 
-    name_embedding: list[float] | None = None
+    name_embedding: list[float] | np.ndarray | None = None
     """The semantic (i.e. text) embedding of the entity (optional)."""
 
-    graph_embedding: list[float] | None = None
+    graph_embedding: list[float] | np.ndarray | None = None
     """The graph embedding of the entity, likely from node2vec (optional)."""
 
     community_ids: list[str] | None = None
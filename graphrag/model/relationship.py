@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from .identified import Identified
 
 
@@ -25,7 +27,7 @@ class Relationship(Identified):
     description: str | None = None
     """A description of the relationship (optional)."""
 
-    description_embedding: list[float] | None = None
+    description_embedding: list[float] | np.ndarray | None = None
     """The semantic embedding for the relationship description (optional)."""
 
     text_unit_ids: list[str] | None = None
@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from .identified import Identified
 
 
@@ -16,7 +18,7 @@ class TextUnit(Identified):
     text: str
     """The text of the unit."""
 
-    text_embedding: list[float] | None = None
+    text_embedding: list[float] | np.ndarray | None = None
     """The text embedding for the text unit (optional)."""
 
     entity_ids: list[str] | None = None
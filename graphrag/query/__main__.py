@@ -6,7 +6,8 @@
 import argparse
 from enum import Enum
 
-from .cli import run_global_search, run_local_search
+from .cli import run_global_search, run_local_search, run_server
+from .server import DEFAULT_HOST, DEFAULT_PORT
 
 INVALID_METHOD_ERROR = "Invalid method"
 
@@ -52,8 +53,8 @@ if __name__ == "__main__":
 
     parser.add_argument(
         "--method",
-        help="The method to run",
-        required=True,
+        help="The method to run, required unless serving",
+        required=False,
         type=SearchType,
         choices=list(SearchType),
     )
@@ -78,35 +79,68 @@ if __name__ == "__main__":
         action="store_true",
     )
 
+    parser.add_argument(
+        "--serve",
+        help="Answer queries over HTTP, keeping the index loaded between queries",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--host",
+        help=f"The host to serve queries on. Default: {DEFAULT_HOST}",
+        type=str,
+        default=DEFAULT_HOST,
+    )
+
+    parser.add_argument(
+        "--port",
+        help=f"The port to serve queries on. Default: {DEFAULT_PORT}",
+        type=int,
+        default=DEFAULT_PORT,
+    )
+
     parser.add_argument(
         "query",
-        nargs=1,
+        nargs="?",
         help="The query to run",
         type=str,
     )
 
     args = parser.parse_args()
 
-    match args.method:
-        case SearchType.LOCAL:
-            run_local_search(
-                args.config,
-                args.data,
-                args.root,
-                args.community_level,
-                args.response_type,
-                args.streaming,
-                args.query[0],
-            )
-        case SearchType.GLOBAL:
-            run_global_search(
-                args.config,
-                args.data,
-                args.root,
-                args.community_level,
-                args.response_type,
-                args.streaming,
-                args.query[0],
-            )
-        case _:
-            raise ValueError(INVALID_METHOD_ERROR)
+    if args.serve:
+        run_server(
+            args.config,
+            args.data,
+            args.root,
+            args.community_level,
+            args.response_type,
+            args.host,
+            args.port,
+        )
+    elif args.method is None or args.query is None:
+        parser.error("--method and a query are required unless serving")
+    else:
+        match args.method:
+            case SearchType.LOCAL:
+                run_local_search(
+                    args.config,
+                    args.data,
+                    args.root,
+                    args.community_level,
+                    args.response_type,
+                    args.streaming,
+                    args.query,
+                )
+            case SearchType.GLOBAL:
+                run_global_search(
+                    args.config,
+                    args.data,
+                    args.root,
+                    args.community_level,
+                    args.response_type,
+                    args.streaming,
+                    args.query,
+                )
+            case _:
+                raise ValueError(INVALID_METHOD_ERROR)
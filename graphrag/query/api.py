@@ -12,6 +12,7 @@ Contains the following functions:
  - global_search_streaming: Perform a global search and stream results via a generator.
  - local_search: Perform a local search.
  - local_search_streaming: Perform a local search and stream results via a generator.
+ - reformat_context_data: Reformat the context data of a search response into lists of records.
 
 WARNING: This API is under development and may undergo changes in future releases.
 Backwards compatibility is not guaranteed at this time.
@@ -25,11 +26,13 @@ from pydantic import validate_call
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.progress.types import PrintProgressReporter
-from graphrag.model.entity import Entity
-from graphrag.vector_stores.lancedb import LanceDBVectorStore
-from graphrag.vector_stores.typing import VectorStoreFactory, VectorStoreType
+from graphrag.vector_stores.typing import VectorStoreType
 
-from .factories import get_global_search_engine, get_local_search_engine
+from .factories import (
+    get_description_embedding_store,
+    get_global_search_engine,
+    get_local_search_engine,
+)
 from .indexer_adapters import (
     read_indexer_covariates,
     read_indexer_entities,
@@ -37,7 +40,6 @@ from .indexer_adapters import (
     read_indexer_reports,
     read_indexer_text_units,
 )
-from .input.loaders.dfs import store_entity_semantic_embeddings
 
 reporter = PrintProgressReporter("")
 
@@ -51,6 +53,7 @@ async def global_search(
     community_level: int,
     response_type: str,
     query: str,
+    token_counts_path: str | None = None,
 ) -> str | dict[str, Any] | list[dict[str, Any]]:
     """Perform a global search.
 
@@ -63,6 +66,7 @@ async def global_search(
     - community_level (int): The community level to search at.
     - response_type (str): The type of response to return.
     - query (str): The user query to search for.
+    - token_counts_path (str | None): A file to keep the token counts of the community reports in, so later searches don't count them again.
 
     Returns
     -------
@@ -79,6 +83,7 @@ async def global_search(
         reports=reports,
         entities=_entities,
         response_type=response_type,
+        token_counts_path=token_counts_path,
     )
     result = await search_engine.asearch(query=query)
     reporter.success(f"Global Search Response: {result.response}")
@@ -94,6 +99,7 @@ async def global_search_streaming(
     community_level: int,
     response_type: str,
     query: str,
+    token_counts_path: str | None = None,
 ) -> AsyncGenerator:
     """Perform a global search and return results as a generator.
 
@@ -108,6 +114,7 @@ async def global_search_streaming(
     - community_level (int): The community level to search at.
     - response_type (str): The type of response to return.
     - query (str): The user query to search for.
+    - token_counts_path (str | None): A file to keep the token counts of the community reports in, so later searches don't count them again.
 
     Returns
     -------
@@ -124,6 +131,7 @@ async def global_search_streaming(
         reports=reports,
         entities=_entities,
         response_type=response_type,
+        token_counts_path=token_counts_path,
     )
     search_result = search_engine.astream_search(query=query)
 
@@ -133,7 +141,7 @@ async def global_search_streaming(
     get_context_data = True
     async for stream_chunk in search_result:
         if get_context_data:
-            context_data = _reformat_context_data(stream_chunk)
+            context_data = reformat_context_data(stream_chunk)
             yield context_data
             get_context_data = False
         else:
@@ -184,7 +192,7 @@ async def local_search(
     vector_store_type = vector_store_args.get("type", VectorStoreType.LanceDB)
 
     _entities = read_indexer_entities(nodes, entities, community_level)
-    description_embedding_store = _get_embedding_description_store(
+    description_embedding_store = get_description_embedding_store(
         entities=_entities,
         vector_store_type=vector_store_type,
         config_args=vector_store_args,
@@ -252,7 +260,7 @@ async def local_search_streaming(
     vector_store_type = vector_store_args.get("type", VectorStoreType.LanceDB)
 
     _entities = read_indexer_entities(nodes, entities, community_level)
-    description_embedding_store = _get_embedding_description_store(
+    description_embedding_store = get_description_embedding_store(
         entities=_entities,
         vector_store_type=vector_store_type,
         config_args=vector_store_args,
@@ -278,61 +286,14 @@ async def local_search_streaming(
     get_context_data = True
     async for stream_chunk in search_result:
         if get_context_data:
-            context_data = _reformat_context_data(stream_chunk)
+            context_data = reformat_context_data(stream_chunk)
             yield context_data
             get_context_data = False
         else:
             yield stream_chunk
 
 
-def _get_embedding_description_store(
-    entities: list[Entity],
-    vector_store_type: str = VectorStoreType.LanceDB,
-    config_args: dict | None = None,
-):
-    """Get the embedding description store."""
-    if not config_args:
-        config_args = {}
-
-    collection_name = config_args.get(
-        "query_collection_name", "entity_description_embeddings"
-    )
-    config_args.update({"collection_name": collection_name})
-    description_embedding_store = VectorStoreFactory.get_vector_store(
-        vector_store_type=vector_store_type, kwargs=config_args
-    )
-
-    description_embedding_store.connect(**config_args)
-
-    if config_args.get("overwrite", True):
-        # this step assumes the embeddings were originally stored in a file rather
-        # than a vector database
-
-        # dump embeddings from the entities list to the description_embedding_store
-        store_entity_semantic_embeddings(
-            entities=entities, vectorstore=description_embedding_store
-        )
-    else:
-        # load description embeddings to an in-memory lancedb vectorstore
-        # and connect to a remote db, specify url and port values.
-        description_embedding_store = LanceDBVectorStore(
-            collection_name=collection_name
-        )
-        description_embedding_store.connect(
-            db_uri=config_args.get("db_uri", "./lancedb")
-        )
-
-        # load data from an existing table
-        description_embedding_store.document_collection = (
-            description_embedding_store.db_connection.open_table(
-                description_embedding_store.collection_name
-            )
-        )
-
-    return description_embedding_store
-
-
-def _reformat_context_data(context_data: dict) -> dict:
+def reformat_context_data(context_data: dict) -> dict:
     """
     Reformats context_data for all query responses.
 
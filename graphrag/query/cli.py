@@ -18,6 +18,8 @@ from graphrag.config import (
 from graphrag.index.progress import PrintProgressReporter
 
 from . import api
+from .engine import QueryEngine
+from .server import serve
 
 reporter = PrintProgressReporter("")
 
@@ -49,6 +51,8 @@ def run_global_search(
     final_community_reports: pd.DataFrame = pd.read_parquet(
         data_path / "create_final_community_reports.parquet"
     )
+    # the token counts of the reports are kept next to the index outputs
+    token_counts_path = str(data_path / "global_search_token_counts.json")
 
     # call the Query API
     if streaming:
@@ -65,6 +69,7 @@ def run_global_search(
                 community_level=community_level,
                 response_type=response_type,
                 query=query,
+                token_counts_path=token_counts_path,
             ):
                 if get_context_data:
                     context_data = stream_chunk
@@ -87,6 +92,7 @@ def run_global_search(
             community_level=community_level,
             response_type=response_type,
             query=query,
+            token_counts_path=token_counts_path,
         )
     )
 
@@ -172,6 +178,41 @@ def run_local_search(
     )
 
 
+def run_server(
+    config_filepath: str | None,
+    data_dir: str | None,
+    root_dir: str | None,
+    community_level: int,
+    response_type: str,
+    host: str,
+    port: int,
+):
+    """Answer queries over HTTP, loading the index files once.
+
+    When the data directory is inferred from the root directory, a reload switches
+    to the latest run of the index.
+    """
+    infer_data_dir = data_dir is None
+    data_dir, root_dir, config = _configure_paths_and_settings(
+        data_dir, root_dir, config_filepath
+    )
+    engine = QueryEngine(
+        config,
+        data_dir=data_dir,
+        community_level=community_level,
+        response_type=response_type,
+    )
+    engine.load()
+
+    def reload() -> bool:
+        return engine.reload(
+            _infer_data_dir(cast(str, root_dir)) if infer_data_dir else None
+        )
+
+    reporter.success(f"Serving queries on http://{host}:{port}")
+    serve(engine, host=host, port=port, reload=reload)
+
+
 def _configure_paths_and_settings(
     data_dir: str | None,
     root_dir: str | None,
@@ -21,6 +21,12 @@ class GlobalContextBuilder(ABC):
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """Build the context for the global search mode."""
 
+    async def abuild_context(
+        self, conversation_history: ConversationHistory | None = None, **kwargs
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """Build the context for the global search mode asynchronously."""
+        return self.build_context(conversation_history, **kwargs)
+
 
 class LocalContextBuilder(ABC):
     """Base class for local-search context builders."""
@@ -33,3 +39,16 @@ class LocalContextBuilder(ABC):
         **kwargs,
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """Build the context for the local search mode."""
+
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        **kwargs,
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """Build the context for the local search mode asynchronously.
+
+        Builders that call out to embedding models or vector stores should override
+        this so that they don't block the event loop.
+        """
+        return self.build_context(query, conversation_history, **kwargs)
@@ -5,6 +5,7 @@
 
 import logging
 import random
+from hashlib import md5
 from typing import Any, cast
 
 import pandas as pd
@@ -37,6 +38,8 @@ def build_community_context(
     single_batch: bool = True,
     context_name: str = "Reports",
     random_state: int = 86,
+    token_counts: dict[str, int] | None = None,
+    rank_order: bool = False,
 ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
     """
     Prepare community report data table as context data for system prompt.
@@ -44,8 +47,21 @@ def build_community_context(
     If entities are provided, the community weight is calculated as the count of text units associated with entities within the community.
 
     The calculated weight is added as an attribute to the community reports and added to the context data table.
+
+    If token_counts is provided, it caches the number of tokens of each rendered report row, keyed by text_hash, so that reports are only tokenized once across calls.
+
+    If rank_order is True, the reports are batched in descending order of rank, then weight, so that the first batches hold the most important communities.
     """
 
+    def _num_tokens(text: str) -> int:
+        if token_counts is None:
+            return num_tokens(text, token_encoder)
+        key = text_hash(text)
+        count = token_counts.get(key)
+        if count is None:
+            count = token_counts[key] = num_tokens(text, token_encoder)
+        return count
+
     def _is_included(report: CommunityReport) -> bool:
         return report.rank is not None and report.rank >= min_community_rank
 
@@ -104,6 +120,20 @@ def build_community_context(
         random.seed(random_state)
         random.shuffle(selected_reports)
 
+    if rank_order:
+        # a stable sort, shuffled reports stay shuffled within a rank
+        selected_reports.sort(
+            key=lambda report: (
+                report.rank or 0,
+                float(
+                    (report.attributes or {}).get(community_weight_name, 0)
+                    if include_community_weight
+                    else 0
+                ),
+            ),
+            reverse=True,
+        )
+
     # "global" variables
     attributes = (
         list(community_reports[0].attributes.keys())
@@ -124,7 +154,7 @@ def build_community_context(
         batch_text = (
             f"-----{context_name}-----" + "\n" + column_delimiter.join(header) + "\n"
         )
-        batch_tokens = num_tokens(batch_text, token_encoder)
+        batch_tokens = _num_tokens(batch_text)
         batch_records = []
 
     def _cut_batch() -> None:
@@ -148,7 +178,7 @@ def build_community_context(
 
     for report in selected_reports:
         new_context_text, new_context = _report_context_text(report, attributes)
-        new_tokens = num_tokens(new_context_text, token_encoder)
+        new_tokens = _num_tokens(new_context_text)
 
         if batch_tokens + new_tokens > max_tokens:
             # add the current batch to the context data and start a new batch if we are in multi-batch mode
@@ -175,6 +205,11 @@ def build_community_context(
     }
 
 
+def text_hash(text: str) -> str:
+    """Get the key of a text in a token count cache."""
+    return md5(text.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
 def _compute_community_weights(
     community_reports: list[CommunityReport],
     entities: list[Entity] | None,
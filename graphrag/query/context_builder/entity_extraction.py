@@ -10,8 +10,9 @@ from graphrag.query.input.retrieval.entities import (
     get_entity_by_key,
     get_entity_by_name,
 )
+from graphrag.query.input.retrieval.retrieval_index import RetrievalIndex
 from graphrag.query.llm.base import BaseTextEmbedding
-from graphrag.vector_stores import BaseVectorStore
+from graphrag.vector_stores import BaseVectorStore, VectorStoreSearchResult
 
 
 class EntityVectorStoreKey(str, Enum):
@@ -42,13 +43,13 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    index: RetrievalIndex | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
-    if include_entity_names is None:
-        include_entity_names = []
-    if exclude_entity_names is None:
-        exclude_entity_names = []
-    matched_entities = []
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    Pass a RetrievalIndex over all_entities to look entities up without scanning the list.
+    """
+    search_results = []
     if query != "":
         # get entities with highest semantic similarity to query
         # oversample to account for excluded entities
@@ -57,11 +58,69 @@ def map_query_to_entities(
             text_embedder=lambda t: text_embedder.embed(t),
             k=k * oversample_scaler,
         )
+    return _select_entities(
+        query,
+        search_results,
+        all_entities,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+        index,
+    )
+
+
+async def amap_query_to_entities(
+    query: str,
+    text_embedding_vectorstore: BaseVectorStore,
+    text_embedder: BaseTextEmbedding,
+    all_entities: list[Entity],
+    embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+    include_entity_names: list[str] | None = None,
+    exclude_entity_names: list[str] | None = None,
+    k: int = 10,
+    oversample_scaler: int = 2,
+    index: RetrievalIndex | None = None,
+) -> list[Entity]:
+    """Extract the same entities as map_query_to_entities, embedding the query and searching the vector store asynchronously."""
+    search_results = []
+    if query != "":
+        search_results = await text_embedding_vectorstore.asimilarity_search_by_text(
+            text=query,
+            text_embedder=lambda t: text_embedder.aembed(t),
+            k=k * oversample_scaler,
+        )
+    return _select_entities(
+        query,
+        search_results,
+        all_entities,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+        index,
+    )
+
+
+def _select_entities(
+    query: str,
+    search_results: list[VectorStoreSearchResult],
+    all_entities: list[Entity],
+    embedding_vectorstore_key: str,
+    include_entity_names: list[str] | None,
+    exclude_entity_names: list[str] | None,
+    k: int,
+    index: RetrievalIndex | None,
+) -> list[Entity]:
+    if include_entity_names is None:
+        include_entity_names = []
+    if exclude_entity_names is None:
+        exclude_entity_names = []
+    matched_entities = []
+    if query != "":
         for result in search_results:
-            matched = get_entity_by_key(
-                entities=all_entities,
-                key=embedding_vectorstore_key,
-                value=result.document.id,
+            matched = _get_entity_by_key(
+                all_entities, embedding_vectorstore_key, result.document.id, index
             )
             if matched:
                 matched_entities.append(matched)
@@ -80,7 +139,11 @@ def map_query_to_entities(
     # add entities in the include_entity list
     included_entities = []
     for entity_name in include_entity_names:
-        included_entities.extend(get_entity_by_name(all_entities, entity_name))
+        included_entities.extend(
+            index.get_entities_by_title(entity_name)
+            if index is not None
+            else get_entity_by_name(all_entities, entity_name)
+        )
     return included_entities + matched_entities
 
 
@@ -92,27 +155,26 @@ def find_nearest_neighbors_by_graph_embeddings(
     embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     k: int = 10,
     oversample_scaler: int = 2,
+    index: RetrievalIndex | None = None,
 ) -> list[Entity]:
     """Retrieve related entities by graph embeddings."""
     if exclude_entity_names is None:
         exclude_entity_names = []
     # find nearest neighbors of this entity using graph embedding
-    query_entity = get_entity_by_key(
-        entities=all_entities, key=embedding_vectorstore_key, value=entity_id
+    query_entity = _get_entity_by_key(
+        all_entities, embedding_vectorstore_key, entity_id, index
     )
     query_embedding = query_entity.graph_embedding if query_entity else None
 
     # oversample to account for excluded entities
-    if query_embedding:
+    if query_embedding is not None and len(query_embedding) > 0:
         matched_entities = []
         search_results = graph_embedding_vectorstore.similarity_search_by_vector(
-            query_embedding=query_embedding, k=k * oversample_scaler
+            query_embedding=list(query_embedding), k=k * oversample_scaler
         )
         for result in search_results:
-            matched = get_entity_by_key(
-                entities=all_entities,
-                key=embedding_vectorstore_key,
-                value=result.document.id,
+            matched = _get_entity_by_key(
+                all_entities, embedding_vectorstore_key, result.document.id, index
             )
             if matched:
                 matched_entities.append(matched)
@@ -136,24 +198,42 @@ def find_nearest_neighbors_by_entity_rank(
     all_relationships: list[Relationship],
     exclude_entity_names: list[str] | None = None,
     k: int | None = 10,
+    index: RetrievalIndex | None = None,
 ) -> list[Entity]:
     """Retrieve entities that have direct connections with the target entity, sorted by entity rank."""
     if exclude_entity_names is None:
         exclude_entity_names = []
-    entity_relationships = [
-        rel
-        for rel in all_relationships
-        if rel.source == entity_name or rel.target == entity_name
-    ]
+    entity_relationships = (
+        index.get_entity_relationships([entity_name])
+        if index is not None
+        else [
+            rel
+            for rel in all_relationships
+            if rel.source == entity_name or rel.target == entity_name
+        ]
+    )
     source_entity_names = {rel.source for rel in entity_relationships}
     target_entity_names = {rel.target for rel in entity_relationships}
     related_entity_names = (source_entity_names.union(target_entity_names)).difference(
         set(exclude_entity_names)
     )
-    top_relations = [
-        entity for entity in all_entities if entity.title in related_entity_names
-    ]
+    top_relations = (
+        index.get_entities_by_titles(related_entity_names)
+        if index is not None
+        else [entity for entity in all_entities if entity.title in related_entity_names]
+    )
     top_relations.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
     if k:
         return top_relations[:k]
     return top_relations
+
+
+def _get_entity_by_key(
+    entities: list[Entity],
+    key: str,
+    value: str | int,
+    index: RetrievalIndex | None,
+) -> Entity | None:
+    if index is not None:
+        return index.get_entity_by_key(key=key, value=value)
+    return get_entity_by_key(entities=entities, key=key, value=value)
@@ -22,6 +22,7 @@ from graphrag.query.input.retrieval.relationships import (
     get_out_network_relationships,
     to_relationship_dataframe,
 )
+from graphrag.query.input.retrieval.retrieval_index import RetrievalIndex
 from graphrag.query.llm.text_utils import num_tokens
 
 
@@ -314,9 +315,17 @@ def get_candidate_context(
     include_entity_rank: bool = True,
     entity_rank_description: str = "number of relationships",
     include_relationship_weight: bool = False,
+    index: RetrievalIndex | None = None,
 ) -> dict[str, pd.DataFrame]:
-    """Prepare entity, relationship, and covariate data tables as context data for system prompt."""
+    """Prepare entity, relationship, and covariate data tables as context data for system prompt.
+
+    Pass a RetrievalIndex over entities and relationships to avoid scanning them.
+    """
     candidate_context = {}
+    if index is not None:
+        relationships = index.get_entity_relationships(
+            entity.title for entity in selected_entities
+        )
     candidate_relationships = get_candidate_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
@@ -325,6 +334,11 @@ def get_candidate_context(
         relationships=candidate_relationships,
         include_relationship_weight=include_relationship_weight,
     )
+    if index is not None:
+        entities = index.get_entities_by_titles(
+            [rel.source for rel in candidate_relationships]
+            + [rel.target for rel in candidate_relationships]
+        )
     candidate_entities = get_entities_from_relationships(
         relationships=candidate_relationships, entities=entities
     )
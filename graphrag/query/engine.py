@@ -0,0 +1,227 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A query engine that keeps the outputs of an index loaded between queries."""
+
+import logging
+import threading
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import cast
+
+import pandas as pd
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.vector_stores.typing import VectorStoreType
+
+from .api import reformat_context_data
+from .factories import (
+    get_description_embedding_store,
+    get_global_search_engine,
+    get_local_search_engine,
+)
+from .indexer_adapters import (
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from .structured_search.base import SearchResult
+from .structured_search.global_search.search import GlobalSearch
+from .structured_search.local_search.search import LocalSearch
+
+log = logging.getLogger(__name__)
+
+NODES_FILE = "create_final_nodes.parquet"
+ENTITIES_FILE = "create_final_entities.parquet"
+COMMUNITY_REPORTS_FILE = "create_final_community_reports.parquet"
+TEXT_UNITS_FILE = "create_final_text_units.parquet"
+RELATIONSHIPS_FILE = "create_final_relationships.parquet"
+COVARIATES_FILE = "create_final_covariates.parquet"
+
+
+class QueryEngine:
+    """Answer many queries over the outputs of an index, loading them once.
+
+    The output tables are read, adapted to the knowledge model and stored in the
+    vector store when the engine is loaded. The search engines built from them are
+    shared by every query, so a query only pays for its own context and LLM calls.
+
+    reload() is the hook for a newly published index: it loads the outputs again
+    when they changed, and swaps them in without interrupting the running queries.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        data_dir: str,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+    ):
+        """Init method definition."""
+        self._config = config
+        self._data_dir = data_dir
+        self._community_level = community_level
+        self._response_type = response_type
+        self._index: _LoadedIndex | None = None
+        # reloads are triggered from the threads of the query server
+        self._lock = threading.Lock()
+
+    @property
+    def data_dir(self) -> str:
+        """Get the folder of the loaded outputs."""
+        return self._data_dir
+
+    @property
+    def global_search_engine(self) -> GlobalSearch:
+        """Get the global search engine of the loaded outputs."""
+        return self._loaded().global_search
+
+    @property
+    def local_search_engine(self) -> LocalSearch:
+        """Get the local search engine of the loaded outputs."""
+        return self._loaded().local_search
+
+    def load(self) -> None:
+        """Load the outputs of the index, replacing the outputs loaded before."""
+        with self._lock:
+            self._load()
+
+    def reload(self, data_dir: str | None = None) -> bool:
+        """Load the outputs again if they changed since they were loaded.
+
+        A data_dir switches the engine to the outputs of another run. Returns whether
+        the outputs were loaded.
+        """
+        with self._lock:
+            data_dir = data_dir or self._data_dir
+            if (
+                self._index is not None
+                and data_dir == self._data_dir
+                and _fingerprint(Path(data_dir)) == self._index.fingerprint
+            ):
+                return False
+            self._data_dir = data_dir
+            self._load()
+            return True
+
+    async def global_search(self, query: str) -> SearchResult:
+        """Perform a global search."""
+        return await self.global_search_engine.asearch(query=query)
+
+    async def global_search_streaming(self, query: str) -> AsyncGenerator:
+        """Perform a global search, yielding the context data and then the response."""
+        async for chunk in _stream(self.global_search_engine.astream_search(query)):
+            yield chunk
+
+    async def local_search(self, query: str) -> SearchResult:
+        """Perform a local search."""
+        return await self.local_search_engine.asearch(query=query)
+
+    async def local_search_streaming(self, query: str) -> AsyncGenerator:
+        """Perform a local search, yielding the context data and then the response."""
+        async for chunk in _stream(self.local_search_engine.astream_search(query)):
+            yield chunk
+
+    def _load(self) -> None:
+        """Load the outputs of the data folder, must hold the lock."""
+        log.info("loading the index outputs from %s", self._data_dir)
+        # queries keep the outputs they started with until they are done
+        self._index = _LoadedIndex(
+            self._config,
+            Path(self._data_dir),
+            self._community_level,
+            self._response_type,
+        )
+
+    def _loaded(self) -> "_LoadedIndex":
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._load()
+                index = self._index
+        return cast(_LoadedIndex, index)
+
+
+class _LoadedIndex:
+    """The search engines built from the outputs of one run of the index."""
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        data_path: Path,
+        community_level: int,
+        response_type: str,
+    ):
+        # fingerprint the outputs first, so outputs written while they are read
+        # are loaded by the next reload
+        self.fingerprint = _fingerprint(data_path)
+
+        nodes = pd.read_parquet(data_path / NODES_FILE)
+        entities = read_indexer_entities(
+            nodes, pd.read_parquet(data_path / ENTITIES_FILE), community_level
+        )
+        reports = read_indexer_reports(
+            pd.read_parquet(data_path / COMMUNITY_REPORTS_FILE),
+            nodes,
+            community_level,
+        )
+        covariates_path = data_path / COVARIATES_FILE
+        covariates = (
+            read_indexer_covariates(pd.read_parquet(covariates_path))
+            if covariates_path.exists()
+            else []
+        )
+
+        self.global_search = get_global_search_engine(
+            config,
+            reports=reports,
+            entities=entities,
+            response_type=response_type,
+            # the token counts of the reports are kept next to the index outputs
+            token_counts_path=str(data_path / "global_search_token_counts.json"),
+        )
+
+        vector_store_args = dict(config.embeddings.vector_store or {})
+        self.local_search = get_local_search_engine(
+            config=config,
+            reports=reports,
+            text_units=read_indexer_text_units(
+                pd.read_parquet(data_path / TEXT_UNITS_FILE)
+            ),
+            entities=entities,
+            relationships=read_indexer_relationships(
+                pd.read_parquet(data_path / RELATIONSHIPS_FILE)
+            ),
+            covariates={"claims": covariates},
+            description_embedding_store=get_description_embedding_store(
+                entities=entities,
+                vector_store_type=vector_store_args.get(
+                    "type", VectorStoreType.LanceDB
+                ),
+                config_args=vector_store_args,
+            ),
+            response_type=response_type,
+        )
+
+
+def _fingerprint(data_path: Path) -> tuple[tuple[str, int, int], ...]:
+    """Identify the state of the output tables by their names, times and sizes."""
+    files = sorted(data_path.glob("*.parquet")) if data_path.is_dir() else []
+    return tuple(
+        (file.name, stat.st_mtime_ns, stat.st_size)
+        for file, stat in ((file, file.stat()) for file in files)
+    )
+
+
+async def _stream(search_result: AsyncGenerator) -> AsyncGenerator:
+    # the context data of the search is streamed first, then the response tokens
+    get_context_data = True
+    async for stream_chunk in search_result:
+        if get_context_data:
+            yield reformat_context_data(stream_chunk)
+            get_context_data = False
+        else:
+            yield stream_chunk
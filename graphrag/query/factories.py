@@ -18,6 +18,7 @@ from graphrag.model import (
     TextUnit,
 )
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.input.loaders.dfs import store_entity_semantic_embeddings
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
 from graphrag.query.llm.oai.embedding import OpenAIEmbedding
 from graphrag.query.llm.oai.typing import OpenaiApiType
@@ -29,7 +30,12 @@ from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
 )
 from graphrag.query.structured_search.local_search.search import LocalSearch
-from graphrag.vector_stores import BaseVectorStore
+from graphrag.vector_stores import (
+    BaseVectorStore,
+    LanceDBVectorStore,
+    VectorStoreFactory,
+    VectorStoreType,
+)
 
 
 def get_llm(config: GraphRagConfig) -> ChatOpenAI:
@@ -159,6 +165,7 @@ def get_global_search_engine(
     reports: list[CommunityReport],
     entities: list[Entity],
     response_type: str,
+    token_counts_path: str | None = None,
 ):
     """Create a global search engine based on data + configuration."""
     token_encoder = tiktoken.get_encoding(config.encoding_model)
@@ -167,7 +174,10 @@ def get_global_search_engine(
     return GlobalSearch(
         llm=get_llm(config),
         context_builder=GlobalCommunityContext(
-            community_reports=reports, entities=entities, token_encoder=token_encoder
+            community_reports=reports,
+            entities=entities,
+            token_encoder=token_encoder,
+            token_counts_path=token_counts_path,
         ),
         token_encoder=token_encoder,
         max_data_tokens=gs_config.data_max_tokens,
@@ -199,4 +209,56 @@ def get_global_search_engine(
         },
         concurrent_coroutines=gs_config.concurrency,
         response_type=response_type,
+        early_stop=gs_config.early_stop,
+        early_stop_min_score=gs_config.early_stop_min_score,
+    )
+
+
+def get_description_embedding_store(
+    entities: list[Entity],
+    vector_store_type: str = VectorStoreType.LanceDB,
+    config_args: dict | None = None,
+) -> BaseVectorStore:
+    """Get a vector store holding the description embeddings of the entities."""
+    if not config_args:
+        config_args = {}
+
+    collection_name = config_args.get(
+        "query_collection_name", "entity_description_embeddings"
     )
+    config_args.update({"collection_name": collection_name})
+    description_embedding_store = VectorStoreFactory.get_vector_store(
+        vector_store_type=vector_store_type, kwargs=config_args
+    )
+
+    description_embedding_store.connect(**config_args)
+
+    if config_args.get("overwrite", True):
+        # this step assumes the embeddings were originally stored in a file rather
+        # than a vector database
+
+        # dump embeddings from the entities list to the description_embedding_store
+        store_entity_semantic_embeddings(
+            entities=entities, vectorstore=description_embedding_store
+        )
+    elif vector_store_type == VectorStoreType.Numpy:
+        # the collection was opened when the store connected
+        pass
+    else:
+        # load description embeddings to an in-memory lancedb vectorstore
+        # and connect to a remote db, specify url and port values.
+        description_embedding_store = LanceDBVectorStore(
+            collection_name=collection_name
+        )
+        description_embedding_store.connect(
+            db_uri=config_args.get("db_uri", "./lancedb")
+        )
+
+        # load data from an existing table
+        description_embedding_store.document_collection = (
+            description_embedding_store.db_connection.open_table(
+                description_embedding_store.collection_name
+            )
+        )
+
+    return description_embedding_store
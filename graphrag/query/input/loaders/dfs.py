@@ -17,6 +17,7 @@ from graphrag.model import (
 from graphrag.query.input.loaders.utils import (
     to_list,
     to_optional_dict,
+    to_optional_embedding,
     to_optional_float,
     to_optional_int,
     to_optional_list,
@@ -51,11 +52,9 @@ def read_entities(
             title=to_str(row, title_col),
             type=to_optional_str(row, type_col),
             description=to_optional_str(row, description_col),
-            name_embedding=to_optional_list(row, name_embedding_col, item_type=float),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            graph_embedding=to_optional_list(row, graph_embedding_col, item_type=float),
+            name_embedding=to_optional_embedding(row, name_embedding_col),
+            description_embedding=to_optional_embedding(row, description_embedding_col),
+            graph_embedding=to_optional_embedding(row, graph_embedding_col),
             community_ids=to_optional_list(row, community_col, item_type=str),
             text_unit_ids=to_optional_list(row, text_unit_ids_col),
             document_ids=to_optional_list(row, document_ids_col),
@@ -136,9 +135,7 @@ def read_relationships(
             source=to_str(row, source_col),
             target=to_str(row, target_col),
             description=to_optional_str(row, description_col),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
+            description_embedding=to_optional_embedding(row, description_embedding_col),
             weight=to_optional_float(row, weight_col),
             text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
             document_ids=to_optional_list(row, document_ids_col, item_type=str),
@@ -246,12 +243,8 @@ def read_community_reports(
             summary=to_str(row, summary_col),
             full_content=to_str(row, content_col),
             rank=to_optional_float(row, rank_col),
-            summary_embedding=to_optional_list(
-                row, summary_embedding_col, item_type=float
-            ),
-            full_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
+            summary_embedding=to_optional_embedding(row, summary_embedding_col),
+            full_content_embedding=to_optional_embedding(row, content_embedding_col),
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
                 if attributes_cols
@@ -287,7 +280,7 @@ def read_text_units(
             covariate_ids=to_optional_dict(
                 row, covariates_col, key_type=str, value_type=str
             ),
-            text_embedding=to_optional_list(row, embedding_col, item_type=float),  # type: ignore
+            text_embedding=to_optional_embedding(row, embedding_col),  # type: ignore
             n_tokens=to_optional_int(row, tokens_col),
             document_ids=to_optional_list(row, document_ids_col, item_type=str),
             attributes=(
@@ -323,12 +316,8 @@ def read_documents(
             type=to_str(row, type_col),
             summary=to_optional_str(row, summary_col),
             raw_content=to_str(row, raw_content_col),
-            summary_embedding=to_optional_list(
-                row, summary_embedding_col, item_type=float
-            ),
-            raw_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
+            summary_embedding=to_optional_embedding(row, summary_embedding_col),
+            raw_content_embedding=to_optional_embedding(row, content_embedding_col),
             text_units=to_list(row, text_units_col, item_type=str),  # type: ignore
             attributes=(
                 {col: row.get(col) for col in attributes_cols}
@@ -6,6 +6,8 @@
 import numpy as np
 import pandas as pd
 
+from graphrag.model.embedding import decode_embedding
+
 
 def to_str(data: pd.Series, column_name: str | None) -> str:
     """Convert and validate a value to a string."""
@@ -91,6 +93,31 @@ def to_optional_list(
     return None
 
 
+def to_optional_embedding(
+    data: pd.Series, column_name: str | None
+) -> np.ndarray | None:
+    """Convert and validate a value to an optional embedding array."""
+    if column_name is None:
+        return None
+
+    if column_name in data:
+        value = data[column_name]  # type: ignore
+        if value is None:
+            return None
+
+        if not isinstance(value, list | np.ndarray):
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise ValueError(msg)
+
+        embedding = decode_embedding(value)
+        if embedding.ndim != 1 or embedding.dtype.kind != "f":
+            msg = f"value is not an embedding: {value} ({embedding.dtype})"
+            raise TypeError(msg)
+        return embedding
+
+    return None
+
+
 def to_int(data: pd.Series, column_name: str | None) -> int:
     """Convert and validate a value to an int."""
     if column_name is None:
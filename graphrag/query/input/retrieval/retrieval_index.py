@@ -0,0 +1,103 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A prebuilt lookup index over the entities, relationships and text units used at query time."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from graphrag.model import Entity, Relationship, TextUnit
+from graphrag.query.input.retrieval.entities import get_entity_by_key, is_valid_uuid
+
+
+class RetrievalIndex:
+    """Hash map and adjacency list lookups, built once and reused across queries.
+
+    Every lookup returns the same items, in the same order, as the linear scans in
+    the retrieval modules.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[Entity],
+        relationships: Iterable[Relationship] | None = None,
+        text_units: Iterable[TextUnit] | None = None,
+    ):
+        self.entities = list(entities)
+        self.relationships = list(relationships or [])
+        self.text_units = list(text_units or [])
+
+        self._entity_keys: dict[str, dict[Any, int]] = {}
+        self._entities_by_title: dict[str, list[int]] = defaultdict(list)
+        for position, entity in enumerate(self.entities):
+            self._entities_by_title[entity.title].append(position)
+        for key in ["id", "short_id", "title"]:
+            self._build_entity_key(key)
+
+        # positions of the relationships each entity takes part in
+        self._entity_relationships: dict[str, list[int]] = defaultdict(list)
+        for position, relationship in enumerate(self.relationships):
+            self._entity_relationships[relationship.source].append(position)
+            if relationship.target != relationship.source:
+                self._entity_relationships[relationship.target].append(position)
+
+        self._text_units_by_id: dict[str, list[int]] = defaultdict(list)
+        for position, unit in enumerate(self.text_units):
+            self._text_units_by_id[unit.id].append(position)
+
+    def get_entity_by_key(self, key: str, value: str | int) -> Entity | None:
+        """Get the first entity whose key matches the value, like get_entity_by_key."""
+        positions = self._entity_keys.get(key)
+        if positions is None:
+            try:
+                positions = self._build_entity_key(key)
+            except TypeError:
+                # unhashable attribute values can only be scanned
+                return get_entity_by_key(self.entities, key, value)
+
+        candidates = [positions.get(value)]
+        if isinstance(value, str) and is_valid_uuid(value):
+            candidates.append(positions.get(value.replace("-", "")))
+        matches = [position for position in candidates if position is not None]
+        return self.entities[min(matches)] if matches else None
+
+    def get_entities_by_title(self, title: str) -> list[Entity]:
+        """Get all entities with the given title, like get_entity_by_name."""
+        return [self.entities[i] for i in self._entities_by_title.get(title, [])]
+
+    def get_entities_by_titles(self, titles: Iterable[str]) -> list[Entity]:
+        """Get all entities with any of the given titles, in entity order."""
+        positions = {
+            position
+            for title in set(titles)
+            for position in self._entities_by_title.get(title, [])
+        }
+        return [self.entities[i] for i in sorted(positions)]
+
+    def get_entity_relationships(
+        self, entity_names: Iterable[str]
+    ) -> list[Relationship]:
+        """Get the relationships with a source or target in entity_names, in relationship order."""
+        positions = {
+            position
+            for name in set(entity_names)
+            for position in self._entity_relationships.get(name, [])
+        }
+        return [self.relationships[i] for i in sorted(positions)]
+
+    def get_text_units(self, text_unit_ids: Iterable[str]) -> list[TextUnit]:
+        """Get the text units with any of the given ids, in text unit order."""
+        positions = {
+            position
+            for id in set(text_unit_ids)
+            for position in self._text_units_by_id.get(id, [])
+        }
+        return [self.text_units[i] for i in sorted(positions)]
+
+    def _build_entity_key(self, key: str) -> dict[Any, int]:
+        positions: dict[Any, int] = {}
+        for position, entity in enumerate(self.entities):
+            positions.setdefault(getattr(entity, key), position)
+        self._entity_keys[key] = positions
+        return positions
@@ -3,6 +3,7 @@
 
 """Chat-based OpenAI LLM implementation."""
 
+import json
 from collections.abc import AsyncGenerator, Callable, Generator
 from typing import Any
 
@@ -15,6 +16,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from graphrag.llm.base import SingleFlight, create_hash_key
 from graphrag.query.llm.base import BaseLLM, BaseLLMCallback
 from graphrag.query.llm.oai.base import OpenAILLMImpl
 from graphrag.query.llm.oai.typing import (
@@ -27,7 +29,11 @@ _MODEL_REQUIRED_MSG = "model is required"
 
 
 class ChatOpenAI(BaseLLM, OpenAILLMImpl):
-    """Wrapper for OpenAI ChatCompletion models."""
+    """Wrapper for OpenAI ChatCompletion models.
+
+    Identical asynchronous calls made while one is running share its response,
+    unless they stream the tokens to callbacks.
+    """
 
     def __init__(
         self,
@@ -59,6 +65,7 @@ class ChatOpenAI(BaseLLM, OpenAILLMImpl):
         )
         self.model = model
         self.retry_error_types = retry_error_types
+        self._in_flight: SingleFlight[str] = SingleFlight()
 
     def generate(
         self,
@@ -132,6 +139,30 @@ class ChatOpenAI(BaseLLM, OpenAILLMImpl):
         **kwargs: Any,
     ) -> str:
         """Generate text asynchronously."""
+        if callbacks:
+            return await self._agenerate_with_retry(
+                messages=messages, streaming=streaming, callbacks=callbacks, **kwargs
+            )
+        key = create_hash_key(
+            "chat",
+            json.dumps(messages),
+            {"model": self.model, "streaming": streaming, **kwargs},
+            None,
+        )
+        return await self._in_flight.run(
+            key,
+            lambda: self._agenerate_with_retry(
+                messages=messages, streaming=streaming, **kwargs
+            ),
+        )
+
+    async def _agenerate_with_retry(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
         try:
             retryer = AsyncRetrying(
                 stop=stop_after_attempt(self.max_retries),
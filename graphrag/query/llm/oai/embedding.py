@@ -4,6 +4,7 @@
 """OpenAI Embedding model implementation."""
 
 import asyncio
+import json
 from collections.abc import Callable
 from typing import Any
 
@@ -18,6 +19,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from graphrag.llm.base import SingleFlight, create_hash_key
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.base import OpenAILLMImpl
 from graphrag.query.llm.oai.typing import (
@@ -29,7 +31,10 @@ from graphrag.query.progress import StatusReporter
 
 
 class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
-    """Wrapper for OpenAI Embedding models."""
+    """Wrapper for OpenAI Embedding models.
+
+    Identical asynchronous calls made while one is running share its embedding.
+    """
 
     def __init__(
         self,
@@ -67,6 +72,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         self.max_tokens = max_tokens
         self.token_encoder = tiktoken.get_encoding(self.encoding_name)
         self.retry_error_types = retry_error_types
+        self._in_flight: SingleFlight[tuple[list[float], int]] = SingleFlight()
 
     def embed(self, text: str, **kwargs: Any) -> list[float]:
         """
@@ -109,7 +115,16 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         chunk_embeddings = []
         chunk_lens = []
         embedding_results = await asyncio.gather(*[
-            self._aembed_with_retry(chunk, **kwargs) for chunk in token_chunks
+            self._in_flight.run(
+                create_hash_key(
+                    "embedding",
+                    json.dumps(chunk),
+                    {"model": self.model, **kwargs},
+                    None,
+                ),
+                lambda chunk=chunk: self._aembed_with_retry(chunk, **kwargs),
+            )
+            for chunk in token_chunks
         ])
         embedding_results = [result for result in embedding_results if result[0]]
         chunk_embeddings = [result[0] for result in embedding_results]
@@ -8,12 +8,12 @@ from itertools import islice
 
 import tiktoken
 
+from graphrag.llm.tokenizer import get_tokenizer
+
 
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
     """Return the number of tokens in the given text."""
-    if token_encoder is None:
-        token_encoder = tiktoken.get_encoding("cl100k_base")
-    return len(token_encoder.encode(text))  # type: ignore
+    return get_tokenizer(token_encoder).num_tokens(text)
 
 
 def batched(iterable: Iterator, n: int):
@@ -35,8 +35,7 @@ def chunk_text(
     text: str, max_tokens: int, token_encoder: tiktoken.Encoding | None = None
 ):
     """Chunk text by token length."""
-    if token_encoder is None:
-        token_encoder = tiktoken.get_encoding("cl100k_base")
-    tokens = token_encoder.encode(text)  # type: ignore
+    tokenizer = get_tokenizer(token_encoder)
+    tokens = tokenizer.encode(text)
     chunk_iterator = batched(iter(tokens), max_tokens)
-    yield from (token_encoder.decode(list(chunk)) for chunk in chunk_iterator)
+    yield from (tokenizer.decode(chunk) for chunk in chunk_iterator)
@@ -71,7 +71,7 @@ class LocalQuestionGen(BaseQuestionGen):
 
         if context_data is None:
             # generate context data based on the question history
-            context_data, context_records = self.context_builder.build_context(
+            context_data, context_records = await self.context_builder.abuild_context(
                 query=question_text,
                 conversation_history=conversation_history,
                 **kwargs,
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A HTTP server answering queries with a query engine that stays loaded."""
+
+import asyncio
+import contextlib
+import json
+import logging
+import threading
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+from .api import reformat_context_data
+from .engine import QueryEngine
+
+log = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+
+class QueryServer(ThreadingHTTPServer):
+    """Answer queries over HTTP with a loaded query engine.
+
+    Routes:
+     - POST /search: {"method": "global" | "local", "query": "..."}, returns the
+       response and its context data.
+     - POST /reload: load the outputs again if a new index was published.
+     - GET /health: the folder of the loaded outputs.
+
+    Requests are handled on their own threads, the searches run on one event loop
+    so they share the LLM clients of the engine.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        engine: QueryEngine,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        reload: Callable[[], bool] | None = None,
+    ):
+        """Init method definition."""
+        super().__init__((host, port), _QueryRequestHandler)
+        self.engine = engine
+        self.reload = reload or engine.reload
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+    def search(self, method: str, query: str) -> dict[str, Any]:
+        """Run a search on the event loop of the server and wait for its result."""
+        match method:
+            case "global":
+                search = self.engine.global_search(query)
+            case "local":
+                search = self.engine.local_search(query)
+            case _:
+                msg = f"Invalid method: {method}"
+                raise ValueError(msg)
+        result = asyncio.run_coroutine_threadsafe(search, self._loop).result()
+        return {
+            "response": result.response,
+            "context_data": reformat_context_data(result.context_data)
+            if isinstance(result.context_data, dict)
+            else result.context_data,
+        }
+
+    def server_close(self) -> None:
+        """Stop the server and its event loop."""
+        super().server_close()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+
+class _QueryRequestHandler(BaseHTTPRequestHandler):
+    @property
+    def query_server(self) -> QueryServer:
+        return cast(QueryServer, self.server)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/health":
+            self._send(HTTPStatus.OK, {"data_dir": self.query_server.engine.data_dir})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        match self.path:
+            case "/search":
+                try:
+                    request = self._read_json()
+                    method = request.get("method", "global")
+                    query = request["query"]
+                except (KeyError, ValueError, AttributeError):
+                    self._send(
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "Expected a JSON object with a query"},
+                    )
+                    return
+                self._run(lambda: self.query_server.search(str(method), str(query)))
+            case "/reload":
+                self._run(
+                    lambda: {
+                        "reloaded": self.query_server.reload(),
+                        "data_dir": self.query_server.engine.data_dir,
+                    }
+                )
+            case _:
+                self._send(
+                    HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"}
+                )
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        log.info(format, *args)
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return cast(dict[str, Any], json.loads(self.rfile.read(length) or b"{}"))
+
+    def _run(self, handle: Callable[[], dict[str, Any]]) -> None:
+        try:
+            body = handle()
+        except ValueError as e:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except Exception as e:
+            log.exception("error handling %s", self.path)
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+        else:
+            self._send(HTTPStatus.OK, body)
+
+    def _send(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        # the context records hold numpy values, which json can't serialize
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def serve(
+    engine: QueryEngine,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    reload: Callable[[], bool] | None = None,
+) -> None:
+    """Answer queries over HTTP until interrupted."""
+    with QueryServer(engine, host, port, reload) as server:
+        log.info("serving queries on http://%s:%d", host, port)
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
@@ -3,6 +3,10 @@
 
 """Contains algorithms to build context data for global search prompt."""
 
+import json
+import logging
+import os
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
@@ -17,9 +21,17 @@ from graphrag.query.context_builder.conversation_history import (
 )
 from graphrag.query.structured_search.base import GlobalContextBuilder
 
+log = logging.getLogger(__name__)
+
 
 class GlobalCommunityContext(GlobalContextBuilder):
-    """GlobalSearch community context builder."""
+    """GlobalSearch community context builder.
+
+    The report batches only depend on the reports and the context parameters, so
+    they are built once for each set of parameters and reused by later queries. The
+    token counts of the rendered reports are cached too, and saved to
+    token_counts_path when given, so a new process doesn't tokenize them again.
+    """
 
     def __init__(
         self,
@@ -27,11 +39,18 @@ class GlobalCommunityContext(GlobalContextBuilder):
         entities: list[Entity] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         random_state: int = 86,
+        token_counts_path: str | Path | None = None,
     ):
         self.community_reports = community_reports
         self.entities = entities
         self.token_encoder = token_encoder
         self.random_state = random_state
+        self.token_counts_path = Path(token_counts_path) if token_counts_path else None
+        self._encoding_name = token_encoder.name if token_encoder else "cl100k_base"
+        self._token_counts = self._load_token_counts()
+        self._community_contexts: dict[
+            tuple, tuple[str | list[str], dict[str, pd.DataFrame]]
+        ] = {}
 
     def build_context(
         self,
@@ -49,6 +68,7 @@ class GlobalCommunityContext(GlobalContextBuilder):
         context_name: str = "Reports",
         conversation_history_user_turns_only: bool = True,
         conversation_history_max_turns: int | None = 5,
+        rank_order: bool = False,
         **kwargs: Any,
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """Prepare batches of community report data table as context data for global search."""
@@ -69,24 +89,51 @@ class GlobalCommunityContext(GlobalContextBuilder):
             if conversation_history_context != "":
                 final_context_data = conversation_history_context_data
 
-        community_context, community_context_data = build_community_context(
-            community_reports=self.community_reports,
-            entities=self.entities,
-            token_encoder=self.token_encoder,
-            use_community_summary=use_community_summary,
-            column_delimiter=column_delimiter,
-            shuffle_data=shuffle_data,
-            include_community_rank=include_community_rank,
-            min_community_rank=min_community_rank,
-            community_rank_name=community_rank_name,
-            include_community_weight=include_community_weight,
-            community_weight_name=community_weight_name,
-            normalize_community_weight=normalize_community_weight,
-            max_tokens=max_tokens,
-            single_batch=False,
-            context_name=context_name,
-            random_state=self.random_state,
+        key = (
+            use_community_summary,
+            column_delimiter,
+            shuffle_data,
+            include_community_rank,
+            min_community_rank,
+            community_rank_name,
+            include_community_weight,
+            community_weight_name,
+            normalize_community_weight,
+            max_tokens,
+            context_name,
+            rank_order,
+            self.random_state,
         )
+        if key not in self._community_contexts:
+            num_token_counts = len(self._token_counts)
+            self._community_contexts[key] = build_community_context(
+                community_reports=self.community_reports,
+                entities=self.entities,
+                token_encoder=self.token_encoder,
+                use_community_summary=use_community_summary,
+                column_delimiter=column_delimiter,
+                shuffle_data=shuffle_data,
+                include_community_rank=include_community_rank,
+                min_community_rank=min_community_rank,
+                community_rank_name=community_rank_name,
+                include_community_weight=include_community_weight,
+                community_weight_name=community_weight_name,
+                normalize_community_weight=normalize_community_weight,
+                max_tokens=max_tokens,
+                single_batch=False,
+                context_name=context_name,
+                random_state=self.random_state,
+                token_counts=self._token_counts,
+                rank_order=rank_order,
+            )
+            if len(self._token_counts) > num_token_counts:
+                self._save_token_counts()
+
+        community_context, cached_context_data = self._community_contexts[key]
+        # the callers own the returned data frames
+        community_context_data = {
+            name: data.copy() for name, data in cached_context_data.items()
+        }
         if isinstance(community_context, list):
             final_context = [
                 f"{conversation_history_context}\n\n{context}"
@@ -97,3 +144,29 @@ class GlobalCommunityContext(GlobalContextBuilder):
 
         final_context_data.update(community_context_data)
         return (final_context, final_context_data)
+
+    def _load_token_counts(self) -> dict[str, int]:
+        if self.token_counts_path is None or not self.token_counts_path.exists():
+            return {}
+        try:
+            data = json.loads(self.token_counts_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            log.warning("could not read token counts from %s", self.token_counts_path)
+            return {}
+        if data.get("encoding") != self._encoding_name:
+            return {}
+        return data.get("token_counts", {})
+
+    def _save_token_counts(self) -> None:
+        if self.token_counts_path is None:
+            return
+        data = {"encoding": self._encoding_name, "token_counts": self._token_counts}
+        temp_path = self.token_counts_path.with_name(
+            f"{self.token_counts_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            temp_path.write_text(json.dumps(data), encoding="utf-8")
+            # replace the file in one step, other processes may be reading it
+            temp_path.replace(self.token_counts_path)
+        except OSError:
+            log.warning("could not save token counts to %s", self.token_counts_path)
@@ -76,6 +76,8 @@ class GlobalSearch(BaseSearch):
         reduce_llm_params: dict[str, Any] = DEFAULT_REDUCE_LLM_PARAMS,
         context_builder_params: dict[str, Any] | None = None,
         concurrent_coroutines: int = 32,
+        early_stop: bool = False,
+        early_stop_min_score: int = 50,
     ):
         super().__init__(
             llm=llm,
@@ -101,6 +103,16 @@ class GlobalSearch(BaseSearch):
 
         self.semaphore = asyncio.Semaphore(concurrent_coroutines)
 
+        # map the highest ranked batches first and reduce as soon as the key points
+        # scoring at least early_stop_min_score fill the reduce context
+        self.early_stop = early_stop
+        self.early_stop_min_score = early_stop_min_score
+        if early_stop:
+            self.context_builder_params = {
+                **self.context_builder_params,
+                "rank_order": True,
+            }
+
     async def astream_search(
         self,
         query: str,
@@ -113,12 +125,7 @@ class GlobalSearch(BaseSearch):
         if self.callbacks:
             for callback in self.callbacks:
                 callback.on_map_response_start(context_chunks)  # type: ignore
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data, query=query, **self.map_llm_params
-            )
-            for data in context_chunks
-        ])
+        map_responses = await self._map_responses(context_chunks, query)
         if self.callbacks:
             for callback in self.callbacks:
                 callback.on_map_response_end(map_responses)  # type: ignore
@@ -155,12 +162,7 @@ class GlobalSearch(BaseSearch):
         if self.callbacks:
             for callback in self.callbacks:
                 callback.on_map_response_start(context_chunks)  # type: ignore
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data, query=query, **self.map_llm_params
-            )
-            for data in context_chunks
-        ])
+        map_responses = await self._map_responses(context_chunks, query)
         if self.callbacks:
             for callback in self.callbacks:
                 callback.on_map_response_end(map_responses)
@@ -195,6 +197,61 @@ class GlobalSearch(BaseSearch):
         """Perform a global search synchronously."""
         return asyncio.run(self.asearch(query, conversation_history))
 
+    async def _map_responses(
+        self, context_chunks: str | list[str], query: str
+    ) -> list[SearchResult]:
+        """Generate the answers for the batches of community reports.
+
+        With early_stop, the batches are mapped in order and the answers are
+        collected as they complete. Once the key points scoring at least
+        early_stop_min_score fill max_data_tokens, the remaining batches are
+        cancelled and the answers of the completed batches are returned.
+        """
+        if isinstance(context_chunks, str):
+            context_chunks = [context_chunks]
+        if not self.early_stop:
+            return await asyncio.gather(*[
+                self._map_response_single_batch(
+                    context_data=data, query=query, **self.map_llm_params
+                )
+                for data in context_chunks
+            ])
+
+        async def _map_batch(index: int, data: str) -> tuple[int, SearchResult]:
+            return index, await self._map_response_single_batch(
+                context_data=data, query=query, **self.map_llm_params
+            )
+
+        # the semaphore lets the tasks call the llm in the order they were created
+        tasks = [
+            asyncio.create_task(_map_batch(index, data))
+            for index, data in enumerate(context_chunks)
+        ]
+        map_responses: dict[int, SearchResult] = {}
+        total_tokens = 0
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                index, response = await next_response
+                map_responses[index] = response
+                for point in _get_key_points([response]):
+                    if point["score"] >= self.early_stop_min_score:
+                        total_tokens += num_tokens(
+                            _format_key_point(point, index), self.token_encoder
+                        )
+                if total_tokens >= self.max_data_tokens:
+                    log.info(
+                        "Reducing after %d of %d map responses",
+                        len(map_responses),
+                        len(tasks),
+                    )
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [map_responses[index] for index in sorted(map_responses)]
+
     async def _map_response_single_batch(
         self,
         context_data: str,
@@ -291,20 +348,7 @@ class GlobalSearch(BaseSearch):
         start_time = time.time()
         try:
             # collect all key points into a single list to prepare for sorting
-            key_points = []
-            for index, response in enumerate(map_responses):
-                if not isinstance(response.response, list):
-                    continue
-                for element in response.response:
-                    if not isinstance(element, dict):
-                        continue
-                    if "answer" not in element or "score" not in element:
-                        continue
-                    key_points.append({
-                        "analyst": index,
-                        "answer": element["answer"],
-                        "score": element["score"],
-                    })
+            key_points = _get_key_points(map_responses)
 
             # filter response with score = 0 and rank responses by descending order of score
             filtered_key_points = [
@@ -336,15 +380,7 @@ class GlobalSearch(BaseSearch):
             data = []
             total_tokens = 0
             for point in filtered_key_points:
-                formatted_response_data = []
-                formatted_response_data.append(
-                    f'----Analyst {point["analyst"] + 1}----'
-                )
-                formatted_response_data.append(
-                    f'Importance Score: {point["score"]}'  # type: ignore
-                )
-                formatted_response_data.append(point["answer"])  # type: ignore
-                formatted_response_text = "\n".join(formatted_response_data)
+                formatted_response_text = _format_key_point(point, point["analyst"])
                 if (
                     total_tokens
                     + num_tokens(formatted_response_text, self.token_encoder)
@@ -397,20 +433,7 @@ class GlobalSearch(BaseSearch):
         **llm_kwargs,
     ) -> AsyncGenerator[str, None]:
         # collect all key points into a single list to prepare for sorting
-        key_points = []
-        for index, response in enumerate(map_responses):
-            if not isinstance(response.response, list):
-                continue
-            for element in response.response:
-                if not isinstance(element, dict):
-                    continue
-                if "answer" not in element or "score" not in element:
-                    continue
-                key_points.append({
-                    "analyst": index,
-                    "answer": element["answer"],
-                    "score": element["score"],
-                })
+        key_points = _get_key_points(map_responses)
 
         # filter response with score = 0 and rank responses by descending order of score
         filtered_key_points = [
@@ -436,12 +459,7 @@ class GlobalSearch(BaseSearch):
         data = []
         total_tokens = 0
         for point in filtered_key_points:
-            formatted_response_data = [
-                f'----Analyst {point["analyst"] + 1}----',
-                f'Importance Score: {point["score"]}',
-                point["answer"],
-            ]
-            formatted_response_text = "\n".join(formatted_response_data)
+            formatted_response_text = _format_key_point(point, point["analyst"])
             if (
                 total_tokens + num_tokens(formatted_response_text, self.token_encoder)
                 > self.max_data_tokens
@@ -467,3 +485,31 @@ class GlobalSearch(BaseSearch):
             **llm_kwargs,  # type: ignore
         ):
             yield resp
+
+
+def _get_key_points(map_responses: list[SearchResult]) -> list[dict[str, Any]]:
+    """Collect the key points of the map responses, tagged with their analyst."""
+    key_points = []
+    for index, response in enumerate(map_responses):
+        if not isinstance(response.response, list):
+            continue
+        for element in response.response:
+            if not isinstance(element, dict):
+                continue
+            if "answer" not in element or "score" not in element:
+                continue
+            key_points.append({
+                "analyst": index,
+                "answer": element["answer"],
+                "score": element["score"],
+            })
+    return key_points
+
+
+def _format_key_point(point: dict[str, Any], analyst: int) -> str:
+    """Format a key point for the reduce context."""
+    return "\n".join([
+        f"----Analyst {analyst + 1}----",
+        f'Importance Score: {point["score"]}',
+        point["answer"],
+    ])
@@ -23,6 +23,7 @@ from graphrag.query.context_builder.conversation_history import (
 )
 from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
+    amap_query_to_entities,
     map_query_to_entities,
 )
 from graphrag.query.context_builder.local_context import (
@@ -38,6 +39,7 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.retrieval_index import RetrievalIndex
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.text_utils import num_tokens
@@ -83,6 +85,12 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        # built once, so queries don't scan the entity, relationship and text unit lists
+        self.index = RetrievalIndex(
+            entities=self.entities.values(),
+            relationships=self.relationships.values(),
+            text_units=self.text_units.values(),
+        )
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
         """Filter entity text embeddings by entity keys."""
@@ -111,12 +119,14 @@ class LocalSearchMixedContext(LocalContextBuilder):
         min_community_rank: int = 0,
         community_context_name: str = "Reports",
         column_delimiter: str = "|",
+        selected_entities: list[Entity] | None = None,
         **kwargs: dict[str, Any],
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """
         Build data context for local search prompt.
 
         Build a context by combining community reports and entity/relationship/covariate tables, and text units using a predefined ratio set by summary_prop.
+        The entities are mapped from the query unless selected_entities are given.
         """
         if include_entity_names is None:
             include_entity_names = []
@@ -129,24 +139,21 @@ class LocalSearchMixedContext(LocalContextBuilder):
             raise ValueError(value_error)
 
         # map user query to entities
-        # if there is conversation history, attached the previous user questions to the current query
-        if conversation_history:
-            pre_user_questions = "\n".join(
-                conversation_history.get_user_turns(conversation_history_max_turns)
+        if selected_entities is None:
+            selected_entities = map_query_to_entities(
+                query=self._get_entity_query(
+                    query, conversation_history, conversation_history_max_turns
+                ),
+                text_embedding_vectorstore=self.entity_text_embeddings,
+                text_embedder=self.text_embedder,
+                all_entities=list(self.entities.values()),
+                embedding_vectorstore_key=self.embedding_vectorstore_key,
+                include_entity_names=include_entity_names,
+                exclude_entity_names=exclude_entity_names,
+                k=top_k_mapped_entities,
+                oversample_scaler=2,
+                index=self.index,
             )
-            query = f"{query}\n{pre_user_questions}"
-
-        selected_entities = map_query_to_entities(
-            query=query,
-            text_embedding_vectorstore=self.entity_text_embeddings,
-            text_embedder=self.text_embedder,
-            all_entities=list(self.entities.values()),
-            embedding_vectorstore_key=self.embedding_vectorstore_key,
-            include_entity_names=include_entity_names,
-            exclude_entity_names=exclude_entity_names,
-            k=top_k_mapped_entities,
-            oversample_scaler=2,
-        )
 
         # build context
         final_context = list[str]()
@@ -218,6 +225,56 @@ class LocalSearchMixedContext(LocalContextBuilder):
 
         return ("\n\n".join(final_context), final_context_data)
 
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        include_entity_names: list[str] | None = None,
+        exclude_entity_names: list[str] | None = None,
+        conversation_history_max_turns: int | None = 5,
+        top_k_mapped_entities: int = 10,
+        **kwargs: Any,
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """Build data context for local search prompt, embedding the query and searching the entity embeddings asynchronously."""
+        selected_entities = await amap_query_to_entities(
+            query=self._get_entity_query(
+                query, conversation_history, conversation_history_max_turns
+            ),
+            text_embedding_vectorstore=self.entity_text_embeddings,
+            text_embedder=self.text_embedder,
+            all_entities=list(self.entities.values()),
+            embedding_vectorstore_key=self.embedding_vectorstore_key,
+            include_entity_names=include_entity_names,
+            exclude_entity_names=exclude_entity_names,
+            k=top_k_mapped_entities,
+            oversample_scaler=2,
+            index=self.index,
+        )
+        return self.build_context(
+            query=query,
+            conversation_history=conversation_history,
+            include_entity_names=include_entity_names,
+            exclude_entity_names=exclude_entity_names,
+            conversation_history_max_turns=conversation_history_max_turns,
+            top_k_mapped_entities=top_k_mapped_entities,
+            selected_entities=selected_entities,
+            **kwargs,
+        )
+
+    def _get_entity_query(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None,
+        conversation_history_max_turns: int | None,
+    ) -> str:
+        # if there is conversation history, attached the previous user questions to the current query
+        if conversation_history:
+            pre_user_questions = "\n".join(
+                conversation_history.get_user_turns(conversation_history_max_turns)
+            )
+            query = f"{query}\n{pre_user_questions}"
+        return query
+
     def _build_community_context(
         self,
         selected_entities: list[Entity],
@@ -313,18 +370,21 @@ class LocalSearchMixedContext(LocalContextBuilder):
             return ("", {context_name.lower(): pd.DataFrame()})
 
         selected_text_units = list[TextUnit]()
+        selected_text_ids = set[str]()
         # for each matching text unit, rank first by the order of the entities that match it, then by the number of matching relationships
         # that the text unit has with the matching entities
         for index, entity in enumerate(selected_entities):
             if entity.text_unit_ids:
+                entity_relationships = {
+                    rel.id: rel
+                    for rel in self.index.get_entity_relationships([entity.title])
+                }
                 for text_id in entity.text_unit_ids:
-                    if (
-                        text_id not in [unit.id for unit in selected_text_units]
-                        and text_id in self.text_units
-                    ):
+                    if text_id not in selected_text_ids and text_id in self.text_units:
+                        selected_text_ids.add(text_id)
                         selected_unit = self.text_units[text_id]
                         num_relationships = count_relationships(
-                            selected_unit, entity, self.relationships
+                            selected_unit, entity, entity_relationships
                         )
                         if selected_unit.attributes is None:
                             selected_unit.attributes = {}
@@ -358,7 +418,11 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if return_candidate_context:
             candidate_context_data = get_candidate_text_units(
                 selected_entities=selected_entities,
-                text_units=list(self.text_units.values()),
+                text_units=self.index.get_text_units(
+                    text_id
+                    for entity in selected_entities
+                    for text_id in entity.text_unit_ids or []
+                ),
             )
             context_key = context_name.lower()
             if context_key not in context_data:
@@ -421,7 +485,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=self.index.get_entity_relationships(
+                    entity.title for entity in added_entities
+                ),
                 token_encoder=self.token_encoder,
                 max_tokens=max_tokens,
                 column_delimiter=column_delimiter,
@@ -472,6 +538,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
+                index=self.index,
             )
             for key in candidate_context_data:
                 candidate_df = candidate_context_data[key]
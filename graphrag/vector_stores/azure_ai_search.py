@@ -6,6 +6,7 @@
 import json
 from typing import Any
 
+import numpy as np
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import DefaultAzureCredential
 from azure.search.documents import SearchClient
@@ -128,7 +129,7 @@ class AzureAISearch(BaseVectorStore):
         batch = [
             {
                 "id": doc.id,
-                "vector": doc.vector,
+                "vector": np.asarray(doc.vector, dtype=float).tolist(),
                 "text": doc.text,
                 "attributes": json.dumps(doc.attributes),
             }
@@ -3,11 +3,14 @@
 
 """Base classes for vector stores."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
-from graphrag.model.types import TextEmbedder
+import numpy as np
+
+from graphrag.model.types import AsyncTextEmbedder, TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
 
@@ -20,7 +23,7 @@ class VectorStoreDocument:
     """unique id for the document"""
 
     text: str | None
-    vector: list[float] | None
+    vector: list[float] | np.ndarray | None
 
     attributes: dict[str, Any] = field(default_factory=dict)
     """store any additional metadata, e.g. title, date ranges, etc"""
@@ -76,6 +79,26 @@ class BaseVectorStore(ABC):
     ) -> list[VectorStoreSearchResult]:
         """Perform ANN search by text."""
 
+    async def asimilarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform ANN search by vector without blocking the event loop.
+
+        The search runs on a worker thread, stores with an async client can override this.
+        """
+        return await asyncio.to_thread(
+            self.similarity_search_by_vector, query_embedding, k, **kwargs
+        )
+
+    async def asimilarity_search_by_text(
+        self, text: str, text_embedder: AsyncTextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform ANN search by text, embedding it with an async text embedder."""
+        query_embedding = await text_embedder(text)
+        if query_embedding:
+            return await self.asimilarity_search_by_vector(query_embedding, k, **kwargs)
+        return []
+
     @abstractmethod
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
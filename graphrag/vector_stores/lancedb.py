@@ -9,6 +9,7 @@ from graphrag.model.types import TextEmbedder
 import json
 from typing import Any
 
+import numpy as np
 import pyarrow as pa
 
 from .base import (
@@ -34,7 +35,7 @@ class LanceDBVectorStore(BaseVectorStore):
             {
                 "id": document.id,
                 "text": document.text,
-                "vector": document.vector,
+                "vector": np.asarray(document.vector, dtype=np.float32),
                 "attributes": json.dumps(document.attributes),
             }
             for document in documents
@@ -47,7 +48,7 @@ class LanceDBVectorStore(BaseVectorStore):
         schema = pa.schema([
             pa.field("id", pa.string()),
             pa.field("text", pa.string()),
-            pa.field("vector", pa.list_(pa.float64())),
+            pa.field("vector", pa.list_(pa.float32())),
             pa.field("attributes", pa.string()),
         ])
         if overwrite:
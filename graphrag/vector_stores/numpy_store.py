@@ -0,0 +1,434 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The memory-mapped NumPy vector storage implementation package."""
+
+import io
+import json
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from graphrag.model.types import TextEmbedder
+
+from .base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+log = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.npy"
+DOCUMENTS_DIR = "documents"
+IVF_INDEX_FILE = "ivf_index.npz"
+
+# the number of rows scored by one matrix product, bounds the size of the score matrix
+SEARCH_BLOCK_SIZE = 65536
+# the number of rows sampled per list to train the IVF centroids
+IVF_TRAINING_ROWS_PER_LIST = 64
+IVF_TRAINING_ITERATIONS = 10
+
+
+class NumpyVectorStore(BaseVectorStore):
+    """A local vector storage that keeps the vectors in a memory-mapped .npy file.
+
+    The vectors of a collection are normalized and stored as one float32 matrix, or a
+    float16 matrix when they are loaded as float16 arrays, and the ids, texts and
+    attributes of the documents in parquet files beside it. Opening a collection maps
+    the matrix instead of reading it, and searches compute exact cosine similarities
+    with matrix products.
+
+    For large collections set ivf_lists to cluster the vectors into that many lists.
+    A search then only scores the rows of the ivf_probes lists closest to the query.
+    The index is built by the first search and saved with the collection.
+    """
+
+    def connect(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage."""
+        db_uri = kwargs.get("db_uri", "./vector_store")
+        self.db_connection = Path(db_uri)
+        self._path = self.db_connection / self.collection_name
+        self._ivf_lists = int(kwargs.get("ivf_lists") or 0)
+        self._ivf_probes = max(int(kwargs.get("ivf_probes") or 8), 1)
+        self._lock = threading.Lock()
+        self._open()
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        """Load documents into vector storage."""
+        documents = [document for document in documents if document.vector is not None]
+        if overwrite and self._path.exists():
+            self._close()
+            shutil.rmtree(self._path)
+
+        if documents:
+            vectors = _normalize(
+                np.asarray([document.vector for document in documents], np.float32)
+            )
+            vectors = vectors.astype(self._get_dtype(documents), copy=False)
+            self._close()
+            documents_dir = self._path / DOCUMENTS_DIR
+            documents_dir.mkdir(parents=True, exist_ok=True)
+            _append_vectors(self._path / VECTORS_FILE, vectors)
+            num_parts = len(list(documents_dir.glob("*.parquet")))
+            pq.write_table(
+                pa.table({
+                    "id": [str(document.id) for document in documents],
+                    "text": [document.text for document in documents],
+                    "attributes": [
+                        json.dumps(document.attributes) for document in documents
+                    ],
+                }),
+                documents_dir / f"part-{num_parts:06d}.parquet",
+            )
+        self._open()
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        """Build a query filter to filter documents by id.
+
+        The filter is a mask over the rows of the collection.
+        """
+        if len(include_ids) == 0:
+            self.query_filter = None
+        else:
+            rows = self._get_rows()
+            include = [rows[str(id)] for id in include_ids if str(id) in rows]
+            self.query_filter = np.zeros(self._num_rows, dtype=bool)
+            self.query_filter[include] = True
+        return self.query_filter
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search."""
+        return self.similarity_search_by_vectors([query_embedding], k)[0]
+
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for a batch of queries.
+
+        Scores are the cosine similarities between the queries and the documents.
+        """
+        if len(query_embeddings) == 0:
+            return []
+        if self._num_rows == 0 or k <= 0:
+            return [[] for _ in query_embeddings]
+
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32))
+        mask = self.query_filter
+        index = self._get_ivf_index()
+        if index is None:
+            rows = None if mask is None else np.flatnonzero(mask)
+            hits = self._search(queries, rows, k)
+        else:
+            hits = [
+                self._search(query[np.newaxis], index.probe(query, mask), k)[0]
+                for query in queries
+            ]
+        return [self._to_results(query_hits) for query_hits in hits]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a similarity search using a given input text."""
+        query_embedding = text_embedder(text)
+        if query_embedding:
+            return self.similarity_search_by_vector(query_embedding, k)
+        return []
+
+    def _open(self) -> None:
+        self._close()
+        vectors_path = self._path / VECTORS_FILE
+        documents_dir = self._path / DOCUMENTS_DIR
+        if not vectors_path.exists():
+            return
+
+        vectors = np.load(vectors_path, mmap_mode="r")
+        parts = sorted(documents_dir.glob("*.parquet"))
+        documents = pa.concat_tables(pq.read_table(part) for part in parts)
+        self._vectors = vectors
+        self.document_collection = documents
+        self._num_rows = min(len(vectors), documents.num_rows)
+        if self._num_rows != len(vectors):
+            # a run stopped between writing the vectors and their documents
+            log.warning(
+                "collection %s has %s vectors for %s documents",
+                self.collection_name,
+                len(vectors),
+                documents.num_rows,
+            )
+
+    def _get_dtype(self, documents: list[VectorStoreDocument]) -> np.dtype:
+        """Get the dtype to store vectors as, float16 vectors are kept compact."""
+        if self._vectors is not None:
+            return self._vectors.dtype
+        if all(
+            isinstance(document.vector, np.ndarray)
+            and document.vector.dtype == np.float16
+            for document in documents
+        ):
+            return np.dtype(np.float16)
+        return np.dtype(np.float32)
+
+    def _close(self) -> None:
+        self._vectors: np.ndarray | None = None
+        self.document_collection = None
+        self.query_filter = None
+        self._num_rows = 0
+        self._rows: dict[str, int] | None = None
+        self._ivf_index: _IVFIndex | None = None
+
+    def _get_rows(self) -> dict[str, int]:
+        """Get the row of every document id, the lookup is built on first use."""
+        with self._lock:
+            if self._rows is None:
+                ids = (
+                    self.document_collection.column("id").to_pylist()
+                    if self.document_collection is not None
+                    else []
+                )
+                self._rows = {id: row for row, id in enumerate(ids[: self._num_rows])}
+            return self._rows
+
+    def _get_ivf_index(self) -> "_IVFIndex | None":
+        if self._ivf_lists <= 0 or self._num_rows <= self._ivf_lists:
+            return None
+        with self._lock:
+            if self._ivf_index is None:
+                self._ivf_index = self._load_ivf_index()
+            return self._ivf_index
+
+    def _load_ivf_index(self) -> "_IVFIndex":
+        path = self._path / IVF_INDEX_FILE
+        if path.exists():
+            index = _IVFIndex.load(path, self._ivf_probes)
+            if index.num_rows == self._num_rows and index.num_lists == self._ivf_lists:
+                return index
+
+        log.info(
+            "building an IVF index with %s lists for collection %s",
+            self._ivf_lists,
+            self.collection_name,
+        )
+        index = _IVFIndex.build(
+            self._vectors[: self._num_rows],  # type: ignore
+            self._ivf_lists,
+            self._ivf_probes,
+        )
+        try:
+            index.save(path)
+        except OSError:
+            log.warning("could not save the IVF index of %s", self.collection_name)
+        return index
+
+    def _search(
+        self, queries: np.ndarray, rows: np.ndarray | None, k: int
+    ) -> list[list[tuple[int, float]]]:
+        """Score the rows exactly, None means all rows, and keep the top k per query."""
+        vectors: np.ndarray = self._vectors  # type: ignore
+        num_rows = self._num_rows if rows is None else len(rows)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, num_rows, SEARCH_BLOCK_SIZE):
+            end = min(start + SEARCH_BLOCK_SIZE, num_rows)
+            if rows is None:
+                block_rows = np.arange(start, end)
+                block = vectors[start:end]
+            else:
+                block_rows = rows[start:end]
+                block = vectors[block_rows]
+            scores = queries @ block.T.astype(np.float32, copy=False)
+            top = _top_k(scores, k)
+            best_rows = np.concatenate(
+                [best_rows, block_rows[top]], axis=1, dtype=np.int64
+            )
+            best_scores = np.concatenate(
+                [best_scores, np.take_along_axis(scores, top, axis=1)], axis=1
+            )
+            top = _top_k(best_scores, k)
+            best_rows = np.take_along_axis(best_rows, top, axis=1)
+            best_scores = np.take_along_axis(best_scores, top, axis=1)
+
+        return [
+            list(zip(query_rows.tolist(), query_scores.tolist(), strict=True))
+            for query_rows, query_scores in zip(best_rows, best_scores, strict=True)
+        ]
+
+    def _to_results(
+        self, hits: list[tuple[int, float]]
+    ) -> list[VectorStoreSearchResult]:
+        if not hits:
+            return []
+        rows = [row for row, _ in hits]
+        documents = self.document_collection.take(rows).to_pylist()  # type: ignore
+        vectors: np.ndarray = self._vectors  # type: ignore
+        return [
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=document["id"],
+                    text=document["text"],
+                    vector=vectors[row].tolist(),
+                    attributes=json.loads(document["attributes"]),
+                ),
+                score=score,
+            )
+            for (row, score), document in zip(hits, documents, strict=True)
+        ]
+
+
+class _IVFIndex:
+    """An inverted file index, the rows of the collection clustered around centroids."""
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        list_rows: np.ndarray,
+        list_offsets: np.ndarray,
+        num_probes: int,
+    ):
+        self.centroids = centroids
+        # the rows of list i are list_rows[list_offsets[i] : list_offsets[i + 1]]
+        self.list_rows = list_rows
+        self.list_offsets = list_offsets
+        self.num_probes = num_probes
+
+    @property
+    def num_lists(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.list_rows)
+
+    def probe(self, query: np.ndarray, mask: np.ndarray | None) -> np.ndarray:
+        """Get the rows in the lists closest to the query that pass the mask."""
+        lists = _top_k((self.centroids @ query)[np.newaxis], self.num_probes)[0]
+        rows = np.concatenate([
+            self.list_rows[self.list_offsets[i] : self.list_offsets[i + 1]]
+            for i in lists
+        ])
+        return rows if mask is None else rows[mask[rows]]
+
+    @classmethod
+    def build(cls, vectors: np.ndarray, num_lists: int, num_probes: int) -> "_IVFIndex":
+        """Cluster the vectors with spherical k-means."""
+        random = np.random.default_rng(0)
+        num_samples = min(len(vectors), num_lists * IVF_TRAINING_ROWS_PER_LIST)
+        samples = vectors[
+            np.sort(random.choice(len(vectors), num_samples, replace=False))
+        ].astype(np.float32)
+        centroids = samples[random.choice(num_samples, num_lists, replace=False)]
+        for _ in range(IVF_TRAINING_ITERATIONS):
+            assignments = _nearest_centroids(samples, centroids)
+            for i in range(num_lists):
+                members = samples[assignments == i]
+                if len(members) > 0:
+                    centroids[i] = _normalize(members.sum(axis=0)[np.newaxis])[0]
+
+        assignments = _nearest_centroids(vectors, centroids)
+        list_rows = np.argsort(assignments, kind="stable")
+        list_offsets = np.zeros(num_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=num_lists), out=list_offsets[1:])
+        return cls(centroids, list_rows, list_offsets, num_probes)
+
+    @classmethod
+    def load(cls, path: Path, num_probes: int) -> "_IVFIndex":
+        with np.load(path) as data:
+            return cls(
+                data["centroids"], data["list_rows"], data["list_offsets"], num_probes
+            )
+
+    def save(self, path: Path) -> None:
+        np.savez(
+            path,
+            centroids=self.centroids,
+            list_rows=self.list_rows,
+            list_offsets=self.list_offsets,
+        )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Get the columns of the k highest scores of every row, best first."""
+    if scores.shape[1] > k:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    return np.concatenate([
+        np.argmax(
+            vectors[start : start + SEARCH_BLOCK_SIZE].astype(np.float32) @ centroids.T,
+            axis=1,
+        )
+        for start in range(0, len(vectors), SEARCH_BLOCK_SIZE)
+    ])
+
+
+def _append_vectors(path: Path, vectors: np.ndarray) -> None:
+    """Append rows to a .npy file, writing only the new rows and the header.
+
+    The header saved by numpy is padded so the number of rows can grow in place.
+    """
+    if path.exists():
+        with path.open("r+b") as f:
+            version = np.lib.format.read_magic(f)
+            read_header, write_header = _HEADER_FORMATS.get(version, (None, None))
+            if read_header is not None and write_header is not None:
+                shape, fortran_order, dtype = read_header(f)
+                if (
+                    fortran_order
+                    or dtype != vectors.dtype
+                    or shape[1:] != vectors.shape[1:]
+                ):
+                    msg = f"Cannot append vectors of shape {vectors.shape} to {shape}"
+                    raise ValueError(msg)
+                data_start = f.tell()
+                header = io.BytesIO()
+                write_header(
+                    header,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(dtype),
+                        "fortran_order": False,
+                        "shape": (shape[0] + len(vectors), *shape[1:]),
+                    },
+                )
+                if header.tell() == data_start:
+                    f.seek(data_start + shape[0] * vectors[0].nbytes)
+                    f.write(vectors.tobytes())
+                    f.truncate()
+                    f.seek(0)
+                    f.write(header.getvalue())
+                    return
+
+        # the header can't be updated in place, rewrite the whole file
+        vectors = np.concatenate([np.load(path), vectors])
+    np.save(path, vectors)
+
+
+_HEADER_FORMATS = {
+    (1, 0): (
+        np.lib.format.read_array_header_1_0,
+        np.lib.format.write_array_header_1_0,
+    ),
+    (2, 0): (
+        np.lib.format.read_array_header_2_0,
+        np.lib.format.write_array_header_2_0,
+    ),
+}
@@ -0,0 +1,17 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from graphrag.benchmark import compare_results, run_benchmark
+
+
+async def test_run_benchmark():
+    results = await run_benchmark(chunks=20, queries=2)
+    index = results["index"]
+    assert index["outputs"]["text_units"] == 20
+    assert index["outputs"]["entities"] > 0
+    assert index["outputs"]["community_reports"] > 0
+    assert index["workflows"]["create_base_entity_graph"]["time"] >= 0
+    assert index["llm"]["entity_extraction"]["calls"] >= 20
+    for search in results["query"]["searches"].values():
+        assert search["errors"] == 0
+        assert search["qps"] > 0
+    assert compare_results(results, results) == []
@@ -0,0 +1,112 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+from typing import Any
+
+import pytest
+import tiktoken
+
+from graphrag.benchmark import compare_results, generate_corpus
+from graphrag.benchmark.mock_openai import chat_response
+from graphrag.benchmark.run import DEFAULT_CHUNK_SIZE
+from graphrag.index.graph.extractors.community_reports.prompts import (
+    COMMUNITY_REPORT_PROMPT,
+)
+from graphrag.index.graph.extractors.graph.graph_extractor import GraphExtractor
+from graphrag.index.graph.extractors.graph.prompts import (
+    CONTINUE_PROMPT,
+    GRAPH_EXTRACTION_PROMPT,
+    LOOP_PROMPT,
+)
+from graphrag.index.graph.extractors.summarize.prompts import SUMMARIZE_PROMPT
+from graphrag.llm import MockChatLLM
+
+
+def test_corpus_is_one_chunk_per_document():
+    corpus = generate_corpus(50, seed=1)
+    assert corpus.equals(generate_corpus(50, seed=1))
+    assert len(set(corpus["id"])) == 50
+    encoding = tiktoken.get_encoding("cl100k_base")
+    assert max(len(encoding.encode(text)) for text in corpus["text"]) < (
+        DEFAULT_CHUNK_SIZE
+    )
+
+
+async def test_mock_extraction_is_parsed_into_the_graph():
+    text = "ENTITY_1 met with ENTITY_2 in the capital. ENTITY_2 traveled with ENTITY_3."
+    kind, response = chat_response([
+        {
+            "role": "user",
+            "content": GRAPH_EXTRACTION_PROMPT.format(
+                entity_types="person",
+                tuple_delimiter="<|>",
+                record_delimiter="##",
+                completion_delimiter="<|COMPLETE|>",
+                input_text=text,
+            ),
+        }
+    ])
+    assert kind == "extraction"
+    extractor = GraphExtractor(MockChatLLM([response, ""]), max_gleanings=1)
+    graph = (await extractor([text], {"entity_types": ["person"]})).output
+    assert sorted(graph.nodes) == ["ENTITY_1", "ENTITY_2", "ENTITY_3"]
+    assert sorted(graph.edges) == [("ENTITY_1", "ENTITY_2"), ("ENTITY_2", "ENTITY_3")]
+
+    assert chat_response([{"content": CONTINUE_PROMPT}]) == ("extraction", "")
+    assert chat_response([{"content": LOOP_PROMPT}]) == ("extraction", "NO")
+
+
+def test_mock_responses_follow_the_prompts():
+    kind, summary = chat_response([
+        {
+            "content": SUMMARIZE_PROMPT.format(
+                entity_name="ENTITY_1", description_list=["a", "b"]
+            )
+        }
+    ])
+    assert kind == "summarization"
+    assert "ENTITY_1" in summary
+
+    kind, report = chat_response([
+        {
+            "content": COMMUNITY_REPORT_PROMPT.format(
+                input_text="id,entity\n0,ENTITY_4\n1,ENTITY_5", max_report_length=1500
+            )
+        }
+    ])
+    assert kind == "report"
+    assert json.loads(report)["title"] == "Community of ENTITY_4"
+
+    assert (
+        chat_response([
+            {"role": "system", "content": "Generate a list of key points"},
+            {"role": "user", "content": "What?"},
+        ])[0]
+        == "query"
+    )
+
+
+def _results(index_time: float, qps: float) -> dict[str, Any]:
+    return {
+        "parameters": {"chunks": 10},
+        "index": {
+            "time": index_time,
+            "peak_rss_mb": 100.0,
+            "workflows": {"create_base_entity_graph": {"time": index_time}},
+        },
+        "query": {"searches": {"local": {"qps": qps}}},
+    }
+
+
+def test_compare_results():
+    baseline = _results(10.0, 5.0)
+    assert compare_results(baseline, _results(11.0, 4.5)) == []
+    assert compare_results(baseline, _results(15.0, 2.0)) == [
+        "index time: 10.00s -> 15.00s (+50%)",
+        "create_base_entity_graph time: 10.00s -> 15.00s (+50%)",
+        "local search: 5.00qps -> 2.00qps (-60%)",
+    ]
+    # short times are noise
+    assert compare_results(_results(0.1, 5.0), _results(0.5, 5.0)) == []
+    with pytest.raises(ValueError):  # noqa PT011
+        compare_results({**baseline, "parameters": {"chunks": 20}}, baseline)
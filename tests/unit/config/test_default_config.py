@@ -43,6 +43,7 @@ from graphrag.config import (
     LLMParametersInput,
     LocalSearchConfig,
     ParallelizationParameters,
+    ProcessPoolConfig,
     ReportingConfig,
     ReportingConfigInput,
     ReportingType,
@@ -85,6 +86,8 @@ ALL_ENV_VARS = {
     "GRAPHRAG_CACHE_CONNECTION_STRING": "test_cs1",
     "GRAPHRAG_CACHE_CONTAINER_NAME": "test_cn1",
     "GRAPHRAG_CACHE_TYPE": "blob",
+    "GRAPHRAG_CACHE_SEGMENTED": "true",
+    "GRAPHRAG_CACHE_SEGMENT_SIZE": "250",
     "GRAPHRAG_CHUNK_BY_COLUMNS": "a,b",
     "GRAPHRAG_CHUNK_OVERLAP": "12",
     "GRAPHRAG_CHUNK_SIZE": "500",
@@ -100,12 +103,17 @@ ALL_ENV_VARS = {
     "GRAPHRAG_EMBEDDING_BATCH_SIZE": "1000000",
     "GRAPHRAG_EMBEDDING_CONCURRENT_REQUESTS": "12",
     "GRAPHRAG_EMBEDDING_DEPLOYMENT_NAME": "model-deployment-name",
+    "GRAPHRAG_EMBEDDING_DTYPE": "float16",
+    "GRAPHRAG_EMBEDDING_KEEPALIVE_EXPIRY": "12.5",
+    "GRAPHRAG_EMBEDDING_MAX_CONNECTIONS": "42",
+    "GRAPHRAG_EMBEDDING_MAX_KEEPALIVE_CONNECTIONS": "21",
     "GRAPHRAG_EMBEDDING_MAX_RETRIES": "3",
     "GRAPHRAG_EMBEDDING_MAX_RETRY_WAIT": "0.1123",
     "GRAPHRAG_EMBEDDING_MODEL": "text-embedding-2",
     "GRAPHRAG_EMBEDDING_REQUESTS_PER_MINUTE": "500",
     "GRAPHRAG_EMBEDDING_SKIP": "a1,b1,c1",
     "GRAPHRAG_EMBEDDING_SLEEP_ON_RATE_LIMIT_RECOMMENDATION": "False",
+    "GRAPHRAG_EMBEDDING_ADAPTIVE_RATE_LIMIT": "True",
     "GRAPHRAG_EMBEDDING_TARGET": "all",
     "GRAPHRAG_EMBEDDING_THREAD_COUNT": "2345",
     "GRAPHRAG_EMBEDDING_THREAD_STAGGER": "0.456",
@@ -118,6 +126,7 @@ ALL_ENV_VARS = {
     "GRAPHRAG_ENTITY_EXTRACTION_PROMPT_FILE": "tests/unit/config/prompt-c.txt",
     "GRAPHRAG_ENTITY_EXTRACTION_ENCODING_MODEL": "encoding_b",
     "GRAPHRAG_INPUT_BASE_DIR": "/some/input/dir",
+    "GRAPHRAG_INPUT_BATCH_SIZE": "100",
     "GRAPHRAG_INPUT_CONNECTION_STRING": "input_cs",
     "GRAPHRAG_INPUT_CONTAINER_NAME": "input_cn",
     "GRAPHRAG_INPUT_DOCUMENT_ATTRIBUTE_COLUMNS": "test1,test2",
@@ -132,6 +141,9 @@ ALL_ENV_VARS = {
     "GRAPHRAG_INPUT_FILE_TYPE": "text",
     "GRAPHRAG_LLM_CONCURRENT_REQUESTS": "12",
     "GRAPHRAG_LLM_DEPLOYMENT_NAME": "model-deployment-name-x",
+    "GRAPHRAG_LLM_KEEPALIVE_EXPIRY": "11.5",
+    "GRAPHRAG_LLM_MAX_CONNECTIONS": "41",
+    "GRAPHRAG_LLM_MAX_KEEPALIVE_CONNECTIONS": "20",
     "GRAPHRAG_LLM_MAX_RETRIES": "312",
     "GRAPHRAG_LLM_MAX_RETRY_WAIT": "0.1122",
     "GRAPHRAG_LLM_MAX_TOKENS": "15000",
@@ -141,11 +153,13 @@ ALL_ENV_VARS = {
     "GRAPHRAG_LLM_REQUEST_TIMEOUT": "12.7",
     "GRAPHRAG_LLM_REQUESTS_PER_MINUTE": "900",
     "GRAPHRAG_LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION": "False",
+    "GRAPHRAG_LLM_ADAPTIVE_RATE_LIMIT": "True",
     "GRAPHRAG_LLM_THREAD_COUNT": "987",
     "GRAPHRAG_LLM_THREAD_STAGGER": "0.123",
     "GRAPHRAG_LLM_TOKENS_PER_MINUTE": "8000",
     "GRAPHRAG_LLM_TYPE": "azure_openai_chat",
     "GRAPHRAG_MAX_CLUSTER_SIZE": "123",
+    "GRAPHRAG_MAX_CONCURRENT_WORKFLOWS": "3",
     "GRAPHRAG_NODE2VEC_ENABLED": "true",
     "GRAPHRAG_NODE2VEC_ITERATIONS": "878787",
     "GRAPHRAG_NODE2VEC_NUM_WALKS": "5000000",
@@ -168,9 +182,12 @@ ALL_ENV_VARS = {
     "GRAPHRAG_STORAGE_TYPE": "blob",
     "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_MAX_LENGTH": "12345",
     "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_PROMPT_FILE": "tests/unit/config/prompt-d.txt",
+    "GRAPHRAG_TABLE_CACHE_MAX_MB": "0",
     "GRAPHRAG_LLM_TEMPERATURE": "0.0",
     "GRAPHRAG_LLM_TOP_P": "1.0",
     "GRAPHRAG_UMAP_ENABLED": "true",
+    "GRAPHRAG_PROCESS_POOL_NUM_PROCESSES": "4",
+    "GRAPHRAG_PROCESS_POOL_VERBS": "chunk,cluster_graph",
     "GRAPHRAG_LOCAL_SEARCH_TEXT_UNIT_PROP": "0.713",
     "GRAPHRAG_LOCAL_SEARCH_COMMUNITY_PROP": "0.1234",
     "GRAPHRAG_LOCAL_SEARCH_LLM_TEMPERATURE": "0.1",
@@ -189,6 +206,8 @@ ALL_ENV_VARS = {
     "GRAPHRAG_GLOBAL_SEARCH_MAP_MAX_TOKENS": "4123",
     "GRAPHRAG_GLOBAL_SEARCH_CONCURRENCY": "7",
     "GRAPHRAG_GLOBAL_SEARCH_REDUCE_MAX_TOKENS": "15432",
+    "GRAPHRAG_GLOBAL_SEARCH_EARLY_STOP": "True",
+    "GRAPHRAG_GLOBAL_SEARCH_EARLY_STOP_MIN_SCORE": "70",
 }
 
 
@@ -208,6 +227,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert LLMParameters is not None
         assert LocalSearchConfig is not None
         assert ParallelizationParameters is not None
+        assert ProcessPoolConfig is not None
         assert ReportingConfig is not None
         assert SnapshotsConfig is not None
         assert StorageConfig is not None
@@ -537,6 +557,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.cache.connection_string == "test_cs1"
         assert parameters.cache.container_name == "test_cn1"
         assert parameters.cache.type == CacheType.blob
+        assert parameters.cache.segmented
+        assert parameters.cache.segment_size == 250
         assert parameters.chunks.group_by_columns == ["a", "b"]
         assert parameters.chunks.overlap == 12
         assert parameters.chunks.size == 500
@@ -557,8 +579,12 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.embed_graph.window_size == 12345
         assert parameters.embeddings.batch_max_tokens == 17
         assert parameters.embeddings.batch_size == 1_000_000
+        assert parameters.embeddings.llm.adaptive_rate_limit is True
         assert parameters.embeddings.llm.concurrent_requests == 12
         assert parameters.embeddings.llm.deployment_name == "model-deployment-name"
+        assert parameters.embeddings.llm.keepalive_expiry == 12.5
+        assert parameters.embeddings.llm.max_connections == 42
+        assert parameters.embeddings.llm.max_keepalive_connections == 21
         assert parameters.embeddings.llm.max_retries == 3
         assert parameters.embeddings.llm.max_retry_wait == 0.1123
         assert parameters.embeddings.llm.model == "text-embedding-2"
@@ -570,6 +596,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.embeddings.parallelization.stagger == 0.456
         assert parameters.embeddings.skip == ["a1", "b1", "c1"]
         assert parameters.embeddings.target == "all"
+        assert parameters.embeddings.dtype == "float16"
         assert parameters.encoding_model == "test123"
         assert parameters.entity_extraction.entity_types == ["cat", "dog", "elephant"]
         assert parameters.entity_extraction.llm.api_base == "http://some/base"
@@ -590,11 +617,15 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.input.timestamp_format == "test_format"
         assert parameters.input.title_column == "test_title"
         assert parameters.input.type == InputType.blob
+        assert parameters.input.batch_size == 100
         assert parameters.llm.api_base == "http://some/base"
         assert parameters.llm.api_key == "test"
         assert parameters.llm.api_version == "v1234"
         assert parameters.llm.concurrent_requests == 12
         assert parameters.llm.deployment_name == "model-deployment-name-x"
+        assert parameters.llm.keepalive_expiry == 11.5
+        assert parameters.llm.max_connections == 41
+        assert parameters.llm.max_keepalive_connections == 20
         assert parameters.llm.max_retries == 312
         assert parameters.llm.max_retry_wait == 0.1122
         assert parameters.llm.max_tokens == 15000
@@ -606,6 +637,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.llm.request_timeout == 12.7
         assert parameters.llm.requests_per_minute == 900
         assert parameters.llm.sleep_on_rate_limit_recommendation is False
+        assert parameters.llm.adaptive_rate_limit is True
         assert parameters.llm.temperature == 0.0
         assert parameters.llm.top_p == 1.0
         assert parameters.llm.tokens_per_minute == 8000
@@ -621,6 +653,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.reporting.container_name == "test_cn2"
         assert parameters.reporting.type == ReportingType.blob
         assert parameters.skip_workflows == ["a", "b", "c"]
+        assert parameters.max_concurrent_workflows == 3
+        assert parameters.table_cache_max_mb == 0
         assert parameters.snapshots.graphml
         assert parameters.snapshots.raw_entities
         assert parameters.snapshots.top_level_nodes
@@ -634,6 +668,10 @@ class TestDefaultConfig(unittest.TestCase):
             parameters.summarize_descriptions.prompt == "tests/unit/config/prompt-d.txt"
         )
         assert parameters.umap.enabled
+        assert parameters.process_pool.num_processes == 4
+        assert parameters.process_pool.verbs == ["chunk", "cluster_graph"]
+        assert parameters.process_pool.num_processes_for("cluster_graph") == 4
+        assert parameters.process_pool.num_processes_for("merge_graphs") == 1
         assert parameters.local_search.text_unit_prop == 0.713
         assert parameters.local_search.community_prop == 0.1234
         assert parameters.local_search.llm_max_tokens == 12
@@ -653,6 +691,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.global_search.map_max_tokens == 4123
         assert parameters.global_search.concurrency == 7
         assert parameters.global_search.reduce_max_tokens == 15432
+        assert parameters.global_search.early_stop
+        assert parameters.global_search.early_stop_min_score == 70
 
     @mock.patch.dict(os.environ, {"API_KEY_X": "test"}, clear=True)
     def test_create_parameters(self) -> None:
@@ -822,6 +862,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.async_mode == defs.ASYNC_MODE
         assert parameters.cache.base_dir == defs.CACHE_BASE_DIR
         assert parameters.cache.type == defs.CACHE_TYPE
+        assert parameters.cache.segmented == defs.CACHE_SEGMENTED
+        assert parameters.cache.segment_size == defs.CACHE_SEGMENT_SIZE
         assert parameters.cache.base_dir == defs.CACHE_BASE_DIR
         assert parameters.chunks.group_by_columns == defs.CHUNK_GROUP_BY_COLUMNS
         assert parameters.chunks.overlap == defs.CHUNK_OVERLAP
@@ -839,6 +881,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.embeddings.batch_size == defs.EMBEDDING_BATCH_SIZE
         assert parameters.embeddings.llm.model == defs.EMBEDDING_MODEL
         assert parameters.embeddings.target == defs.EMBEDDING_TARGET
+        assert parameters.embeddings.dtype == defs.EMBEDDING_DTYPE
         assert parameters.embeddings.llm.type == defs.EMBEDDING_TYPE
         assert (
             parameters.embeddings.llm.requests_per_minute
@@ -849,6 +892,10 @@ class TestDefaultConfig(unittest.TestCase):
             parameters.embeddings.llm.sleep_on_rate_limit_recommendation
             == defs.LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION
         )
+        assert (
+            parameters.embeddings.llm.adaptive_rate_limit
+            == defs.LLM_ADAPTIVE_RATE_LIMIT
+        )
         assert (
             parameters.entity_extraction.entity_types
             == defs.ENTITY_EXTRACTION_ENTITY_TYPES
@@ -858,6 +905,8 @@ class TestDefaultConfig(unittest.TestCase):
             == defs.ENTITY_EXTRACTION_MAX_GLEANINGS
         )
         assert parameters.encoding_model == defs.ENCODING_MODEL
+        assert parameters.max_concurrent_workflows == defs.MAX_CONCURRENT_WORKFLOWS
+        assert parameters.table_cache_max_mb == defs.TABLE_CACHE_MAX_MB
         assert parameters.input.base_dir == defs.INPUT_BASE_DIR
         assert parameters.input.file_pattern == defs.INPUT_CSV_PATTERN
         assert parameters.input.encoding == defs.INPUT_FILE_ENCODING
@@ -865,7 +914,14 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.input.base_dir == defs.INPUT_BASE_DIR
         assert parameters.input.text_column == defs.INPUT_TEXT_COLUMN
         assert parameters.input.file_type == defs.INPUT_FILE_TYPE
+        assert parameters.input.batch_size == defs.INPUT_BATCH_SIZE
         assert parameters.llm.concurrent_requests == defs.LLM_CONCURRENT_REQUESTS
+        assert parameters.llm.keepalive_expiry == defs.LLM_KEEPALIVE_EXPIRY
+        assert parameters.llm.max_connections == defs.LLM_MAX_CONNECTIONS
+        assert (
+            parameters.llm.max_keepalive_connections
+            == defs.LLM_MAX_KEEPALIVE_CONNECTIONS
+        )
         assert parameters.llm.max_retries == defs.LLM_MAX_RETRIES
         assert parameters.llm.max_retry_wait == defs.LLM_MAX_RETRY_WAIT
         assert parameters.llm.max_tokens == defs.LLM_MAX_TOKENS
@@ -877,6 +933,7 @@ class TestDefaultConfig(unittest.TestCase):
             parameters.llm.sleep_on_rate_limit_recommendation
             == defs.LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION
         )
+        assert parameters.llm.adaptive_rate_limit == defs.LLM_ADAPTIVE_RATE_LIMIT
         assert parameters.llm.type == defs.LLM_TYPE
         assert parameters.cluster_graph.max_cluster_size == defs.MAX_CLUSTER_SIZE
         assert parameters.embed_graph.enabled == defs.NODE2VEC_ENABLED
@@ -897,6 +954,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.storage.base_dir == defs.STORAGE_BASE_DIR
         assert parameters.storage.type == defs.STORAGE_TYPE
         assert parameters.umap.enabled == defs.UMAP_ENABLED
+        assert parameters.process_pool.num_processes == defs.PROCESS_POOL_NUM_PROCESSES
+        assert parameters.process_pool.verbs == defs.PROCESS_POOL_VERBS
 
     @mock.patch.dict(
         os.environ,
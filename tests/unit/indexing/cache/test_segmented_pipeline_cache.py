@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+import os
+import tempfile
+import unittest
+
+from graphrag.index.cache import SegmentedPipelineCache
+from graphrag.index.storage.file_pipeline_storage import (
+    FilePipelineStorage,
+)
+
+
+def list_files(root: str) -> list[str]:
+    return sorted(
+        os.path.relpath(os.path.join(path, name), root).replace(os.sep, "/")
+        for path, _, names in os.walk(root)
+        for name in names
+    )
+
+
+class TestSegmentedPipelineCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_cache(self, segment_size: int = 100) -> SegmentedPipelineCache:
+        return SegmentedPipelineCache(
+            FilePipelineStorage(self.root), segment_size=segment_size, num_shards=2
+        )
+
+    async def test_get_set(self):
+        cache = self.create_cache()
+        await cache.set("test1", "value1", {"input": "prompt"})
+        await cache.set("test2", {"nested": [1, 2]})
+        assert await cache.get("test1") == "value1"
+        assert await cache.get("test2") == {"nested": [1, 2]}
+        assert await cache.get("NON_EXISTENT") is None
+        assert await cache.has("test1")
+        assert not await cache.has("NON_EXISTENT")
+        # nothing is written until a shard is full or the cache is flushed
+        assert list_files(self.root) == []
+
+    async def test_get_many_set_many(self):
+        cache = self.create_cache(segment_size=3)
+        values = {f"key{i}": f"value{i}" for i in range(10)}
+        await cache.set_many(values)
+        keys = ["key3", "missing", "key0", "key9"]
+        assert await cache.get_many(keys) == ["value3", None, "value0", "value9"]
+
+    async def test_writes_full_shards_as_segments(self):
+        cache = self.create_cache(segment_size=2)
+        await cache.set_many({f"key{i}": f"value{i}" for i in range(8)})
+        files = list_files(self.root)
+        # at most one entry per shard is still buffered
+        assert len(files) >= 3
+        for file in files:
+            assert file.startswith("segments/")
+            with open(os.path.join(self.root, file)) as f:
+                assert len(f.read().splitlines()) == 2
+
+    async def test_resumed_run_reads_flushed_entries(self):
+        cache = self.create_cache(segment_size=3)
+        await cache.set_many({f"key{i}": f"value{i}" for i in range(10)})
+        await cache.set("key0", "updated")
+        await cache.delete("key1")
+        await cache.flush()
+
+        with open(os.path.join(self.root, "cache_index.json")) as f:
+            index = json.load(f)
+        indexed_keys = {key for segment in index["segments"] for key in segment["keys"]}
+        assert indexed_keys == {f"key{i}" for i in range(10)} - {"key1"}
+
+        resumed = self.create_cache(segment_size=3)
+        assert await resumed.get("key0") == "updated"
+        assert await resumed.get("key1") is None
+        assert await resumed.get_many([f"key{i}" for i in range(2, 10)]) == [
+            f"value{i}" for i in range(2, 10)
+        ]
+
+    async def test_indexes_segments_written_after_the_last_flush(self):
+        cache = self.create_cache(segment_size=1)
+        await cache.set("key0", "value0")
+        await cache.flush()
+        await cache.set("key1", "value1")
+        await cache.set("key0", "updated")
+
+        resumed = self.create_cache(segment_size=1)
+        assert await resumed.get("key0") == "updated"
+        assert await resumed.get("key1") == "value1"
+
+    async def test_child_caches_are_flushed(self):
+        cache = self.create_cache()
+        child = cache.child("test")
+        assert cache.child("test") is child
+        await child.set("test1", "value1")
+        await cache.flush()
+        assert "test/cache_index.json" in list_files(self.root)
+
+        resumed = self.create_cache().child("test")
+        assert await resumed.get("test1") == "value1"
+
+    async def test_clear(self):
+        cache = self.create_cache()
+        child = cache.child("test")
+        await cache.set("test1", "value1")
+        await child.set("test2", "value2")
+        await cache.flush()
+
+        await cache.clear()
+        assert list_files(self.root) == []
+        assert await cache.get("test1") is None
+        assert await child.get("test2") is None
@@ -0,0 +1,34 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.emit.csv_table_emitter import CSVTableEmitter
+from graphrag.index.storage import MemoryPipelineStorage
+
+
+async def test_embeddings_are_written_in_full():
+    embeddings = [
+        np.random.default_rng(i).standard_normal(1536).astype(np.float32)
+        for i in range(2)
+    ]
+    data = pd.DataFrame({
+        "id": ["a", "b"],
+        "description_embedding": [embeddings[0], None],
+        "text_embedding": embeddings,
+    })
+    storage = MemoryPipelineStorage()
+    await CSVTableEmitter(storage).emit("table", data)
+
+    output = await storage.get("table.csv")
+    assert "..." not in output
+    result = pd.read_csv(io.StringIO(output))
+    assert result["id"].tolist() == ["a", "b"]
+    description_embeddings = result["description_embedding"].tolist()
+    assert pd.isna(description_embeddings[1])
+    np.testing.assert_array_equal(json.loads(description_embeddings[0]), embeddings[0])
+    for expected, actual in zip(embeddings, result["text_embedding"], strict=True):
+        np.testing.assert_array_equal(json.loads(actual), expected)
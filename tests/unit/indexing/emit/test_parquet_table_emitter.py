@@ -0,0 +1,47 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from graphrag.index.emit.parquet_table_emitter import ParquetTableEmitter
+from graphrag.index.storage import MemoryPipelineStorage
+
+
+def raise_error(e, *_):
+    raise e
+
+
+async def emit(data: pd.DataFrame) -> bytes:
+    storage = MemoryPipelineStorage()
+    await ParquetTableEmitter(storage, raise_error).emit("table", data)
+    return await storage.get("table.parquet", as_bytes=True)
+
+
+async def test_embeddings_are_stored_as_fixed_size_lists():
+    embeddings = [np.array([i, 0.5, -1], dtype=np.float16) for i in range(3)]
+    data = pd.DataFrame({"id": ["a", "b", "c"], "embedding": embeddings})
+    output = await emit(data)
+
+    schema = pq.read_schema(io.BytesIO(output))
+    assert schema.field("embedding").type == pa.list_(pa.float16(), 3)
+    result = pd.read_parquet(io.BytesIO(output))
+    assert result["id"].tolist() == ["a", "b", "c"]
+    for expected, actual in zip(embeddings, result["embedding"], strict=True):
+        assert actual.dtype == np.float16
+        np.testing.assert_array_equal(actual, expected)
+
+
+async def test_columns_with_missing_embeddings_are_stored_as_lists():
+    data = pd.DataFrame({
+        "embedding": [np.array([1, 2], dtype=np.int8), None],
+        "labels": [["x"], ["y", "z"]],
+    })
+    output = await emit(data)
+
+    schema = pq.read_schema(io.BytesIO(output))
+    assert schema.field("embedding").type == pa.list_(pa.int8())
+    assert schema.field("labels").type == pa.list_(pa.string())
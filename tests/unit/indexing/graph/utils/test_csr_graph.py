@@ -0,0 +1,109 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import random
+import unittest
+
+import networkx as nx
+import pytest
+from graspologic.partition import hierarchical_leiden
+
+from graphrag.index.graph.utils import CSRGraph, stable_largest_connected_component
+from graphrag.index.verbs.graph.clustering.strategies.leiden import (
+    _compute_leiden_communities,
+)
+
+
+def create_random_graph(seed: int, self_loops: bool = False) -> nx.Graph:
+    rng = random.Random(seed)
+    # names that normalize to the same name are merged by the stable LCC
+    names = [f"node {i}" for i in range(30)] + [" NODE 1", "Node 2", "node &amp; 3"]
+    rng.shuffle(names)
+    graph = nx.Graph()
+    graph.add_nodes_from(names)
+    for _ in range(60):
+        source, target = rng.choice(names), rng.choice(names)
+        if source != target or self_loops:
+            graph.add_edge(source, target, weight=rng.randint(1, 5))
+    return graph
+
+
+def edges_of(graph: nx.Graph) -> list[tuple[str, str, float]]:
+    return [
+        (source, target, float(weight))
+        for source, target, weight in graph.edges(data="weight", default=1.0)
+    ]
+
+
+def csr_edges_of(graph: CSRGraph) -> list[tuple[str, str, float]]:
+    return [
+        (graph.names[source], graph.names[target], weight)
+        for source, target, weight in graph.edge_list()
+    ]
+
+
+class TestCSRGraph(unittest.TestCase):
+    def test_stable_lcc_matches_the_networkx_graph(self):
+        for seed in range(20):
+            graph = create_random_graph(seed, self_loops=True)
+            expected = stable_largest_connected_component(graph)
+            lcc = CSRGraph.from_graph(graph).stable_largest_connected_component()
+
+            assert lcc.names == list(expected.nodes)
+            assert csr_edges_of(lcc) == edges_of(expected)
+
+    def test_stable_lcc_takes_the_first_of_the_largest_components(self):
+        graph = nx.Graph()
+        graph.add_edges_from([("c", "d"), ("b", "a"), ("e", "f")])
+        lcc = CSRGraph.from_graph(graph).stable_largest_connected_component()
+
+        assert lcc.names == ["C", "D"]
+        assert csr_edges_of(lcc) == [("C", "D", 1.0)]
+
+    def test_connected_components_match_the_networkx_graph(self):
+        for seed in range(10):
+            graph = create_random_graph(seed, self_loops=True)
+            components = CSRGraph.from_graph(graph).connected_components()
+
+            expected = sorted(
+                nx.connected_components(graph),
+                key=lambda nodes: min(list(graph.nodes).index(node) for node in nodes),
+            )
+            assert [component.names for component in components] == [
+                [node for node in graph.nodes if node in nodes] for nodes in expected
+            ]
+            assert [csr_edges_of(component) for component in components] == [
+                [edge for edge in edges_of(graph) if edge[0] in nodes]
+                for nodes in expected
+            ]
+
+    def test_fingerprint_changes_with_the_graph(self):
+        graph = create_random_graph(0)
+        fingerprint = CSRGraph.from_graph(graph).fingerprint()
+        assert CSRGraph.from_graph(graph.copy()).fingerprint() == fingerprint
+
+        graph.add_edge("node 0", "node 1", weight=10)
+        assert CSRGraph.from_graph(graph).fingerprint() != fingerprint
+
+    def test_directed_graphs_are_rejected(self):
+        with pytest.raises(ValueError):  # noqa PT011
+            CSRGraph.from_graph(nx.DiGraph([("a", "b")]))
+
+    def test_leiden_communities_match_graspologic(self):
+        for seed in range(10):
+            graph = create_random_graph(seed)
+            expected: dict[int, dict[str, int]] = {}
+            for partition in hierarchical_leiden(
+                stable_largest_connected_component(graph),
+                max_cluster_size=5,
+                random_seed=0xDEADBEEF,
+            ):
+                expected.setdefault(partition.level, {})[partition.node] = (
+                    partition.cluster
+                )
+
+            assert (
+                _compute_leiden_communities(
+                    graph, max_cluster_size=5, use_lcc=True, seed=0xDEADBEEF
+                )
+                == expected
+            )
@@ -0,0 +1,39 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.index.config import PipelineCSVInputConfig, PipelineTextInputConfig
+from graphrag.index.input.csv import load as load_csv
+from graphrag.index.input.csv import load_batches as load_csv_batches
+from graphrag.index.input.text import load as load_text
+from graphrag.index.input.text import load_batches as load_text_batches
+from graphrag.index.storage import FilePipelineStorage
+
+
+async def test_text_batches_match_load(tmp_path):
+    for i in range(5):
+        (tmp_path / f"doc{i}.txt").write_text(f"document {i}")
+    storage = FilePipelineStorage(str(tmp_path))
+    config = PipelineTextInputConfig(file_pattern=r".*\.txt$")
+
+    batches = [batch async for batch in load_text_batches(config, None, storage, 2)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(batches, ignore_index=True), await load_text(config, None, storage)
+    )
+
+
+async def test_csv_batches_split_files(tmp_path):
+    pd.DataFrame({"text": ["a", "b", "c"]}).to_csv(tmp_path / "one.csv", index=False)
+    pd.DataFrame({"text": ["d", "e"]}).to_csv(tmp_path / "two.csv", index=False)
+    storage = FilePipelineStorage(str(tmp_path))
+    config = PipelineCSVInputConfig(file_pattern=r".*\.csv$")
+
+    batches = [batch async for batch in load_csv_batches(config, None, storage, 2)]
+    assert [batch["text"].tolist() for batch in batches] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+    loaded = await load_csv(config, None, storage)
+    assert pd.concat(batches)["id"].tolist() == loaded["id"].tolist()
@@ -0,0 +1,35 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from datashaper import NoopVerbCallbacks
+
+from graphrag.config.enums import LLMType
+from graphrag.index.cache import InMemoryCache
+from graphrag.index.llm import load_llm
+
+CONFIG = {"type": LLMType.StaticResponse, "responses": ["response"]}
+
+
+def test_rows_of_a_verb_share_one_llm():
+    callbacks = NoopVerbCallbacks()
+    cache = InMemoryCache()
+
+    llm = load_llm("extraction", LLMType.StaticResponse, callbacks, cache, CONFIG)
+    assert (
+        load_llm("extraction", LLMType.StaticResponse, callbacks, cache, CONFIG) is llm
+    )
+
+    other_config = {**CONFIG, "responses": ["other response"]}
+    assert (
+        load_llm("extraction", LLMType.StaticResponse, callbacks, cache, other_config)
+        is not llm
+    )
+    assert (
+        load_llm("summarize", LLMType.StaticResponse, callbacks, cache, CONFIG)
+        is not llm
+    )
+    assert (
+        load_llm(
+            "extraction", LLMType.StaticResponse, NoopVerbCallbacks(), cache, CONFIG
+        )
+        is not llm
+    )
@@ -94,3 +94,23 @@ async def test_child():
             assert not has_test
     finally:
         parent.delete_container()
+
+
+async def test_batch_methods():
+    parent = BlobPipelineStorage(
+        connection_string=WELL_KNOWN_BLOB_STORAGE_KEY,
+        container_name="testbatch",
+        max_concurrency=2,
+    )
+    try:
+        storage = parent.child("output")
+        values = {f"file{i}.txt": f"value {i}" for i in range(5)}
+        await storage.set_many({**values, "large.bin": bytes(5 * 1024 * 1024)})
+
+        keys = [*values, "missing.txt"]
+        assert await storage.has_many(keys) == [True] * 5 + [False]
+        assert await storage.get_many(keys) == [*values.values(), None]
+        assert await storage.get("large.bin", as_bytes=True) == bytes(5 * 1024 * 1024)
+        assert await parent.get_many(["output/file0.txt"]) == ["value 0"]
+    finally:
+        parent.delete_container()
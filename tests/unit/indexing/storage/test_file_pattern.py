@@ -0,0 +1,28 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import os
+import re
+
+from graphrag.index.storage.file_pattern import (
+    could_contain_prefix,
+    get_literal_prefix,
+)
+
+
+def test_literal_prefix():
+    assert get_literal_prefix(re.compile(r".*\.txt$")) == ""
+    assert get_literal_prefix(re.compile(r"input/2024/.*\.txt$")) == "input/2024/"
+    assert get_literal_prefix(re.compile(r"^input\.d/(?P<name>.*)")) == "input.d/"
+    assert get_literal_prefix(re.compile(r"inputs?/.*")) == "input"
+    assert get_literal_prefix(re.compile(r"inputs+/.*")) == "inputs"
+    assert get_literal_prefix(re.compile(r"input\d{4}")) == "input"
+    assert get_literal_prefix(re.compile(r"a/.*|b/.*")) == ""
+    assert get_literal_prefix(re.compile(r"input/.*", re.IGNORECASE)) == ""
+
+
+def test_could_contain_prefix():
+    assert could_contain_prefix("input", "input/2024/", "/")
+    assert could_contain_prefix("input/2024/a", "input/2024/", "/")
+    assert not could_contain_prefix("output", "input/2024/", "/")
+    assert not could_contain_prefix("input/2023", "input/2024/", "/")
+    assert could_contain_prefix("anything", "", os.sep)
@@ -48,3 +48,36 @@ async def test_child():
     await storage.delete("test.txt")
     output = await storage.get("test.txt")
     assert output is None
+
+
+def test_find_skips_directories_outside_prefix(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    for name in ["a/one.txt", "a/b/two.txt", "c/three.txt", "four.txt"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(name)
+
+    items = [item[0] for item in storage.find(re.compile(r".*\.txt$"))]
+    assert items == [
+        "four.txt",
+        str(Path("a/one.txt")),
+        str(Path("a/b/two.txt")),
+        str(Path("c/three.txt")),
+    ]
+
+    pattern = re.compile(re.escape(f"{tmp_path}{os.sep}a{os.sep}") + r".*\.txt$")
+    items = [item[0] for item in storage.find(pattern)]
+    assert items == [str(Path("a/one.txt")), str(Path("a/b/two.txt"))]
+
+
+async def test_batch_methods(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await storage.set_many({"one.txt": "one", "two.bin": b"two"})
+    assert await storage.has_many(["one.txt", "missing.txt", "two.bin"]) == [
+        True,
+        False,
+        True,
+    ]
+    assert await storage.get_many(["two.bin", "one.txt"], as_bytes=True) == [
+        b"two",
+        b"one",
+    ]
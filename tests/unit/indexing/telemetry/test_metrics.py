@@ -0,0 +1,147 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+from typing import Any
+
+import pandas as pd
+from datashaper import TableContainer, VerbCallbacks, VerbInput
+
+from graphrag.index import run_pipeline
+from graphrag.index.config import PipelineWorkflowReference
+from graphrag.index.storage import MemoryPipelineStorage
+from graphrag.index.telemetry import (
+    LLM_CACHE_HIT,
+    LLM_CACHE_MISS,
+    LLM_INPUT_TOKENS,
+    LLM_LATENCY,
+    MetricsExporter,
+    OpenTelemetryMetricsExporter,
+    PipelineMetrics,
+    llm_measure_name,
+)
+
+
+class ListExporter(MetricsExporter):
+    def __init__(self):
+        self.records: list[tuple[str, float, dict[str, str]]] = []
+        self.exported: list[dict[str, Any]] = []
+
+    def record(self, name: str, value: float, attributes: dict[str, str]) -> None:
+        self.records.append((name, value, attributes))
+
+    def export(self, metrics: dict[str, Any]) -> None:
+        self.exported.append(metrics)
+
+
+class FakeInstrument:
+    def __init__(self):
+        self.measurements: list[tuple[float, dict[str, str]]] = []
+
+    def add(self, value: float, attributes: dict[str, str]) -> None:
+        self.measurements.append((value, attributes))
+
+    def record(self, value: float, attributes: dict[str, str]) -> None:
+        self.measurements.append((value, attributes))
+
+
+class FakeMeter:
+    def __init__(self):
+        self.counters: dict[str, FakeInstrument] = {}
+        self.histograms: dict[str, FakeInstrument] = {}
+
+    def create_counter(self, name: str, unit: str = "") -> FakeInstrument:
+        return self.counters.setdefault(name, FakeInstrument())
+
+    def create_histogram(self, name: str, unit: str = "") -> FakeInstrument:
+        return self.histograms.setdefault(name, FakeInstrument())
+
+
+def test_llm_measurements_are_summarized():
+    exporter = ListExporter()
+    metrics = PipelineMetrics([exporter])
+    name = "entity_extraction"
+    for latency in [0.02, 0.3, 200.0]:
+        metrics.record_measure(llm_measure_name(name, LLM_LATENCY), latency)
+    metrics.record_measure(llm_measure_name(name, LLM_INPUT_TOKENS), 100)
+    metrics.record_measure(llm_measure_name(name, LLM_CACHE_HIT), 1)
+    metrics.record_measure(llm_measure_name(name, LLM_CACHE_MISS), 1)
+    metrics.record_measure(llm_measure_name(name, LLM_CACHE_MISS), 1)
+    # measurements that aren't known are left out
+    metrics.record_measure("rows_processed", 5)
+    metrics.record_measure(llm_measure_name(name, "unknown"), 5)
+
+    llm = metrics.export()["llm"][name]
+    assert llm["calls"] == 3
+    assert llm["input_tokens"] == 100
+    assert llm["cache_hit_ratio"] == 1 / 3
+    latency = llm["latency"]
+    assert latency["count"] == 3
+    assert latency["min"] == 0.02
+    assert latency["max"] == 200.0
+    assert latency["buckets"][0] == {"le": 0.05, "count": 1}
+    assert latency["buckets"][-1] == {"le": None, "count": 1}
+    assert sum(bucket["count"] for bucket in latency["buckets"]) == 3
+    assert llm["limiter_wait"]["count"] == 0
+    assert llm["limiter_wait"]["mean"] is None
+
+    assert len(exporter.records) == 7
+    assert exporter.records[0] == ("graphrag.llm.latency", 0.02, {"llm": name})
+    assert exporter.exported == [metrics.to_dict()]
+
+
+def test_open_telemetry_exporter_uses_counters_and_histograms():
+    meter = FakeMeter()
+    metrics = PipelineMetrics([OpenTelemetryMetricsExporter(meter)])
+    metrics.record_llm("summarize", LLM_LATENCY, 1.5)
+    metrics.record_llm("summarize", LLM_LATENCY, 0.5)
+    metrics.record_llm("summarize", LLM_INPUT_TOKENS, 10)
+    metrics.record_verb("workflow", "0_verb", 1.0, 0.5, 1024 * 1024)
+
+    assert meter.histograms["graphrag.llm.latency"].measurements == [
+        (1.5, {"llm": "summarize"}),
+        (0.5, {"llm": "summarize"}),
+    ]
+    assert meter.counters["graphrag.llm.input_tokens"].measurements == [
+        (10, {"llm": "summarize"})
+    ]
+    assert meter.histograms["graphrag.verb.peak_rss"].measurements == [
+        (1024 * 1024, {"workflow": "workflow", "verb": "0_verb"})
+    ]
+
+
+def measuring_verb(input: VerbInput, callbacks: VerbCallbacks, **_kwargs):
+    callbacks.measure(llm_measure_name("test_llm", LLM_LATENCY), 0.1)
+    return TableContainer(table=input.get_input())
+
+
+async def test_run_pipeline_writes_metrics():
+    storage = MemoryPipelineStorage()
+    exporter = ListExporter()
+    workflows = [
+        PipelineWorkflowReference(
+            name="measured",
+            steps=[
+                {"verb": "measuring_verb", "input": {"source": "source"}},
+                {"verb": "measuring_verb"},
+            ],
+        )
+    ]
+    dataset = pd.DataFrame({"id": ["1"], "text": ["text"], "title": ["title"]})
+    results = [
+        result
+        async for result in run_pipeline(
+            workflows,
+            dataset,
+            storage=storage,
+            additional_verbs={"measuring_verb": measuring_verb},
+            metrics_exporters=[exporter],
+        )
+    ]
+    assert [result.errors for result in results] == [None]
+
+    metrics = json.loads(await storage.get("metrics.json"))
+    verbs = metrics["workflows"]["measured"]["verbs"]
+    assert list(verbs) == ["0_measuring_verb", "1_measuring_verb"]
+    assert verbs["0_measuring_verb"]["wall_time"] >= 0
+    assert metrics["llm"]["test_llm"]["calls"] == 2
+    assert exporter.exported[-1] == metrics
@@ -0,0 +1,265 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import unittest
+from collections.abc import AsyncIterator
+from io import BytesIO
+from typing import cast
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.config import PipelineWorkflowReference
+from graphrag.index.storage import MemoryPipelineStorage
+from graphrag.index.update import (
+    DOCUMENTS_TABLE,
+    get_document_delta,
+    index_in_batches,
+    merge_covariates,
+    merge_extracted_entities,
+    merge_text_units,
+    update_from_previous_run,
+)
+from graphrag.index.utils import load_graph, serialize_graph
+from graphrag.index.verbs.graph.report import PREVIOUS_REPORTS_TABLE
+from graphrag.index.workflows.v1.create_base_extracted_entities import (
+    TEXT_UNIT_GRAPHS_TABLE,
+)
+
+
+class TestIncrementalUpdate(unittest.TestCase):
+    def test_document_delta(self):
+        dataset = pd.DataFrame({"id": ["a", "c", "d"], "text": ["A", "C", "D"]})
+        previous = pd.DataFrame({"id": ["a", "b"]})
+        delta = get_document_delta(dataset, previous)
+        assert delta.new_documents["id"].tolist() == ["c", "d"]
+        assert delta.removed_ids == {"b"}
+
+    def test_merge_text_units_keeps_document_order(self):
+        previous = pd.DataFrame({
+            "id": ["1", "2", "3"],
+            "document_ids": [["a"], ["c"], ["c"]],
+        })
+        delta = pd.DataFrame({"id": ["4", "5"], "document_ids": [["b"], ["d"]]})
+        merged = merge_text_units(previous, delta, {"c"})
+        assert merged["id"].tolist() == ["1", "4", "5"]
+
+    def test_merge_covariates_renumbers(self):
+        previous = pd.DataFrame({
+            "id": ["x", "y"],
+            "human_readable_id": ["1", "2"],
+            "text_unit_id": ["1", "2"],
+        })
+        delta = pd.DataFrame({
+            "id": ["z"],
+            "human_readable_id": ["1"],
+            "text_unit_id": ["3"],
+        })
+        text_units = pd.DataFrame({"id": ["2", "3"]})
+        merged = merge_covariates(previous, delta, text_units)
+        assert merged["id"].tolist() == ["y", "z"]
+        assert merged["human_readable_id"].tolist() == ["1", "2"]
+
+    def test_merge_extracted_entities(self):
+        previous = nx.Graph()
+        previous.add_node("A", description="first", source_id="1")
+        previous.add_edge("A", "B", weight=1.0, description="ab", source_id="1")
+        delta = nx.Graph()
+        delta.add_node("A", description="second", source_id="2")
+        delta.add_edge("A", "B", weight=2.0, description="ab again", source_id="2")
+
+        merged = merge_extracted_entities(
+            pd.DataFrame({"entity_graph": [serialize_graph(previous)]}),
+            pd.DataFrame({"entity_graph": [serialize_graph(delta)]}),
+        )
+        graph = load_graph(cast(bytes, merged["entity_graph"].iloc[0]))
+        assert graph.nodes["A"]["description"] == "first\nsecond"
+        assert graph.edges["A", "B"]["weight"] == 3.0
+
+
+async def test_index_in_batches():
+    workflows = [
+        PipelineWorkflowReference(
+            name="create_base_text_units", config={"chunk_by": ["id"]}
+        ),
+        PipelineWorkflowReference(name="create_base_extracted_entities"),
+        PipelineWorkflowReference(name="create_final_covariates"),
+    ]
+
+    async def batches() -> AsyncIterator[pd.DataFrame]:  # noqa RUF029 async is required for interface
+        yield pd.DataFrame({"id": ["c", "d"], "text": ["C", "D"]})
+        yield pd.DataFrame({"id": ["a"], "text": ["A"]})
+
+    async def run_delta(
+        delta_workflows: list[PipelineWorkflowReference], documents: pd.DataFrame
+    ) -> MemoryPipelineStorage:
+        assert [workflow.name for workflow in delta_workflows] == [
+            "create_base_text_units",
+            "create_base_extracted_entities",
+            "create_final_covariates",
+        ]
+        ids = documents["id"].tolist()
+        text_units = pd.DataFrame({
+            "id": [f"unit-{id}" for id in ids],
+            "document_ids": [[id] for id in ids],
+        })
+        # the status of the first batch is empty, so its column has no type
+        covariates = pd.DataFrame({
+            "id": [f"claim-{id}" for id in ids],
+            "human_readable_id": ["1"] * len(ids),
+            "text_unit_id": [f"unit-{id}" for id in ids],
+            "status": [None if "c" in ids else "TRUE"] * len(ids),
+        })
+        graph = nx.Graph()
+        for id, text in zip(ids, documents["text"], strict=True):
+            graph.add_node("X", description=text, source_id=id)
+        storage = MemoryPipelineStorage()
+        await storage.set("create_base_text_units.parquet", text_units.to_parquet())
+        await storage.set("create_final_covariates.parquet", covariates.to_parquet())
+        await storage.set(
+            "create_base_extracted_entities.parquet",
+            pd.DataFrame({"entity_graph": [serialize_graph(graph)]}).to_parquet(),
+        )
+        return storage
+
+    storage = MemoryPipelineStorage()
+    num_documents, indexed = await index_in_batches(
+        workflows, batches(), storage, run_delta
+    )
+    assert num_documents == 3
+    assert indexed == {
+        "create_base_text_units",
+        "create_base_extracted_entities",
+        "create_final_covariates",
+    }
+
+    async def load(name: str) -> pd.DataFrame:
+        return pd.read_parquet(BytesIO(await storage.get(name, as_bytes=True)))
+
+    documents = await load(f"{DOCUMENTS_TABLE}.parquet")
+    assert documents["id"].tolist() == ["c", "d", "a"]
+    assert not await storage.has(f"{DOCUMENTS_TABLE}.part-00000.parquet")
+
+    text_units = await load("create_base_text_units.parquet")
+    assert text_units["id"].tolist() == ["unit-c", "unit-d", "unit-a"]
+    assert text_units["document_ids"].map(list).tolist() == [["c"], ["d"], ["a"]]
+    covariates = await load("create_final_covariates.parquet")
+    assert covariates["human_readable_id"].tolist() == ["1", "2", "3"]
+    assert covariates["status"].tolist() == [None, None, "TRUE"]
+    entities = await load("create_base_extracted_entities.parquet")
+    graph = load_graph(cast(bytes, entities["entity_graph"].iloc[0]))
+    assert graph.nodes["X"]["description"] == "D\nA"
+
+
+async def test_index_in_batches_full_index():
+    workflows = [PipelineWorkflowReference(name="create_base_text_units")]
+
+    async def batches() -> AsyncIterator[pd.DataFrame]:  # noqa RUF029 async is required for interface
+        yield pd.DataFrame({"id": ["c"], "text": ["C"]})
+        yield pd.DataFrame({"id": ["a"], "text": ["A"]})
+
+    async def run_delta(*_args) -> MemoryPipelineStorage:  # noqa RUF029 async is required for interface
+        msg = "the documents are indexed by a full index"
+        raise AssertionError(msg)
+
+    storage = MemoryPipelineStorage()
+    num_documents, indexed = await index_in_batches(
+        workflows, batches(), storage, run_delta
+    )
+    assert (num_documents, indexed) == (2, set())
+    documents = pd.read_parquet(
+        BytesIO(await storage.get(f"{DOCUMENTS_TABLE}.parquet", as_bytes=True))
+    )
+    assert documents["text"].tolist() == ["C", "A"]
+
+
+async def test_update_drops_the_graphs_of_removed_documents():
+    workflows = [
+        PipelineWorkflowReference(
+            name="create_base_text_units", config={"chunk_by": ["id"]}
+        ),
+        PipelineWorkflowReference(name="create_base_extracted_entities"),
+    ]
+
+    def text_unit_graph(id: str, nodes: list[str]) -> dict:
+        graph = nx.Graph()
+        for node in nodes:
+            graph.add_node(node, description=id.upper(), source_id=f"unit-{id}")
+        return {
+            "id": f"unit-{id}",
+            "document_ids": [id],
+            "entity_graph": serialize_graph(graph),
+        }
+
+    def graphs_table(ids: list[str]) -> pd.DataFrame:
+        nodes = {"a": ["X"], "b": ["X", "Y"], "c": ["X"]}
+        return pd.DataFrame([text_unit_graph(id, nodes[id]) for id in ids])
+
+    previous_storage = MemoryPipelineStorage()
+    previous_tables = {
+        "create_base_documents": pd.DataFrame({"id": ["a", "b"]}),
+        "create_base_text_units": graphs_table(["a", "b"])[["id", "document_ids"]],
+        "create_base_extracted_entities": merge_extracted_entities(
+            graphs_table(["a", "b"]), None
+        ),
+        TEXT_UNIT_GRAPHS_TABLE: graphs_table(["a", "b"]),
+        "create_final_nodes": pd.DataFrame({
+            "title": ["X", "Y"],
+            "community": ["0", "0"],
+            "level": [0, 0],
+        }),
+        "create_final_community_reports": pd.DataFrame({
+            "community": ["0"],
+            "level": [0],
+            "title": ["report"],
+            "id": ["report-id"],
+        }),
+    }
+    for name, table in previous_tables.items():
+        await previous_storage.set(f"{name}.parquet", table.to_parquet())
+
+    async def run_delta(
+        delta_workflows: list[PipelineWorkflowReference], documents: pd.DataFrame
+    ) -> MemoryPipelineStorage:
+        # the entities of the removed document are dropped, not extracted again
+        assert [workflow.name for workflow in delta_workflows] == [
+            "create_base_text_units",
+            "create_base_extracted_entities",
+        ]
+        assert documents["id"].tolist() == ["c"]
+        graphs = graphs_table(["c"])
+        storage = MemoryPipelineStorage()
+        await storage.set(
+            "create_base_text_units.parquet",
+            graphs[["id", "document_ids"]].to_parquet(),
+        )
+        await storage.set(f"{TEXT_UNIT_GRAPHS_TABLE}.parquet", graphs.to_parquet())
+        await storage.set(
+            "create_base_extracted_entities.parquet",
+            merge_extracted_entities(graphs, None).to_parquet(),
+        )
+        return storage
+
+    storage = MemoryPipelineStorage()
+    indexed = await update_from_previous_run(
+        workflows,
+        pd.DataFrame({"id": ["a", "c"], "text": ["A", "C"]}),
+        storage,
+        previous_storage,
+        run_delta,
+    )
+    assert indexed == {"create_base_text_units", "create_base_extracted_entities"}
+
+    async def load(name: str) -> pd.DataFrame:
+        return pd.read_parquet(BytesIO(await storage.get(name, as_bytes=True)))
+
+    entities = await load("create_base_extracted_entities.parquet")
+    graph = load_graph(cast(bytes, entities["entity_graph"].iloc[0]))
+    assert list(graph.nodes) == ["X"]
+    assert graph.nodes["X"]["description"] == "A\nC"
+    graphs = await load(f"{TEXT_UNIT_GRAPHS_TABLE}.parquet")
+    assert graphs["id"].tolist() == ["unit-a", "unit-c"]
+
+    previous_reports = await load(f"{PREVIOUS_REPORTS_TABLE}.parquet")
+    assert previous_reports["title"].tolist() == ["report"]
+    assert previous_reports["members"].map(list).tolist() == [["X", "Y"]]
+    assert "id" not in previous_reports.columns
@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import unittest
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.utils import (
+    graph_to_graphml,
+    graphs_to_graphml,
+    load_graph,
+    serialize_graph,
+)
+
+
+class TestGraphSerialization(unittest.TestCase):
+    def test_round_trip_matches_graphml(self):
+        graph = self._create_graph()
+        serialized = serialize_graph(graph)
+        assert isinstance(serialized, bytes)
+
+        from_bytes = load_graph(serialized)
+        from_graphml = load_graph("\n".join(nx.generate_graphml(graph)))
+
+        assert list(from_bytes.nodes(data=True)) == list(from_graphml.nodes(data=True))
+        assert list(from_bytes.edges(data=True)) == list(from_graphml.edges(data=True))
+
+    def test_directed_graph_is_preserved(self):
+        graph = nx.DiGraph()
+        graph.add_edge("B", "A", weight=1.0)
+        loaded = load_graph(serialize_graph(graph))
+        assert loaded.is_directed()
+        assert list(loaded.edges) == [("B", "A")]
+
+    def test_empty_graph(self):
+        loaded = load_graph(serialize_graph(nx.Graph()))
+        assert len(loaded.nodes) == 0
+        assert len(loaded.edges) == 0
+
+    def test_mixed_attribute_types_fall_back_to_graphml(self):
+        graph = nx.Graph()
+        graph.add_node("A", value="text")
+        graph.add_node("B", value=1)
+        serialized = serialize_graph(graph)
+        assert isinstance(serialized, str)
+        assert load_graph(serialized).nodes["A"]["value"] == "text"
+
+    def test_graphml_export(self):
+        graph = self._create_graph()
+        exported = graph_to_graphml(serialize_graph(graph))
+        assert exported == "\n".join(nx.generate_graphml(graph))
+
+    def test_table_export_converts_graph_columns(self):
+        graph = self._create_graph()
+        table = pd.DataFrame({"id": [1], "graph": [serialize_graph(graph)]})
+        exported = graphs_to_graphml(table)
+        assert exported["graph"][0] == "\n".join(nx.generate_graphml(graph))
+        assert isinstance(table["graph"][0], bytes)
+
+    def _create_graph(self) -> nx.Graph:
+        graph = nx.Graph()
+        graph.add_node("A", type="PERSON", description="a person", degree=2)
+        graph.add_node("B", type="ORGANIZATION", source_id="1,2")
+        graph.add_node("C")
+        graph.add_edge("A", "B", weight=2.0, description="works at")
+        graph.add_edge("C", "A", weight=1.0, source_id="3")
+        return graph
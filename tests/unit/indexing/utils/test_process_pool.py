@@ -0,0 +1,37 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import os
+import unittest
+
+from graphrag.index.utils import map_in_processes
+
+
+def scale(item: int, shared: int) -> int:
+    return item * shared
+
+
+def process_id(_item: int, _shared: None) -> int:
+    return os.getpid()
+
+
+class TestMapInProcesses(unittest.TestCase):
+    def test_results_in_item_order(self):
+        items = list(range(50))
+        results = list(map_in_processes(scale, items, 3, shared=2))
+        assert results == [item * 2 for item in items]
+
+    def test_runs_inline_with_one_process(self):
+        results = list(map_in_processes(process_id, range(5), 1))
+        assert results == [os.getpid()] * 5
+
+    def test_runs_inline_with_one_item(self):
+        results = list(map_in_processes(process_id, [0], 4))
+        assert results == [os.getpid()]
+
+    def test_runs_on_worker_processes(self):
+        results = list(map_in_processes(process_id, range(8), 2))
+        assert len(results) == 8
+        assert os.getpid() not in results
+
+    def test_no_items(self):
+        assert list(map_in_processes(scale, [], 4, shared=2)) == []
@@ -0,0 +1,52 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import unittest
+
+import pandas as pd
+
+from graphrag.index.utils import TableCache
+
+
+def table_size(table: pd.DataFrame) -> int:
+    return int(table.memory_usage(index=True, deep=True).sum())
+
+
+class TestTableCache(unittest.TestCase):
+    def test_get_returns_copy(self):
+        table = pd.DataFrame({"id": [1, 2, 3]})
+        cache = TableCache(table_size(table))
+        cache.set("a", table)
+
+        cached = cache.get("a")
+        assert cached is not None
+        cached["id"] = 0
+        cached["extra"] = 1
+        assert table["id"].tolist() == [1, 2, 3]
+        assert "extra" not in table.columns
+
+    def test_evicts_least_recently_used(self):
+        tables = {name: pd.DataFrame({"id": [1, 2, 3]}) for name in ["a", "b", "c"]}
+        cache = TableCache(2 * table_size(tables["a"]))
+        cache.set("a", tables["a"])
+        cache.set("b", tables["b"])
+        cache.get("a")
+        cache.set("c", tables["c"])
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.size == 2 * table_size(tables["a"])
+
+    def test_skips_tables_over_budget(self):
+        cache = TableCache(0)
+        cache.set("a", pd.DataFrame({"id": [1]}))
+        assert cache.get("a") is None
+        assert cache.size == 0
+
+    def test_discard(self):
+        cache = TableCache(1024 * 1024)
+        cache.set("a", pd.DataFrame({"id": [1]}))
+        cache.discard("a")
+        cache.discard("missing")
+        assert cache.get("a") is None
+        assert cache.size == 0
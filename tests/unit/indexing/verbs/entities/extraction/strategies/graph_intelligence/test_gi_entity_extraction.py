@@ -2,8 +2,7 @@
 # Licensed under the MIT License
 import unittest
 
-import networkx as nx
-
+from graphrag.index.utils import load_graph
 from graphrag.index.verbs.entities.extraction.strategies.graph_intelligence.run_graph_intelligence import (
     Document,
     run_extract_entities,
@@ -117,8 +116,8 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
 
         # self.assertItemsEqual isn't available yet, or I am just silly
         # so we sort the lists and compare them
-        assert results.graphml_graph is not None, "No graphml graph returned!"
-        graph = nx.parse_graphml(results.graphml_graph)  # type: ignore
+        assert results.graph is not None, "No graph returned!"
+        graph = load_graph(results.graph)
 
         # convert to strings for more visual comparison
         edges_str = sorted([f"{edge[0]} -> {edge[1]}" for edge in graph.edges])
@@ -160,8 +159,8 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             ),
         )
 
-        assert results.graphml_graph is not None, "No graphml graph returned!"
-        graph = nx.parse_graphml(results.graphml_graph)  # type: ignore
+        assert results.graph is not None, "No graph returned!"
+        graph = load_graph(results.graph)
 
         # TODO: The edges might come back in any order, but we're assuming they're coming
         # back in the order that we passed in the docs, that might not be true
@@ -172,7 +171,7 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             graph.nodes["TEST_ENTITY_2"].get("source_id") == "1"
         )  # TEST_ENTITY_2 should be in just 1
         assert sorted(
-            graph.nodes["TEST_ENTITY_1"].get("source_id").split(",")
+            graph.nodes["TEST_ENTITY_1"].get("source_id").split(",")  # type: ignore
         ) == sorted(["1", "2"])  # TEST_ENTITY_1 should be 1 and 2
 
     async def test_run_extract_entities_multiple_documents_correct_edge_source_ids_mapped(
@@ -208,8 +207,8 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             ),
         )
 
-        assert results.graphml_graph is not None, "No graphml graph returned!"
-        graph = nx.parse_graphml(results.graphml_graph)  # type: ignore
+        assert results.graph is not None, "No graph returned!"
+        graph = load_graph(results.graph)
         edges = list(graph.edges(data=True))
 
         # should only have 2 edges
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import unittest
+from typing import cast
+from unittest import mock
+
+import networkx as nx
+import pandas as pd
+from datashaper import NoopVerbCallbacks, TableContainer, VerbInput
+
+from graphrag.index.cache import InMemoryCache
+from graphrag.index.utils import load_graph
+from graphrag.index.verbs.entities.summarize import description_summarize
+from graphrag.index.verbs.entities.summarize.strategies.typing import (
+    SummarizedDescriptionResult,
+)
+
+
+def create_graph(descriptions: dict[str, str], edge_description: str) -> str:
+    graph = nx.Graph()
+    for node, description in descriptions.items():
+        graph.add_node(node, description=description)
+    graph.add_edge("A", "B", description=edge_description)
+    return "\n".join(nx.generate_graphml(graph))
+
+
+class TestSummarizeDescriptions(unittest.IsolatedAsyncioTestCase):
+    async def summarize(self, graphs: list[str]) -> tuple[list[nx.Graph], list]:
+        calls = []
+
+        async def strategy(items, descriptions, *_):  # noqa: RUF029
+            calls.append((items, descriptions))
+            return SummarizedDescriptionResult(
+                items=items, description=f"summary of {' + '.join(descriptions)}"
+            )
+
+        with mock.patch.object(
+            description_summarize, "load_strategy", return_value=strategy
+        ):
+            result = await description_summarize.summarize_descriptions(
+                input=VerbInput(
+                    source=TableContainer(table=pd.DataFrame({"graph": graphs}))
+                ),
+                cache=InMemoryCache(),
+                callbacks=NoopVerbCallbacks(),
+                column="graph",
+                to="summarized",
+            )
+        table = cast(pd.DataFrame, result.table)
+        return [load_graph(graph) for graph in table["summarized"]], calls
+
+    async def test_single_descriptions_are_not_summarized(self):
+        graph = create_graph({"A": "a\na", "B": ""}, "ab")
+        [summarized], calls = await self.summarize([graph])
+
+        assert calls == []
+        assert summarized.nodes["A"]["description"] == "a"
+        assert summarized.nodes["B"]["description"] == ""
+        assert summarized.edges["A", "B"]["description"] == "ab"
+
+    async def test_repeated_items_are_summarized_once(self):
+        graphs = [
+            create_graph({"A": "a2\na1", "B": "b1\nb2"}, "ab"),
+            create_graph({"A": "a1\na2", "B": "b1\nb3"}, "ab"),
+        ]
+        summarized, calls = await self.summarize(graphs)
+
+        assert sorted(calls) == [
+            ("A", ["a1", "a2"]),
+            ("B", ["b1", "b2"]),
+            ("B", ["b1", "b3"]),
+        ]
+        for graph in summarized:
+            assert graph.nodes["A"]["description"] == "summary of a1 + a2"
+            assert graph.edges["A", "B"]["description"] == "ab"
+        assert summarized[0].nodes["B"]["description"] == "summary of b1 + b2"
+        assert summarized[1].nodes["B"]["description"] == "summary of b1 + b3"
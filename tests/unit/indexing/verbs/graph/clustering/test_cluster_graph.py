@@ -0,0 +1,155 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import importlib
+import random
+import unittest
+from typing import cast
+from unittest import mock
+
+import networkx as nx
+import pandas as pd
+from datashaper import NoopVerbCallbacks, TableContainer, VerbInput
+from graspologic.partition import hierarchical_leiden
+
+from graphrag.index.cache import JsonPipelineCache, PipelineCache
+from graphrag.index.graph.utils import stable_largest_connected_component
+from graphrag.index.storage import MemoryPipelineStorage
+from graphrag.index.utils import load_graph
+
+# the clustering package exports the verb under the name of its module
+cluster_graph_module = importlib.import_module(
+    "graphrag.index.verbs.graph.clustering.cluster_graph"
+)
+STRATEGY = {"type": "leiden", "max_cluster_size": 3}
+
+
+def create_graph(edges: list[tuple[str, str]]) -> str:
+    # the node names are normalized like those of the entity graphs
+    return "\n".join(nx.generate_graphml(nx.Graph(edges)))
+
+
+class TestClusterGraph(unittest.IsolatedAsyncioTestCase):
+    async def cluster(
+        self, graphs: list[str], cache: PipelineCache, strategy: dict
+    ) -> tuple[pd.DataFrame, int]:
+        with mock.patch.object(
+            cluster_graph_module, "run_layout", wraps=cluster_graph_module.run_layout
+        ) as run_layout:
+            result = await cluster_graph_module.cluster_graph(
+                input=VerbInput(
+                    source=TableContainer(table=pd.DataFrame({"graph": graphs}))
+                ),
+                cache=cache,
+                callbacks=NoopVerbCallbacks(),
+                strategy=strategy,
+                column="graph",
+                to="clustered_graph",
+                level_to="level",
+            )
+        return cast(pd.DataFrame, result.table), run_layout.call_count
+
+    async def test_cached_communities_skip_clustering(self):
+        graphs = [
+            create_graph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("E", "A")]),
+            create_graph([("X", "Y")]),
+        ]
+        # the communities go through JSON, as with the file cache
+        cache = JsonPipelineCache(MemoryPipelineStorage())
+        first, calls = await self.cluster(graphs, cache, STRATEGY)
+        assert calls == 2
+
+        second, calls = await self.cluster(graphs, cache, STRATEGY)
+        assert calls == 0
+        pd.testing.assert_frame_equal(first, second)
+
+    async def test_changed_graphs_and_strategies_are_clustered_again(self):
+        cache = JsonPipelineCache(MemoryPipelineStorage())
+        await self.cluster([create_graph([("A", "B")])], cache, STRATEGY)
+
+        _, calls = await self.cluster(
+            [create_graph([("A", "B"), ("B", "C")])], cache, STRATEGY
+        )
+        assert calls == 1
+
+        _, calls = await self.cluster(
+            [create_graph([("A", "B")])], cache, {**STRATEGY, "seed": 1}
+        )
+        assert calls == 1
+
+    async def test_unchanged_components_keep_their_communities(self):
+        cache = JsonPipelineCache(MemoryPipelineStorage())
+        strategy = {**STRATEGY, "use_lcc": False}
+        ring = [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("E", "A")]
+
+        def ring_communities(table: pd.DataFrame) -> dict[int, set[frozenset[str]]]:
+            communities: dict[int, set[frozenset[str]]] = {}
+            for level, graph in zip(
+                table["level"], table["clustered_graph"], strict=True
+            ):
+                clusters: dict[str, set[str]] = {}
+                for node, data in load_graph(graph).nodes(data=True):
+                    if node in "ABCDE" and "cluster" in data:
+                        clusters.setdefault(data["cluster"], set()).add(node)
+                communities[level] = {frozenset(nodes) for nodes in clusters.values()}
+            return communities
+
+        first, calls = await self.cluster(
+            [create_graph([*ring, ("X", "Y")])], cache, strategy
+        )
+        assert calls == 2
+
+        second, calls = await self.cluster(
+            [create_graph([*ring, ("X", "Y"), ("Y", "Z")])], cache, strategy
+        )
+        assert calls == 1
+        assert ring_communities(second) == ring_communities(first)
+
+    async def test_clustering_version_is_part_of_the_key(self):
+        cache = JsonPipelineCache(MemoryPipelineStorage())
+        graphs = [create_graph([("A", "B")])]
+        await self.cluster(graphs, cache, STRATEGY)
+
+        with mock.patch.object(
+            cluster_graph_module,
+            "CLUSTERING_VERSION",
+            cluster_graph_module.CLUSTERING_VERSION + 1,
+        ):
+            _, calls = await self.cluster(graphs, cache, STRATEGY)
+        assert calls == 1
+
+    async def test_self_loops_are_clustered_like_the_networkx_graph(self):
+        rng = random.Random(0)
+        names = [f"ENTITY_{i}" for i in range(60)]
+        graph = nx.Graph()
+        for _ in range(150):
+            graph.add_edge(*rng.sample(names, 2), weight=rng.randint(1, 5))
+        for name in names[::4]:
+            graph.add_edge(name, name, weight=rng.randint(1, 5))
+        strategy = {"type": "leiden", "max_cluster_size": 10}
+
+        expected: dict[int, dict[str, str]] = {}
+        for partition in hierarchical_leiden(
+            stable_largest_connected_component(graph),
+            max_cluster_size=10,
+            random_seed=0xDEADBEEF,
+        ):
+            expected.setdefault(partition.level, {})[partition.node] = str(
+                partition.cluster
+            )
+
+        table, _ = await self.cluster(
+            ["\n".join(nx.generate_graphml(graph))],
+            JsonPipelineCache(MemoryPipelineStorage()),
+            strategy,
+        )
+        clustered = {
+            level: {
+                node: data["cluster"]
+                for node, data in load_graph(graph).nodes(data=True)
+                if "cluster" in data
+            }
+            for level, graph in zip(
+                table["level"], table["clustered_graph"], strict=True
+            )
+        }
+        assert clustered == expected
@@ -0,0 +1,132 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import random
+import unittest
+
+import networkx as nx
+
+from graphrag.index.verbs.graph.merge.defaults import (
+    DEFAULT_EDGE_OPERATIONS,
+    DEFAULT_NODE_OPERATIONS,
+)
+from graphrag.index.verbs.graph.merge.merge_graphs import (
+    _get_detailed_attribute_merge_operation,
+    merge_all_graphs,
+    merge_edges,
+    merge_nodes,
+)
+
+NODE_OPERATIONS = {
+    "source_id": {"operation": "concat", "delimiter": ", ", "distinct": True},
+    "description": {"operation": "concat", "separator": "\n", "distinct": False},
+    "type": "replace",
+    "degree": "max",
+    "rank": "min",
+    "score": "average",
+    "*": "skip",
+}
+
+EDGE_OPERATIONS = {
+    "weight": "sum",
+    "factor": "multiply",
+    "source_id": {"operation": "concat", "distinct": True},
+    "*": "replace",
+}
+
+
+def create_graphs(seed: int) -> list[nx.Graph]:
+    rng = random.Random(seed)
+    names = [f"N{i}" for i in range(12)]
+    graphs = []
+    for _ in range(30):
+        graph = nx.Graph()
+        for name in rng.sample(names, 5):
+            attributes = {
+                "source_id": ",".join(rng.sample(["a", "b", "c", "d"], 2)),
+                "description": rng.choice(["x", "y", "", None]),
+                "type": rng.choice(["ORG", "PERSON", ""]),
+                "degree": rng.randint(0, 5),
+                "rank": rng.random(),
+                "score": rng.choice([rng.random(), None]),
+                "extra": rng.choice(["e1", "e2"]),
+            }
+            if rng.random() < 0.1:
+                attributes = {}
+            # attributes missing from some records are only added by later merges
+            graph.add_node(
+                name, **{k: v for k, v in attributes.items() if rng.random() < 0.8}
+            )
+        nodes = list(graph.nodes)
+        for _ in range(6):
+            source, target = rng.sample(nodes, 2)
+            graph.add_edge(
+                source,
+                target,
+                weight=rng.random(),
+                factor=rng.choice([2, 0.5, None]),
+                source_id=rng.choice(["a", "b,c"]),
+                description=rng.choice(["r1", "r2"]),
+            )
+        graphs.append(graph)
+    return graphs
+
+
+def merge_one_at_a_time(graphs, node_ops, edge_ops) -> nx.Graph:
+    merged = nx.Graph()
+    for graph in graphs:
+        merge_nodes(merged, graph, node_ops)
+        merge_edges(merged, graph, edge_ops)
+    return merged
+
+
+def detailed(operations: dict) -> dict:
+    return {
+        attrib: _get_detailed_attribute_merge_operation(value)
+        for attrib, value in operations.items()
+    }
+
+
+class TestMergeAllGraphs(unittest.TestCase):
+    def assert_identical(self, expected: nx.Graph, actual: nx.Graph):
+        assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+        for node in expected.nodes:
+            # the attribute order is part of the serialized graph
+            assert list(actual.nodes[node]) == list(expected.nodes[node])
+
+    def test_matches_merging_one_graph_at_a_time(self):
+        node_ops = detailed(NODE_OPERATIONS)
+        edge_ops = detailed(EDGE_OPERATIONS)
+        for seed in range(5):
+            graphs = create_graphs(seed)
+            self.assert_identical(
+                merge_one_at_a_time(graphs, node_ops, edge_ops),
+                merge_all_graphs(graphs, node_ops, edge_ops),
+            )
+
+    def test_matches_merging_one_graph_at_a_time_with_default_operations(self):
+        node_ops = detailed(DEFAULT_NODE_OPERATIONS)
+        edge_ops = detailed(DEFAULT_EDGE_OPERATIONS)
+        graphs = create_graphs(42)
+        self.assert_identical(
+            merge_one_at_a_time(graphs, node_ops, edge_ops),
+            merge_all_graphs(graphs, node_ops, edge_ops),
+        )
+
+    def test_distinct_concat(self):
+        ops = detailed({"source_id": {"operation": "concat", "distinct": True}})
+        graphs = []
+        for source_id in ["b,a", "a", "c,b", "a"]:
+            graph = nx.Graph()
+            graph.add_node("node", source_id=source_id)
+            graphs.append(graph)
+        merged = merge_all_graphs(graphs, ops, {})
+        assert merged.nodes["node"]["source_id"] == "a,b,c"
+
+    def test_reversed_edges_are_the_same_edge(self):
+        first = nx.Graph()
+        first.add_edge("a", "b", weight=1.0)
+        second = nx.DiGraph()
+        second.add_edge("b", "a", weight=2.0)
+        merged = merge_all_graphs([first, second], {}, detailed({"weight": "sum"}))
+        assert list(merged.edges(data=True)) == [("a", "b", {"weight": 3.0})]
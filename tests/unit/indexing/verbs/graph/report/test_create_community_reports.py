@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import importlib
+from typing import cast
+from unittest import mock
+
+import pandas as pd
+from datashaper import NoopVerbCallbacks, TableContainer, VerbInput
+
+from graphrag.index.cache import InMemoryCache
+from graphrag.index.storage import MemoryPipelineStorage
+from graphrag.index.verbs.graph.report import (
+    PREVIOUS_REPORTS_TABLE,
+    get_community_members,
+    restore_community_hierarchy,
+)
+
+from .test_prepare_community_reports import create_tables, prepare
+
+# the report package exports the verb under the name of its module
+create_community_reports_module = importlib.import_module(
+    "graphrag.index.verbs.graph.report.create_community_reports"
+)
+
+
+def create_report(community: str, level: int, title: str) -> dict:
+    return {
+        "community": community,
+        "title": title,
+        "summary": f"{title} summary",
+        "full_content": f"# {title}",
+        "full_content_json": "{}",
+        "rank": 1.0,
+        "level": level,
+        "rank_explanation": "",
+        "findings": [{"summary": title, "explanation": title}],
+    }
+
+
+async def create_reports(storage: MemoryPipelineStorage) -> tuple[pd.DataFrame, list]:
+    nodes, _, _ = create_tables()
+    generated = []
+
+    async def run(community, _context, level, *_args):  # noqa RUF029 async is required for interface
+        generated.append((level, community))
+        return create_report(community, level, "generated")
+
+    with mock.patch.object(
+        create_community_reports_module, "load_strategy", return_value=run
+    ):
+        result = await create_community_reports_module.create_community_reports(
+            input=VerbInput(
+                source=TableContainer(table=prepare(1)),
+                named={
+                    "nodes": TableContainer(table=nodes),
+                    "community_hierarchy": restore_community_hierarchy(
+                        VerbInput(source=TableContainer(table=nodes))
+                    ),
+                },
+            ),
+            callbacks=NoopVerbCallbacks(),
+            cache=InMemoryCache(),
+            storage=storage,
+            strategy={"type": "graph_intelligence"},
+        )
+    return cast(pd.DataFrame, result.table), generated
+
+
+async def test_reports_of_unchanged_communities_are_copied():
+    nodes, _, _ = create_tables()
+    members = get_community_members(nodes)
+    previous = members[members["community"] == "0"]
+    # the same members, but another community id in the previous run
+    previous_reports = pd.DataFrame([
+        {**create_report("7", level, "previous"), "members": names}
+        for level, names in zip(previous["level"], previous["members"], strict=True)
+    ])
+    storage = MemoryPipelineStorage()
+    await storage.set(
+        f"{PREVIOUS_REPORTS_TABLE}.parquet", previous_reports.to_parquet()
+    )
+
+    reports, generated = await create_reports(storage)
+    assert len(reports) == len(members)
+    assert len(generated) == len(members) - 2
+    assert (0, "0") not in generated
+    assert (1, "0") not in generated
+
+    copied = reports[reports["title"] == "previous"]
+    assert sorted(zip(copied["level"], copied["community"], strict=True)) == [
+        (0, "0"),
+        (1, "0"),
+    ]
+    assert (
+        copied["findings"].tolist()
+        == [[{"summary": "previous", "explanation": "previous"}]] * 2
+    )
+
+
+async def test_every_community_is_reported_without_previous_reports():
+    reports, generated = await create_reports(MemoryPipelineStorage())
+    assert (
+        len(generated) == len(reports) == len(get_community_members(create_tables()[0]))
+    )
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import random
+
+import pandas as pd
+
+from graphrag.index.verbs.graph.report.prepare_community_reports import (
+    _community_shards,
+    _prepare_reports_in_process,
+)
+
+
+def create_tables() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    rng = random.Random(0)
+    names = [f"ENTITY_{i}" for i in range(40)]
+    nodes = [
+        {
+            "title": name,
+            "community": str(index // size),
+            "level": level,
+            "degree": rng.randint(1, 5),
+            "node_details": {
+                "human_readable_id": index,
+                "title": name,
+                "description": f"{name} description",
+                "degree": 1,
+            },
+        }
+        for level, size in enumerate([8, 3])
+        for index, name in enumerate(names)
+    ]
+    edges = []
+    for index in range(80):
+        source, target = rng.sample(names, 2)
+        edges.append({
+            "source": source,
+            "target": target,
+            "edge_details": {
+                "human_readable_id": index,
+                "source": source,
+                "target": target,
+                "description": f"{source} and {target}",
+                "rank": rng.randint(1, 10),
+            },
+        })
+    claims = [
+        {
+            "subject_id": name,
+            "claim_details": {
+                "human_readable_id": index,
+                "subject_id": name,
+                "type": "CLAIM",
+                "status": "TRUE",
+                "description": f"a claim on {name}",
+            },
+        }
+        for index, name in enumerate(names[::3])
+    ]
+    return pd.DataFrame(nodes), pd.DataFrame(edges), pd.DataFrame(claims)
+
+
+def prepare(num_processes: int) -> pd.DataFrame:
+    node_df, edge_df, claim_df = create_tables()
+    shards = _community_shards(node_df, num_processes)
+    return pd.concat(
+        [
+            _prepare_reports_in_process(shard, (node_df, edge_df, claim_df, 16_000))
+            for shard in shards
+        ],
+        ignore_index=True,
+    )
+
+
+def test_community_shards_split_the_levels():
+    node_df, _, _ = create_tables()
+    assert _community_shards(node_df, 1) == [(1, None), (0, None)]
+
+    # with 4 processes there are up to 16 shards per level, so one per community
+    shards = _community_shards(node_df, 4)
+    assert shards[:3] == [
+        (1, ["0"]),
+        (1, ["1"]),
+        (1, ["10"]),
+    ]
+    assert [level for level, _ in shards] == [1] * 14 + [0] * 5
+
+
+def test_sharded_communities_have_the_same_contexts():
+    pd.testing.assert_frame_equal(prepare(4), prepare(1))
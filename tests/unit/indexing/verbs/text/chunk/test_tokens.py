@@ -0,0 +1,68 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import random
+
+import pytest
+import tiktoken
+from datashaper import ProgressTicker
+
+from graphrag.index.text_splitting import Tokenizer
+from graphrag.index.verbs.text.chunk.strategies.tokens import run, split_text_on_tokens
+from graphrag.index.verbs.text.chunk.typing import TextChunk
+
+WORDS = ["graph", "community", "report", "entity", "the", "of", ",", "."]
+
+
+def split_tuples(texts: list[str], size: int, overlap: int) -> list[TextChunk]:
+    """Chunk texts from a list of (doc, token) tuples, as the strategy used to."""
+    enc = tiktoken.get_encoding("cl100k_base")
+    input_ids = [
+        (doc_idx, id) for doc_idx, text in enumerate(texts) for id in enc.encode(text)
+    ]
+    result = []
+    for start in range(0, len(input_ids), size - overlap):
+        chunk_ids = input_ids[start : start + size]
+        result.append(
+            TextChunk(
+                text_chunk=enc.decode([id for _, id in chunk_ids]),
+                source_doc_indices=list({doc_idx for doc_idx, _ in chunk_ids}),
+                n_tokens=len(chunk_ids),
+            )
+        )
+    return result
+
+
+def test_chunks_span_documents():
+    texts = ["one two three", "", "four five", "six"]
+    chunks = list(
+        run(texts, {"chunk_size": 4, "chunk_overlap": 1}, ProgressTicker(None, 0))
+    )
+    assert [chunk.text_chunk for chunk in chunks] == [
+        "one two threefour",
+        "four fivesix",
+    ]
+    assert [chunk.source_doc_indices for chunk in chunks] == [[0, 2], [2, 3]]
+    assert [chunk.n_tokens for chunk in chunks] == [4, 3]
+
+
+def test_chunks_match_token_tuples():
+    rng = random.Random(0)
+    for _ in range(50):
+        texts = [
+            " ".join(rng.choices(WORDS, k=rng.choice([0, 1, 5, 50])))
+            for _ in range(rng.randint(0, 20))
+        ]
+        size = rng.randint(1, 30)
+        overlap = rng.randint(0, size - 1)
+        args = {"chunk_size": size, "chunk_overlap": overlap}
+        chunks = list(run(texts, args, ProgressTicker(None, 0)))
+        assert chunks == split_tuples(texts, size, overlap)
+
+
+def test_overlap_must_be_smaller_than_the_chunk_size():
+    enc = tiktoken.get_encoding("cl100k_base")
+    tokenizer = Tokenizer(
+        chunk_overlap=10, tokens_per_chunk=10, encode=enc.encode, decode=enc.decode
+    )
+    with pytest.raises(ValueError, match="chunk_overlap"):
+        split_text_on_tokens(["text"], tokenizer, ProgressTicker(None, 0))
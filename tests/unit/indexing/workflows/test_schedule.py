@@ -0,0 +1,94 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import unittest
+
+import pytest
+
+from graphrag.index.workflows import WorkflowToRun, create_workflow, schedule_workflows
+
+from .helpers import mock_verbs
+
+
+def _workflow(name: str) -> WorkflowToRun:
+    return WorkflowToRun(
+        create_workflow(
+            name,
+            [{"verb": "mock_verb", "args": {"column": "test"}}],
+            additional_verbs=mock_verbs,
+        ),
+        config={},
+    )
+
+
+DEPENDENCIES = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+
+
+class TestScheduleWorkflows(unittest.IsolatedAsyncioTestCase):
+    async def _run(self, max_concurrency: int, completed: set[str] | None = None):
+        workflows = [_workflow(name) for name in ["a", "b", "c", "d"]]
+        events: list[str] = []
+        running = 0
+        max_running = 0
+
+        async def run(workflow: WorkflowToRun) -> str:
+            nonlocal running, max_running
+            name = workflow.workflow.name
+            events.append(f"start {name}")
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            events.append(f"end {name}")
+            return name
+
+        results = [
+            result
+            async for _, result in schedule_workflows(
+                workflows, DEPENDENCIES, run, max_concurrency, completed
+            )
+        ]
+        return results, events, max_running
+
+    async def test_sequential_preserves_order(self):
+        results, events, max_running = await self._run(max_concurrency=1)
+        assert results == ["a", "b", "c", "d"]
+        assert max_running == 1
+        assert events[:2] == ["start a", "end a"]
+
+    async def test_independent_workflows_overlap(self):
+        results, events, max_running = await self._run(max_concurrency=4)
+        assert results[0] == "a"
+        assert results[-1] == "d"
+        assert max_running == 2
+        # d only starts once both of its dependencies are done
+        assert events.index("start d") > events.index("end b")
+        assert events.index("start d") > events.index("end c")
+
+    async def test_completed_workflows_are_skipped(self):
+        results, _, _ = await self._run(max_concurrency=2, completed={"a", "b"})
+        assert results == ["c", "d"]
+
+    async def test_failure_cancels_running_workflows(self):
+        workflows = [_workflow(name) for name in ["a", "b"]]
+        cancelled = []
+
+        async def run(workflow: WorkflowToRun) -> None:
+            if workflow.workflow.name == "a":
+                msg = "boom"
+                raise ValueError(msg)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(workflow.workflow.name)
+                raise
+
+        async def consume():
+            async for _ in schedule_workflows(
+                workflows, {"a": [], "b": []}, run, max_concurrency=2
+            ):
+                pass
+
+        with pytest.raises(ValueError, match="boom"):
+            await consume()
+        assert cancelled == ["b"]
@@ -71,3 +71,39 @@ async def test_composite_llm() -> None:
     response = await llm("input 2", history=history)
     history: list[dict] = cast(list[dict], response.history)
     assert len(history) == 4
+
+
+async def test_identical_concurrent_calls_share_one_delegate_call() -> None:
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def counting_responder(input: str, **kwargs: dict) -> LLMOutput:
+        calls.append(input)
+        await release.wait()
+        return LLMOutput(output=f"response to [{input}]")
+
+    hits: list[str] = []
+    cache = TestCache()
+    llm = CachingLLM(
+        cast(CompletionLLM, counting_responder),
+        llm_parameters={},
+        operation="test",
+        cache=cache,
+    )
+    llm.on_cache_hit(lambda key, _name: hits.append(key))
+
+    tasks = [
+        asyncio.create_task(llm(input)) for input in ["input 1", "input 1", "input 2"]
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert sorted(calls) == ["input 1", "input 2"]
+    assert [response.output for response in responses] == [
+        "response to [input 1]",
+        "response to [input 1]",
+        "response to [input 2]",
+    ]
+    assert len(hits) == 1
+    assert len(cache.cache) == 2
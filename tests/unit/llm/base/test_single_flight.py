@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import threading
+
+import pytest
+
+from graphrag.llm.base import SingleFlight
+
+
+async def test_waiting_calls_share_the_error() -> None:
+    flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fail() -> str:
+        await release.wait()
+        raise ValueError
+
+    tasks = [asyncio.create_task(flight.run("key", fail)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+async def test_a_waiting_call_runs_again_when_the_call_is_cancelled() -> None:
+    flight: SingleFlight[str] = SingleFlight()
+    calls = 0
+
+    async def call() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    leader = asyncio.create_task(flight.run("key", call))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(flight.run("key", call))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == "result"
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+def test_calls_from_other_event_loops_share_the_result() -> None:
+    flight: SingleFlight[str] = SingleFlight()
+    started = threading.Event()
+    calls = 0
+
+    async def call() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.1)
+        return "result"
+
+    results: list[str] = []
+
+    def run_in_thread() -> None:
+        started.wait()
+        results.append(asyncio.run(flight.run("key", call)))
+
+    thread = threading.Thread(target=run_in_thread)
+    thread.start()
+    results.append(asyncio.run(flight.run("key", call)))
+    thread.join()
+
+    assert results == ["result", "result"]
+    assert calls == 1
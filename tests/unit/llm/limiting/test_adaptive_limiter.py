@@ -0,0 +1,188 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+import pytest
+
+from graphrag.llm import (
+    AdaptiveLLMLimiter,
+    OpenAIConfiguration,
+    create_openai_chat_llm,
+    create_openai_client,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def acquires(limiter: AdaptiveLLMLimiter, num_tokens: int = 1) -> bool:
+    try:
+        await asyncio.wait_for(limiter.acquire(num_tokens), 0.05)
+    except TimeoutError:
+        return False
+    return True
+
+
+async def test_concurrency_grows_on_success_and_is_cut_on_throttling():
+    clock = FakeClock()
+    limiter = AdaptiveLLMLimiter(concurrency=4, max_concurrency=6, clock=clock)
+    for _ in range(4):
+        assert await acquires(limiter)
+    assert not await acquires(limiter)
+
+    for _ in range(4):
+        limiter.release()
+    for _ in range(4):
+        assert await acquires(limiter)
+        limiter.release()
+    assert limiter.concurrency == 5
+
+    limiter.on_throttled()
+    assert limiter.concurrency == 2
+    # the calls sent before the cut don't cut it again
+    limiter.on_throttled()
+    assert limiter.concurrency == 2
+    clock.now += 2
+    limiter.on_throttled()
+    assert limiter.concurrency == 1
+
+
+async def test_reserved_tokens_are_given_back():
+    limiter = AdaptiveLLMLimiter(tokens_per_minute=600, clock=FakeClock())
+    assert await acquires(limiter, 500)
+    assert not await acquires(limiter, 200)
+    limiter.release(reserved_tokens=500, used_tokens=100)
+    assert await acquires(limiter, 200)
+
+
+async def test_follows_the_rate_limit_headers():
+    clock = FakeClock()
+    limiter = AdaptiveLLMLimiter(clock=clock)
+    limiter.on_response({
+        "x-ratelimit-limit-tokens": "1000",
+        "x-ratelimit-remaining-tokens": "0",
+        "x-ratelimit-reset-tokens": "1m0s",
+    })
+    assert not await acquires(limiter, 100)
+    clock.now += 60
+    assert await acquires(limiter, 1000)
+    limiter.release(1000, 1000)
+    assert not await acquires(limiter, 100)
+    clock.now += 6
+    assert await acquires(limiter, 100)
+
+    limiter.on_response({"Retry-After-Ms": "500"})
+    assert not await acquires(limiter, 0)
+    clock.now += 0.5
+    assert await acquires(limiter, 0)
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Answer chat completions, throttling the requests over the concurrency limit."""
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        server = cast(FakeOpenAIServer, self.server)
+        with server.lock:
+            server.in_flight += 1
+            throttled = server.in_flight > server.max_concurrency
+            server.throttled += throttled
+        try:
+            if throttled:
+                self._send(
+                    429,
+                    {"error": {"message": "Too many requests", "type": "rate_limit"}},
+                    {"retry-after-ms": "20"},
+                )
+                return
+            threading.Event().wait(0.02)
+            self._send(
+                200,
+                {
+                    "id": "chatcmpl-0",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "gpt-4",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "Hello"},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                },
+                {
+                    "x-ratelimit-limit-tokens": "100000",
+                    "x-ratelimit-remaining-tokens": "99000",
+                },
+            )
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _send(self, status: int, body: dict, headers: dict[str, str]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in {**headers, "Content-Type": "application/json"}.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, max_concurrency: int):
+        super().__init__(("127.0.0.1", 0), FakeOpenAIHandler)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def server() -> Iterator[FakeOpenAIServer]:
+    with FakeOpenAIServer(max_concurrency=2) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+async def test_adapts_to_a_throttling_server(server: FakeOpenAIServer):
+    config = OpenAIConfiguration({
+        "api_key": "test",
+        "model": "gpt-4",
+        "api_base": f"http://127.0.0.1:{server.server_address[1]}/v1",
+        "max_tokens": 100,
+        "max_retries": 20,
+        "max_retry_wait": 0.01,
+    })
+    limiter = AdaptiveLLMLimiter(concurrency=8, decrease_cooldown=0.0)
+    llm = create_openai_chat_llm(
+        create_openai_client(config, azure=False), config, limiter=limiter
+    )
+
+    results = await asyncio.gather(*(llm(f"Say hello {i}") for i in range(12)))
+
+    assert [result.output for result in results] == ["Hello"] * 12
+    assert server.throttled > 0
+    assert limiter.concurrency < 8
+    assert limiter.in_flight == 0
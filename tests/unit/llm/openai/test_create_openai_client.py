@@ -0,0 +1,29 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from graphrag.llm import OpenAIConfiguration, create_openai_client
+
+
+def create_configuration(**kwargs) -> OpenAIConfiguration:
+    return OpenAIConfiguration({
+        "api_key": "test",
+        "model": "gpt-4-turbo-preview",
+        "api_base": "http://localhost:1234/v1",
+        **kwargs,
+    })
+
+
+def test_configurations_connecting_the_same_way_share_a_client():
+    client = create_openai_client(create_configuration(temperature=0.0), False)
+    assert (
+        create_openai_client(
+            create_configuration(model="text-embedding-3-small", max_tokens=10),
+            False,
+        )
+        is client
+    )
+    assert create_openai_client(create_configuration(max_connections=7), False) is not (
+        client
+    )
+    assert create_openai_client(create_configuration(api_key="other"), False) is not (
+        client
+    )
@@ -0,0 +1,63 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Tokenizer Tests."""
+
+from unittest import mock
+
+import tiktoken
+
+from graphrag.llm import CachedTokenizer, get_tokenizer
+
+TEXTS = [
+    "The quick brown fox jumps over the lazy dog.",
+    "A longer sentence about graphs, communities and their reports.",
+    "short",
+    "",
+]
+
+
+def test_get_tokenizer_is_shared():
+    tokenizer = get_tokenizer("cl100k_base")
+    assert get_tokenizer() is tokenizer
+    assert get_tokenizer(model="gpt-4") is tokenizer
+    assert get_tokenizer(tiktoken.get_encoding("cl100k_base")) is tokenizer
+    # unknown models fall back to the default encoding
+    assert get_tokenizer(model="unknown-model") is tokenizer
+
+
+def test_num_tokens_matches_the_encoding():
+    encoding = tiktoken.get_encoding("cl100k_base")
+    tokenizer = CachedTokenizer(encoding)
+    for text in TEXTS:
+        assert tokenizer.num_tokens(text) == len(encoding.encode(text))
+    assert tokenizer.num_tokens_batch(TEXTS) == [
+        len(tokens) for tokens in encoding.encode_batch(TEXTS)
+    ]
+    assert tokenizer.encode_batch(TEXTS) == encoding.encode_batch(TEXTS)
+    assert tokenizer.decode(tokenizer.encode(TEXTS[0])) == TEXTS[0]
+
+
+def test_num_tokens_are_cached():
+    tokenizer = CachedTokenizer(tiktoken.get_encoding("cl100k_base"))
+    expected = tokenizer.num_tokens_batch(TEXTS)
+    with mock.patch.object(
+        tokenizer.encoding, "encode", wraps=tokenizer.encoding.encode
+    ) as encode:
+        assert [tokenizer.num_tokens(text) for text in TEXTS] == expected
+        # only the texts too short to cache are encoded again
+        assert encode.call_count == 2
+
+
+def test_least_recently_used_counts_are_dropped():
+    tokenizer = CachedTokenizer(
+        tiktoken.get_encoding("cl100k_base"), max_cached_counts=1
+    )
+    tokenizer.num_tokens(TEXTS[0])
+    tokenizer.num_tokens(TEXTS[1])
+    with mock.patch.object(
+        tokenizer.encoding, "encode", wraps=tokenizer.encoding.encode
+    ) as encode:
+        tokenizer.num_tokens(TEXTS[1])
+        encode.assert_not_called()
+        tokenizer.num_tokens(TEXTS[0])
+        encode.assert_called_once()
@@ -0,0 +1,55 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import numpy as np
+import pandas as pd
+
+from graphrag.model.embedding import encode_embedding
+from graphrag.query.input.loaders.dfs import read_entities
+
+
+def create_entities(embeddings: list) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [f"id{i}" for i in range(len(embeddings))],
+        "title": [f"title{i}" for i in range(len(embeddings))],
+        "type": "entity",
+        "description": "description",
+        "description_embedding": embeddings,
+    })
+
+
+def read_description_embeddings(df: pd.DataFrame) -> list:
+    entities = read_entities(
+        df,
+        short_id_col=None,
+        name_embedding_col=None,
+        graph_embedding_col=None,
+        community_col=None,
+        text_unit_ids_col=None,
+        document_ids_col=None,
+        rank_col=None,
+    )
+    return [entity.description_embedding for entity in entities]
+
+
+def test_read_entities_decodes_int8_embeddings():
+    vectors = [np.array([0.6, -0.8, 0.0]), np.array([0.0, 1.0, 0.0])]
+    embeddings = read_description_embeddings(
+        create_entities([encode_embedding(vector, "int8") for vector in vectors])
+    )
+    for vector, embedding in zip(vectors, embeddings, strict=True):
+        assert embedding.dtype == np.float32
+        np.testing.assert_allclose(embedding, vector, atol=1 / 127)
+
+
+def test_read_entities_keeps_compact_float_embeddings():
+    embeddings = read_description_embeddings(
+        create_entities([
+            np.array([0.5, 0.25], dtype=np.float16),
+            [0.5, 0.25],
+            None,
+        ])
+    )
+    assert embeddings[0].dtype == np.float16
+    assert embeddings[1].dtype == np.float32
+    np.testing.assert_array_equal(embeddings[1], [0.5, 0.25])
+    assert embeddings[2] is None
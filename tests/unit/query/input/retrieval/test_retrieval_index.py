@@ -0,0 +1,70 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import unittest
+import uuid
+
+from graphrag.model import Entity, Relationship, TextUnit
+from graphrag.query.input.retrieval.entities import (
+    get_entity_by_key,
+    get_entity_by_name,
+)
+from graphrag.query.input.retrieval.relationships import get_candidate_relationships
+from graphrag.query.input.retrieval.retrieval_index import RetrievalIndex
+
+
+class TestRetrievalIndex(unittest.TestCase):
+    def setUp(self):
+        self.uuid = str(uuid.uuid4())
+        self.entities = [
+            Entity(id="1", short_id="a", title="A", text_unit_ids=["t1"]),
+            Entity(id=self.uuid.replace("-", ""), short_id="b", title="B"),
+            Entity(id="3", short_id="c", title="A"),
+            Entity(id="4", short_id="d", title="C"),
+        ]
+        self.relationships = [
+            Relationship(id="r1", short_id="r1", source="A", target="B"),
+            Relationship(id="r2", short_id="r2", source="C", target="D"),
+            Relationship(id="r3", short_id="r3", source="B", target="C"),
+            Relationship(id="r4", short_id="r4", source="A", target="A"),
+        ]
+        self.text_units = [
+            TextUnit(id="t2", short_id="2", text="two"),
+            TextUnit(id="t1", short_id="1", text="one"),
+        ]
+        self.index = RetrievalIndex(self.entities, self.relationships, self.text_units)
+
+    def test_entity_by_key_matches_scan(self):
+        for key, value in [
+            ("id", "1"),
+            ("id", self.uuid),
+            ("id", "missing"),
+            ("short_id", "c"),
+            ("title", "A"),
+            ("rank", 1),
+        ]:
+            assert self.index.get_entity_by_key(key, value) is get_entity_by_key(
+                self.entities, key, value
+            )
+
+    def test_entities_by_title(self):
+        assert self.index.get_entities_by_title("A") == get_entity_by_name(
+            self.entities, "A"
+        )
+        assert self.index.get_entities_by_titles(["C", "A"]) == [
+            self.entities[0],
+            self.entities[2],
+            self.entities[3],
+        ]
+
+    def test_entity_relationships_keep_order(self):
+        selected = [self.entities[1], self.entities[3]]
+        assert self.index.get_entity_relationships(["B", "C"]) == (
+            get_candidate_relationships(selected, self.relationships)
+        )
+        assert self.index.get_entity_relationships(["A"]) == [
+            self.relationships[0],
+            self.relationships[3],
+        ]
+
+    def test_text_units(self):
+        assert self.index.get_text_units(["t1", "t2", "missing"]) == self.text_units
@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import tiktoken
+
+from graphrag.model import CommunityReport, Entity
+from graphrag.query.context_builder import community_context
+from graphrag.query.structured_search.global_search.community_context import (
+    GlobalCommunityContext,
+)
+
+
+def create_reports() -> list[CommunityReport]:
+    return [
+        CommunityReport(
+            id=f"report{i}",
+            short_id=str(i),
+            title=f"Community {i}",
+            community_id=str(i),
+            summary=f"summary of community {i} " * (i + 1),
+            rank=float(i),
+        )
+        for i in range(10)
+    ]
+
+
+def create_entities() -> list[Entity]:
+    return [
+        Entity(
+            id=f"entity{i}",
+            short_id=str(i),
+            title=f"ENTITY {i}",
+            community_ids=[str(i % 10)],
+            text_unit_ids=[f"unit{j}" for j in range(i % 3 + 1)],
+        )
+        for i in range(20)
+    ]
+
+
+class TestGlobalCommunityContext(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.token_counts_path = Path(self.temp_dir.name) / "token_counts.json"
+        self.token_encoder = tiktoken.get_encoding("cl100k_base")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_context(self, **kwargs) -> GlobalCommunityContext:
+        return GlobalCommunityContext(
+            community_reports=create_reports(),
+            entities=create_entities(),
+            token_encoder=self.token_encoder,
+            **kwargs,
+        )
+
+    def test_context_matches_uncached_context(self):
+        context, context_data = self.create_context().build_context(max_tokens=100)
+        expected, expected_data = community_context.build_community_context(
+            community_reports=create_reports(),
+            entities=create_entities(),
+            token_encoder=self.token_encoder,
+            community_weight_name="occurrence",
+            max_tokens=100,
+            single_batch=False,
+        )
+        assert isinstance(context, list)
+        assert len(context) > 1
+        assert context == [f"\n\n{batch}" for batch in expected]
+        assert context_data["reports"].equals(expected_data["reports"])
+
+    def test_batches_are_built_once_per_parameters(self):
+        builder = self.create_context()
+        with mock.patch.object(
+            community_context,
+            "num_tokens",
+            wraps=community_context.num_tokens,
+        ) as num_tokens:
+            first, first_data = builder.build_context(max_tokens=100)
+            num_calls = num_tokens.call_count
+            # callers may change the data frames they get
+            first_data["reports"]["title"] = ""
+            second, second_data = builder.build_context(max_tokens=100)
+            assert num_tokens.call_count == num_calls
+            assert second == first
+            assert "Community 0" in second_data["reports"]["title"].to_numpy()
+
+            # the rendered reports are not tokenized again for other batch sizes
+            builder.build_context(max_tokens=200)
+            assert num_tokens.call_count == num_calls
+
+    def test_token_counts_are_persisted(self):
+        builder = self.create_context(token_counts_path=self.token_counts_path)
+        expected = builder.build_context(max_tokens=100)[0]
+        data = json.loads(self.token_counts_path.read_text())
+        assert data["encoding"] == "cl100k_base"
+        assert len(data["token_counts"]) == 11
+
+        reloaded = self.create_context(token_counts_path=self.token_counts_path)
+        with mock.patch.object(community_context, "num_tokens") as num_tokens:
+            assert reloaded.build_context(max_tokens=100)[0] == expected
+            num_tokens.assert_not_called()
+
+    def test_token_counts_of_other_encodings_are_ignored(self):
+        self.token_counts_path.write_text(
+            json.dumps({"encoding": "p50k_base", "token_counts": {"key": 1}})
+        )
+        builder = self.create_context(token_counts_path=self.token_counts_path)
+        builder.build_context(max_tokens=100)
+        data = json.loads(self.token_counts_path.read_text())
+        assert "key" not in data["token_counts"]
@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import json
+import re
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
+
+import tiktoken
+
+from graphrag.model import CommunityReport
+from graphrag.query.llm.base import BaseLLM, BaseLLMCallback
+from graphrag.query.structured_search.global_search.community_context import (
+    GlobalCommunityContext,
+)
+from graphrag.query.structured_search.global_search.search import GlobalSearch
+
+REDUCE_PROMPT = "REDUCE {response_type}\n{report_data}"
+
+
+class CommunityLLM(BaseLLM):
+    """Answers every map batch with one point per community in it."""
+
+    def __init__(self):
+        self.map_batches: list[list[str]] = []
+        self.reduce_prompts: list[str] = []
+
+    def generate(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        raise NotImplementedError
+
+    def stream_generate(
+        self,
+        messages: str | list[Any],
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
+        raise NotImplementedError
+
+    async def agenerate(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        assert isinstance(messages, list)
+        prompt = messages[0]["content"]
+        if prompt.startswith("REDUCE"):
+            self.reduce_prompts.append(prompt)
+            return "answer"
+
+        communities = re.findall(r"Community (\d+)", prompt)
+        self.map_batches.append(communities)
+        # stands in for the llm round-trip
+        await asyncio.sleep(0.01)
+        return json.dumps({
+            "points": [
+                {"description": f"point about community {community}", "score": 80}
+                for community in communities
+            ]
+        })
+
+    async def astream_generate(  # type: ignore
+        self,
+        messages: str | list[Any],
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        yield await self.agenerate(messages, callbacks=callbacks, **kwargs)
+
+
+def create_search(llm: BaseLLM, **kwargs) -> GlobalSearch:
+    reports = [
+        CommunityReport(
+            id=f"report{i}",
+            short_id=str(i),
+            title=f"Community {i}",
+            community_id=str(i),
+            full_content=f"content of community {i}",
+            rank=float(i),
+        )
+        for i in range(10)
+    ]
+    token_encoder = tiktoken.get_encoding("cl100k_base")
+    return GlobalSearch(
+        llm=llm,
+        context_builder=GlobalCommunityContext(
+            community_reports=reports, token_encoder=token_encoder
+        ),
+        token_encoder=token_encoder,
+        reduce_system_prompt=REDUCE_PROMPT,
+        json_mode=False,
+        max_data_tokens=20,
+        context_builder_params={"use_community_summary": False, "max_tokens": 30},
+        concurrent_coroutines=1,
+        **kwargs,
+    )
+
+
+async def test_maps_every_batch():
+    llm = CommunityLLM()
+    result = await create_search(llm).asearch("query")
+    assert len(llm.map_batches) == len(result.context_text) == 10
+    assert len(result.map_responses) == 10
+    assert result.response == "answer"
+
+
+async def test_early_stop_maps_the_highest_ranked_batches():
+    llm = CommunityLLM()
+    search = create_search(llm, early_stop=True)
+    result = await search.asearch("query")
+
+    # each batch holds one community, the first two batches fill the data tokens and
+    # the batch that was already waiting for the llm is cancelled
+    assert llm.map_batches == [["9"], ["8"], ["7"]]
+    assert len(result.map_responses) == 2
+    assert len(llm.reduce_prompts) == 1
+    assert "point about community 9" in llm.reduce_prompts[0]
+    assert result.response == "answer"
+
+
+async def test_early_stop_ignores_points_below_the_min_score():
+    llm = CommunityLLM()
+    search = create_search(llm, early_stop=True, early_stop_min_score=90)
+    result = await search.asearch("query")
+    assert len(llm.map_batches) == len(result.map_responses) == 10
+
+
+async def test_early_stop_streams_the_reduce_response():
+    llm = CommunityLLM()
+    search = create_search(llm, early_stop=True)
+    responses = [response async for response in search.astream_search("query")]
+    assert responses[1:] == ["answer"]
+    assert len(llm.map_batches) == 3
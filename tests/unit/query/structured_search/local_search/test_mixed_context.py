@@ -0,0 +1,151 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+from typing import Any
+
+import numpy as np
+
+from graphrag.model import Entity, Relationship, TextUnit
+from graphrag.model.types import TextEmbedder
+from graphrag.query.context_builder.conversation_history import ConversationHistory
+from graphrag.query.llm.base import BaseTextEmbedding
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
+from graphrag.vector_stores import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+TITLES = ["APPLE", "BANANA", "CHERRY", "DATE", "ELDERBERRY"]
+
+
+def embed(text: str) -> list[float]:
+    return [text.count(letter) / (len(text) or 1) for letter in "abcdeinrty"]
+
+
+class LetterEmbedding(BaseTextEmbedding):
+    def __init__(self):
+        self.pending = 0
+        self.max_pending = 0
+
+    def embed(self, text: str, **kwargs: Any) -> list[float]:
+        return embed(text)
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        # stands in for the embedding round-trip
+        await asyncio.sleep(0.01)
+        self.pending -= 1
+        return embed(text)
+
+
+class InMemoryVectorStore(BaseVectorStore):
+    def connect(self, **kwargs: Any) -> None:
+        self.documents: list[VectorStoreDocument] = []
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        self.documents = documents
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        scores = [
+            float(np.dot(query_embedding, document.vector or []))
+            for document in self.documents
+        ]
+        ranked = sorted(zip(scores, self.documents, strict=True), key=lambda x: -x[0])
+        return [
+            VectorStoreSearchResult(document=document, score=score)
+            for score, document in ranked[:k]
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        return self.similarity_search_by_vector(text_embedder(text), k)
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        return None
+
+
+def create_context_builder() -> tuple[LocalSearchMixedContext, LetterEmbedding]:
+    entities = [
+        Entity(
+            id=str(i),
+            short_id=str(i),
+            title=title,
+            description=f"{title.lower()} is a fruit",
+            rank=i,
+            text_unit_ids=[f"t{i}"],
+        )
+        for i, title in enumerate(TITLES)
+    ]
+    relationships = [
+        Relationship(
+            id=f"r{i}",
+            short_id=f"r{i}",
+            source=TITLES[i],
+            target=TITLES[i + 1],
+            description="grows next to",
+            weight=1.0,
+        )
+        for i in range(len(TITLES) - 1)
+    ]
+    text_units = [
+        TextUnit(id=f"t{i}", short_id=str(i), text=f"a text about {title.lower()}")
+        for i, title in enumerate(TITLES)
+    ]
+    store = InMemoryVectorStore(collection_name="entities")
+    store.connect()
+    store.load_documents([
+        VectorStoreDocument(id=entity.id, text=entity.title, vector=embed(entity.title))
+        for entity in entities
+    ])
+    embedding = LetterEmbedding()
+    builder = LocalSearchMixedContext(
+        entities=entities,
+        entity_text_embeddings=store,
+        text_embedder=embedding,
+        text_units=text_units,
+        relationships=relationships,
+    )
+    return builder, embedding
+
+
+def assert_same_context(expected, actual):
+    expected_text, expected_records = expected
+    actual_text, actual_records = actual
+    assert actual_text == expected_text
+    assert actual_records.keys() == expected_records.keys()
+    for name, records in expected_records.items():
+        assert actual_records[name].equals(records)
+
+
+async def test_abuild_context_matches_build_context():
+    builder, _ = create_context_builder()
+    history = ConversationHistory.from_list([
+        {"role": "user", "content": "tell me about dates"}
+    ])
+    for query, kwargs in [
+        ("which fruit is red", {}),
+        ("banana", {"top_k_mapped_entities": 2, "exclude_entity_names": ["BANANA"]}),
+        ("", {"include_entity_names": ["CHERRY"]}),
+        ("apple", {"conversation_history": history, "max_tokens": 200}),
+    ]:
+        assert_same_context(
+            builder.build_context(query, **kwargs),
+            await builder.abuild_context(query, **kwargs),
+        )
+
+
+async def test_abuild_context_does_not_block_other_queries():
+    builder, embedding = create_context_builder()
+    await asyncio.gather(
+        *(builder.abuild_context(f"query {title.lower()}") for title in TITLES)
+    )
+    assert embedding.max_pending == len(TITLES)
@@ -0,0 +1,171 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from graphrag.config import create_graphrag_config
+from graphrag.query.engine import QueryEngine
+from graphrag.query.llm.base import BaseLLM, BaseLLMCallback
+from graphrag.query.server import QueryServer
+
+MAP_RESPONSE = json.dumps({"points": [{"description": "A point", "score": 80}]})
+
+
+class PointLLM(BaseLLM):
+    """Answers every prompt with the same key point."""
+
+    def generate(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        return MAP_RESPONSE
+
+    def stream_generate(
+        self,
+        messages: str | list[Any],
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
+        yield MAP_RESPONSE
+
+    async def agenerate(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        return MAP_RESPONSE
+
+    async def astream_generate(  # type: ignore
+        self,
+        messages: str | list[Any],
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        yield MAP_RESPONSE
+
+
+def write_outputs(data_dir: Path, summary: str) -> None:
+    titles = ["ALICE", "BOB"]
+    pd.DataFrame({
+        "title": titles,
+        "degree": [1, 1],
+        "community": ["0", "0"],
+        "level": [0, 0],
+    }).to_parquet(data_dir / "create_final_nodes.parquet")
+    pd.DataFrame({
+        "id": ["e0", "e1"],
+        "name": titles,
+        "type": ["PERSON", "PERSON"],
+        "human_readable_id": [0, 1],
+        "description": ["Alice knows Bob", "Bob knows Alice"],
+        "description_embedding": [[1.0, 0.0], [0.0, 1.0]],
+        "text_unit_ids": [["t0"], ["t0"]],
+    }).to_parquet(data_dir / "create_final_entities.parquet")
+    pd.DataFrame({
+        "community": ["0"],
+        "level": [0],
+        "title": ["Community 0"],
+        "summary": [summary],
+        "full_content": ["The content of a report"],
+        "rank": [1.0],
+    }).to_parquet(data_dir / "create_final_community_reports.parquet")
+    pd.DataFrame({
+        "id": ["t0"],
+        "text": ["Alice knows Bob"],
+        "n_tokens": [3],
+        "document_ids": [["d0"]],
+        "entity_ids": [["e0", "e1"]],
+        "relationship_ids": [["r0"]],
+    }).to_parquet(data_dir / "create_final_text_units.parquet")
+    pd.DataFrame({
+        "id": ["r0"],
+        "source": ["ALICE"],
+        "target": ["BOB"],
+        "human_readable_id": [0],
+        "description": ["Alice knows Bob"],
+        "weight": [1.0],
+        "rank": [2],
+        "text_unit_ids": [["t0"]],
+    }).to_parquet(data_dir / "create_final_relationships.parquet")
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> QueryEngine:
+    data_dir = tmp_path / "artifacts"
+    data_dir.mkdir()
+    write_outputs(data_dir, summary="A summary")
+    config = create_graphrag_config(
+        {
+            "llm": {"api_key": "test"},
+            "embeddings": {
+                "vector_store": {"type": "numpy", "db_uri": str(tmp_path / "vectors")}
+            },
+        },
+        str(tmp_path),
+    )
+    engine = QueryEngine(config, data_dir=str(data_dir))
+    engine.load()
+    return engine
+
+
+def test_reload_only_loads_changed_outputs(engine: QueryEngine):
+    global_search = engine.global_search_engine
+    local_search = engine.local_search_engine
+    assert engine.global_search_engine is global_search
+    assert not engine.reload()
+    assert engine.global_search_engine is global_search
+
+    write_outputs(Path(engine.data_dir), summary="A new summary")
+    assert engine.reload()
+    assert engine.global_search_engine is not global_search
+    assert engine.local_search_engine is not local_search
+    context_builder = engine.global_search_engine.context_builder
+    reports = context_builder.community_reports  # type: ignore
+    assert [report.summary for report in reports] == ["A new summary"]
+
+
+def test_server_answers_queries(engine: QueryEngine):
+    engine.global_search_engine.llm = PointLLM()
+    with QueryServer(engine, port=0) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        def post(path: str, body: dict[str, Any]) -> dict[str, Any]:
+            request = urllib.request.Request(
+                url + path, data=json.dumps(body).encode(), method="POST"
+            )
+            with urllib.request.urlopen(request) as response:
+                return json.loads(response.read())
+
+        try:
+            result = post("/search", {"method": "global", "query": "Who is Alice?"})
+            assert result["response"] == MAP_RESPONSE
+            assert result["context_data"]["reports"][0]["title"] == "Community 0"
+
+            assert post("/reload", {}) == {
+                "reloaded": False,
+                "data_dir": engine.data_dir,
+            }
+            with urllib.request.urlopen(url + "/health") as response:
+                assert json.loads(response.read()) == {"data_dir": engine.data_dir}
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                post("/search", {"method": "drift", "query": "Who is Alice?"})
+            assert error.value.code == 400
+        finally:
+            server.shutdown()
+            thread.join()
@@ -0,0 +1,133 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from graphrag.vector_stores import (
+    NumpyVectorStore,
+    VectorStoreDocument,
+    VectorStoreFactory,
+    VectorStoreType,
+)
+from graphrag.vector_stores.numpy_store import IVF_INDEX_FILE
+
+
+def create_documents(vectors: np.ndarray, start: int = 0) -> list[VectorStoreDocument]:
+    return [
+        VectorStoreDocument(
+            id=f"doc{start + i}",
+            text=f"text {start + i}",
+            vector=vector.tolist(),
+            attributes={"title": f"title {start + i}"},
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def brute_force(vectors: np.ndarray, query: np.ndarray, k: int) -> list[str]:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [f"doc{i}" for i in np.argsort(-scores, kind="stable")[:k]]
+
+
+class TestNumpyVectorStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.random = np.random.default_rng(42)
+        self.vectors = self.random.normal(size=(200, 16)).astype(np.float32)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_store(self, **kwargs) -> NumpyVectorStore:
+        store = NumpyVectorStore(collection_name="test")
+        store.connect(db_uri=self.temp_dir.name, **kwargs)
+        return store
+
+    def test_factory(self):
+        store = VectorStoreFactory.get_vector_store(
+            VectorStoreType.Numpy, {"collection_name": "test"}
+        )
+        assert isinstance(store, NumpyVectorStore)
+
+    def test_exact_search_matches_brute_force(self):
+        store = self.create_store()
+        store.load_documents(create_documents(self.vectors))
+        queries = self.random.normal(size=(3, 16))
+
+        results = store.similarity_search_by_vectors(queries.tolist(), k=5)
+        for query, query_results in zip(queries, results, strict=True):
+            ids = [result.document.id for result in query_results]
+            assert ids == brute_force(self.vectors, query, 5)
+            scores = [result.score for result in query_results]
+            assert scores == sorted(scores, reverse=True)
+
+        result = store.similarity_search_by_vector(queries[0].tolist(), k=1)[0]
+        number = str(result.document.id)[3:]
+        assert result.document.text == f"text {number}"
+        assert result.document.attributes == {"title": f"title {number}"}
+        vector = np.asarray(result.document.vector)
+        query = queries[0] / np.linalg.norm(queries[0])
+        assert np.isclose(result.score, vector @ query)
+
+    def test_appended_documents_are_reopened_from_disk(self):
+        store = self.create_store()
+        store.load_documents(create_documents(self.vectors[:150]))
+        store.load_documents(create_documents(self.vectors[150:], start=150), False)
+
+        reopened = self.create_store()
+        assert isinstance(reopened._vectors, np.memmap)  # noqa: SLF001
+        query = self.vectors[170]
+        results = reopened.similarity_search_by_vector(query.tolist(), k=3)
+        assert [result.document.id for result in results] == brute_force(
+            self.vectors, query, 3
+        )
+        assert results[0].document.id == "doc170"
+        assert np.isclose(results[0].score, 1)
+
+    def test_overwrite_replaces_the_collection(self):
+        store = self.create_store()
+        store.load_documents(create_documents(self.vectors[:10]))
+        store.load_documents(create_documents(self.vectors[10:12], start=10))
+
+        results = self.create_store().similarity_search_by_vector(
+            self.vectors[0].tolist(), k=10
+        )
+        assert sorted(result.document.id for result in results) == ["doc10", "doc11"]
+
+    def test_filter_by_id(self):
+        store = self.create_store()
+        store.load_documents(create_documents(self.vectors))
+        store.filter_by_id(["doc3", "doc7", "missing"])
+
+        results = store.similarity_search_by_vector(self.vectors[5].tolist(), k=5)
+        assert sorted(result.document.id for result in results) == ["doc3", "doc7"]
+
+        store.filter_by_id([])
+        results = store.similarity_search_by_vector(self.vectors[5].tolist(), k=1)
+        assert results[0].document.id == "doc5"
+
+    def test_ivf_index_finds_the_nearest_documents(self):
+        store = self.create_store(ivf_lists=8, ivf_probes=8)
+        store.load_documents(create_documents(self.vectors))
+        queries = self.random.normal(size=(4, 16))
+
+        # probing every list gives the exact results
+        results = store.similarity_search_by_vectors(queries.tolist(), k=5)
+        for query, query_results in zip(queries, results, strict=True):
+            ids = [result.document.id for result in query_results]
+            assert ids == brute_force(self.vectors, query, 5)
+
+        assert (Path(self.temp_dir.name) / "test" / IVF_INDEX_FILE).exists()
+        reopened = self.create_store(ivf_lists=8, ivf_probes=1)
+        results = reopened.similarity_search_by_vector(self.vectors[9].tolist(), k=1)
+        assert results[0].document.id == "doc9"
+
+    def test_empty_collection(self):
+        store = self.create_store()
+        assert store.similarity_search_by_vector([1.0, 0.0], k=3) == []
+        store.load_documents([VectorStoreDocument(id="a", text="a", vector=None)])
+        assert store.similarity_search_by_vectors([[1.0, 0.0]], k=3) == [[]]